@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+ELIS harvest throughput benchmark against the local mock API.
+
+Runs the real OpenAlex / CrossRef / Scopus adapters (pagination, retry,
+backoff and polite delays included) against ``elis.sources.mock_api`` and
+reports records/s, requests and injected failures per source.  Latency,
+429/5xx injection and server-side rate limits are configurable and seeded, so
+changes to concurrency, rate-limit or retry code can be compared without
+network access.  Pages come from recorded cassettes when ``--cassette-dir``
+is given (record them with ``ELIS_HTTP_RECORD_DIR=<dir> elis harvest ...``),
+otherwise from a synthetic corpus.
+
+``--time-scale`` multiplies the adapters' client delays and backoff, e.g.
+``0`` to measure pure transport/parse cost or ``1`` for production pacing.
+
+``--quota-per-key`` gives every Scopus API key a request quota that renews
+every ``--quota-reset`` seconds; ``--scopus-keys`` sets how many keys the
+adapter rotates across.  Quota state goes to a temporary file.
+
+Usage:
+    python benchmarks/scripts/harvest_throughput_benchmark.py \
+        [--sources openalex crossref scopus] [--queries 2] [--max-results 1000] \
+        [--latency-ms 50] [--error-rate-429 0.05] [--error-rate-5xx 0.02] \
+        [--rate-limit 10] [--time-scale 0] [--seed 0] \
+        [--scopus-keys 3 --quota-per-key 100 --quota-reset 10] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from elis.sources import crossref, openalex, scopus  # noqa: E402
+from elis.sources.mock_api import MockApiConfig, MockApiServer  # noqa: E402
+
+ADAPTERS = {
+    "openalex": (openalex, openalex.OpenAlexAdapter),
+    "crossref": (crossref, crossref.CrossRefAdapter),
+    "scopus": (scopus, scopus.ScopusAdapter),
+}
+
+
+def _scaled_client(module, time_scale: float):
+    original = module.ELISHttpClient
+
+    def make(*args, **kwargs):
+        client = original(*args, **kwargs)
+        client.delay_seconds *= time_scale
+        client.backoff_base *= time_scale
+        client.backoff_max *= time_scale
+        return client
+
+    return make
+
+
+def run_source(
+    source: str,
+    config: MockApiConfig,
+    *,
+    queries: list[str],
+    max_results: int,
+    time_scale: float,
+    scopus_keys: int = 1,
+) -> dict[str, object]:
+    module, adapter_cls = ADAPTERS[source]
+    keys = " ".join(f"bench-{i}" for i in range(scopus_keys))
+    with MockApiServer(config) as api, ExitStack() as stack:
+        state_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        stack.enter_context(patch.object(module, "_BASE_URL", api.url(source)))
+        stack.enter_context(
+            patch.object(module, "ELISHttpClient", _scaled_client(module, time_scale))
+        )
+        stack.enter_context(
+            patch.dict(
+                os.environ,
+                {
+                    "SCOPUS_API_KEYS": keys,
+                    "SCOPUS_INST_TOKEN": "bench",
+                    "SCOPUS_QUOTA_STATE": str(Path(state_dir) / "quota.json"),
+                },
+            )
+        )
+        started = time.perf_counter()
+        records = sum(1 for _ in adapter_cls().harvest(queries, max_results))
+        seconds = time.perf_counter() - started
+        stats = dict(api.stats)
+    return {
+        "records": records,
+        "seconds": round(seconds, 3),
+        "records_per_second": round(records / seconds, 1) if seconds else None,
+        "requests": stats.get("requests", 0),
+        "injected_429": stats.get("injected_429", 0),
+        "injected_5xx": stats.get("injected_5xx", 0),
+        "rate_limited": stats.get("rate_limited", 0),
+        "replayed": stats.get("replayed", 0),
+        "quota_exceeded": stats.get("quota_exceeded", 0),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sources", nargs="+", choices=sorted(ADAPTERS), default=sorted(ADAPTERS)
+    )
+    parser.add_argument("--queries", type=int, default=2, help="Queries per source")
+    parser.add_argument("--max-results", type=int, default=1000)
+    parser.add_argument("--results-per-query", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate-429", type=float, default=0.0)
+    parser.add_argument("--error-rate-5xx", type=float, default=0.0)
+    parser.add_argument(
+        "--rate-limit", type=float, default=None, help="Server requests/second"
+    )
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--scopus-keys", type=int, default=1)
+    parser.add_argument(
+        "--quota-per-key", type=int, default=None, help="Requests per key per reset"
+    )
+    parser.add_argument(
+        "--quota-reset", type=float, default=60.0, help="Quota window in seconds"
+    )
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cassette-dir", default=None)
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    args = parser.parse_args(argv)
+    # Retry warnings are expected under injection; the table counts them.
+    logging.getLogger("elis").setLevel(logging.ERROR)
+
+    config = MockApiConfig(
+        results_per_query=args.results_per_query,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate_429=args.error_rate_429,
+        error_rate_5xx=args.error_rate_5xx,
+        rate_limit_per_second=args.rate_limit,
+        retry_after_seconds=args.retry_after,
+        quota_per_key=args.quota_per_key,
+        quota_reset_seconds=args.quota_reset,
+        cassette_dir=args.cassette_dir,
+    )
+    queries = [f"benchmark query {i}" for i in range(args.queries)]
+    results = {
+        source: run_source(
+            source,
+            replace(config, seed=args.seed),
+            queries=queries,
+            max_results=args.max_results,
+            time_scale=args.time_scale,
+            scopus_keys=args.scopus_keys,
+        )
+        for source in args.sources
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(
+        f"{'source':<9} {'records':>8} {'seconds':>8} {'rec/s':>8} "
+        f"{'requests':>9} {'429':>5} {'5xx':>5} {'limited':>8} {'quota':>6}"
+    )
+    for source, row in results.items():
+        print(
+            f"{source:<9} {row['records']:>8} {row['seconds']:>8} "
+            f"{row['records_per_second']:>8} {row['requests']:>9} "
+            f"{row['injected_429']:>5} {row['injected_5xx']:>5} {row['rate_limited']:>8} "
+            f"{row['quota_exceeded']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
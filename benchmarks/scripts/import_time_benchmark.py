@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+ELIS CLI startup benchmark.
+
+Measures wall time of ``python -m elis <subcommand> --help`` over several
+runs and, with ``python -X importtime``, the cost of importing ``elis.cli``
+and which heavy modules are loaded before the subcommand runs.  Guards the lazy-import structure of
+``elis.cli`` / ``elis.sources``: only ``harvest`` should load an adapter
+or ``requests``.
+
+Usage:
+    python benchmarks/scripts/import_time_benchmark.py [--runs N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+SUBCOMMANDS = ("validate", "harvest", "merge", "dedup", "screen", "enrich")
+# Modules whose presence at startup indicates an eager import regression.
+WATCHED_MODULES = (
+    "elis.manifest",
+    "elis.sources.http_client",
+    "elis.sources.openalex",
+    "requests",
+    "jsonschema",
+    "yaml",
+)
+
+
+def _run(args: list[str], *, importtime: bool = False) -> tuple[float, str]:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += args
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, check=False
+    )
+    return time.perf_counter() - start, proc.stderr
+
+
+def _imported_modules(stderr: str) -> dict[str, int]:
+    """Parse ``-X importtime`` output into ``{module: cumulative_us}``."""
+    modules: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[12:].split("|"))
+        if cumulative.isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def benchmark(runs: int) -> dict[str, dict[str, object]]:
+    results: dict[str, dict[str, object]] = {}
+    for sub in SUBCOMMANDS:
+        args = ["-m", "elis", sub, "--help"]
+        timings = [_run(args)[0] for _ in range(runs)]
+        _, stderr = _run(args, importtime=True)
+        modules = _imported_modules(stderr)
+        results[sub] = {
+            "median_ms": round(statistics.median(timings) * 1000, 1),
+            "min_ms": round(min(timings) * 1000, 1),
+            "elis_cli_import_us": modules.get("elis.cli", 0),
+            "eager_modules": [m for m in WATCHED_MODULES if m in modules],
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'subcommand':<10} {'median ms':>10} {'min ms':>8}  eager imports")
+    for sub, row in results.items():
+        eager = ", ".join(row["eager_modules"]) or "-"
+        print(f"{sub:<10} {row['median_ms']:>10} {row['min_ms']:>8}  {eager}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
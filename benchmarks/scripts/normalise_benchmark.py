@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+ELIS normalisation microbenchmark.
+
+Measures the per-record cost of the key normalisations merge and dedup run
+(DOI, title, first author, all author names, venue) on a synthetic corpus with
+realistic repetition: authors and venues are drawn from small pools, titles
+carry punctuation and irregular whitespace.  Compares
+
+- ``legacy``: the pre-``elis.normalise`` helpers, calling ``re.sub`` with
+  uncompiled patterns on every call;
+- ``scalar``: ``elis.normalise`` precompiled scalar functions;
+- ``cached``: scalar, with memoised forms for authors and venues;
+- ``batch``:  ``normalise_many`` over whole columns.
+
+Usage:
+    python benchmarks/scripts/normalise_benchmark.py [--records 50000] [--repeat 3] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from elis.normalise import (  # noqa: E402
+    collapse_ws,
+    collapse_ws_cached,
+    normalise_doi,
+    normalise_many,
+    normalise_text,
+    normalise_text_cached,
+)
+
+_WORDS = (
+    "electoral integrity voting audit risk-limiting blockchain trust voter "
+    "verification paper ballot system security e-voting transparency (VVPAT) "
+    "machine learning survey: evidence, review; model"
+).split()
+
+
+def synthetic_records(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    authors = [f"Author{i},  {chr(65 + i % 26)}." for i in range(max(50, count // 20))]
+    venues = [f"Journal  of {rng.choice(_WORDS).title()} {i}" for i in range(200)]
+    records = []
+    for i in range(count):
+        title = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 16)))
+        records.append(
+            {
+                "doi": f"https://doi.org/10.{1000 + i % 900}/X{i}" if i % 3 else None,
+                "title": f"  {title.capitalize()}!  ",
+                "authors": rng.sample(authors, rng.randint(1, 5)),
+                "venue": rng.choice(venues),
+            }
+        )
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Variants
+# ---------------------------------------------------------------------------
+
+
+def _legacy_collapse_ws(value: str | None) -> str:
+    if not value:
+        return ""
+    return re.sub(r"\s+", " ", value.strip())
+
+
+def _legacy_normalise_doi(doi: str | None) -> str:
+    value = (doi or "").strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+        if value.startswith(prefix):
+            value = value[len(prefix) :]
+            break
+    return value
+
+
+def _legacy_normalise_text(text: str | None) -> str:
+    if not text:
+        return ""
+    s = text.lower()
+    s = re.sub(r"[^\w\s]", "", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+def _per_record(
+    records: list[dict[str, Any]],
+    doi: Callable[[Any], str],
+    text: Callable[[Any], str],
+    name_text: Callable[[Any], str],
+    name_ws: Callable[[Any], str],
+) -> int:
+    out = 0
+    for rec in records:
+        authors = rec["authors"]
+        out += len(doi(rec["doi"]))
+        out += len(text(rec["title"]))
+        out += len(name_text(authors[0]))
+        out += sum(len(name_ws(author)) for author in authors)
+        out += len(name_ws(rec["venue"]))
+    return out
+
+
+def legacy(records: list[dict[str, Any]]) -> int:
+    return _per_record(
+        records,
+        _legacy_normalise_doi,
+        _legacy_normalise_text,
+        _legacy_normalise_text,
+        _legacy_collapse_ws,
+    )
+
+
+def scalar(records: list[dict[str, Any]]) -> int:
+    return _per_record(
+        records, normalise_doi, normalise_text, normalise_text, collapse_ws
+    )
+
+
+def cached(records: list[dict[str, Any]]) -> int:
+    return _per_record(
+        records,
+        normalise_doi,
+        normalise_text,
+        normalise_text_cached,
+        collapse_ws_cached,
+    )
+
+
+def batch(records: list[dict[str, Any]]) -> int:
+    columns = [
+        normalise_many((rec["doi"] for rec in records), "doi"),
+        normalise_many((rec["title"] for rec in records), "text"),
+        normalise_many((rec["authors"][0] for rec in records), "text"),
+        normalise_many((a for rec in records for a in rec["authors"]), "ws"),
+        normalise_many((rec["venue"] for rec in records), "ws"),
+    ]
+    return sum(len(value) for column in columns for value in column)
+
+
+VARIANTS = {"legacy": legacy, "scalar": scalar, "cached": cached, "batch": batch}
+
+
+def benchmark(records: int, repeat: int) -> dict[str, dict[str, float]]:
+    rows = synthetic_records(records)
+    expected = legacy(rows)
+    results: dict[str, dict[str, float]] = {}
+    for name, variant in VARIANTS.items():
+        timings = []
+        for _ in range(repeat):
+            normalise_text_cached.cache_clear()
+            collapse_ws_cached.cache_clear()
+            started = time.perf_counter()
+            total = variant(rows)
+            timings.append(time.perf_counter() - started)
+        if total != expected:
+            raise AssertionError(f"{name} output differs from legacy")
+        best = min(timings)
+        results[name] = {
+            "seconds": round(best, 4),
+            "us_per_record": round(best / records * 1e6, 3),
+        }
+    base = results["legacy"]["seconds"]
+    for row in results.values():
+        row["speedup"] = round(base / row["seconds"], 2) if row["seconds"] else 0.0
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.records, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'variant':<8} {'seconds':>9} {'us/record':>10} {'speedup':>8}")
+    for name, row in results.items():
+        print(
+            f"{name:<8} {row['seconds']:>9} {row['us_per_record']:>10} "
+            f"{row['speedup']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,12 +8,16 @@ Phase 2 will be executed after EBSCOhost and ProQuest API access is obtained.
 """
 
 import json
+import sys
 import yaml
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set
 from dataclasses import dataclass, asdict
-import re
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from elis.normalise import normalise_alnum
 
 # Configuration
 CONFIG_FILE = "benchmark_2_config.yaml"
@@ -48,16 +52,8 @@ class FuzzyMatcher:
 
     @staticmethod
     def normalize_text(text: str) -> str:
-        """Normalize text for comparison"""
-        if not text:
-            return ""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove special characters but keep spaces
-        text = re.sub(r"[^a-z0-9\s]", "", text)
-        # Remove extra spaces
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        """Normalize text for comparison (lowercase ASCII alphanumerics)"""
+        return normalise_alnum(text)
 
     @staticmethod
     def calculate_similarity(str1: str, str2: str) -> float:
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from elis.agentic.evidence import validate_evidence_spans
+from elis.jsonl_index import ASTA_OUTPUTS_KEY_FIELDS, write_jsonl_with_index
 
 AstaMCPAdapter = None
 
@@ -173,7 +174,7 @@ def run_enrich(
     out_path = Path(output) if output else _default_enrich_output(run_id)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: list[str] = []
+    rows: list[dict[str, Any]] = []
     for record in records:
         rid = _record_id(record)
         query = str(record.get("title") or "")
@@ -204,9 +205,9 @@ def run_enrich(
             "run_id": run_id,
             "timestamp": _utc_now(),
         }
-        lines.append(json.dumps(row, ensure_ascii=False))
+        rows.append(row)
 
-    out_path.write_text(("\n".join(lines) + "\n") if lines else "", encoding="utf-8")
+    write_jsonl_with_index(out_path, rows, ASTA_OUTPUTS_KEY_FIELDS)
     return out_path
 
 
@@ -7,7 +7,35 @@ import json
 from pathlib import Path
 from typing import Any, Sequence
 
-from elis.manifest import emit_run_manifest, manifest_path_for_output, now_utc_iso
+# ---------------------------------------------------------------------------
+# Lazy manifest helpers — each subcommand imports only what it needs, so
+# ``elis.manifest`` is loaded on first use rather than at startup.
+# ---------------------------------------------------------------------------
+
+
+# Manifests written during the current ``main()`` call; ``--profile`` places
+# its artefacts next to the last one.
+_EMITTED_MANIFESTS: list[Path] = []
+
+
+def emit_run_manifest(**kwargs: Any) -> Path:
+    from elis.manifest import emit_run_manifest as _emit_run_manifest
+
+    path = _emit_run_manifest(**kwargs)
+    _EMITTED_MANIFESTS.append(Path(path))
+    return path
+
+
+def manifest_path_for_output(output_path: str | Path) -> Path:
+    from elis.manifest import manifest_path_for_output as _manifest_path_for_output
+
+    return _manifest_path_for_output(output_path)
+
+
+def now_utc_iso() -> str:
+    from elis.manifest import now_utc_iso as _now_utc_iso
+
+    return _now_utc_iso()
 
 
 def _count_data_rows(path: str | Path) -> int:
@@ -70,58 +98,83 @@ def _resolve_merge_inputs(args: argparse.Namespace) -> list[str]:
     raise SystemExit("Provide --inputs or --from-manifest.")
 
 
-def _build_json_validator(schema: dict[str, Any]):
-    """Select validator class from schema metadata."""
-    from jsonschema import Draft7Validator, Draft202012Validator
-
-    schema_uri = str(schema.get("$schema", ""))
-    if "2020-12" in schema_uri or "2019-09" in schema_uri:
-        return Draft202012Validator(schema)
-    return Draft7Validator(schema)
+def _json_root_is_array(path: Path) -> bool:
+    """Return True for JSONL files and JSON documents whose root is an array."""
+    if path.suffix.lower() == ".jsonl":
+        return True
+    with path.open("r", encoding="utf-8") as fh:
+        while True:
+            char = fh.read(1)
+            if not char or not char.isspace():
+                return char == "["
 
 
 def _validate_json_target(
     schema_path: Path,
     json_path: Path,
-) -> tuple[bool, int, list[str]]:
-    """Validate JSON payload against schema for both array and object roots."""
+    *,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+) -> tuple[bool, int, list[str], int]:
+    """Validate JSON payload against schema for both array and object roots.
+
+    Returns ``(is_valid, row_count, errors, cached_rows)``.
+    """
+    from elis.pipeline.validate import (
+        RowCache,
+        compile_validator,
+        iter_json_rows,
+        validate_rows,
+    )
+
+    errors: list[str] = []
     try:
         schema = json.loads(schema_path.read_text(encoding="utf-8"))
+
+        # Legacy behavior for row-based appendices: validate each non-_meta
+        # row, streamed and sharded across processes for large files.
+        if _json_root_is_array(json_path):
+            item_schema = schema.get("items", schema)
+            cache = (
+                RowCache.for_data(cache_dir, json_path, item_schema)
+                if cache_dir is not None
+                else None
+            )
+            keyed = cache is not None
+            rows = (
+                item
+                for item in iter_json_rows(json_path, with_hash=keyed)
+                if isinstance(item[1] if keyed else item, dict)
+            )
+            result = validate_rows(
+                rows, item_schema, workers=workers, cache=cache, prehashed=keyed
+            )
+            if cache is not None:
+                cache.save()
+            return (
+                result.is_valid,
+                result.row_count,
+                result.messages(),
+                result.cached_rows,
+            )
+
         payload = json.loads(json_path.read_text(encoding="utf-8"))
     except FileNotFoundError as exc:
-        return False, 0, [f"File not found: {exc}"]
+        return False, 0, [f"File not found: {exc}"], 0
     except json.JSONDecodeError as exc:
-        return False, 0, [f"Invalid JSON: {exc}"]
+        return False, 0, [f"Invalid JSON: {exc}"], 0
     except Exception as exc:  # pragma: no cover - defensive
-        return False, 0, [f"Unexpected error: {exc}"]
-
-    errors: list[str] = []
-
-    # Legacy behavior for row-based appendices: validate each non-_meta row.
-    if isinstance(payload, list):
-        item_schema = schema.get("items", schema)
-        validator = _build_json_validator(item_schema)
-        rows = [
-            row for row in payload if isinstance(row, dict) and not row.get("_meta")
-        ]
-        for idx, row in enumerate(rows):
-            for err in validator.iter_errors(row):
-                if err.path:
-                    field = ".".join(str(part) for part in err.path)
-                    errors.append(f"row {idx}, field '{field}': {err.message}")
-                else:
-                    errors.append(f"row {idx}: {err.message}")
-        return (len(errors) == 0), len(rows), errors
+        return False, 0, [f"Unexpected error: {exc}"], 0
 
     # Object/scalar roots (e.g., run_manifest.schema.json) validate as-is.
-    validator = _build_json_validator(schema)
+    validator = compile_validator(schema)
     for err in validator.iter_errors(payload):
         if err.path:
             field = ".".join(str(part) for part in err.path)
             errors.append(f"field '{field}': {err.message}")
         else:
             errors.append(err.message)
-    return (len(errors) == 0), 0, errors
+    return (len(errors) == 0), 0, errors, 0
 
 
 def _run_validate(args: argparse.Namespace) -> int:
@@ -137,9 +190,15 @@ def _run_validate(args: argparse.Namespace) -> int:
 
     if schema_path and json_path:
         target_path = Path(json_path)
-        is_valid, count, errors = _validate_json_target(Path(schema_path), target_path)
+        cache_dir = Path(args.cache_dir) if args.cache_dir else None
+        is_valid, count, errors, cached = _validate_json_target(
+            Path(schema_path), target_path, workers=args.workers, cache_dir=cache_dir
+        )
         status = "[OK]" if is_valid else "[ERR]"
-        print(f"{status} Validation target: rows={count} file={target_path.name}")
+        line = f"{status} Validation target: rows={count} file={target_path.name}"
+        if cached:
+            line += f" cached={cached}"
+        print(line)
         if errors:
             print("Errors:")
             for error in errors[:10]:
@@ -195,10 +254,28 @@ def _run_validate(args: argparse.Namespace) -> int:
 # ---------------------------------------------------------------------------
 
 
+def _attribute_record(record: dict[str, Any], planned: Any) -> None:
+    """Attach the planned query's topic attributions to a harvested record.
+
+    The first attribution seen becomes ``query_topic``/``query_string``;
+    every attribution is kept in ``query_attributions``.
+    """
+    if not planned.attributions:
+        return
+    attributions = record.setdefault("query_attributions", [])
+    for topic, query in planned.attributions:
+        entry = {"query_topic": topic, "query_string": query}
+        if entry not in attributions:
+            attributions.append(entry)
+    record.setdefault("query_topic", planned.query_topic)
+    record.setdefault("query_string", planned.query_string)
+
+
 def _run_harvest(args: argparse.Namespace) -> int:
     """Execute a harvest run for a single source."""
     from elis.sources import get_adapter
-    from elis.sources.config import load_harvest_config
+    from elis.sources.base import SaturationPolicy, record_keys
+    from elis.sources.config import PlannedQuery, load_harvest_config
 
     started_at = now_utc_iso()
 
@@ -232,39 +309,47 @@ def _run_harvest(args: argparse.Namespace) -> int:
             existing_results = json.load(fh)
         print(f"Loaded {len(existing_results)} existing results")
 
-    # Build dedup index (DOI + source-specific ID)
-    existing_dois: set[str] = {r["doi"] for r in existing_results if r.get("doi")}
-    existing_ids: set[str] = set()
+    # Build dedup index (DOI + source-specific ID) -> held record
+    held: dict[str, dict] = {}
     for r in existing_results:
-        for key in ("openalex_id", "crossref_id", "scopus_id"):
-            val = r.get(key)
-            if val:
-                existing_ids.add(val)
+        for key in record_keys(r):
+            held.setdefault(key, r)
 
     # Instantiate adapter and harvest
     adapter_cls = get_adapter(args.source)
     adapter = adapter_cls()
 
+    harvest_kwargs: dict[str, Any] = {}
+    saturation: SaturationPolicy | None = None
+    if getattr(args, "saturation_ratio", None) is not None:
+        saturation = SaturationPolicy(
+            min_new_ratio=args.saturation_ratio,
+            patience=args.saturation_pages,
+            known_records=existing_results,
+        )
+        harvest_kwargs["saturation"] = saturation
+
+    # Each unique query is fetched once; records are attributed to every
+    # (query_topic, query_string) that the plan collapsed into it.
+    query_plan = list(getattr(harvest_cfg, "query_plan", ()) or ()) or [
+        PlannedQuery(query) for query in harvest_cfg.queries
+    ]
+
     new_count = 0
-    for record in adapter.harvest(harvest_cfg.queries, harvest_cfg.max_results):
-        doi = record.get("doi", "")
-        # Check all ID fields for dedup
-        is_dup = bool(doi and doi in existing_dois)
-        if not is_dup:
-            for key in ("openalex_id", "crossref_id", "scopus_id"):
-                val = record.get(key)
-                if val and val in existing_ids:
-                    is_dup = True
-                    break
-
-        if not is_dup:
+    for planned in query_plan:
+        for record in adapter.harvest(
+            [planned.query], harvest_cfg.max_results, **harvest_kwargs
+        ):
+            keys = record_keys(record)
+            existing = next((held[k] for k in keys if k in held), None)
+            if existing is not None:
+                _attribute_record(existing, planned)
+                continue
+
+            _attribute_record(record, planned)
             existing_results.append(record)
-            if doi:
-                existing_dois.add(doi)
-            for key in ("openalex_id", "crossref_id", "scopus_id"):
-                val = record.get(key)
-                if val:
-                    existing_ids.add(val)
+            for key in keys:
+                held[key] = record
             new_count += 1
 
     # Write output
@@ -279,6 +364,9 @@ def _run_harvest(args: argparse.Namespace) -> int:
     print(f"New results added: {new_count}")
     print(f"Total records in dataset: {len(existing_results)}")
     print(f"Saved to: {harvest_cfg.output_path}")
+    if saturation is not None:
+        stops = saturation.report()["saturated_queries"]
+        print(f"Queries stopped early (saturated): {len(stops)}")
     print(f"{'=' * 80}\n")
 
     config_source = (
@@ -297,10 +385,28 @@ def _run_harvest(args: argparse.Namespace) -> int:
             "tier": getattr(args, "tier", None),
             "max_results": harvest_cfg.max_results,
             "output": str(output_path),
+            **(
+                {
+                    "saturation_ratio": saturation.min_new_ratio,
+                    "saturation_pages": saturation.patience,
+                }
+                if saturation is not None
+                else {}
+            ),
         },
         started_at=started_at,
         finished_at=now_utc_iso(),
         manifest_path=manifest_path_for_output(output_path),
+        stage_report={
+            "new_records": new_count,
+            "query_plan": {
+                "planned_queries": sum(
+                    max(1, len(planned.attributions)) for planned in query_plan
+                ),
+                "unique_queries": len(query_plan),
+            },
+            **({"saturation": saturation.report()} if saturation is not None else {}),
+        },
     )
 
     return 0
@@ -333,6 +439,40 @@ def _run_merge(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_enrich(args: argparse.Namespace) -> int:
+    """Execute batch DOI metadata enrichment stage (before dedup)."""
+    from elis.pipeline.enrich import run_enrich
+
+    started_at = now_utc_iso()
+    run_enrich(
+        args.input,
+        args.output,
+        args.report,
+        cache_path=args.cache_path,
+        providers=args.providers,
+        workers=args.workers,
+    )
+    print(f"[OK] Enrich complete -> {args.output}")
+    print(f"[OK] Enrich report  -> {args.report}")
+    emit_run_manifest(
+        stage="enrich",
+        source="system",
+        input_paths=[str(args.input)],
+        output_path=str(args.output),
+        record_count=_count_data_rows(args.output),
+        config_payload={
+            "report": str(args.report),
+            "cache_path": str(args.cache_path),
+            "providers": args.providers,
+            "workers": int(args.workers),
+        },
+        started_at=started_at,
+        finished_at=now_utc_iso(),
+        manifest_path=manifest_path_for_output(args.output),
+    )
+    return 0
+
+
 def _run_dedup(args: argparse.Namespace) -> int:
     """Execute PE4 deterministic dedup stage."""
     from elis.pipeline.dedup import run_dedup
@@ -345,6 +485,8 @@ def _run_dedup(args: argparse.Namespace) -> int:
         duplicates_path=args.duplicates_path,
         fuzzy=args.fuzzy,
         threshold=args.threshold,
+        near_dup=args.near_dup,
+        near_dup_threshold=args.near_dup_threshold,
         config_path=args.config_path,
     )
     print(f"[OK] Dedup complete -> {args.output}")
@@ -361,6 +503,8 @@ def _run_dedup(args: argparse.Namespace) -> int:
             "duplicates_path": str(args.duplicates_path),
             "fuzzy": bool(args.fuzzy),
             "threshold": float(args.threshold),
+            "near_dup": bool(args.near_dup),
+            "near_dup_threshold": float(args.near_dup_threshold),
             "config_path": str(args.config_path),
         },
         started_at=started_at,
@@ -443,12 +587,12 @@ def _run_agentic_asta_enrich(args: argparse.Namespace) -> int:
 
 
 def _run_export_latest(args: argparse.Namespace) -> int:
-    """Copy canonical artefacts from runs/<run_id>/ to json_jsonl/ (PE6)."""
-    import shutil
+    """Export canonical artefacts from runs/<run_id>/ to json_jsonl/ (PE6)."""
+    from elis.export_latest import LATEST_RUN_ID_FILE, ExportError, export_run
 
     runs_dir = Path(args.runs_dir)
     export_dir = Path(args.export_dir)
-    latest_txt = export_dir / "LATEST_RUN_ID.txt"
+    latest_txt = export_dir / LATEST_RUN_ID_FILE
 
     run_id = getattr(args, "run_id", None)
     if not run_id:
@@ -465,33 +609,123 @@ def _run_export_latest(args: argparse.Namespace) -> int:
         print(f"[ERROR] Run directory not found: {run_path}")
         return 1
 
-    export_dir.mkdir(parents=True, exist_ok=True)
-
-    # Copy all JSON/JSONL files from the run tree into json_jsonl/ (flat).
-    copied = 0
-    for src in sorted(run_path.rglob("*.json")) + sorted(run_path.rglob("*.jsonl")):
-        if src.name.endswith("_manifest.json"):
-            continue  # skip manifest sidecars
-        dest = export_dir / src.name
-        shutil.copy2(src, dest)
-        copied += 1
-        print(f"  copied: {src.relative_to(runs_dir)} -> {dest}")
-
-    # Write LATEST_RUN_ID.txt
-    latest_txt.write_text(run_id + "\n", encoding="utf-8")
-    print(f"\n[OK] Exported {copied} file(s) from run {run_id!r} -> {export_dir}/")
+    try:
+        result = export_run(
+            run_path, export_dir, run_id, mode=getattr(args, "link", "copy")
+        )
+    except ExportError as exc:
+        print(f"[ERROR] {exc}")
+        return 1
+    for item in result.files:
+        print(
+            f"  {item.action}: {item.source.relative_to(runs_dir)} -> {item.destination}"
+        )
+
+    unchanged = result.count("unchanged")
+    print(
+        f"\n[OK] Exported {result.written} file(s) from run {run_id!r} -> {export_dir}/"
+        + (f" ({unchanged} unchanged)" if unchanged else "")
+    )
     print(f"[OK] LATEST_RUN_ID.txt written: {run_id}")
     return 0
 
 
+def _run_index(args: argparse.Namespace) -> int:
+    """Build or incrementally update the local corpus index."""
+    from elis.corpus_index import CorpusIndex
+
+    with CorpusIndex(args.db) as index:
+        stats = index.update(args.roots, prune=not args.no_prune)
+        summary = index.summary()
+    for error in stats.errors:
+        print(f"[WARN] {error}")
+    print(
+        f"[OK] Indexed {stats.files_indexed} file(s) ({stats.rows_indexed} rows); "
+        f"{stats.files_unchanged} unchanged, {stats.files_removed} removed"
+    )
+    print(
+        f"[OK] {summary['records']} record(s) from {summary['files']} file(s) -> {args.db}"
+    )
+    return 0
+
+
+def _run_query(args: argparse.Namespace) -> int:
+    """Look up records in the local corpus index."""
+    from elis.corpus_index import CorpusIndex
+
+    if not Path(args.db).exists():
+        print(f"[ERROR] Corpus index not found: {args.db} (run `elis index` first)")
+        return 1
+    with CorpusIndex(args.db) as index:
+        try:
+            hits = index.query(
+                " ".join(args.text) or None,
+                doi=args.doi,
+                source_id=args.source_id,
+                cluster_id=args.cluster_id,
+                record_id=args.record_id,
+                run_id=args.run_id,
+                kind=args.kind,
+                raw_fts=args.fts,
+                limit=args.limit,
+            )
+        except ValueError as exc:
+            print(f"[ERROR] {exc}")
+            return 1
+    if args.json:
+        print(json.dumps([hit.as_dict() for hit in hits], indent=2, ensure_ascii=False))
+        return 0
+    for hit in hits:
+        print(
+            f"{hit.kind}\t{hit.run_id or '-'}\t{hit.record_id or '-'}\t"
+            f"{hit.doi or '-'}\t{hit.title or ''}"
+        )
+    return 0 if hits else 1
+
+
 # ---------------------------------------------------------------------------
 # Parser
 # ---------------------------------------------------------------------------
 
 
+def _profile_prefix(args: argparse.Namespace, command: str) -> Path:
+    """``<dir>/<stem>`` shared by the stage manifest and profile artefacts."""
+    if _EMITTED_MANIFESTS:
+        manifest = _EMITTED_MANIFESTS[-1]
+    elif getattr(args, "output", None):
+        manifest = manifest_path_for_output(args.output)
+    else:
+        stamp = now_utc_iso().replace(":", "").replace("-", "")
+        return Path(".cache") / "elis" / "profiles" / f"{command}_{stamp}"
+    return manifest.with_name(manifest.name.removesuffix("_manifest.json"))
+
+
+def _run_profiled(args: argparse.Namespace) -> int:
+    """Run the subcommand under ``StageProfiler``, writing artefacts even on failure."""
+    from elis.profiling import StageProfiler
+
+    command = args.func.__name__.removeprefix("_run_")
+    profiler = StageProfiler(args.profile)
+    try:
+        with profiler:
+            return args.func(args)
+    finally:
+        written = profiler.write(_profile_prefix(args, command), command=command)
+        print(f"[PROFILE] {args.profile} profile ({profiler.wall_seconds:.2f}s):")
+        for path in written:
+            print(f"  {path}")
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build argument parser for ELIS CLI."""
     parser = argparse.ArgumentParser(prog="elis", description="ELIS SLR Agent CLI")
+    parser.add_argument(
+        "--profile",
+        choices=("cpu", "mem", "both"),
+        default=None,
+        help="Profile the subcommand (cProfile and/or tracemalloc) and write "
+        "<stem>_profile.* artefacts next to its run manifest",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # validate -----------------------------------------------------------
@@ -501,6 +735,17 @@ def build_parser() -> argparse.ArgumentParser:
     )
     validate.add_argument("schema_path", nargs="?", help="Path to JSON schema")
     validate.add_argument("json_path", nargs="?", help="Path to JSON data file")
+    validate.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for large files (default: CPU count)",
+    )
+    validate.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse per-row results from a row-hash cache in this directory",
+    )
     validate.set_defaults(func=_run_validate)
 
     # harvest ------------------------------------------------------------
@@ -510,7 +755,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     harvest.add_argument(
         "source",
-        help="Source to harvest from (e.g. openalex, crossref, scopus)",
+        help="Source to harvest from (e.g. openalex, crossref, scopus, semanticscholar)",
     )
     harvest.add_argument(
         "--search-config",
@@ -536,6 +781,23 @@ def build_parser() -> argparse.ArgumentParser:
         default="json_jsonl/ELIS_Appendix_A_Search_rows.json",
         help="Output file path (default: json_jsonl/ELIS_Appendix_A_Search_rows.json)",
     )
+    harvest.add_argument(
+        "--saturation-ratio",
+        type=float,
+        default=None,
+        dest="saturation_ratio",
+        help=(
+            "Stop paging a query once pages bring fewer than this share of "
+            "new records (e.g. 0.1). Disabled by default."
+        ),
+    )
+    harvest.add_argument(
+        "--saturation-pages",
+        type=int,
+        default=2,
+        dest="saturation_pages",
+        help="Consecutive low-novelty pages before stopping (default: 2)",
+    )
     harvest.set_defaults(func=_run_harvest)
 
     # merge --------------------------------------------------------------
@@ -570,6 +832,53 @@ def build_parser() -> argparse.ArgumentParser:
     )
     merge.set_defaults(func=_run_merge)
 
+    # enrich -------------------------------------------------------------
+    from elis.pipeline.enrich import PROVIDERS as ENRICH_PROVIDERS
+
+    enrich = subparsers.add_parser(
+        "enrich",
+        help="Batch-resolve missing abstract/language/venue by DOI (before dedup)",
+    )
+    enrich.add_argument(
+        "--input",
+        type=str,
+        default="json_jsonl/ELIS_Appendix_A_Search_rows.json",
+        help="Merged Appendix A input file",
+    )
+    enrich.add_argument(
+        "--output",
+        type=str,
+        default="enrich/appendix_a_enriched.json",
+        help="Enriched Appendix A output path",
+    )
+    enrich.add_argument(
+        "--report",
+        type=str,
+        default="enrich/enrich_report.json",
+        help="Enrich report output path",
+    )
+    enrich.add_argument(
+        "--cache",
+        type=str,
+        default="enrich/doi_cache.json",
+        dest="cache_path",
+        help="Per-provider DOI metadata cache (reused across runs)",
+    )
+    enrich.add_argument(
+        "--providers",
+        nargs="+",
+        choices=sorted(ENRICH_PROVIDERS),
+        default=None,
+        help=f"Providers to query, in order (default: {' '.join(ENRICH_PROVIDERS)})",
+    )
+    enrich.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent batch requests per provider (default: 4)",
+    )
+    enrich.set_defaults(func=_run_enrich)
+
     # dedup --------------------------------------------------------------
     dedup = subparsers.add_parser(
         "dedup",
@@ -605,6 +914,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.85,
         help="Similarity threshold for fuzzy mode (default: 0.85)",
     )
+    dedup.add_argument(
+        "--near-dup",
+        action="store_true",
+        default=False,
+        help="Merge near-duplicate title + abstract text (MinHash/LSH, opt-in)",
+    )
+    dedup.add_argument(
+        "--near-dup-threshold",
+        type=float,
+        default=0.8,
+        help="Shingle Jaccard threshold for --near-dup (default: 0.8)",
+    )
     dedup.add_argument(
         "--config",
         type=str,
@@ -773,8 +1094,91 @@ def build_parser() -> argparse.ArgumentParser:
         dest="export_dir",
         help="Export target directory (default: json_jsonl)",
     )
+    export_latest.add_argument(
+        "--link",
+        choices=["copy", "hardlink", "reflink", "auto"],
+        default="copy",
+        help="How changed files are materialised: copy (default), hardlink, "
+        "reflink (copy-on-write), or auto (reflink > hardlink > copy). "
+        "Identical destinations are always skipped.",
+    )
     export_latest.set_defaults(func=_run_export_latest)
 
+    # index --------------------------------------------------------------
+    index = subparsers.add_parser(
+        "index",
+        help="Build/update the local SQLite corpus index from run artefacts",
+    )
+    index.add_argument(
+        "roots",
+        nargs="*",
+        default=["runs", "json_jsonl", "dedup"],
+        help="Directories or files to scan (default: runs json_jsonl dedup)",
+    )
+    index.add_argument(
+        "--db",
+        type=str,
+        default=".cache/elis/corpus_index.sqlite",
+        help="Index database path (default: .cache/elis/corpus_index.sqlite)",
+    )
+    index.add_argument(
+        "--no-prune",
+        action="store_true",
+        default=False,
+        help="Keep rows of indexed files that no longer exist under the roots",
+    )
+    index.set_defaults(func=_run_index)
+
+    # query --------------------------------------------------------------
+    query = subparsers.add_parser(
+        "query",
+        help="Look up records in the local corpus index (see `elis index`)",
+    )
+    query.add_argument("text", nargs="*", help="Words to match in title/abstract")
+    query.add_argument("--doi", type=str, default=None, help="Match a DOI")
+    query.add_argument(
+        "--source-id", type=str, default=None, dest="source_id", help="Match source_id"
+    )
+    query.add_argument(
+        "--cluster-id",
+        type=str,
+        default=None,
+        dest="cluster_id",
+        help="Match dedup cluster_id",
+    )
+    query.add_argument(
+        "--record-id", type=str, default=None, dest="record_id", help="Match record id"
+    )
+    query.add_argument(
+        "--run-id", type=str, default=None, dest="run_id", help="Restrict to a run"
+    )
+    query.add_argument(
+        "--kind",
+        type=str,
+        default=None,
+        help="Restrict to one artefact kind (appendix_a, appendix_b, appendix_c, "
+        "duplicates, asta, or a manifest stage name)",
+    )
+    query.add_argument(
+        "--fts",
+        action="store_true",
+        default=False,
+        help="Treat TEXT as raw FTS5 query syntax (phrases, OR, NEAR, prefix*)",
+    )
+    query.add_argument(
+        "--limit", type=int, default=20, help="Maximum hits (default: 20)"
+    )
+    query.add_argument(
+        "--json", action="store_true", default=False, help="Emit hits as JSON"
+    )
+    query.add_argument(
+        "--db",
+        type=str,
+        default=".cache/elis/corpus_index.sqlite",
+        help="Index database path (default: .cache/elis/corpus_index.sqlite)",
+    )
+    query.set_defaults(func=_run_query)
+
     return parser
 
 
@@ -782,4 +1186,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     """CLI dispatcher."""
     parser = build_parser()
     args = parser.parse_args(argv)
-    return args.func(args)
+    _EMITTED_MANIFESTS.clear()
+    if not getattr(args, "profile", None):
+        return args.func(args)
+    return _run_profiled(args)
@@ -0,0 +1,505 @@
+"""Local SQLite corpus index over ELIS run artefacts.
+
+Answers "do we already have this paper?" and "which records mention X across
+runs" without re-reading multi-hundred-MB JSON files.  ``elis index`` loads
+Appendix A/B/C rows, dedup sidecars and ASTA outputs into one SQLite database
+with an FTS5 table over title/abstract and B-tree indexes on DOI, source_id,
+cluster_id and run_id; ``elis query`` looks records up from it.
+
+Indexing is incremental.  Files are discovered from run manifests
+(``*_manifest.json`` -> ``output_path``) and from canonical artefact names
+under the scanned roots; a file whose size and mtime are unchanged is skipped,
+one whose content hash is unchanged only has its stat refreshed, and only
+changed files have their rows replaced.  Files that disappeared are dropped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+from elis.jsonl_index import INDEX_SUFFIX
+from elis.normalise import normalise_doi
+
+DEFAULT_INDEX_PATH = ".cache/elis/corpus_index.sqlite"
+DEFAULT_ROOTS = ("runs", "json_jsonl", "dedup")
+SCHEMA_VERSION = 1
+
+_RUN_ID_FROM_PATH = re.compile(r"(?:^|/)runs/([^/]+)/")
+# Appendix row files: canonical ``ELIS_Appendix_<X>_<Name>_rows.json[l]`` and
+# the pipeline's ``appendix_<x>[_deduped|_enriched].json[l]``.  Config,
+# profile and report files that merely mention an appendix do not match.
+_APPENDIX_ROWS = re.compile(
+    r"^(?:elis_appendix_([abc])_\w*_rows|appendix_([abc])(?:_deduped|_enriched)?)"
+    r"\.jsonl?$"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    run_id TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    row_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    rowid INTEGER PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    run_id TEXT,
+    record_id TEXT,
+    source_id TEXT,
+    doi TEXT,
+    cluster_id TEXT,
+    source TEXT,
+    year INTEGER,
+    title TEXT,
+    abstract TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_file ON records(file_path);
+CREATE INDEX IF NOT EXISTS records_doi ON records(doi);
+CREATE INDEX IF NOT EXISTS records_source_id ON records(source_id);
+CREATE INDEX IF NOT EXISTS records_cluster_id ON records(cluster_id);
+CREATE INDEX IF NOT EXISTS records_run_id ON records(run_id);
+CREATE INDEX IF NOT EXISTS records_record_id ON records(record_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(
+    title, abstract, content='records', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS records_ai AFTER INSERT ON records BEGIN
+    INSERT INTO records_fts(rowid, title, abstract)
+    VALUES (new.rowid, new.title, new.abstract);
+END;
+CREATE TRIGGER IF NOT EXISTS records_ad AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts(records_fts, rowid, title, abstract)
+    VALUES ('delete', old.rowid, old.title, old.abstract);
+END;
+"""
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+
+def artefact_kind(path: Path) -> str | None:
+    """Classify an artefact file by name; ``None`` if it is not indexed."""
+    name = path.name.lower()
+    if name.endswith(("_manifest.json", INDEX_SUFFIX)) or path.suffix.lower() not in {
+        ".json",
+        ".jsonl",
+    }:
+        return None
+    match = _APPENDIX_ROWS.match(name)
+    if match:
+        return f"appendix_{match.group(1) or match.group(2)}"
+    if name.startswith("duplicates") or name.startswith("collisions"):
+        return "duplicates"
+    if name.startswith("asta_outputs"):
+        return "asta"
+    return None
+
+
+@dataclass(frozen=True)
+class IndexSource:
+    path: Path
+    kind: str
+    run_id: str | None
+
+
+def _run_id_from_path(path: Path) -> str | None:
+    match = _RUN_ID_FROM_PATH.search(path.as_posix())
+    return match.group(1) if match else None
+
+
+def _manifest_source(manifest_path: Path) -> IndexSource | None:
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or not manifest.get("output_path"):
+        return None
+    output = Path(str(manifest["output_path"]))
+    if not output.exists():
+        output = manifest_path.parent / output.name
+    if not output.is_file():
+        return None
+    kind = artefact_kind(output) or str(manifest.get("stage") or "") or None
+    if kind is None or output.suffix.lower() not in {".json", ".jsonl"}:
+        return None
+    return IndexSource(
+        output, kind, manifest.get("run_id") or _run_id_from_path(output)
+    )
+
+
+def discover_sources(roots: Iterable[str | Path]) -> list[IndexSource]:
+    """Artefacts named by run manifests or canonical file names under *roots*.
+
+    A manifest's ``run_id`` wins over one inferred from ``runs/<run_id>/``.
+    """
+    found: dict[Path, IndexSource] = {}
+    for root in roots:
+        root = Path(root)
+        if root.is_file():
+            candidates = [root]
+        elif root.is_dir():
+            candidates = sorted(root.rglob("*.json")) + sorted(root.rglob("*.jsonl"))
+        else:
+            continue
+        for path in candidates:
+            if path.name.endswith("_manifest.json"):
+                source = _manifest_source(path)
+                if source is not None:
+                    found[source.path.resolve()] = source
+                continue
+            kind = artefact_kind(path)
+            if kind is not None:
+                found.setdefault(
+                    path.resolve(), IndexSource(path, kind, _run_id_from_path(path))
+                )
+    return sorted(found.values(), key=lambda source: str(source.path))
+
+
+# ---------------------------------------------------------------------------
+# Row extraction
+# ---------------------------------------------------------------------------
+
+
+def _iter_rows(path: Path) -> Iterator[dict[str, Any]]:
+    """Data rows of a JSON array or JSONL file, skipping ``_meta`` headers."""
+    with path.open("r", encoding="utf-8") as handle:
+        head = handle.read(1)
+        while head and head.isspace():
+            head = handle.read(1)
+        handle.seek(0)
+        if head == "[":
+            rows = json.load(handle)
+            rows = rows if isinstance(rows, list) else []
+        else:
+            rows = (json.loads(line) for line in handle if line.strip())
+        for row in rows:
+            if isinstance(row, dict) and not row.get("_meta"):
+                yield row
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _year(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _record_values(
+    row: dict[str, Any], source: IndexSource, file_path: str
+) -> tuple[Any, ...]:
+    abstract = row.get("abstract")
+    if abstract is None and isinstance(row.get("evidence_spans"), list):
+        abstract = " ".join(
+            str(span.get("text", "")) if isinstance(span, dict) else str(span)
+            for span in row["evidence_spans"]
+        )
+    source_id = row.get("source_id") or row.get("screening_id")
+    return (
+        file_path,
+        source.kind,
+        _text(row.get("run_id")) or source.run_id,
+        _text(row.get("id") or row.get("record_id") or row.get("_stable_id")),
+        _text(source_id),
+        normalise_doi(_text(row.get("doi"))) or None,
+        _text(row.get("cluster_id")),
+        _text(row.get("source")),
+        _year(row.get("year")),
+        _text(row.get("title")),
+        _text(abstract),
+        json.dumps(row, ensure_ascii=False, sort_keys=True),
+    )
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class IndexStats:
+    files_seen: int = 0
+    files_indexed: int = 0
+    files_unchanged: int = 0
+    files_removed: int = 0
+    rows_indexed: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "files_seen": self.files_seen,
+            "files_indexed": self.files_indexed,
+            "files_unchanged": self.files_unchanged,
+            "files_removed": self.files_removed,
+            "rows_indexed": self.rows_indexed,
+            "errors": list(self.errors),
+        }
+
+
+@dataclass(frozen=True)
+class QueryHit:
+    kind: str
+    run_id: str | None
+    record_id: str | None
+    source_id: str | None
+    doi: str | None
+    cluster_id: str | None
+    title: str | None
+    file_path: str
+    score: float | None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "run_id": self.run_id,
+            "record_id": self.record_id,
+            "source_id": self.source_id,
+            "doi": self.doi,
+            "cluster_id": self.cluster_id,
+            "title": self.title,
+            "file_path": self.file_path,
+            "score": self.score,
+        }
+
+
+def fts_phrase_query(text: str) -> str:
+    """Plain words to an FTS5 query that ANDs each word as a literal token."""
+    words = re.findall(r"\w+", text)
+    return " ".join('"' + word.replace('"', '""') + '"' for word in words)
+
+
+class CorpusIndex:
+    """SQLite corpus index at *path*; use as a context manager or ``close()``."""
+
+    def __init__(self, path: str | Path = DEFAULT_INDEX_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute(
+            "INSERT OR IGNORE INTO meta(key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+        self.connection.commit()
+
+    def __enter__(self) -> CorpusIndex:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    # -- building ---------------------------------------------------------
+
+    def update(
+        self, roots: Sequence[str | Path] = DEFAULT_ROOTS, *, prune: bool = True
+    ) -> IndexStats:
+        """Index new or changed artefacts under *roots*; drop vanished files."""
+        stats = IndexStats()
+        sources = discover_sources(roots)
+        seen: set[str] = set()
+        for source in sources:
+            stats.files_seen += 1
+            key = str(source.path.resolve())
+            seen.add(key)
+            try:
+                self._update_file(source, key, stats)
+            except (OSError, ValueError) as exc:
+                self.connection.rollback()
+                stats.errors.append(f"{source.path}: {exc}")
+        if prune:
+            stats.files_removed = self._prune(seen, roots)
+        return stats
+
+    def _update_file(self, source: IndexSource, key: str, stats: IndexStats) -> None:
+        stat = source.path.stat()
+        known = self.connection.execute(
+            "SELECT size, mtime_ns, sha256, kind, run_id FROM files WHERE path = ?",
+            (key,),
+        ).fetchone()
+        if known and (known["kind"], known["run_id"]) == (source.kind, source.run_id):
+            if (known["size"], known["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                stats.files_unchanged += 1
+                return
+            digest = _sha256(source.path)
+            if digest == known["sha256"]:
+                with self.connection:
+                    self.connection.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                        (stat.st_size, stat.st_mtime_ns, key),
+                    )
+                stats.files_unchanged += 1
+                return
+        else:
+            digest = _sha256(source.path)
+
+        with self.connection:
+            self.connection.execute("DELETE FROM records WHERE file_path = ?", (key,))
+            count = 0
+            batch: list[tuple[Any, ...]] = []
+            for row in _iter_rows(source.path):
+                batch.append(_record_values(row, source, key))
+                if len(batch) >= 1000:
+                    count += self._insert(batch)
+            count += self._insert(batch)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files"
+                "(path, kind, run_id, size, mtime_ns, sha256, row_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    source.kind,
+                    source.run_id,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    digest,
+                    count,
+                ),
+            )
+        stats.files_indexed += 1
+        stats.rows_indexed += count
+
+    def _insert(self, batch: list[tuple[Any, ...]]) -> int:
+        if batch:
+            self.connection.executemany(
+                "INSERT INTO records(file_path, kind, run_id, record_id, source_id,"
+                " doi, cluster_id, source, year, title, abstract, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+        count = len(batch)
+        batch.clear()
+        return count
+
+    def _prune(self, seen: set[str], roots: Sequence[str | Path]) -> int:
+        """Forget indexed files under *roots* that were not found this time."""
+        prefixes = [str(Path(root).resolve()) for root in roots]
+        stale = [
+            path
+            for (path,) in self.connection.execute("SELECT path FROM files")
+            if path not in seen
+            and any(path == p or path.startswith(p.rstrip("/") + "/") for p in prefixes)
+        ]
+        with self.connection:
+            for path in stale:
+                self.connection.execute(
+                    "DELETE FROM records WHERE file_path = ?", (path,)
+                )
+                self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+        return len(stale)
+
+    # -- querying ---------------------------------------------------------
+
+    def query(
+        self,
+        text: str | None = None,
+        *,
+        doi: str | None = None,
+        source_id: str | None = None,
+        cluster_id: str | None = None,
+        record_id: str | None = None,
+        run_id: str | None = None,
+        kind: str | None = None,
+        raw_fts: bool = False,
+        limit: int = 20,
+    ) -> list[QueryHit]:
+        """Records matching every given filter; full-text hits ranked by bm25.
+
+        *text* is matched word-by-word as literal tokens unless *raw_fts* is
+        set, in which case it is passed through as FTS5 query syntax.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("r.source_id", source_id),
+            ("r.cluster_id", cluster_id),
+            ("r.record_id", record_id),
+            ("r.run_id", run_id),
+            ("r.kind", kind),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if doi:
+            clauses.append("r.doi = ?")
+            params.append(normalise_doi(doi))
+
+        match = (text if raw_fts else fts_phrase_query(text)) if text else ""
+        if match:
+            sql = (
+                "SELECT r.*, bm25(records_fts) AS score FROM records_fts"
+                " JOIN records r ON r.rowid = records_fts.rowid"
+                " WHERE records_fts MATCH ?"
+            )
+            params.insert(0, match)
+            order = " ORDER BY score, r.rowid"
+        else:
+            sql = "SELECT r.*, NULL AS score FROM records r WHERE 1 = 1"
+            order = " ORDER BY r.rowid"
+        if not match and not clauses:
+            raise ValueError("query needs search text or at least one filter")
+        for clause in clauses:
+            sql += f" AND {clause}"
+        sql += order + " LIMIT ?"
+        params.append(int(limit))
+        try:
+            rows = self.connection.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as exc:
+            raise ValueError(f"invalid full-text query {match!r}: {exc}") from exc
+        return [
+            QueryHit(
+                kind=row["kind"],
+                run_id=row["run_id"],
+                record_id=row["record_id"],
+                source_id=row["source_id"],
+                doi=row["doi"],
+                cluster_id=row["cluster_id"],
+                title=row["title"],
+                file_path=row["file_path"],
+                score=None if row["score"] is None else round(row["score"], 4),
+            )
+            for row in rows
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        kinds = {
+            row["kind"]: row["n"]
+            for row in self.connection.execute(
+                "SELECT kind, COUNT(*) AS n FROM records GROUP BY kind ORDER BY kind"
+            )
+        }
+        files = self.connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        return {"files": files, "records": sum(kinds.values()), "by_kind": kinds}
@@ -0,0 +1,163 @@
+"""Export of canonical run artefacts into the ``json_jsonl/`` compat view (PE6).
+
+Every JSON/JSONL file under ``runs/<run_id>/`` (manifest, offset-index
+and profile sidecars excluded) is placed flat in the export directory:
+
+- Destinations whose content already matches the source (same inode, or same
+  size and SHA-256) are left alone, so re-exporting a run writes nothing.
+- Changed files are materialised under a temporary name and swapped in with
+  ``os.replace``; a destination that is a hardlink into an older run is
+  therefore replaced, never written through.
+- ``mode`` selects how bytes are materialised: ``copy`` (default, always an
+  independent file), ``hardlink``, ``reflink`` (copy-on-write clone, e.g.
+  Btrfs/XFS), or ``auto`` (reflink, then hardlink, then copy).  Linked exports
+  are near-instant and take no extra space, but a hardlinked export shares
+  its bytes with the run: edit exported files only by replacing them.
+- ``LATEST_RUN_ID.txt`` is switched atomically after all files are in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+
+LATEST_RUN_ID_FILE = "LATEST_RUN_ID.txt"
+EXPORT_MODES = ("copy", "hardlink", "reflink", "auto")
+_SKIPPED_SUFFIXES = ("_manifest.json", ".idx.json", "_profile.json")
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+class ExportError(RuntimeError):
+    """Raised when a requested link mode is impossible for a file."""
+
+
+@dataclass(frozen=True)
+class ExportedFile:
+    source: Path
+    destination: Path
+    action: str  # "copied" | "hardlinked" | "reflinked" | "unchanged"
+
+
+@dataclass
+class ExportResult:
+    run_id: str
+    files: list[ExportedFile] = field(default_factory=list)
+
+    def count(self, action: str) -> int:
+        return sum(1 for item in self.files if item.action == action)
+
+    @property
+    def written(self) -> int:
+        return sum(1 for item in self.files if item.action != "unchanged")
+
+
+def run_artefacts(run_path: Path) -> list[Path]:
+    """JSON then JSONL files under *run_path*, sorted, without sidecars."""
+    return [
+        path
+        for path in sorted(run_path.rglob("*.json")) + sorted(run_path.rglob("*.jsonl"))
+        if not path.name.endswith(_SKIPPED_SUFFIXES)
+    ]
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def same_content(source: Path, destination: Path) -> bool:
+    """True when *destination* already holds exactly the bytes of *source*."""
+    try:
+        if os.path.samefile(source, destination):
+            return True
+        if source.stat().st_size != destination.stat().st_size:
+            return False
+    except FileNotFoundError:
+        return False
+    return _sha256(source) == _sha256(destination)
+
+
+def _reflink(source: Path, target: Path) -> None:
+    import fcntl
+
+    with source.open("rb") as src, target.open("wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            target.unlink()
+            raise
+    shutil.copystat(source, target)
+
+
+def _materialise(source: Path, target: Path, mode: str) -> str:
+    """Create *target* from *source*; return the action actually taken."""
+    attempts = {
+        "copy": ("copied",),
+        "hardlink": ("hardlinked",),
+        "reflink": ("reflinked",),
+        "auto": ("reflinked", "hardlinked", "copied"),
+    }[mode]
+    errors = []
+    for action in attempts:
+        try:
+            if action == "reflinked":
+                _reflink(source, target)
+            elif action == "hardlinked":
+                os.link(source, target)
+            else:
+                shutil.copy2(source, target)
+            return action
+        except (OSError, ImportError) as exc:
+            errors.append(f"{action[:-2]}: {exc}")
+    raise ExportError(f"Cannot export {source} ({'; '.join(errors)})")
+
+
+def export_file(source: Path, destination: Path, mode: str = "copy") -> str:
+    """Place *source* at *destination* unless it is already identical."""
+    if same_content(source, destination):
+        return "unchanged"
+    tmp = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        action = _materialise(source, tmp, mode)
+        os.replace(tmp, destination)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return action
+
+
+def write_latest_run_id(export_dir: Path, run_id: str) -> Path:
+    """Atomically point ``LATEST_RUN_ID.txt`` at *run_id*."""
+    target = export_dir / LATEST_RUN_ID_FILE
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as handle:
+        handle.write(run_id + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, target)
+    return target
+
+
+def export_run(
+    run_path: Path, export_dir: Path, run_id: str, *, mode: str = "copy"
+) -> ExportResult:
+    """Export *run_path* into *export_dir* and switch ``LATEST_RUN_ID.txt``."""
+    if mode not in EXPORT_MODES:
+        raise ValueError(f"mode must be one of {EXPORT_MODES}, got {mode!r}")
+    export_dir.mkdir(parents=True, exist_ok=True)
+    result = ExportResult(run_id=run_id)
+    for source in run_artefacts(run_path):
+        destination = export_dir / source.name
+        action = export_file(source, destination, mode)
+        result.files.append(ExportedFile(source, destination, action))
+    write_latest_run_id(export_dir, run_id)
+    return result
@@ -33,6 +33,7 @@ from elis.synthesis_offhost_contract import (
 )
 from elis.workload_placement_policy import (
     DEFAULT_WORKLOAD_PLACEMENT_POLICY,
+    LocalAdmissionController,
     WorkloadPlacementPolicy,
     enforce_local_workload_request,
     report_workload_classes,
@@ -144,6 +145,7 @@ def run_hybrid_slr_flow(
     commit_sha: str,
     generated_at: str,
     policy: WorkloadPlacementPolicy = DEFAULT_WORKLOAD_PLACEMENT_POLICY,
+    admission: LocalAdmissionController | None = None,
 ) -> HybridFlowResult:
     """Run one representative hybrid SLR flow and return the aggregated result.
 
@@ -162,32 +164,41 @@ def run_hybrid_slr_flow(
     )
 
     # Phase 2 — local screening
-    screening_decision = enforce_local_workload_request(
-        "screening",
-        requested_concurrency=1,
-        current_local_jobs=0,
-        policy=policy,
-    )
+    if admission is not None:
+        # Host-wide gate: the decision reflects real running jobs and load.
+        with admission.slot("screening") as ticket:
+            screening_decision = ticket.decision
+    else:
+        screening_decision = enforce_local_workload_request(
+            "screening",
+            requested_concurrency=1,
+            current_local_jobs=0,
+            policy=policy,
+        )
     if not screening_decision["allowed"]:
         raise RuntimeError("Screening was unexpectedly deferred during hybrid flow")
 
     # Phase 3 — local support-agent (bibliometric clustering)
     #   Screening is sequential and has completed; the local slot is free.
     #   Honour the admission result: only run clustering if admitted.
-    support_agent_admission = enforce_local_workload_request(
-        "bibliometric-preanalysis",
-        requested_concurrency=1,
-        current_local_jobs=0,
-        policy=policy,
-    )
-    if support_agent_admission["allowed"]:
-        clusters = cluster_by_title_similarity(
+    def _cluster() -> list[Any]:
+        return cluster_by_title_similarity(
             screening_records,
             threshold=0.5,
             max_records=policy.max_local_concurrency * 500,
         )
+
+    if admission is not None:
+        with admission.slot("bibliometric-preanalysis"):
+            clusters = _cluster()
     else:
-        clusters = []
+        support_agent_admission = enforce_local_workload_request(
+            "bibliometric-preanalysis",
+            requested_concurrency=1,
+            current_local_jobs=0,
+            policy=policy,
+        )
+        clusters = _cluster() if support_agent_admission["allowed"] else []
 
     # Phase 4a — off-host extraction
     extraction_envelope = ExtractionWorkflowEnvelope(
@@ -0,0 +1,426 @@
+"""Byte-offset index sidecars for large JSONL artefacts.
+
+``dedup/duplicates.jsonl``, ``asta_outputs.jsonl`` and the ASTA request /
+response logs can only be read by scanning the whole file.  A JSONL index is a
+pair of sidecars next to the data file:
+
+- ``<file>.idx.json``, a small header checked before the index is used::
+
+    {
+      "format": "elis-jsonl-index",
+      "version": 2,
+      "source": "duplicates.jsonl",
+      "size": 48213,
+      "mtime_ns": 1739000000000000000,
+      "tail_sha256": "...",
+      "rows": 3,
+      "data_size": 164,
+      "fields": {"cluster_id": {"keys": 2, "table": 24, "postings": 64,
+                                "strings": 76}, ...}
+    }
+
+- ``<file>.idx.bin``, fixed-width little-endian arrays: the byte offset of
+  every row (``u64``), then per key field a table of its distinct values
+  sorted by UTF-8 bytes (``u64`` string offset, ``u32`` length, ``u32`` first
+  posting, ``u32`` posting count), the row numbers of each value (``u32``) and
+  the value strings.
+
+``JsonlIndexReader`` memory-maps the data file and ``<file>.idx.bin``, so
+opening it reads only the header and a key lookup is a binary search over the
+sorted table: jumping from a keeper to its duplicates or evidence rows costs
+O(log keys) instead of O(file), and only the requested rows are parsed.  A
+stale sidecar is rebuilt; one left behind by an append-only writer (the ASTA
+logs) is extended from its last indexed row.  Key fields may be dotted paths
+into nested objects (``payload.id``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+INDEX_FORMAT = "elis-jsonl-index"
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".idx.json"
+INDEX_DATA_SUFFIX = ".idx.bin"
+DEFAULT_KEY_FIELDS = ("cluster_id", "record_id", "id", "duplicate_of")
+DUPLICATES_KEY_FIELDS = ("cluster_id", "duplicate_of", "id")
+ASTA_OUTPUTS_KEY_FIELDS = ("record_id",)
+# ASTA adapter audit logs (runs/<run_id>/asta/*.jsonl): JSON-RPC request ids
+# pair requests with responses.
+ASTA_LOG_KEY_FIELDS = ("operation", "payload.id", "response.id")
+ASTA_LOG_NAMES = (
+    "requests.jsonl",
+    "responses.jsonl",
+    "normalized_records.jsonl",
+    "errors.jsonl",
+)
+
+
+def index_path_for(path: str | Path) -> Path:
+    """Sidecar path for *path* (``duplicates.jsonl`` -> ``duplicates.jsonl.idx.json``)."""
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def index_data_path_for(path: str | Path) -> Path:
+    """Binary sidecar for *path* (``duplicates.jsonl`` -> ``duplicates.jsonl.idx.bin``)."""
+    path = Path(path)
+    return path.with_name(path.name + INDEX_DATA_SUFFIX)
+
+
+_OFFSET = struct.Struct("<Q")
+# Per distinct key value: string offset, string length, first posting, count.
+_ENTRY = struct.Struct("<QIII")
+_POSTING = struct.Struct("<I")
+
+
+def _pack(code: str, values: Sequence[int]) -> bytes:
+    return struct.pack(f"<{len(values)}{code}", *values)
+
+
+class _KeyTable:
+    """Sorted key table of one field inside ``.idx.bin``; a bisectable sequence."""
+
+    def __init__(self, data: Any, spec: dict[str, int]) -> None:
+        self.data = data
+        self.table = spec["table"]
+        self.postings = spec["postings"]
+        self.strings = spec["strings"]
+        self.size = spec["keys"]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _entry(self, index: int) -> tuple[int, int, int, int]:
+        return _ENTRY.unpack_from(self.data, self.table + index * _ENTRY.size)
+
+    def __getitem__(self, index: int) -> bytes:
+        offset, length, _start, _count = self._entry(index)
+        start = self.strings + offset
+        return bytes(self.data[start : start + length])
+
+    def rows(self, index: int) -> list[int]:
+        _offset, _length, start, count = self._entry(index)
+        position = self.postings + start * _POSTING.size
+        return list(struct.unpack_from(f"<{count}I", self.data, position))
+
+    def find(self, key: bytes) -> list[int]:
+        index = bisect_left(self, key)
+        if index < self.size and self[index] == key:
+            return self.rows(index)
+        return []
+
+
+def _lookup(row: dict[str, Any], field: str) -> Any:
+    value: Any = row
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+class _IndexBuilder:
+    """Accumulates offsets and key maps while rows are written or scanned."""
+
+    def __init__(self, key_fields: Sequence[str]) -> None:
+        self.key_fields = list(key_fields)
+        self.offsets: list[int] = []
+        self.keys: dict[str, dict[str, list[int]]] = {f: {} for f in self.key_fields}
+
+    @classmethod
+    def from_index(cls, header: dict[str, Any], data: bytes) -> _IndexBuilder:
+        """Builder holding the rows of an existing index, ready to extend it."""
+        builder = cls(list(header["fields"]))
+        builder.offsets = list(struct.unpack_from(f"<{header['rows']}Q", data))
+        for field, spec in header["fields"].items():
+            table = _KeyTable(data, spec)
+            builder.keys[field] = {
+                table[i].decode("utf-8"): table.rows(i) for i in range(len(table))
+            }
+        return builder
+
+    def add(self, offset: int, line: bytes) -> None:
+        """Index a line read back from disk."""
+        row: Any = None
+        if line.strip():
+            try:
+                row = json.loads(line)
+            except ValueError:
+                pass  # a torn trailing write; the row stays addressable by number
+        self.add_row(offset, row)
+
+    def add_row(self, offset: int, row: Any) -> None:
+        """Index *row*, already parsed (or being written), starting at *offset*."""
+        row_number = len(self.offsets)
+        self.offsets.append(offset)
+        if not isinstance(row, dict):
+            return
+        for field in self.key_fields:
+            value = _lookup(row, field)
+            if value is not None and value != "":
+                self.keys[field].setdefault(str(value), []).append(row_number)
+
+    def scan(self, handle: Any, start: int) -> int:
+        """Index complete lines from byte *start*; return the end of the last one."""
+        handle.seek(start)
+        position = start
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break  # incomplete final line; picked up once it is finished
+            self.add(position, line)
+            position += len(line)
+        return position
+
+    def write(self, source: Path, size: int, tail: bytes) -> dict[str, Any]:
+        """Write ``.idx.bin``, then the ``.idx.json`` header; return the header."""
+        chunks = [_pack("Q", self.offsets)]
+        position = len(chunks[0])
+        fields: dict[str, dict[str, int]] = {}
+        for field in self.key_fields:
+            entries = sorted(
+                (key.encode("utf-8"), rows) for key, rows in self.keys[field].items()
+            )
+            table = bytearray()
+            strings = bytearray()
+            postings: list[int] = []
+            for key, rows in entries:
+                table += _ENTRY.pack(len(strings), len(key), len(postings), len(rows))
+                strings += key
+                postings.extend(rows)
+            packed = _pack("I", postings)
+            fields[field] = {
+                "keys": len(entries),
+                "table": position,
+                "postings": position + len(table),
+                "strings": position + len(table) + len(packed),
+            }
+            chunks += [bytes(table), packed, bytes(strings)]
+            position += len(table) + len(packed) + len(strings)
+
+        _replace(index_data_path_for(source), b"".join(chunks))
+        header = {
+            "format": INDEX_FORMAT,
+            "version": INDEX_VERSION,
+            "source": source.name,
+            "size": size,
+            "mtime_ns": source.stat().st_mtime_ns,
+            "tail_sha256": hashlib.sha256(tail).hexdigest(),
+            "rows": len(self.offsets),
+            "data_size": position,
+            "fields": fields,
+        }
+        _replace(index_path_for(source), json.dumps(header, indent=2).encode("utf-8"))
+        return header
+
+
+def _last_line(handle: Any, offsets: list[int], size: int) -> bytes:
+    if not offsets:
+        return b""
+    handle.seek(offsets[-1])
+    return handle.read(size - offsets[-1])
+
+
+def _replace(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _read_header(path: Path) -> dict[str, Any] | None:
+    """The index header of *path*, or ``None`` if missing or unusable."""
+    try:
+        header = json.loads(index_path_for(path).read_text(encoding="utf-8"))
+        data_size = index_data_path_for(path).stat().st_size
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(header, dict)
+        or header.get("format") != INDEX_FORMAT
+        or header.get("version") != INDEX_VERSION
+        or header.get("data_size") != data_size
+    ):
+        return None
+    return header
+
+
+def _build(path: Path, key_fields: Sequence[str]) -> dict[str, Any]:
+    builder = _IndexBuilder(key_fields)
+    with path.open("rb") as handle:
+        size = builder.scan(handle, 0)
+        tail = _last_line(handle, builder.offsets, size)
+    return builder.write(path, size, tail)
+
+
+def build_jsonl_index(
+    path: str | Path, key_fields: Sequence[str] = DEFAULT_KEY_FIELDS
+) -> Path:
+    """Scan *path* and write its index sidecars from scratch."""
+    path = Path(path)
+    _build(path, key_fields)
+    return index_path_for(path)
+
+
+def write_jsonl_with_index(
+    path: str | Path,
+    rows: Iterable[dict[str, Any]],
+    key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+) -> Path:
+    """Write *rows* as JSONL and its index sidecar in one pass."""
+    path = Path(path)
+    builder = _IndexBuilder(key_fields)
+    position = 0
+    line = b""
+    with path.open("wb") as handle:
+        for row in rows:
+            line = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+            handle.write(line)
+            builder.add_row(position, row)
+            position += len(line)
+    builder.write(path, position, line)
+    return path
+
+
+def ensure_jsonl_index(
+    path: str | Path, key_fields: Sequence[str] = DEFAULT_KEY_FIELDS
+) -> dict[str, Any]:
+    """Return the header of a current index for *path*, extending or rebuilding it.
+
+    The sidecars are reused when the file is unchanged, extended when the file
+    only grew past a still-intact last indexed row (append-only logs), and
+    rebuilt otherwise or when *key_fields* are not all indexed.
+    """
+    path = Path(path)
+    header = _read_header(path)
+    if header is None:
+        return _build(path, key_fields)
+    fields = list(header["fields"])
+    if not set(key_fields) <= set(fields):
+        return _build(path, list(dict.fromkeys([*fields, *key_fields])))
+    stat = path.stat()
+    if (header["size"], header["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+        return header
+    if stat.st_size >= header["size"]:
+        data = index_data_path_for(path).read_bytes()
+        builder = _IndexBuilder.from_index(header, data)
+        with path.open("rb") as handle:
+            tail = _last_line(handle, builder.offsets, header["size"])
+            if hashlib.sha256(tail).hexdigest() == header["tail_sha256"]:
+                size = builder.scan(handle, header["size"])
+                tail = _last_line(handle, builder.offsets, size)
+                return builder.write(path, size, tail)
+    return _build(path, fields)
+
+
+def index_asta_logs(log_dir: str | Path) -> list[Path]:
+    """Create or refresh index sidecars for the ASTA audit logs in *log_dir*.
+
+    The adapter appends to these logs on every call, so they are indexed on
+    demand (here or by ``JsonlIndexReader``) rather than on each write.
+    """
+    indexed = []
+    for name in ASTA_LOG_NAMES:
+        path = Path(log_dir) / name
+        if path.exists():
+            ensure_jsonl_index(path, ASTA_LOG_KEY_FIELDS)
+            indexed.append(index_path_for(path))
+    return indexed
+
+
+class JsonlIndexReader:
+    """Random access to rows of an indexed JSONL file via ``mmap``.
+
+    Use as a context manager.  Rows are returned as parsed dicts; only the
+    requested rows are decoded.
+    """
+
+    def __init__(
+        self, path: str | Path, key_fields: Sequence[str] = DEFAULT_KEY_FIELDS
+    ) -> None:
+        self.path = Path(path)
+        self.index = ensure_jsonl_index(self.path, key_fields)
+        self._rows = int(self.index["rows"])
+        self._end = int(self.index["size"])
+        self._handles = [self.path.open("rb")]
+        self._map: mmap.mmap | None = None
+        self._data: mmap.mmap | bytes = b""
+        if self._end:
+            self._map = mmap.mmap(self._handles[0].fileno(), 0, access=mmap.ACCESS_READ)
+        if self.index["data_size"]:
+            self._handles.append(index_data_path_for(self.path).open("rb"))
+            self._data = mmap.mmap(
+                self._handles[1].fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+    def __enter__(self) -> JsonlIndexReader:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+            self._data = b""
+        for handle in self._handles:
+            handle.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def _offset(self, row_number: int) -> int:
+        return _OFFSET.unpack_from(self._data, row_number * _OFFSET.size)[0]
+
+    def raw(self, row_number: int) -> bytes:
+        """Bytes of one row without its newline."""
+        if self._map is None or not 0 <= row_number < self._rows:
+            raise IndexError(row_number)
+        start = self._offset(row_number)
+        if row_number + 1 < self._rows:
+            end = self._offset(row_number + 1)
+        else:
+            end = self._end
+        return self._map[start:end].rstrip(b"\r\n")
+
+    def row(self, row_number: int) -> dict[str, Any]:
+        return json.loads(self.raw(row_number))
+
+    def _table(self, field: str) -> _KeyTable:
+        try:
+            return _KeyTable(self._data, self.index["fields"][field])
+        except KeyError:
+            raise KeyError(f"{self.path.name} is not indexed by {field!r}") from None
+
+    def row_numbers(self, field: str, value: Any) -> list[int]:
+        return self._table(field).find(str(value).encode("utf-8"))
+
+    def get(self, field: str, value: Any) -> list[dict[str, Any]]:
+        """All rows whose *field* equals *value*, in file order."""
+        return [self.row(n) for n in self.row_numbers(field, value)]
+
+    def first(self, field: str, value: Any) -> dict[str, Any] | None:
+        numbers = self.row_numbers(field, value)
+        return self.row(numbers[0]) if numbers else None
+
+    def keys(self, field: str) -> list[str]:
+        """Distinct values of *field*, sorted by their UTF-8 bytes."""
+        if field not in self.index["fields"]:
+            return []
+        table = self._table(field)
+        return [table[i].decode("utf-8") for i in range(len(table))]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for row_number in range(self._rows):
+            raw = self.raw(row_number)
+            if raw.strip():
+                yield json.loads(raw)
@@ -1,13 +1,14 @@
-"""Run manifest writer utility for PE1a."""
+"""Run manifest writer utility for PE1a.
+
+Heavier stdlib modules (``subprocess``, ``importlib.metadata``,
+``platform``) are imported inside the functions that need them so that
+importing this module stays cheap for every ``elis`` invocation.
+"""
 
 from __future__ import annotations
 
 import hashlib
-import importlib
-import importlib.metadata
 import json
-import platform
-import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping, Sequence
@@ -36,6 +37,8 @@ def now_utc_iso() -> str:
 
 def short_commit_sha() -> str:
     """Return short git SHA when available; otherwise a schema-valid placeholder."""
+    import subprocess
+
     try:
         out = subprocess.check_output(
             ["git", "rev-parse", "--short", "HEAD"],
@@ -51,6 +54,8 @@ def short_commit_sha() -> str:
 
 def _package_version() -> str:
     """Return installed package version, with a safe fallback for local runs."""
+    import importlib.metadata
+
     try:
         return importlib.metadata.version("elis-slr-agent")
     except importlib.metadata.PackageNotFoundError:
@@ -60,24 +65,11 @@ def _package_version() -> str:
 def _collect_adapter_versions() -> dict[str, str]:
     """Return adapter version mapping (source -> version string)."""
     try:
-        from elis.sources import available_sources, get_adapter
+        from elis.sources import adapter_versions
     except Exception:
         return {"unknown": "unknown"}
 
-    versions: dict[str, str] = {}
-    for source in available_sources():
-        try:
-            adapter_cls = get_adapter(source)
-            module = importlib.import_module(adapter_cls.__module__)
-            version = (
-                getattr(module, "__version__", None)
-                or getattr(module, "ADAPTER_VERSION", None)
-                or "builtin"
-            )
-            versions[source] = str(version)
-        except Exception:
-            versions[source] = "unknown"
-    return versions or {"unknown": "unknown"}
+    return adapter_versions() or {"unknown": "unknown"}
 
 
 def sha256_json(payload: Mapping[str, Any]) -> str:
@@ -122,8 +114,15 @@ def emit_run_manifest(
     started_at: str | None = None,
     finished_at: str | None = None,
     manifest_path: str | Path | None = None,
+    stage_report: Mapping[str, Any] | None = None,
 ) -> Path:
-    """Build and write a run manifest sidecar for a pipeline stage."""
+    """Build and write a run manifest sidecar for a pipeline stage.
+
+    *stage_report* carries optional stage-specific run statistics (e.g.
+    harvest saturation stops) and is omitted from the manifest when unset.
+    """
+    import platform
+
     out_path = Path(output_path)
     target = (
         Path(manifest_path) if manifest_path else manifest_path_for_output(out_path)
@@ -159,4 +158,6 @@ def emit_run_manifest(
         "adapter_versions": dict(adapter_versions or _collect_adapter_versions()),
         "tool_versions": {"python": platform.python_version()},
     }
+    if stage_report is not None:
+        manifest["stage_report"] = dict(stage_report)
     return write_manifest(manifest, target)
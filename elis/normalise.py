@@ -0,0 +1,142 @@
+"""Shared string normalisation for merge, dedup, search and imports.
+
+One precompiled implementation of each normaliser the stages key records on,
+so ``re`` never re-resolves a pattern per call and every stage agrees on the
+exact same output:
+
+==================  =====================================================
+``collapse_ws``     strip, collapse whitespace runs to one space
+``normalise_doi``   lowercase, drop ``https://doi.org/`` / ``doi:`` prefix
+``normalise_text``  lowercase, delete punctuation, collapse (dedup keys)
+``normalise_title`` lowercase, punctuation -> space, collapse (stable ids)
+``normalise_alnum`` lowercase, keep only ``[a-z0-9]`` and spaces
+==================  =====================================================
+
+``normalise_many(values, kind)`` normalises a whole column: each distinct
+value is processed once, and the regex passes run over all of them joined
+into one string rather than once per value.  ``collapse_ws_cached`` and
+``normalise_text_cached`` memoise the scalar forms for short, highly
+repeated values such as author names, venues and query topics.
+
+Outputs are part of the on-disk contract (dedup cluster ids, ``_stable_id``),
+so changing a normaliser changes ids: treat this module as frozen behaviour.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Callable, Iterable
+
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "doi:")
+MEMO_SIZE = 1 << 16
+
+_WS = re.compile(r"\s+")
+_PUNCT = re.compile(r"[^\w\s]")
+_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+# Batch forms: NUL separates values in a joined column and must survive.
+_SEP = "\x00"
+_PUNCT_BATCH = re.compile(r"[^\w\s\x00]")
+_NON_ALNUM_BATCH = re.compile(r"[^a-z0-9\s\x00]")
+
+
+# ---------------------------------------------------------------------------
+# Scalar normalisers
+# ---------------------------------------------------------------------------
+
+
+def collapse_ws(value: str | None) -> str:
+    """Strip and collapse internal whitespace runs to a single space."""
+    if not value:
+        return ""
+    return _WS.sub(" ", value.strip())
+
+
+def normalise_doi(doi: str | None) -> str:
+    """Normalise a DOI to its bare lowercase form (no prefix)."""
+    value = (doi or "").strip().lower()
+    for prefix in DOI_PREFIXES:
+        if value.startswith(prefix):
+            return value[len(prefix) :]
+    return value
+
+
+def normalise_text(text: str | None) -> str:
+    """Lowercase, strip punctuation, collapse whitespace."""
+    if not text:
+        return ""
+    return _WS.sub(" ", _PUNCT.sub("", text.lower())).strip()
+
+
+def normalise_title(title: str | None) -> str:
+    """Lowercase, replace punctuation with spaces, collapse whitespace."""
+    if not title:
+        return ""
+    return _WS.sub(" ", _PUNCT.sub(" ", title.lower())).strip()
+
+
+def normalise_alnum(text: str | None) -> str:
+    """Lowercase and keep only ASCII letters, digits and single spaces."""
+    if not text:
+        return ""
+    return _WS.sub(" ", _NON_ALNUM.sub("", text.lower())).strip()
+
+
+collapse_ws_cached = lru_cache(maxsize=MEMO_SIZE)(collapse_ws)
+normalise_text_cached = lru_cache(maxsize=MEMO_SIZE)(normalise_text)
+
+
+# ---------------------------------------------------------------------------
+# Batch (column) API
+# ---------------------------------------------------------------------------
+
+
+def _joined_kernel(
+    pattern: re.Pattern[str] | None, replacement: str, lower: bool
+) -> Callable[[list[str]], list[str]]:
+    def kernel(values: list[str]) -> list[str]:
+        joined = _SEP.join(values)
+        if lower:
+            joined = joined.lower()
+        if pattern is not None:
+            joined = pattern.sub(replacement, joined)
+        return [part.strip() for part in _WS.sub(" ", joined).split(_SEP)]
+
+    return kernel
+
+
+_SCALAR: dict[str, Callable[[str | None], str]] = {
+    "ws": collapse_ws,
+    "doi": normalise_doi,
+    "text": normalise_text,
+    "title": normalise_title,
+    "alnum": normalise_alnum,
+}
+_KERNELS: dict[str, Callable[[list[str]], list[str]]] = {
+    "ws": _joined_kernel(None, "", lower=False),
+    "doi": lambda values: [normalise_doi(value) for value in values],
+    "text": _joined_kernel(_PUNCT_BATCH, "", lower=True),
+    "title": _joined_kernel(_PUNCT_BATCH, " ", lower=True),
+    "alnum": _joined_kernel(_NON_ALNUM_BATCH, "", lower=True),
+}
+NORMALISERS = tuple(_SCALAR)
+
+
+def normalise_many(values: Iterable[str | None], kind: str = "text") -> list[str]:
+    """Normalise a column of values; ``result[i] == <kind normaliser>(values[i])``.
+
+    *kind* is one of :data:`NORMALISERS`.  Falsy values map to ``""``.
+    """
+    try:
+        kernel = _KERNELS[kind]
+    except KeyError:
+        raise ValueError(f"kind must be one of {NORMALISERS}, got {kind!r}") from None
+    column = list(values)
+    distinct = list(dict.fromkeys(value for value in column if value))
+    if any(_SEP in value for value in distinct):
+        scalar = _SCALAR[kind]
+        normalised = [scalar(value) for value in distinct]
+    else:
+        normalised = kernel(distinct) if distinct else []
+    lookup = dict(zip(distinct, normalised))
+    return [lookup[value] if value else "" for value in column]
@@ -0,0 +1,411 @@
+"""Typed, cached model of the CURRENT_PE.md coordination file.
+
+CURRENT_PE.md is read by the sequencer, the PM scripts, the check gates and
+the runners.  They all look at the same four sections:
+
+- ``## Release context`` and ``## Current PE``: two-column Field/Value tables.
+- ``## Agent roles``: an Agent/Role table.
+- ``## Active PE Registry``: the multi-column registry of every PE.
+
+This module is the single parser for that layout.  ``load_current_pe``
+caches the parsed document in-process, keyed by path, mtime and size.  When
+``ELIS_PE_REGISTRY_SNAPSHOT`` names a JSON file, the parse is also persisted
+there, keyed by the sha256 of the source text, so short-lived scripts in the
+same checkout can skip it.  ``read_text_cached`` gives the same mtime-keyed
+caching to LESSONS_LEARNED.md and the REVIEW files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping
+
+RELEASE_HEADING = "## Release context"
+CURRENT_PE_HEADING = "## Current PE"
+ROLES_HEADING = "## Agent roles"
+REGISTRY_HEADING = "## Active PE Registry"
+
+SNAPSHOT_ENV = "ELIS_PE_REGISTRY_SNAPSHOT"
+SNAPSHOT_VERSION = 1
+
+FIELD_ROW_RE = re.compile(r"^\|\s*(?P<field>[^|]+?)\s*\|\s*(?P<value>[^|]+?)\s*\|$")
+
+
+class RegistryError(ValueError):
+    """Raised when the Active PE Registry table is missing or malformed."""
+
+
+# ---------------------------------------------------------------------------
+# Table primitives
+# ---------------------------------------------------------------------------
+
+
+def split_row(line: str) -> list[str]:
+    """Split a markdown table row into stripped cell values."""
+    return [part.strip() for part in line.strip().strip("|").split("|")]
+
+
+def table_block(lines: list[str], heading: str) -> list[str]:
+    """Return the first contiguous block of ``|`` lines under *heading*.
+
+    The heading match is case-insensitive.  Blank lines and prose between
+    the heading and the table are skipped; the block ends at the first
+    blank or non-table line after it.  Returns ``[]`` when the heading is
+    absent.
+    """
+    target = heading.strip().lower()
+    start = None
+    for idx, line in enumerate(lines):
+        if line.strip().lower() == target:
+            start = idx + 1
+            break
+    if start is None:
+        return []
+
+    block: list[str] = []
+    for line in lines[start:]:
+        stripped = line.strip()
+        if not stripped:
+            if block:
+                break
+            continue
+        if stripped.startswith("|"):
+            block.append(stripped)
+            continue
+        if block:
+            break
+    return block
+
+
+def parse_registry_table(content: str) -> tuple[list[str], list[list[str]]]:
+    """Return ``(header, rows)`` of the Active PE Registry as raw cell lists.
+
+    The header keeps its original case so callers can rewrite the table.
+    Raises ``RegistryError`` when the section, the table or a row is
+    malformed.
+    """
+    lines = content.splitlines()
+    if not any(line.strip().lower() == REGISTRY_HEADING.lower() for line in lines):
+        raise RegistryError("Active PE Registry table not found.")
+    block = table_block(lines, REGISTRY_HEADING)
+    if len(block) < 3:
+        raise RegistryError("Active PE Registry table missing or malformed.")
+
+    header = split_row(block[0])
+    rows: list[list[str]] = []
+    for raw in block[2:]:
+        values = split_row(raw)
+        if len(values) != len(header):
+            raise RegistryError("Active PE Registry row has wrong column count.")
+        rows.append(values)
+    return header, rows
+
+
+def parse_registry(content: str) -> tuple[list[str], list[dict[str, str]]]:
+    """Return ``(lowercased header, row dicts)`` of the Active PE Registry."""
+    header, rows = parse_registry_table(content)
+    columns = [col.lower() for col in header]
+    return columns, [dict(zip(columns, values)) for values in rows]
+
+
+def _parse_sections(content: str) -> dict[str, dict[str, str]]:
+    """Map each lowercased ``## `` heading to its two-column Field/Value rows.
+
+    Only the first occurrence of a field within a section is kept.
+    """
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    for line in content.splitlines():
+        stripped = line.strip()
+        if line.startswith("## "):
+            current = sections.setdefault(stripped.lower(), {})
+            continue
+        if current is None:
+            continue
+        match = FIELD_ROW_RE.match(stripped)
+        if match:
+            current.setdefault(match.group("field").strip(), match.group("value"))
+    return sections
+
+
+def section_value(content: str, heading: str, field_name: str) -> str | None:
+    """Return *field_name* from the Field/Value table under *heading*."""
+    return _parse_sections(content).get(heading.strip().lower(), {}).get(field_name)
+
+
+# ---------------------------------------------------------------------------
+# Typed model
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RegistryRow:
+    """One Active PE Registry row; *columns* is the lowercased header."""
+
+    columns: tuple[str, ...]
+    values: tuple[str, ...]
+
+    def get(self, column: str, default: str = "") -> str:
+        try:
+            return self.values[self.columns.index(column)]
+        except ValueError:
+            return default
+
+    def as_dict(self) -> dict[str, str]:
+        return dict(zip(self.columns, self.values))
+
+    @property
+    def pe_id(self) -> str:
+        return self.get("pe-id")
+
+    @property
+    def domain(self) -> str:
+        return self.get("domain")
+
+    @property
+    def implementer(self) -> str:
+        return self.get("implementer-agentid")
+
+    @property
+    def validator(self) -> str:
+        return self.get("validator-agentid")
+
+    @property
+    def branch(self) -> str:
+        return self.get("branch")
+
+    @property
+    def status(self) -> str:
+        return self.get("status")
+
+    @property
+    def last_updated(self) -> str:
+        return self.get("last-updated")
+
+
+@dataclass(frozen=True)
+class CurrentPEDocument:
+    """Parsed CURRENT_PE.md.
+
+    ``registry_error`` holds the ``RegistryError`` message when the registry
+    table could not be parsed; the Field/Value sections are still usable.
+    """
+
+    sections: dict[str, dict[str, str]] = field(default_factory=dict)
+    header: tuple[str, ...] = ()
+    rows: tuple[RegistryRow, ...] = ()
+    registry_error: str | None = None
+
+    # -- Field/Value sections -------------------------------------------
+
+    def section_value(self, heading: str, field_name: str) -> str | None:
+        return self.sections.get(heading.strip().lower(), {}).get(field_name)
+
+    def field_value(self, field_name: str) -> str | None:
+        """Return *field_name* from the first section that defines it."""
+        for values in self.sections.values():
+            if field_name in values:
+                return values[field_name]
+        return None
+
+    # -- Registry -------------------------------------------------------
+
+    def registry(self) -> tuple[list[str], list[dict[str, str]]]:
+        """Return ``(lowercased header, row dicts)`` or raise ``RegistryError``."""
+        if self.registry_error is not None:
+            raise RegistryError(self.registry_error)
+        return [col.lower() for col in self.header], [r.as_dict() for r in self.rows]
+
+    def row(self, pe_id: str) -> RegistryRow | None:
+        """Return the first registry row for *pe_id* (the registry may repeat ids)."""
+        return next((row for row in self.rows if row.pe_id == pe_id), None)
+
+    # -- Snapshot (de)serialisation ------------------------------------
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "sections": self.sections,
+            "header": list(self.header),
+            "rows": [list(row.values) for row in self.rows],
+            "registry_error": self.registry_error,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, Any]) -> CurrentPEDocument:
+        header = tuple(payload.get("header") or ())
+        columns = tuple(col.lower() for col in header)
+        return cls(
+            sections={k: dict(v) for k, v in (payload.get("sections") or {}).items()},
+            header=header,
+            rows=tuple(
+                RegistryRow(columns, tuple(values))
+                for values in payload.get("rows") or ()
+            ),
+            registry_error=payload.get("registry_error"),
+        )
+
+
+def parse_current_pe(content: str) -> CurrentPEDocument:
+    """Parse CURRENT_PE.md *content* into a ``CurrentPEDocument``."""
+    sections = _parse_sections(content)
+    try:
+        header, raw_rows = parse_registry_table(content)
+    except RegistryError as exc:
+        return CurrentPEDocument(sections=sections, registry_error=str(exc))
+    columns = tuple(col.lower() for col in header)
+    return CurrentPEDocument(
+        sections=sections,
+        header=tuple(header),
+        rows=tuple(RegistryRow(columns, tuple(values)) for values in raw_rows),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cached loading
+# ---------------------------------------------------------------------------
+
+_DOCUMENT_CACHE: dict[Path, tuple[tuple[int, int], CurrentPEDocument]] = {}
+_TEXT_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def clear_cache() -> None:
+    """Drop every in-process cache entry (used by tests and long-lived hosts)."""
+    _DOCUMENT_CACHE.clear()
+    _TEXT_CACHE.clear()
+
+
+def read_text_cached(path: Path) -> str:
+    """Return the UTF-8 text of *path*, re-reading only when mtime/size change."""
+    resolved = Path(path).resolve()
+    key = _stat_key(resolved)
+    cached = _TEXT_CACHE.get(resolved)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    text = resolved.read_text(encoding="utf-8")
+    _TEXT_CACHE[resolved] = (key, text)
+    return text
+
+
+def _content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def load_snapshot(snapshot_path: Path, digest: str) -> CurrentPEDocument | None:
+    """Return the snapshot document if it was built from text with *digest*."""
+    try:
+        payload = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != SNAPSHOT_VERSION
+        or payload.get("sha256") != digest
+    ):
+        return None
+    return CurrentPEDocument.from_json(payload.get("document") or {})
+
+
+def write_snapshot(
+    snapshot_path: Path, document: CurrentPEDocument, *, source: Path, digest: str
+) -> None:
+    """Persist *document* atomically so the next process can skip the parse."""
+    target = Path(snapshot_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "source": str(source),
+        "sha256": digest,
+        "document": document.to_json(),
+    }
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def load_current_pe(
+    path: Path, *, snapshot_path: Path | None = None
+) -> CurrentPEDocument:
+    """Load and parse *path*, reusing the in-process cache and JSON snapshot.
+
+    *snapshot_path* defaults to ``$ELIS_PE_REGISTRY_SNAPSHOT``; without
+    either, only the in-process cache is used.
+    """
+    resolved = Path(path).resolve()
+    key = _stat_key(resolved)
+    cached = _DOCUMENT_CACHE.get(resolved)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    content = read_text_cached(resolved)
+    if snapshot_path is None and os.environ.get(SNAPSHOT_ENV):
+        snapshot_path = Path(os.environ[SNAPSHOT_ENV])
+
+    document = None
+    if snapshot_path is not None:
+        digest = _content_digest(content)
+        document = load_snapshot(snapshot_path, digest)
+        if document is None:
+            document = parse_current_pe(content)
+            try:
+                write_snapshot(snapshot_path, document, source=resolved, digest=digest)
+            except OSError:
+                pass  # The snapshot is an optimisation; never fail the caller.
+    else:
+        document = parse_current_pe(content)
+
+    _DOCUMENT_CACHE[resolved] = (key, document)
+    return document
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m elis.pe_registry",
+        description="Parse CURRENT_PE.md and write its JSON snapshot.",
+    )
+    parser.add_argument("--current-pe", default="CURRENT_PE.md")
+    parser.add_argument(
+        "--snapshot",
+        default=os.environ.get(SNAPSHOT_ENV),
+        help=f"Snapshot path (default: ${SNAPSHOT_ENV}); omit to print JSON.",
+    )
+    args = parser.parse_args(argv)
+
+    source = Path(args.current_pe)
+    try:
+        content = source.read_text(encoding="utf-8")
+    except OSError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    document = parse_current_pe(content)
+    if args.snapshot:
+        write_snapshot(
+            Path(args.snapshot),
+            document,
+            source=source.resolve(),
+            digest=_content_digest(content),
+        )
+        print(f"Wrote {args.snapshot} ({len(document.rows)} registry rows)")
+    else:
+        print(json.dumps(document.to_json(), indent=2))
+    return 1 if document.registry_error else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
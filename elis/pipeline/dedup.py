@@ -6,12 +6,15 @@ import argparse
 import hashlib
 import json
 import logging
-import re
 import sys
 import warnings
 from pathlib import Path
 from typing import Any
 
+from elis.jsonl_index import DUPLICATES_KEY_FIELDS, write_jsonl_with_index
+from elis.normalise import normalise_doi, normalise_many, normalise_text
+from elis.pipeline.near_duplicates import DEFAULT_THRESHOLD, find_near_duplicates
+
 logger = logging.getLogger(__name__)
 
 CANONICAL_INPUT = "json_jsonl/ELIS_Appendix_A_Search_rows.json"
@@ -34,31 +37,6 @@ _KEEPER_PRIORITY_DEFAULT = [
 ]
 
 
-# ---------------------------------------------------------------------------
-# Normalisation helpers
-# ---------------------------------------------------------------------------
-
-
-def normalise_doi(doi: str | None) -> str:
-    """Normalise a DOI to its bare lowercase form (no prefix)."""
-    value = (doi or "").strip().lower()
-    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
-        if value.startswith(prefix):
-            value = value[len(prefix) :]
-            break
-    return value
-
-
-def normalise_text(text: str | None) -> str:
-    """Lowercase, strip punctuation, collapse whitespace."""
-    if not text:
-        return ""
-    s = text.lower()
-    s = re.sub(r"[^\w\s]", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-
 # ---------------------------------------------------------------------------
 # Dedup key + cluster ID
 # ---------------------------------------------------------------------------
@@ -160,7 +138,7 @@ def _pick_keeper_index(records: list[dict[str, Any]], priority: list[str]) -> in
 # ---------------------------------------------------------------------------
 
 
-def _load_records(path: Path) -> list[dict[str, Any]]:
+def load_records(path: Path) -> list[dict[str, Any]]:
     """
     Load records from a JSON array or JSONL file, skipping any _meta header.
     """
@@ -189,7 +167,7 @@ def _load_records(path: Path) -> list[dict[str, Any]]:
     return rows
 
 
-def _load_meta(path: Path) -> dict[str, Any] | None:
+def load_meta(path: Path) -> dict[str, Any] | None:
     """Return the _meta header dict from a JSON array, or None."""
     text = path.read_text(encoding="utf-8").strip()
     if not text.startswith("["):
@@ -201,6 +179,77 @@ def _load_meta(path: Path) -> dict[str, Any] | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Near-duplicate merge
+# ---------------------------------------------------------------------------
+
+
+def _record_text(record: dict[str, Any]) -> str:
+    return f"{record.get('title') or ''} {record.get('abstract') or ''}"
+
+
+def _record_ref(record: dict[str, Any]) -> str:
+    return str(record.get("id") or record.get("_stable_id") or record.get("doi") or "")
+
+
+def _merge_near_duplicates(
+    clusters: dict[str, list[dict[str, Any]]], threshold: float
+) -> tuple[int, list[dict[str, Any]], dict[str, Any]]:
+    """
+    Merge clusters whose representatives are near-duplicates, in place.
+
+    Each cluster is represented by its record with the longest title +
+    abstract.  Matched clusters are unioned and absorbed into the earliest
+    cluster in input order, so cluster IDs stay deterministic.  Returns
+    (records moved, matched pairs, index statistics).
+    """
+    keys = list(clusters)
+    representatives = [
+        max(clusters[key], key=lambda rec: len(_record_text(rec))) for key in keys
+    ]
+    result = find_near_duplicates(
+        [_record_text(rec) for rec in representatives], threshold=threshold
+    )
+
+    parent = list(range(len(keys)))
+
+    def root(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for pair in result.pairs:
+        left, right = root(pair.left), root(pair.right)
+        if left != right:
+            parent[max(left, right)] = min(left, right)
+
+    moved = 0
+    for index, key in enumerate(keys):
+        target = root(index)
+        if target != index:
+            moved += len(clusters[key])
+            clusters[keys[target]].extend(clusters.pop(key))
+
+    pairs = [
+        {
+            "cluster_id": _cluster_id(keys[root(pair.left)]),
+            "left": _record_ref(representatives[pair.left]),
+            "right": _record_ref(representatives[pair.right]),
+            "left_title": representatives[pair.left].get("title"),
+            "right_title": representatives[pair.right].get("title"),
+            "similarity": pair.similarity,
+        }
+        for pair in result.pairs
+    ]
+    stats = {
+        "eligible_clusters": result.eligible,
+        "candidate_pairs": result.candidates,
+        "skipped_buckets": result.skipped_buckets,
+    }
+    return moved, pairs, stats
+
+
 # ---------------------------------------------------------------------------
 # Core dedup logic
 # ---------------------------------------------------------------------------
@@ -214,6 +263,8 @@ def run_dedup(
     duplicates_path: str = CANONICAL_DUPLICATES,
     fuzzy: bool = False,
     threshold: float = 0.85,
+    near_dup: bool = False,
+    near_dup_threshold: float = DEFAULT_THRESHOLD,
     config_path: str = KEEPER_PRIORITY_CONFIG,
 ) -> tuple[Path, Path]:
     """
@@ -222,6 +273,10 @@ def run_dedup(
     non-keeper (dropped) records with traceability fields to *duplicates_path*
     (JSONL, one record per line with ``cluster_id`` and ``duplicate_of``).
 
+    With *near_dup*, clusters whose title + abstract shingles reach a Jaccard
+    similarity of *near_dup_threshold* are merged (MinHash/LSH, see
+    ``elis.pipeline.near_duplicates``) and the matched pairs are reported.
+
     Returns (output_path, report_path) as Path objects.
     """
     if fuzzy:
@@ -239,26 +294,34 @@ def run_dedup(
     config_source = config_path if Path(config_path).exists() else "default"
 
     # Preserve the upstream _meta so screen can use it
-    upstream_meta = _load_meta(in_path)
-    records = _load_records(in_path)
+    upstream_meta = load_meta(in_path)
+    records = load_records(in_path)
     total_input = len(records)
 
     # --- Build clusters (exact) ---
     clusters: dict[str, list[dict[str, Any]]] = {}
     cluster_methods: dict[str, str] = {}  # "doi" or "title"
 
-    for rec in records:
-        doi = normalise_doi(rec.get("doi"))
+    # Normalise key columns in bulk; same values as _dedup_key per record.
+    dois = normalise_many((rec.get("doi") for rec in records), "doi")
+    no_doi = [rec for rec, doi in zip(records, dois) if not doi]
+    titles = iter(normalise_many((rec.get("title") for rec in no_doi), "text"))
+    first_authors = iter(
+        normalise_many(
+            (str(rec["authors"][0]) if rec.get("authors") else None for rec in no_doi),
+            "text",
+        )
+    )
+
+    for rec, doi in zip(records, dois):
         if doi:
             key = doi
             method = "doi"
         else:
-            title = normalise_text(rec.get("title"))
+            title = next(titles)
             year = rec.get("year")
             year_str = str(int(year)) if isinstance(year, (int, float)) and year else ""
-            authors = rec.get("authors") or []
-            first_author = normalise_text(str(authors[0])) if authors else ""
-            key = f"{title}|{year_str}|{first_author}"
+            key = f"{title}|{year_str}|{next(first_authors)}"
             method = "title"
 
         if key not in clusters:
@@ -290,6 +353,15 @@ def run_dedup(
                     fuzzy_count += len(clusters[ki]) - before
                     absorbed.add(kj)
 
+    # --- Optional near-duplicate merge (MinHash/LSH over title + abstract) ---
+    near_dup_count = 0
+    near_dup_pairs: list[dict[str, Any]] = []
+    near_dup_stats: dict[str, Any] = {}
+    if near_dup:
+        near_dup_count, near_dup_pairs, near_dup_stats = _merge_near_duplicates(
+            clusters, near_dup_threshold
+        )
+
     # --- Pick keepers and annotate ---
     keepers: list[dict[str, Any]] = []
     non_keepers: list[dict[str, Any]] = []
@@ -363,6 +435,7 @@ def run_dedup(
         "unique_clusters": len(keepers),
         "duplicates_removed": duplicates_removed,
         "fuzzy_enabled": fuzzy,
+        "near_dup_enabled": near_dup,
         "keeper_priority_source": config_source,
     }
     if upstream_meta:
@@ -383,11 +456,9 @@ def run_dedup(
         encoding="utf-8",
     )
 
-    # Write traceability sidecar: every dropped record with cluster_id + duplicate_of
-    dup_path.write_text(
-        "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in non_keepers),
-        encoding="utf-8",
-    )
+    # Write traceability sidecar: every dropped record with cluster_id + duplicate_of,
+    # plus a byte-offset index so keeper -> duplicates lookups skip the scan.
+    write_jsonl_with_index(dup_path, non_keepers, DUPLICATES_KEY_FIELDS)
 
     report: dict[str, Any] = {
         "input_records": total_input,
@@ -399,6 +470,10 @@ def run_dedup(
         "keeper_priority_source": config_source,
         "top_10_collisions": top_collisions,
     }
+    if near_dup:
+        report["near_duplicate_dedup"] = near_dup_count
+        report["near_duplicate"] = {"threshold": near_dup_threshold, **near_dup_stats}
+        report["near_duplicate_pairs"] = near_dup_pairs
     rep_path.write_text(
         json.dumps(report, indent=2, ensure_ascii=False) + "\n",
         encoding="utf-8",
@@ -443,6 +518,18 @@ def main(argv: list[str] | None = None) -> int:
         default=0.85,
         help="Similarity threshold for fuzzy mode (default: 0.85)",
     )
+    parser.add_argument(
+        "--near-dup",
+        action="store_true",
+        default=False,
+        help="Merge near-duplicate title + abstract text (MinHash/LSH, opt-in)",
+    )
+    parser.add_argument(
+        "--near-dup-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Shingle Jaccard threshold for --near-dup (default: {DEFAULT_THRESHOLD})",
+    )
     parser.add_argument(
         "--config",
         default=KEEPER_PRIORITY_CONFIG,
@@ -464,6 +551,8 @@ def main(argv: list[str] | None = None) -> int:
         duplicates_path=args.duplicates_path,
         fuzzy=args.fuzzy,
         threshold=args.threshold,
+        near_dup=args.near_dup,
+        near_dup_threshold=args.near_dup_threshold,
         config_path=args.config_path,
     )
     return 0
@@ -0,0 +1,385 @@
+"""ELIS pipeline - batch DOI metadata enrichment stage (runs before dedup).
+
+Collects DOIs of merged Appendix A records that are missing
+``abstract`` / ``language`` / ``venue`` / ``doc_type`` and resolves them in
+bulk: OpenAlex ``filter=doi:a|b|...`` (50 DOIs per call) first, then
+Semantic Scholar ``/paper/batch`` (500 IDs per call) for whatever is still
+missing.  Existing values are never overwritten.  Worker threads share one
+rate limiter per provider, so concurrency never exceeds its polite rate.
+
+Resolved metadata is cached per provider in a JSON sidecar so that
+re-running the stage only queries DOIs it has not seen before.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable
+from urllib.parse import quote
+
+import requests
+
+from elis.normalise import normalise_doi
+from elis.pipeline.dedup import load_meta, load_records
+
+logger = logging.getLogger(__name__)
+
+CANONICAL_INPUT = "json_jsonl/ELIS_Appendix_A_Search_rows.json"
+CANONICAL_OUTPUT = "enrich/appendix_a_enriched.json"
+CANONICAL_REPORT = "enrich/enrich_report.json"
+CANONICAL_CACHE = "enrich/doi_cache.json"
+
+ENRICHABLE_FIELDS = ("abstract", "language", "venue", "doc_type")
+
+OPENALEX_URL = "https://api.openalex.org/works"
+OPENALEX_BATCH_SIZE = 50  # OR-filter limit per request
+SEMANTIC_SCHOLAR_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500  # /paper/batch limit per request
+
+_OPENALEX_SELECT = (
+    "doi",
+    "abstract_inverted_index",
+    "language",
+    "primary_location",
+    "type",
+)
+# Characters that delimit OpenAlex filter values; DOIs containing them are
+# resolved one by one instead of through the OR filter.
+_FILTER_DELIMITERS = ("|", ",")
+_SEMANTIC_SCHOLAR_FIELDS = ("externalIds", "abstract", "venue", "publicationTypes")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def missing_fields(record: dict[str, Any]) -> list[str]:
+    """Return the enrichable fields that are null/empty on *record*."""
+    return [f for f in ENRICHABLE_FIELDS if _is_missing(record.get(f))]
+
+
+def _chunks(items: list[str], size: int) -> Iterable[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _load_cache(path: Path) -> dict[str, dict[str, dict[str, Any]]]:
+    """Load the provider -> DOI -> fields cache; unreadable caches start empty."""
+    if not path.exists():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Ignoring unreadable enrich cache: %s", path)
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Providers
+# ---------------------------------------------------------------------------
+
+
+def _openalex_fields(work: dict[str, Any]) -> dict[str, Any]:
+    from elis.sources.openalex import _reconstruct_abstract
+
+    source = (work.get("primary_location") or {}).get("source") or {}
+    return {
+        "abstract": _reconstruct_abstract(work.get("abstract_inverted_index") or {}),
+        "language": work.get("language") or "",
+        "venue": source.get("display_name") or "",
+        "doc_type": work.get("type") or "",
+    }
+
+
+def fetch_openalex(client: Any, dois: list[str]) -> dict[str, dict[str, Any]]:
+    """Resolve up to ``OPENALEX_BATCH_SIZE`` DOIs with one OR-filter request.
+
+    DOIs containing a filter delimiter (``|`` or ``,``) would corrupt the OR
+    filter, so each of those is looked up on its own ``/works/<doi>`` URL.
+    """
+    params: dict[str, object] = {"select": ",".join(_OPENALEX_SELECT)}
+    mailto = os.getenv("ELIS_CONTACT")
+    if mailto:
+        params["mailto"] = mailto
+
+    batchable = [d for d in dois if not any(c in d for c in _FILTER_DELIMITERS)]
+    resolved: dict[str, dict[str, Any]] = {}
+    if batchable:
+        batch_params = {
+            "filter": "doi:" + "|".join(batchable),
+            "per_page": len(batchable),
+            **params,
+        }
+        data = client.get(OPENALEX_URL, params=batch_params).json()
+        for work in data.get("results", []):
+            doi = normalise_doi(work.get("doi"))
+            if doi:
+                resolved[doi] = _openalex_fields(work)
+
+    for doi in dois:
+        if doi in batchable:
+            continue
+        url = f"{OPENALEX_URL}/https://doi.org/{quote(doi, safe='/')}"
+        try:
+            work = client.get(url, params=params).json()
+        except requests.HTTPError as exc:
+            if exc.response is not None and exc.response.status_code == 404:
+                continue
+            raise
+        resolved[doi] = _openalex_fields(work)
+    return resolved
+
+
+def fetch_semantic_scholar(client: Any, dois: list[str]) -> dict[str, dict[str, Any]]:
+    """Resolve up to ``SEMANTIC_SCHOLAR_BATCH_SIZE`` DOIs with one batch request."""
+    headers: dict[str, str] = {}
+    api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    if api_key:
+        headers["x-api-key"] = api_key
+    resp = client.post(
+        SEMANTIC_SCHOLAR_URL,
+        params={"fields": ",".join(_SEMANTIC_SCHOLAR_FIELDS)},
+        headers=headers,
+        json_body={"ids": [f"DOI:{doi}" for doi in dois]},
+    )
+    resolved: dict[str, dict[str, Any]] = {}
+    # The batch response is positionally aligned with the request ids,
+    # with ``null`` for unknown papers.
+    for doi, paper in zip(dois, resp.json()):
+        if not isinstance(paper, dict):
+            continue
+        types = paper.get("publicationTypes") or []
+        resolved[doi] = {
+            "abstract": paper.get("abstract") or "",
+            "venue": paper.get("venue") or "",
+            "doc_type": str(types[0]).lower() if types else "",
+        }
+    return resolved
+
+
+# Ordered: cheaper / richer provider first.
+PROVIDERS: dict[str, tuple[Callable[..., dict[str, dict[str, Any]]], int, float]] = {
+    "openalex": (fetch_openalex, OPENALEX_BATCH_SIZE, 0.1),
+    "semanticscholar": (fetch_semantic_scholar, SEMANTIC_SCHOLAR_BATCH_SIZE, 1.0),
+}
+
+
+def _resolve_batches(
+    provider: str,
+    dois: list[str],
+    *,
+    workers: int,
+) -> tuple[dict[str, dict[str, Any]], int, set[str]]:
+    """Resolve *dois* via *provider* with bounded concurrency.
+
+    Returns ``(resolved, requests_made, failed_dois)``.  A failed batch is
+    logged and skipped so one bad request does not abort the stage.
+    """
+    from elis.sources.http_client import ELISHttpClient, IntervalLimiter
+
+    fetch, batch_size, delay = PROVIDERS[provider]
+    # Sessions are per thread; the politeness delay is shared by all of them.
+    limiter = IntervalLimiter(delay)
+    local = threading.local()
+
+    def _client() -> ELISHttpClient:
+        if not hasattr(local, "client"):
+            local.client = ELISHttpClient(
+                provider, delay_seconds=0, rate_limiter=limiter
+            )
+        return local.client
+
+    def _run(batch: list[str]) -> dict[str, dict[str, Any]] | None:
+        try:
+            return fetch(_client(), batch)
+        except Exception as exc:
+            logger.warning(
+                "[%s] Batch of %d DOIs failed: %s", provider, len(batch), exc
+            )
+            return None
+
+    batches = list(_chunks(dois, batch_size))
+    resolved: dict[str, dict[str, Any]] = {}
+    failed: set[str] = set()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for batch, result in zip(batches, pool.map(_run, batches)):
+            if result is None:
+                failed.update(batch)
+                continue
+            resolved.update(result)
+    return resolved, len(batches), failed
+
+
+# ---------------------------------------------------------------------------
+# Core enrichment
+# ---------------------------------------------------------------------------
+
+
+def enrich_records(
+    records: list[dict[str, Any]],
+    *,
+    cache: dict[str, dict[str, dict[str, Any]]],
+    providers: Iterable[str] | None = None,
+    workers: int = 4,
+) -> dict[str, Any]:
+    """Fill missing fields on *records* in place and update *cache*.
+
+    *providers* defaults to every entry of ``PROVIDERS``, in order.
+    Returns per-provider statistics for the enrich report.
+    """
+    stats: dict[str, Any] = {"providers": {}}
+
+    for provider in providers if providers is not None else list(PROVIDERS):
+        provider_cache = cache.setdefault(provider, {})
+        wanted: dict[str, list[dict[str, Any]]] = {}
+        for rec in records:
+            doi = normalise_doi(rec.get("doi"))
+            if doi and missing_fields(rec):
+                wanted.setdefault(doi, []).append(rec)
+
+        to_fetch = sorted(doi for doi in wanted if doi not in provider_cache)
+        resolved: dict[str, dict[str, Any]] = {}
+        requests_made, failed = 0, set()
+        if to_fetch:
+            resolved, requests_made, failed = _resolve_batches(
+                provider, to_fetch, workers=workers
+            )
+        # Cache misses as empty dicts so unknown DOIs are not re-queried;
+        # DOIs from failed batches stay uncached and are retried next run.
+        for doi in to_fetch:
+            if doi not in failed:
+                provider_cache[doi] = resolved.get(doi, {})
+
+        filled: dict[str, int] = {}
+        for doi, recs in wanted.items():
+            fields = provider_cache.get(doi) or {}
+            for rec in recs:
+                for field in missing_fields(rec):
+                    value = fields.get(field)
+                    if _is_missing(value):
+                        continue
+                    rec[field] = value
+                    rec.setdefault("enrichment", {})[field] = provider
+                    filled[field] = filled.get(field, 0) + 1
+
+        stats["providers"][provider] = {
+            "candidate_dois": len(wanted),
+            "cache_hits": len(wanted) - len(to_fetch),
+            "fetched_dois": len(to_fetch),
+            "requests": requests_made,
+            "failed_dois": len(failed),
+            "fields_filled": dict(sorted(filled.items())),
+        }
+    return stats
+
+
+def run_enrich(
+    input_path: str,
+    output_path: str,
+    report_path: str,
+    *,
+    cache_path: str = CANONICAL_CACHE,
+    providers: Iterable[str] | None = None,
+    workers: int = 4,
+) -> tuple[Path, Path]:
+    """
+    Enrich records from *input_path* and write them (with the upstream _meta
+    header preserved) to *output_path*, statistics to *report_path*, and the
+    updated DOI cache to *cache_path*.
+
+    Returns (output_path, report_path) as Path objects.
+    """
+    in_path = Path(input_path)
+    out_path = Path(output_path)
+    rep_path = Path(report_path)
+    cache_file = Path(cache_path)
+
+    selected = list(providers) if providers else list(PROVIDERS)
+    unknown = sorted(set(selected) - set(PROVIDERS))
+    if unknown:
+        raise ValueError(f"Unknown enrich provider(s): {unknown}")
+
+    upstream_meta = load_meta(in_path)
+    records = load_records(in_path)
+    missing_before = {
+        f: sum(1 for r in records if _is_missing(r.get(f))) for f in ENRICHABLE_FIELDS
+    }
+
+    cache = _load_cache(cache_file)
+    stats = enrich_records(records, cache=cache, providers=selected, workers=workers)
+    missing_after = {
+        f: sum(1 for r in records if _is_missing(r.get(f))) for f in ENRICHABLE_FIELDS
+    }
+
+    payload: list[dict[str, Any]] = records
+    if upstream_meta is not None:
+        meta = dict(upstream_meta)
+        meta["enrich"] = {"providers": selected}
+        payload = [meta] + records
+
+    _write_json(out_path, payload)
+    _write_json(cache_file, cache)
+    report = {
+        "input_records": len(records),
+        "records_with_doi": sum(1 for r in records if normalise_doi(r.get("doi"))),
+        "missing_before": missing_before,
+        "missing_after": missing_after,
+        "cache_path": str(cache_file),
+        **stats,
+    }
+    _write_json(rep_path, report)
+    return out_path, rep_path
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="elis enrich", description="Batch-enrich missing Appendix A metadata"
+    )
+    parser.add_argument("--input", default=CANONICAL_INPUT)
+    parser.add_argument("--output", default=CANONICAL_OUTPUT)
+    parser.add_argument("--report", default=CANONICAL_REPORT)
+    parser.add_argument("--cache", default=CANONICAL_CACHE, dest="cache_path")
+    parser.add_argument(
+        "--providers", nargs="+", choices=sorted(PROVIDERS), default=None
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    run_enrich(
+        args.input,
+        args.output,
+        args.report,
+        cache_path=args.cache_path,
+        providers=args.providers,
+        workers=args.workers,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
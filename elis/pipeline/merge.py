@@ -5,32 +5,18 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
-import re
 import sys
 from collections import Counter
 from pathlib import Path
 from typing import Any
 
+from elis.normalise import collapse_ws, collapse_ws_cached, normalise_doi
+
 CANONICAL_OUTPUT = "json_jsonl/ELIS_Appendix_A_Search_rows.json"
 CANONICAL_REPORT = "json_jsonl/merge_report.json"
 _EPOCH_ISO = "1970-01-01T00:00:00Z"
 
 
-def _collapse_ws(value: str | None) -> str:
-    if not value:
-        return ""
-    return re.sub(r"\s+", " ", value.strip())
-
-
-def normalise_doi(doi: str | None) -> str:
-    value = (doi or "").strip().lower()
-    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
-        if value.startswith(prefix):
-            value = value[len(prefix) :]
-            break
-    return value
-
-
 def normalise_year(value: Any) -> int | None:
     if value is None or value == "":
         return None
@@ -45,7 +31,7 @@ def _stable_id(record: dict[str, Any]) -> str:
     if doi:
         return f"doi:{doi}"
 
-    title = _collapse_ws(record.get("title")).lower()
+    title = collapse_ws(record.get("title")).lower()
     year = normalise_year(record.get("year"))
     source = str(record.get("source", "")).strip().lower()
     source_id = str(record.get("source_id", "")).strip().lower()
@@ -83,20 +69,21 @@ def _load_records(path: Path) -> list[dict[str, Any]]:
 def _normalise_record(
     record: dict[str, Any], *, source_file: str, merge_position: int
 ) -> dict[str, Any]:
-    source = _collapse_ws(str(record.get("source", "") or source_file)).lower()
-    title = _collapse_ws(record.get("title"))
+    # Sources, authors and query fields repeat across records: memoised.
+    source = collapse_ws_cached(str(record.get("source", "") or source_file)).lower()
+    title = collapse_ws(record.get("title"))
     authors = [
-        _collapse_ws(str(author))
-        for author in (record.get("authors") or [])
-        if _collapse_ws(str(author))
+        name
+        for name in map(collapse_ws_cached, map(str, record.get("authors") or []))
+        if name
     ]
     year = normalise_year(record.get("year"))
     doi = normalise_doi(record.get("doi"))
 
-    query_topic = _collapse_ws(str(record.get("query_topic", "") or "unknown"))
-    query_string = _collapse_ws(str(record.get("query_string", "") or ""))
-    retrieved_at = _collapse_ws(str(record.get("retrieved_at", "") or _EPOCH_ISO))
-    source_id = _collapse_ws(str(record.get("source_id", "") or ""))
+    query_topic = collapse_ws_cached(str(record.get("query_topic", "") or "unknown"))
+    query_string = collapse_ws_cached(str(record.get("query_string", "") or ""))
+    retrieved_at = collapse_ws(str(record.get("retrieved_at", "") or _EPOCH_ISO))
+    source_id = collapse_ws(str(record.get("source_id", "") or ""))
 
     merged = dict(record)
     merged.update(
@@ -23,6 +23,8 @@ from typing import Any, Dict, List, Optional
 import requests
 import yaml
 
+from elis.normalise import normalise_title as normalize_title
+
 # ------------------------- Constants & runtime knobs -------------------------
 CANONICAL_A = "json_jsonl/ELIS_Appendix_A_Search_rows.json"
 CONFIG_PATH = "config/elis_search_queries.yml"
@@ -54,14 +56,6 @@ def load_yaml(path: str) -> dict:
         return yaml.safe_load(f)
 
 
-def normalize_title(title: Optional[str]) -> str:
-    """Normalise title for dedupe: lowercase, strip punctuation/extra spaces."""
-    if not title:
-        return ""
-    t = re.sub(r"[^\w\s]", " ", title.lower())
-    return re.sub(r"\s+", " ", t).strip()
-
-
 def stable_id(doi: Optional[str], title: Optional[str], year: Optional[int]) -> str:
     """
     Produce a stable deterministic id for deduping.
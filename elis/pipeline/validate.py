@@ -4,21 +4,43 @@ ELIS pipeline — JSON Validator
 Importable module wrapping the MVP validation logic from scripts/validate_json.py.
 Validates JSON artefacts (Appendix A/B/C) against JSON Schemas and generates
 Markdown validation reports.
+
+Validation runs through a small engine: validators are compiled once per
+schema (cached by schema hash), rows are streamed from JSON arrays or JSONL
+rather than loaded up front, large inputs are sharded across a process pool,
+and only the first few errors per field are kept (the rest are counted).
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import operator
+import os
+import re
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
-from jsonschema import Draft202012Validator
+from jsonschema import Draft7Validator, Draft202012Validator
 
 log = logging.getLogger(__name__)
 
+# Rows per shard sent to a worker process.
+CHUNK_SIZE = 2000
+# Below this many rows a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 20000
+# Error messages kept per field; further errors are only counted.
+MAX_ERRORS_PER_FIELD = 20
+
+_READ_SIZE = 1 << 20
+
 
 def load_json_file(file_path: Path) -> List[Dict[str, Any]]:
     """
@@ -42,76 +64,699 @@ def load_schema(schema_path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
+# ------------------------- Validation engine --------------------------------
+def schema_hash(schema: Any) -> str:
+    """Return a stable SHA-256 of *schema* (key order does not matter)."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# Keywords that never affect validity (``format`` is not asserted without a
+# format checker, matching the jsonschema defaults used here).
+_ANNOTATION_KEYWORDS = frozenset(
+    {"$schema", "$id", "$comment", "title", "description", "default", "format"}
+)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "number": _is_number,
+    "integer": lambda v: (
+        (isinstance(v, int) and not isinstance(v, bool))
+        or (isinstance(v, float) and v.is_integer())
+    ),
+}
+# Types whose check is a bare isinstance (no bool/int overlap to exclude).
+_PLAIN_TYPES: Dict[str, type] = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "null": type(None),
+}
+_SIZE_BOUNDS: Dict[str, Tuple[type, Callable[[Any, Any], bool]]] = {
+    "minLength": (str, operator.ge),
+    "maxLength": (str, operator.le),
+    "minItems": (list, operator.ge),
+    "maxItems": (list, operator.le),
+    "minProperties": (dict, operator.ge),
+    "maxProperties": (dict, operator.le),
+}
+_NUMBER_BOUNDS: Dict[str, Callable[[Any, Any], bool]] = {
+    "minimum": operator.ge,
+    "maximum": operator.le,
+}
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """JSON equality: unlike ``==``, ``True`` and ``1`` differ."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(_json_equal, a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _compile_check(schema: Any) -> Callable[[Any], bool] | None:
+    """Compile *schema* into a plain predicate, or None if unsupported.
+
+    Covers the keyword subset the ELIS schemas use for rows.  The predicate
+    is only a fast path: it must never accept an instance jsonschema would
+    reject, and rows it rejects are re-checked by jsonschema for messages.
+    """
+    if schema is True or schema == {}:
+        return lambda v: True
+    if not isinstance(schema, dict):
+        return None
+
+    checks: List[Callable[[Any], bool]] = []
+    for keyword, value in schema.items():
+        if keyword in _ANNOTATION_KEYWORDS:
+            continue
+        if keyword == "type":
+            names = [value] if isinstance(value, str) else list(value)
+            if any(name not in _TYPE_CHECKS for name in names):
+                return None
+            if all(name in _PLAIN_TYPES for name in names):
+                plain = tuple(_PLAIN_TYPES[name] for name in names)
+                checks.append(lambda v, t=plain: isinstance(v, t))
+            else:
+                type_checks = [_TYPE_CHECKS[name] for name in names]
+                checks.append(lambda v, tc=type_checks: any(c(v) for c in tc))
+        elif keyword == "required":
+            required = tuple(value)
+            checks.append(
+                lambda v, r=required: not isinstance(v, dict) or all(k in v for k in r)
+            )
+        elif keyword == "properties":
+            props: Dict[str, Callable[[Any], bool]] = {}
+            for name, sub in value.items():
+                compiled = _compile_check(sub)
+                if compiled is None:
+                    return None
+                props[name] = compiled
+            checks.append(_properties_check(tuple(props.items())))
+        elif keyword == "additionalProperties":
+            if "patternProperties" in schema:
+                return None
+            known = frozenset(schema.get("properties", {}))
+            extra = _compile_check(value) if value is not False else None
+            if value is False:
+                checks.append(
+                    lambda v, kn=known: not isinstance(v, dict) or v.keys() <= kn
+                )
+            elif extra is None:
+                return None
+            else:
+                checks.append(
+                    lambda v, kn=known, c=extra: not isinstance(v, dict)
+                    or all(c(v[k]) for k in v.keys() - kn)
+                )
+        elif keyword == "items":
+            item_check = _compile_check(value)
+            if item_check is None:
+                return None
+            checks.append(
+                lambda v, c=item_check: not isinstance(v, list) or all(map(c, v))
+            )
+        elif keyword == "enum":
+            options = list(value)
+            checks.append(lambda v, o=options: any(_json_equal(v, e) for e in o))
+        elif keyword == "const":
+            checks.append(lambda v, c=value: _json_equal(v, c))
+        elif keyword in _SIZE_BOUNDS:
+            kind, cmp = _SIZE_BOUNDS[keyword]
+            checks.append(
+                lambda v, k=kind, c=cmp, b=value: not isinstance(v, k) or c(len(v), b)
+            )
+        elif keyword in _NUMBER_BOUNDS:
+            checks.append(
+                lambda v, c=_NUMBER_BOUNDS[keyword], b=value: not _is_number(v)
+                or c(v, b)
+            )
+        elif keyword == "pattern":
+            regex = re.compile(value)
+            checks.append(
+                lambda v, rx=regex: not isinstance(v, str) or bool(rx.search(v))
+            )
+        else:
+            return None
+
+    return _all_of(checks)
+
+
+def _properties_check(
+    props: Tuple[Tuple[str, Callable[[Any], bool]], ...],
+) -> Callable[[Any], bool]:
+    def check(value: Any) -> bool:
+        if isinstance(value, dict):
+            for name, sub_check in props:
+                if name in value and not sub_check(value[name]):
+                    return False
+        return True
+
+    return check
+
+
+def _all_of(checks: List[Callable[[Any], bool]]) -> Callable[[Any], bool]:
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: Any) -> bool:
+        for sub_check in checks:
+            if not sub_check(value):
+                return False
+        return True
+
+    return check
+
+
+class CompiledValidator:
+    """A jsonschema validator fronted by a compiled fast-path predicate.
+
+    ``iter_errors`` returns nothing for rows the predicate accepts and
+    defers to jsonschema otherwise, so messages are unchanged.
+    """
+
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        schema_uri = str(schema.get("$schema", ""))
+        if "2020-12" in schema_uri or "2019-09" in schema_uri:
+            self.validator = Draft202012Validator(schema)
+        else:
+            self.validator = Draft7Validator(schema)
+        self.fast_check = _compile_check(schema)
+
+    def iter_errors(self, instance: Any) -> Iterator[Any]:
+        if self.fast_check is not None and self.fast_check(instance):
+            return iter(())
+        return self.validator.iter_errors(instance)
+
+
+_VALIDATOR_CACHE: Dict[str, CompiledValidator] = {}
+
+
+def compile_validator(schema: Dict[str, Any]) -> CompiledValidator:
+    """Return a validator for *schema*, built once per distinct schema.
+
+    Draft 2020-12 / 2019-09 schemas (by ``$schema``) use
+    ``Draft202012Validator``; everything else uses ``Draft7Validator``.
+    """
+    key = schema_hash(schema)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator = CompiledValidator(schema)
+        _VALIDATOR_CACHE[key] = validator
+    return validator
+
+
+def _iter_json_array(fh: Any) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(source_text, element)`` for each element of a top-level JSON
+    array without loading the whole document."""
+    decoder = json.JSONDecoder()
+    buf = fh.read(_READ_SIZE)
+    eof = not buf
+    pos = 0
+
+    def _skip(chars: str) -> None:
+        nonlocal pos
+        while pos < len(buf) and buf[pos] in chars:
+            pos += 1
+
+    _skip(" \t\r\n")
+    if pos >= len(buf):
+        raise json.JSONDecodeError("Expecting value", buf, pos)
+    if buf[pos] != "[":
+        # Not an array: decode the whole document to report its type.
+        payload = json.loads(buf[pos:] + fh.read())
+        raise ValueError(f"Expected array, got {type(payload).__name__}")
+    pos += 1
+
+    def _more() -> bool:
+        """Append the next chunk to the unread text; False at EOF."""
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = fh.read(_READ_SIZE)
+        eof = not chunk
+        buf, pos = buf[pos:] + chunk, 0
+        return not eof
+
+    def _next_char() -> str:
+        """Skip whitespace; return the next character ("" at EOF)."""
+        while True:
+            _skip(" \t\r\n")
+            if pos < len(buf):
+                return buf[pos]
+            if not _more():
+                return ""
+
+    first = True
+    while True:
+        char = _next_char()
+        if char == "]":
+            pos += 1
+            break
+        if not first:
+            # Exactly one comma between elements; "]" right after it fails
+            # below as "Expecting value", like json.loads.
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+            pos += 1
+            _next_char()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not _more():
+                    raise
+                continue
+            # A scalar ending exactly at the buffer edge may be truncated.
+            if end == len(buf) and not eof:
+                _more()
+                continue
+            break
+        yield buf[pos:end], item
+        pos = end
+        first = False
+
+    if _next_char():
+        raise json.JSONDecodeError("Extra data", buf, pos)
+
+
+def iter_json_rows(path: Path, *, with_hash: bool = False) -> Iterator[Any]:
+    """Stream rows from a JSON array or JSONL file, skipping ``_meta`` headers.
+
+    ``.jsonl`` files are read line by line; anything else must be a JSON
+    array (``ValueError`` otherwise).  With *with_hash*, yields
+    ``(row_hash, row)`` pairs hashed from the row's source text, which is
+    much cheaper than re-serialising it (see ``validate_rows(prehashed=)``).
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        if Path(path).suffix.lower() == ".jsonl":
+            stripped = (line.strip() for line in fh)
+            rows: Iterable[Tuple[str, Any]] = (
+                (text, json.loads(text)) for text in stripped if text
+            )
+        else:
+            rows = _iter_json_array(fh)
+        for text, row in rows:
+            if isinstance(row, dict) and row.get("_meta", False):
+                continue
+            yield (_digest(text), row) if with_hash else row
+
+
+# (error key, message after the "row N" prefix) for each error of one row.
+RowErrors = List[Tuple[str, str]]
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating a stream of rows.
+
+    At most ``max_errors_per_field`` messages are stored per field;
+    ``error_counts`` holds the full per-field totals.  ``cached_rows`` of
+    the ``row_count`` rows were answered from a ``RowCache``.
+    """
+
+    row_count: int = 0
+    cached_rows: int = 0
+    error_counts: Dict[str, int] = field(default_factory=dict)
+    max_errors_per_field: int = MAX_ERRORS_PER_FIELD
+    _stored: List[Tuple[str, str]] = field(default_factory=list, repr=False)
+
+    @classmethod
+    def failure(cls, message: str) -> ValidationResult:
+        """A result for input that could not be read at all."""
+        result = cls()
+        result.add("<load>", message)
+        return result
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.error_counts
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.error_counts.values())
+
+    @property
+    def errors(self) -> List[str]:
+        return [message for _, message in self._stored]
+
+    def add(self, key: str, message: str) -> None:
+        seen = self.error_counts.get(key, 0)
+        self.error_counts[key] = seen + 1
+        if seen < self.max_errors_per_field:
+            self._stored.append((key, message))
+
+    def add_row(self, index: int, errors: RowErrors) -> None:
+        self.row_count += 1
+        for key, detail in errors:
+            self.add(key, f"row {index}{detail}")
+
+    def messages(self) -> List[str]:
+        """Stored messages plus one summary line per capped field."""
+        lines = self.errors
+        for key, total in self.error_counts.items():
+            hidden = total - min(total, self.max_errors_per_field)
+            if hidden:
+                lines.append(f"{_describe_key(key)}: {hidden} more errors not shown")
+        return lines
+
+
+def _describe_key(key: str) -> str:
+    if key.startswith("<"):
+        return f"row-level '{key[1:-1]}'"
+    return f"field '{key}'"
+
+
+def _error_key(error: Any) -> str:
+    """Group errors by field path; path-less errors by schema keyword."""
+    if error.path:
+        return ".".join(str(part) for part in error.path)
+    return f"<{error.validator}>"
+
+
+def _error_detail(error: Any) -> str:
+    if error.path:
+        field_path = ".".join(str(p) for p in error.path)
+        return f", field '{field_path}': {error.message}"
+    return f": {error.message}"
+
+
+def _check_rows(validator: Any, rows: List[Any]) -> List[RowErrors]:
+    return [
+        [(_error_key(e), _error_detail(e)) for e in validator.iter_errors(row)]
+        for row in rows
+    ]
+
+
+_WORKER_VALIDATOR: Any = None
+
+
+def _init_worker(schema: Dict[str, Any]) -> None:
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = compile_validator(schema)
+
+
+def _check_rows_in_worker(rows: List[Any]) -> List[RowErrors]:
+    return _check_rows(_WORKER_VALIDATOR, rows)
+
+
+def _chunked(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ------------------------- Row cache ----------------------------------------
+DEFAULT_CACHE_DIR = Path("validation_reports/.row_cache")
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def row_hash(row: Any) -> str:
+    """Return a content hash of *row* (key order does not matter)."""
+    return _digest(json.dumps(row, sort_keys=True, separators=(",", ":")))
+
+
+class RowCache:
+    """Sidecar mapping row content hashes to their validation errors.
+
+    Entries are only meaningful for the schema they were produced under:
+    a cache file written for a different schema hash is discarded on load.
+    ``save`` keeps only the rows seen in the current run, so deleted rows
+    do not accumulate.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, schema_digest: str) -> None:
+        self.path = Path(path)
+        self.schema_hash = schema_digest
+        self.invalidated = False
+        self._entries: Dict[str, RowErrors] = {}
+        self._seen: Dict[str, RowErrors] = {}
+        self._load()
+
+    @classmethod
+    def for_data(
+        cls, cache_dir: Path, data_path: Path, schema: Dict[str, Any]
+    ) -> RowCache:
+        """Open the cache for *data_path* under *cache_dir*."""
+        path_digest = hashlib.sha1(str(data_path).encode("utf-8")).hexdigest()[:8]
+        name = f"{Path(data_path).name}.{path_digest}.json"
+        return cls(Path(cache_dir) / name, schema_hash(schema))
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            log.warning("Ignoring unreadable validation cache: %s", self.path)
+            return
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != self.VERSION
+            or payload.get("schema_hash") != self.schema_hash
+        ):
+            self.invalidated = True
+            return
+        rows = payload.get("rows")
+        if isinstance(rows, dict):
+            self._entries = rows
+
+    def get(self, digest: str) -> RowErrors | None:
+        errors = self._entries.get(digest)
+        if errors is not None:
+            self._seen[digest] = errors
+        return errors
+
+    def put(self, digest: str, errors: RowErrors) -> None:
+        self._seen[digest] = errors
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": self.VERSION,
+            "schema_hash": self.schema_hash,
+            "rows": self._seen,
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# (start index, row hashes or None, cached errors per row, rows to check)
+_Shard = Tuple[int, List[str] | None, List[RowErrors | None], List[Any]]
+
+
+def validate_rows(
+    rows: Iterable[Any],
+    schema: Dict[str, Any],
+    *,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+    max_errors_per_field: int = MAX_ERRORS_PER_FIELD,
+    cache: RowCache | None = None,
+    prehashed: bool = False,
+) -> ValidationResult:
+    """Validate each row of *rows* against the item schema *schema*.
+
+    Rows are consumed in chunks of *chunk_size*.  With a *cache*, rows whose
+    content hash is already known reuse their recorded outcome and only new
+    or changed rows are checked; with *prehashed*, *rows* yields
+    ``(row_hash, row)`` pairs (``iter_json_rows(with_hash=True)``).  Once more than *parallel_threshold* rows
+    need checking (and ``workers`` allows more than one process) the
+    remaining chunks are sharded across a process pool; results are
+    collected in row order so output is deterministic.
+    """
+    validator = compile_validator(schema)
+    result = ValidationResult(max_errors_per_field=max_errors_per_field)
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    def shards() -> Iterator[_Shard]:
+        start = 0
+        for chunk in _chunked(rows, max(1, chunk_size)):
+            if prehashed:
+                hashes = [digest for digest, _ in chunk]
+                chunk = [row for _, row in chunk]
+            elif cache is not None:
+                hashes = [row_hash(row) for row in chunk]
+            if cache is None:
+                yield start, None, [None] * len(chunk), chunk
+            else:
+                cached = [cache.get(digest) for digest in hashes]
+                todo = [row for row, hit in zip(chunk, cached) if hit is None]
+                yield start, hashes, cached, todo
+            start += len(chunk)
+
+    def collect(shard: _Shard, fresh: List[RowErrors]) -> None:
+        start, hashes, cached, _ = shard
+        fresh_iter = iter(fresh)
+        for offset, hit in enumerate(cached):
+            if hit is None:
+                errors = next(fresh_iter)
+                if cache is not None and hashes is not None:
+                    cache.put(hashes[offset], errors)
+            else:
+                errors = hit
+                result.cached_rows += 1
+            result.add_row(start + offset, errors)
+
+    pending_shards = shards()
+    buffered: List[_Shard] = []
+    to_check = 0
+    for shard in pending_shards:
+        buffered.append(shard)
+        to_check += len(shard[3])
+        if to_check > parallel_threshold:
+            break
+    else:
+        # Few rows to check (or stream exhausted): validate in-process.
+        n_workers = 1
+
+    if n_workers <= 1:
+        for shard in chain(buffered, pending_shards):
+            collect(shard, _check_rows(validator, shard[3]))
+        return result
+
+    pending: deque[Tuple[_Shard, Future[List[RowErrors]]]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_init_worker, initargs=(schema,)
+    ) as pool:
+        for shard in chain(buffered, pending_shards):
+            pending.append((shard, pool.submit(_check_rows_in_worker, shard[3])))
+            # Bound in-flight shards so streaming input stays streaming.
+            while len(pending) >= 2 * n_workers:
+                done, future = pending.popleft()
+                collect(done, future.result())
+        while pending:
+            done, future = pending.popleft()
+            collect(done, future.result())
+    return result
+
+
+# ------------------------- Appendix validation ------------------------------
 def validate_records(
-    records: List[Dict[str, Any]], schema: Dict[str, Any], file_name: str
+    records: List[Dict[str, Any]],
+    schema: Dict[str, Any],
+    file_name: str,
+    *,
+    workers: int | None = None,
 ) -> Tuple[bool, List[str]]:
     """
     Validate records against schema.
 
-    Returns (is_valid, list_of_errors).
+    Returns (is_valid, list_of_errors).  Errors beyond
+    ``MAX_ERRORS_PER_FIELD`` per field are summarised, not listed.
     """
-    errors = []
-
     items_schema = schema.get("items", schema)
 
     if not items_schema or items_schema == {}:
         return True, []
 
-    from jsonschema import Draft7Validator
+    result = validate_rows(records, items_schema, workers=workers)
+    return result.is_valid, result.messages()
 
-    schema_version = items_schema.get("$schema", "")
-    if "2020-12" in schema_version or "2019-09" in schema_version:
-        validator = Draft202012Validator(items_schema)
-    else:
-        validator = Draft7Validator(items_schema)
 
-    for idx, record in enumerate(records):
-        validation_errors = list(validator.iter_errors(record))
-        if validation_errors:
-            for error in validation_errors:
-                error_msg = f"row {idx}: {error.message}"
-                if error.path:
-                    field_path = ".".join(str(p) for p in error.path)
-                    error_msg = f"row {idx}, field '{field_path}': {error.message}"
-                errors.append(error_msg)
+def validate_path(
+    json_file: Path,
+    schema_file: Path,
+    *,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+) -> ValidationResult:
+    """
+    Stream-validate the rows of *json_file* against *schema_file*.
+
+    With *cache_dir*, outcomes are kept in a per-file ``RowCache`` so that
+    only new or changed rows are re-checked on the next run.  Unreadable
+    input yields a failed result rather than raising.
+    """
+    try:
+        schema = load_schema(schema_file)
+        items_schema = schema.get("items", schema)
+        cache = (
+            RowCache.for_data(cache_dir, json_file, items_schema)
+            if cache_dir is not None
+            else None
+        )
+        result = validate_rows(
+            iter_json_rows(json_file, with_hash=cache is not None),
+            items_schema,
+            workers=workers,
+            cache=cache,
+            prehashed=cache is not None,
+        )
+    except FileNotFoundError as e:
+        return ValidationResult.failure(f"File not found: {e}")
+    except json.JSONDecodeError as e:
+        return ValidationResult.failure(f"Invalid JSON: {e}")
+    except Exception as e:
+        return ValidationResult.failure(f"Unexpected error: {e}")
 
-    return len(errors) == 0, errors
+    if cache is not None:
+        cache.save()
+        log.info(
+            "%s: %d of %d rows reused from validation cache",
+            json_file,
+            result.cached_rows,
+            result.row_count,
+        )
+    return result
 
 
 def validate_appendix(
-    appendix_name: str, json_file: Path, schema_file: Path
+    appendix_name: str,
+    json_file: Path,
+    schema_file: Path,
+    *,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
 ) -> Tuple[bool, int, List[str]]:
     """
-    Validate an appendix file.
+    Validate an appendix file, streaming its rows.
 
     Returns (is_valid, record_count, errors).
     """
-    try:
-        records = load_json_file(json_file)
-        schema = load_schema(schema_file)
-        is_valid, errors = validate_records(records, schema, json_file.name)
-        return is_valid, len(records), errors
+    result = validate_path(json_file, schema_file, workers=workers, cache_dir=cache_dir)
+    return result.is_valid, result.row_count, result.messages()
 
-    except FileNotFoundError as e:
-        return False, 0, [f"File not found: {e}"]
-    except json.JSONDecodeError as e:
-        return False, 0, [f"Invalid JSON: {e}"]
-    except Exception as e:
-        return False, 0, [f"Unexpected error: {e}"]
 
+def generate_report(results: Dict[str, Tuple[Any, ...]]) -> str:
+    """Generate markdown validation report.
 
-def generate_report(results: Dict[str, Tuple[bool, int, List[str]]]) -> str:
-    """Generate markdown validation report."""
+    Values are ``(is_valid, row_count, messages)``, optionally followed by
+    the total error count; ``messages`` may be capped, so the count falls
+    back to ``len(messages)`` only when it is not given.
+    """
     lines = ["# ELIS Validation Report (MVP)", ""]
 
-    for appendix_name, (is_valid, count, errors) in results.items():
+    for appendix_name, (is_valid, count, errors, *total) in results.items():
         status = "\u2705 Valid" if is_valid else "\u274c Errors"
         lines.append(f"## {appendix_name} \u2014 {status}")
         lines.append("")
         lines.append(f"- Row count: **{count}**")
 
         if errors:
-            lines.append(f"- Error count: **{len(errors)}**")
+            lines.append(f"- Error count: **{total[0] if total else len(errors)}**")
             lines.append("- Errors:")
             for error in errors[:10]:
                 lines.append(f"  - {error}")
@@ -161,12 +806,15 @@ def _infer_schema(data_path: Path) -> Path | None:
     return None
 
 
-def run_full_validation() -> int:
+def run_full_validation(cache_dir: Path | None = DEFAULT_CACHE_DIR) -> int:
     """Legacy behaviour: validate all canonical appendices, write reports.
 
+    Row outcomes are cached under *cache_dir* (``None`` disables the cache),
+    so unchanged rows are not re-checked on the next run.
+
     Returns 0 always (informational, not blocking).
     """
-    results: Dict[str, Tuple[bool, int, List[str]]] = {}
+    results: Dict[str, Tuple[bool, int, List[str], int]] = {}
 
     for name, (json_rel, schema_rel) in CANONICAL_APPENDICES.items():
         json_file = Path(json_rel)
@@ -178,11 +826,19 @@ def run_full_validation() -> int:
             print(f"[SKIP] {name}: schema not found")
             continue
 
-        is_valid, count, errors = validate_appendix(name, json_file, schema_file)
-        results[name] = (is_valid, count, errors)
+        result = validate_path(json_file, schema_file, cache_dir=cache_dir)
+        results[name] = (
+            result.is_valid,
+            result.row_count,
+            result.messages(),
+            result.error_count,
+        )
 
-        status = "[OK]" if is_valid else "[ERR]"
-        print(f"{status} {name}: rows={count} file={json_file.name}")
+        status = "[OK]" if result.is_valid else "[ERR]"
+        line = f"{status} {name}: rows={result.row_count} file={json_file.name}"
+        if result.cached_rows:
+            line += f" cached={result.cached_rows}"
+        print(line)
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
 
@@ -241,13 +897,18 @@ def main(argv: List[str] | None = None) -> int:
         metavar="FILE",
         help="JSON Schema file (inferred from data filename when omitted)",
     )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every row instead of reusing the row-hash cache",
+    )
     args = ap.parse_args(argv)
 
     data_path_str = args.data_flag or args.data_pos
 
     # No explicit data → legacy full validation run.
     if data_path_str is None:
-        return run_full_validation()
+        return run_full_validation(None if args.no_cache else DEFAULT_CACHE_DIR)
 
     # Explicit data file supplied → single-file validation mode.
     data_path = Path(data_path_str)
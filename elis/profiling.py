@@ -0,0 +1,222 @@
+"""Opt-in CPU and memory profiling for ``elis --profile {cpu,mem,both}``.
+
+``StageProfiler`` wraps one subcommand.  CPU mode runs it under ``cProfile``;
+memory mode traces allocations with ``tracemalloc``; ``both`` does both at
+once (tracemalloc hooks inflate CPU timings, so profile separately when exact
+numbers matter).  Artefacts share the stage's manifest prefix, e.g. for
+``dedup/appendix_a_deduped_manifest.json``:
+
+- ``appendix_a_deduped_profile.json``: summary; top functions by own and
+  cumulative time, the hot path (heaviest call chain from the stage entry
+  point), peak traced memory and the top allocation sites.
+- ``appendix_a_deduped_profile.pstats``: raw cProfile data, loadable with
+  ``python -m pstats`` or snakeviz.
+- ``appendix_a_deduped_profile_cpu.txt``: pstats listing sorted by
+  cumulative time.
+- ``appendix_a_deduped_profile_mem.txt``: tracemalloc top allocations by
+  line.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+PROFILE_MODES = ("cpu", "mem", "both")
+PROFILE_SUFFIX = "_profile.json"
+DEFAULT_TOP = 30
+HOT_PATH_DEPTH = 20
+# One frame per allocation keeps tracemalloc overhead tolerable on full runs.
+TRACEMALLOC_FRAMES = 1
+
+# pstats key: (filename, lineno, function name)
+_Func = tuple[str, int, str]
+
+
+def _label(func: _Func) -> str:
+    filename, lineno, name = func
+    if filename == "~":  # built-in
+        return name
+    return f"{filename}:{lineno}({name})"
+
+
+def _function_rows(
+    stats: dict[_Func, tuple], sort_index: int, top: int, total: float
+) -> list[dict[str, Any]]:
+    ranked = sorted(stats.items(), key=lambda item: item[1][sort_index], reverse=True)
+    return [
+        {
+            "function": _label(func),
+            "calls": nc,
+            "primitive_calls": cc,
+            "own_seconds": round(tt, 6),
+            "cumulative_seconds": round(ct, 6),
+            "cumulative_pct": round(100.0 * ct / total, 2) if total else 0.0,
+        }
+        for func, (cc, nc, tt, ct, _callers) in ranked[:top]
+    ]
+
+
+def hot_path(
+    stats: dict[_Func, tuple], depth: int = HOT_PATH_DEPTH
+) -> list[dict[str, Any]]:
+    """Heaviest call chain: from the costliest root, follow the costliest callee."""
+    callees: dict[_Func, dict[_Func, float]] = {}
+    for func, (_cc, _nc, _tt, _ct, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+    roots = [f for f, row in stats.items() if not row[4]] or list(stats)
+    if not roots:
+        return []
+    current = max(roots, key=lambda f: stats[f][3])
+    total = stats[current][3]
+    path: list[dict[str, Any]] = []
+    seen: set[_Func] = set()
+    while current not in seen and len(path) < depth:
+        seen.add(current)
+        _cc, nc, tt, ct, _callers = stats[current]
+        path.append(
+            {
+                "function": _label(current),
+                "calls": nc,
+                "own_seconds": round(tt, 6),
+                "cumulative_seconds": round(ct, 6),
+                "cumulative_pct": round(100.0 * ct / total, 2) if total else 0.0,
+            }
+        )
+        children = {f: t for f, t in callees.get(current, {}).items() if f not in seen}
+        if not children:
+            break
+        current = max(children, key=children.__getitem__)
+    return path
+
+
+class StageProfiler:
+    """Context manager collecting cProfile and/or tracemalloc data."""
+
+    def __init__(self, mode: str, top: int = DEFAULT_TOP) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"mode must be one of {PROFILE_MODES}, got {mode!r}")
+        self.mode = mode
+        self.top = top
+        self.wall_seconds = 0.0
+        self._profile: cProfile.Profile | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._memory: tuple[int, int] = (0, 0)
+        self._started_tracing = False
+        self._started = 0.0
+
+    @property
+    def cpu(self) -> bool:
+        return self.mode in ("cpu", "both")
+
+    @property
+    def mem(self) -> bool:
+        return self.mode in ("mem", "both")
+
+    def __enter__(self) -> StageProfiler:
+        if self.mem:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        if self.cpu:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        self.wall_seconds = time.perf_counter() - self._started
+        if self.mem:
+            self._memory = tracemalloc.get_traced_memory()
+            self._snapshot = tracemalloc.take_snapshot().filter_traces(
+                (
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib.*>"),
+                )
+            )
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    # -- reporting --------------------------------------------------------
+
+    def summary(self, command: str | None = None) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "mode": self.mode,
+            "command": command,
+            "wall_seconds": round(self.wall_seconds, 6),
+        }
+        if self._profile is not None:
+            stats = pstats.Stats(self._profile).stats  # type: ignore[attr-defined]
+            total = max((row[3] for row in stats.values()), default=0.0)
+            payload["cpu"] = {
+                "profiled_seconds": round(total, 6),
+                "functions": len(stats),
+                "top_cumulative": _function_rows(stats, 3, self.top, total),
+                "top_own": _function_rows(stats, 2, self.top, total),
+                "hot_path": hot_path(stats),
+            }
+        if self._snapshot is not None:
+            current, peak = self._memory
+            payload["memory"] = {
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "top_allocations": [
+                    {
+                        "location": f"{stat.traceback[0].filename}:"
+                        f"{stat.traceback[0].lineno}",
+                        "size_bytes": stat.size,
+                        "count": stat.count,
+                    }
+                    for stat in self._snapshot.statistics("lineno")[: self.top]
+                ],
+            }
+        return payload
+
+    def write(self, prefix: str | Path, command: str | None = None) -> list[Path]:
+        """Write artefacts named ``<prefix>_profile*``; return their paths."""
+        prefix = Path(prefix)
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+
+        def target(suffix: str) -> Path:
+            return prefix.with_name(prefix.name + suffix)
+
+        written = []
+        summary_path = target(PROFILE_SUFFIX)
+        summary_path.write_text(
+            json.dumps(self.summary(command), indent=2) + "\n", encoding="utf-8"
+        )
+        written.append(summary_path)
+        if self._profile is not None:
+            pstats_path = target("_profile.pstats")
+            self._profile.dump_stats(str(pstats_path))
+            listing = io.StringIO()
+            pstats.Stats(self._profile, stream=listing).sort_stats(
+                "cumulative"
+            ).print_stats(self.top * 2)
+            cpu_path = target("_profile_cpu.txt")
+            cpu_path.write_text(listing.getvalue(), encoding="utf-8")
+            written += [pstats_path, cpu_path]
+        if self._snapshot is not None:
+            current, peak = self._memory
+            lines = [
+                f"current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB",
+                "",
+                *(
+                    str(stat)
+                    for stat in self._snapshot.statistics("lineno")[: self.top]
+                ),
+            ]
+            mem_path = target("_profile_mem.txt")
+            mem_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            written.append(mem_path)
+        return written
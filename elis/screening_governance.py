@@ -1,15 +1,24 @@
 """Screening governance helpers for PE-SLR-04.
 
 Adds provenance/rationale field enforcement, borderline-case detection,
-reproducible audit bundles, and capacity/throttling policy for local screening.
+reproducible audit bundles, capacity/throttling policy for local screening,
+and a chunked, checkpointed executor that processes every record within that
+policy instead of truncating at the per-run cap.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import time
 from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
 
 # ---------------------------------------------------------------------------
@@ -179,5 +188,216 @@ def enforce_capacity(
     records: list[Any],
     policy: CapacityPolicy = DEFAULT_CAPACITY_POLICY,
 ) -> list[Any]:
-    """Return records truncated to policy.max_records_per_run."""
+    """Return records truncated to policy.max_records_per_run.
+
+    Records beyond the cap are dropped; use ``run_batched`` to process a full
+    set as a sequence of policy-sized runs.
+    """
     return records[: policy.max_records_per_run]
+
+
+# ---------------------------------------------------------------------------
+# AC-4b: Chunked, checkpointed execution
+# ---------------------------------------------------------------------------
+
+CHECKPOINT_VERSION = 1
+
+
+def batch_size(policy: CapacityPolicy = DEFAULT_CAPACITY_POLICY) -> int:
+    """Records per batch: one batch never exceeds a single run's cap."""
+    return min(policy.max_records_per_batch, policy.max_records_per_run)
+
+
+def plan_batches(
+    records: list[Any],
+    policy: CapacityPolicy = DEFAULT_CAPACITY_POLICY,
+) -> list[list[Any]]:
+    """Split *records* into consecutive policy-sized batches (nothing dropped)."""
+    size = batch_size(policy)
+    return [records[start : start + size] for start in range(0, len(records), size)]
+
+
+def _records_fingerprint(records: list[Any]) -> str:
+    payload = json.dumps(records, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class BatchRunReport:
+    """Outcome of one ``run_batched`` invocation."""
+
+    total_records: int
+    batch_size: int
+    batch_count: int
+    batches_processed: list[int] = field(default_factory=list)
+    batches_resumed: list[int] = field(default_factory=list)
+    rows: list[Any] = field(default_factory=list)
+    throttle_seconds: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        done = len(self.batches_processed) + len(self.batches_resumed)
+        return done == self.batch_count
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total_records": self.total_records,
+            "batch_size": self.batch_size,
+            "batch_count": self.batch_count,
+            "batches_processed": sorted(self.batches_processed),
+            "batches_resumed": sorted(self.batches_resumed),
+            "rows_written": len(self.rows),
+            "throttle_seconds": round(self.throttle_seconds, 3),
+            "complete": self.complete,
+        }
+
+
+class BatchCheckpoint:
+    """Completed-batch ledger under *directory* (``checkpoint.json`` + outputs).
+
+    A checkpoint is bound to the input fingerprint and batch size; reusing the
+    directory for different input raises ``ValueError`` unless ``reset()`` is
+    called first.  The ledger is rewritten atomically after every batch, so an
+    interrupted run resumes from the last completed batch.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.path = directory / "checkpoint.json"
+        self._lock = threading.Lock()
+        self._state: dict[str, Any] = {}
+        if self.path.exists():
+            self._state = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def bind(self, fingerprint: str, size: int, total: int) -> None:
+        if self._state:
+            bound = (self._state.get("input_sha256"), self._state.get("batch_size"))
+            if bound != (fingerprint, size):
+                raise ValueError(
+                    f"Checkpoint {self.path} belongs to a different input or batch "
+                    "size; reset it to start over."
+                )
+            return
+        self._state = {
+            "version": CHECKPOINT_VERSION,
+            "input_sha256": fingerprint,
+            "batch_size": size,
+            "total_records": total,
+            "completed": {},
+            "last_batch_started_at": None,
+        }
+        self._save()
+
+    def reset(self) -> None:
+        with self._lock:
+            for name in self._state.get("completed", {}).values():
+                (self.directory / name["file"]).unlink(missing_ok=True)
+            self.path.unlink(missing_ok=True)
+            self._state = {}
+
+    def completed(self) -> set[int]:
+        return {int(index) for index in self._state.get("completed", {})}
+
+    def rows(self, index: int) -> list[Any]:
+        entry = self._state["completed"][str(index)]
+        return json.loads((self.directory / entry["file"]).read_text(encoding="utf-8"))
+
+    @property
+    def last_batch_started_at(self) -> float | None:
+        return self._state.get("last_batch_started_at")
+
+    def mark_started(self, started_at: float) -> None:
+        with self._lock:
+            self._state["last_batch_started_at"] = started_at
+            self._save()
+
+    def mark_completed(self, index: int, rows: list[Any]) -> None:
+        name = f"batch_{index:05d}.json"
+        self._write(self.directory / name, rows)
+        with self._lock:
+            self._state["completed"][str(index)] = {
+                "file": name,
+                "rows": len(rows),
+                "completed_at": _now_utc_iso(),
+            }
+            self._save()
+
+    def _save(self) -> None:
+        self._write(self.path, self._state)
+
+    @staticmethod
+    def _write(path: Path, payload: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{threading.get_ident()}.tmp")
+        tmp.write_text(
+            json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        os.replace(tmp, path)
+
+
+def run_batched(
+    records: list[Any],
+    process_batch: Callable[[list[Any]], list[Any]],
+    *,
+    checkpoint_dir: Path,
+    policy: CapacityPolicy = DEFAULT_CAPACITY_POLICY,
+    max_batches: int | None = None,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+) -> BatchRunReport:
+    """Process every record in policy-sized batches, checkpointing each batch.
+
+    - Batches hold at most ``batch_size(policy)`` records and run with up to
+      ``policy.max_concurrent_runs`` in flight.
+    - Consecutive batch starts are at least ``policy.min_seconds_between_runs``
+      apart, including across invocations (the last start is checkpointed).
+    - Batches already recorded in *checkpoint_dir* are not re-run; their rows
+      are loaded from the checkpoint.  *max_batches* bounds how many new
+      batches this invocation processes, leaving the rest for a later resume.
+
+    Returned ``rows`` are in input order across resumed and new batches.
+    """
+    batches = plan_batches(records, policy)
+    checkpoint = BatchCheckpoint(checkpoint_dir)
+    checkpoint.bind(_records_fingerprint(records), batch_size(policy), len(records))
+
+    done = checkpoint.completed()
+    pending = [index for index in range(len(batches)) if index not in done]
+    if max_batches is not None:
+        pending = pending[: max(0, max_batches)]
+
+    report = BatchRunReport(
+        total_records=len(records),
+        batch_size=batch_size(policy),
+        batch_count=len(batches),
+        batches_resumed=sorted(done),
+    )
+    spacing = policy.min_seconds_between_runs
+    gate = threading.Lock()
+
+    def _run(index: int) -> list[Any]:
+        with gate:
+            last = checkpoint.last_batch_started_at
+            if spacing and last is not None:
+                wait = last + spacing - clock()
+                if wait > 0:
+                    report.throttle_seconds += wait
+                    sleep(wait)
+            checkpoint.mark_started(clock())
+        rows = process_batch(batches[index])
+        checkpoint.mark_completed(index, rows)
+        return rows
+
+    results: dict[int, list[Any]] = {}
+    with ThreadPoolExecutor(max_workers=policy.max_concurrent_runs) as pool:
+        futures = {index: pool.submit(_run, index) for index in pending}
+        for index, future in futures.items():
+            results[index] = future.result()
+    report.batches_processed = sorted(results)
+
+    for index in range(len(batches)):
+        if index in results:
+            report.rows.extend(results[index])
+        elif index in done:
+            report.rows.extend(checkpoint.rows(index))
+    return report
@@ -11,11 +11,19 @@ from __future__ import annotations
 import importlib
 import json
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from elis.screening_governance import (
+    DEFAULT_CAPACITY_POLICY,
+    BatchCheckpoint,
+    CapacityPolicy,
+    run_batched,
+)
+from elis.workload_placement_policy import LocalAdmissionController
+
 
 RUNTIME_STATE_DIR_NAMES = {".openclaw", ".claude", ".codex", ".config"}
 
@@ -76,6 +84,18 @@ class ScreeningWorkspaceContract:
     def pilot_manifest(self) -> Path:
         return self.audit_dir() / "screening_pilot_manifest.json"
 
+    def batch_checkpoint_dir(self) -> Path:
+        return self.audit_dir() / "batches"
+
+    def human_decisions(self) -> Path:
+        return self.input_dir() / "screening_decisions.json"
+
+    def prioritised_queue(self) -> Path:
+        return self.output_dir() / "screening_queue.json"
+
+    def prioritisation_report(self) -> Path:
+        return self.audit_dir() / "screening_prioritisation_report.json"
+
     def appendix_a_schema(self) -> Path:
         return Path("schemas/appendix_a.schema.json")
 
@@ -171,8 +191,28 @@ def run_bounded_screening_pilot(
     contract: ScreeningWorkspaceContract,
     appendix_a_path: Path,
     record_cap: int = 100,
+    admission: LocalAdmissionController | None = None,
+    admission_timeout: float | None = None,
+) -> dict[str, Any]:
+    """Run bounded local pilot and persist auditable outputs.
+
+    With *admission*, the run first waits for a host-wide ``screening`` slot
+    (raising ``AdmissionTimeout`` after *admission_timeout* seconds) and holds
+    it until the artefacts are written.
+    """
+    if admission is None:
+        return _run_bounded_screening_pilot(contract, appendix_a_path, record_cap)
+    with admission.slot("screening", timeout=admission_timeout) as ticket:
+        report = _run_bounded_screening_pilot(contract, appendix_a_path, record_cap)
+    report["admission_wait_seconds"] = ticket.waited_seconds
+    return report
+
+
+def _run_bounded_screening_pilot(
+    contract: ScreeningWorkspaceContract,
+    appendix_a_path: Path,
+    record_cap: int,
 ) -> dict[str, Any]:
-    """Run bounded local pilot and persist auditable outputs."""
     contract.ensure_dirs()
     assert_non_runtime_storage(contract.appendix_b_output())
     assert_non_runtime_storage(contract.pilot_report())
@@ -222,3 +262,176 @@ def run_bounded_screening_pilot(
     )
 
     return report
+
+
+def run_batched_screening(
+    *,
+    contract: ScreeningWorkspaceContract,
+    appendix_a_path: Path,
+    policy: CapacityPolicy = DEFAULT_CAPACITY_POLICY,
+    max_batches: int | None = None,
+    reset: bool = False,
+    admission: LocalAdmissionController | None = None,
+    admission_timeout: float | None = None,
+) -> dict[str, Any]:
+    """Screen every Appendix A record in checkpointed, policy-sized batches.
+
+    Unlike the bounded pilot nothing is cut off: the input is split by
+    ``run_batched`` and completed batches are recorded under
+    ``contract.batch_checkpoint_dir()``, so a rerun (or a run limited by
+    *max_batches*) resumes where the previous one stopped.  Appendix B is
+    rewritten with every row produced so far.  With *admission*, the run holds
+    host-wide ``screening`` slots for ``policy.max_concurrent_runs`` batches.
+    """
+    if admission is None:
+        return _run_batched_screening(
+            contract, appendix_a_path, policy, max_batches, reset
+        )
+    with admission.slot(
+        "screening",
+        requested_concurrency=policy.max_concurrent_runs,
+        timeout=admission_timeout,
+    ) as ticket:
+        granted = replace(policy, max_concurrent_runs=ticket.slots)
+        report = _run_batched_screening(
+            contract, appendix_a_path, granted, max_batches, reset
+        )
+    report["admission_wait_seconds"] = ticket.waited_seconds
+    return report
+
+
+def _run_batched_screening(
+    contract: ScreeningWorkspaceContract,
+    appendix_a_path: Path,
+    policy: CapacityPolicy,
+    max_batches: int | None,
+    reset: bool,
+) -> dict[str, Any]:
+    contract.ensure_dirs()
+    assert_non_runtime_storage(contract.appendix_b_output())
+    assert_non_runtime_storage(contract.batch_checkpoint_dir())
+
+    records = _load_appendix_a(appendix_a_path)
+    if reset:
+        BatchCheckpoint(contract.batch_checkpoint_dir()).reset()
+    run = run_batched(
+        records,
+        _to_appendix_b_rows,
+        checkpoint_dir=contract.batch_checkpoint_dir(),
+        policy=policy,
+        max_batches=max_batches,
+    )
+    contract.appendix_b_output().write_text(
+        json.dumps(run.rows, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+
+    report = {
+        "review_id": contract.review_id,
+        "stage": "screening-batched",
+        "appendix_a_input_path": appendix_a_path.as_posix(),
+        "appendix_b_output_path": contract.appendix_b_output().as_posix(),
+        "checkpoint_path": contract.batch_checkpoint_dir().as_posix(),
+        "records_seen": len(records),
+        **run.as_dict(),
+        "stored_outside_runtime_state": True,
+        "generated_at": now_utc_iso(),
+    }
+    contract.pilot_report().write_text(
+        json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    manifest = {
+        "schema_version": "1.0",
+        "review_id": contract.review_id,
+        "stage": "screening",
+        "pilot_mode": "batched",
+        "batch_size": run.batch_size,
+        "complete": run.complete,
+        "artefacts": {
+            "appendix_b_output": contract.appendix_b_output().as_posix(),
+            "pilot_report": contract.pilot_report().as_posix(),
+            "batch_checkpoint": contract.batch_checkpoint_dir().as_posix(),
+        },
+        "generated_at": now_utc_iso(),
+    }
+    contract.pilot_manifest().write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    return report
+
+
+def run_prioritised_screening(
+    *,
+    contract: ScreeningWorkspaceContract,
+    appendix_a_path: Path,
+    decisions_path: Path | None = None,
+    batch_size: int = 100,
+    recall_target: float = 0.95,
+    min_screened: int = 50,
+    seed_text: str = "",
+) -> dict[str, Any]:
+    """Rank unscreened records by learned relevance and emit the next batch.
+
+    Human decisions are read from *decisions_path* (default
+    ``contract.human_decisions()``), as Appendix B-style rows with
+    ``included``/``excluded`` decisions.  The next *batch_size* records go to
+    ``contract.prioritised_queue()``, most likely relevant first, and the
+    report records the recall estimate and whether screening can stop.
+    Requires the ``screening`` extra (NumPy, SciPy).
+    """
+    from elis.screening_prioritisation import (
+        ActiveLearningScreener,
+        decisions_from_rows,
+    )
+
+    contract.ensure_dirs()
+    assert_non_runtime_storage(contract.prioritised_queue())
+    assert_non_runtime_storage(contract.prioritisation_report())
+
+    records = _load_appendix_a(appendix_a_path)
+    decisions_path = decisions_path or contract.human_decisions()
+    decisions: dict[str, str] = {}
+    if decisions_path.exists():
+        payload = json.loads(decisions_path.read_text(encoding="utf-8"))
+        if not isinstance(payload, list):
+            raise ValueError(
+                f"Screening decisions must be a JSON array: {decisions_path}"
+            )
+        decisions = decisions_from_rows(payload)
+
+    screener = ActiveLearningScreener(
+        records,
+        seed_text=seed_text,
+        recall_target=recall_target,
+        min_screened=min_screened,
+    )
+    screener.record_decisions(decisions)
+    status = screener.status()
+    queue = [] if status.stop else screener.ranked()[: max(0, batch_size)]
+    contract.prioritised_queue().write_text(
+        json.dumps(
+            [
+                {"rank": rank, "relevance_score": round(score, 6), **record}
+                for rank, (record, score) in enumerate(queue, start=1)
+            ],
+            indent=2,
+            ensure_ascii=False,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    report = {
+        "review_id": contract.review_id,
+        "stage": "screening-prioritisation",
+        "appendix_a_input_path": appendix_a_path.as_posix(),
+        "decisions_path": decisions_path.as_posix(),
+        "queue_path": contract.prioritised_queue().as_posix(),
+        "queued": len(queue),
+        **status.as_dict(),
+        "generated_at": now_utc_iso(),
+    }
+    contract.prioritisation_report().write_text(
+        json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    return report
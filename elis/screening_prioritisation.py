@@ -0,0 +1,369 @@
+"""Local, CPU-only relevance prioritisation for title/abstract screening.
+
+Reviewers label records in batches; after each batch the engine retrains a
+lightweight classifier on every human include/exclude decision and re-ranks
+the records still unscreened, so likely-relevant records surface first.
+Screening can stop once the estimated recall reaches a configurable target.
+
+- Features: TF-IDF over title + abstract (sublinear term frequency, smoothed
+  IDF, L2-normalised rows) held in a ``scipy.sparse`` CSR matrix.
+- Model: L2-regularised logistic regression trained by full-batch gradient
+  descent on the labelled rows, warm-started from the previous weights, with
+  balanced class weights (relevant records are rare).
+- Cold start: until both classes are labelled, records are ranked by cosine
+  similarity to an optional seed text (e.g. the research question), otherwise
+  kept in input order.
+- Recall estimate: ``found / (found + expected relevant among the unscreened)``,
+  where the expectation sums prior-corrected probabilities.  The labelled
+  sample over-represents relevant records, so the correction is partial, the
+  estimate errs low and stopping errs late.
+
+NumPy and SciPy are an optional extra: ``pip install 'elis-slr-agent[screening]'``.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - optional extra
+    np = None  # type: ignore[assignment]
+    sparse = None  # type: ignore[assignment]
+
+
+DEFAULT_RECALL_TARGET = 0.95
+TRAINING_DECISIONS = {"included": 1, "excluded": 0}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    """
+    a about above after again against all also an and any are as at be because
+    been before being between both but by can could did do does doing during each
+    few for from further had has have having here how i if in into is it its
+    itself more most no nor not of off on once only or other our out over own
+    same should so some such than that the their them then there these they
+    this those through to too under until up very was we were what when where
+    which while who whom why will with would you your using based study paper
+    """.split()
+)
+
+
+def _require_numeric() -> None:
+    if np is None or sparse is None:
+        raise ImportError(
+            "Screening prioritisation needs NumPy and SciPy: "
+            "pip install 'elis-slr-agent[screening]'"
+        )
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case alphanumeric tokens without stopwords or 1-character noise."""
+    return [
+        token
+        for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS and not token.isdigit()
+    ]
+
+
+def record_text(record: Mapping[str, Any]) -> str:
+    """Title and abstract joined; the title is weighted by repetition."""
+    title = str(record.get("title") or "")
+    abstract = str(record.get("abstract") or "")
+    return f"{title} {title} {abstract}"
+
+
+# ---------------------------------------------------------------------------
+# TF-IDF
+# ---------------------------------------------------------------------------
+
+
+class TfidfVectoriser:
+    """Sparse TF-IDF features fitted on one screening corpus."""
+
+    def __init__(self, *, min_df: int = 2, max_features: int | None = 50_000):
+        _require_numeric()
+        self.min_df = min_df
+        self.max_features = max_features
+        self.vocabulary: dict[str, int] = {}
+        self.idf: Any = None
+
+    def fit_transform(self, texts: list[str]) -> Any:
+        tokenised = [Counter(tokenize(text)) for text in texts]
+        document_frequency: Counter[str] = Counter()
+        for counts in tokenised:
+            document_frequency.update(counts.keys())
+        # Corpora smaller than min_df documents keep every term.
+        min_df = min(self.min_df, max(1, len(texts)))
+        terms = [t for t, df in document_frequency.items() if df >= min_df]
+        terms.sort(key=lambda t: (-document_frequency[t], t))
+        if self.max_features is not None:
+            terms = terms[: self.max_features]
+        self.vocabulary = {term: index for index, term in enumerate(sorted(terms))}
+        n_docs = len(texts)
+        self.idf = np.array(
+            [
+                math.log((1 + n_docs) / (1 + document_frequency[term])) + 1.0
+                for term in sorted(terms)
+            ]
+        )
+        return self._matrix(tokenised)
+
+    def transform(self, texts: list[str]) -> Any:
+        return self._matrix([Counter(tokenize(text)) for text in texts])
+
+    def _matrix(self, tokenised: list[Counter[str]]) -> Any:
+        indptr = [0]
+        indices: list[int] = []
+        data: list[float] = []
+        for counts in tokenised:
+            for term, count in counts.items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    indices.append(column)
+                    data.append(1.0 + math.log(count))
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.array(data), np.array(indices, dtype=np.int64), np.array(indptr)),
+            shape=(len(tokenised), len(self.vocabulary)),
+        )
+        matrix = matrix.multiply(self.idf).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1.0 / norms) @ matrix
+
+
+# ---------------------------------------------------------------------------
+# Classifier
+# ---------------------------------------------------------------------------
+
+
+class IncrementalLogisticClassifier:
+    """Logistic regression over sparse rows, warm-started between fits."""
+
+    def __init__(
+        self,
+        n_features: int,
+        *,
+        l2: float = 1e-3,
+        learning_rate: float = 1.0,
+        epochs: int = 60,
+    ) -> None:
+        _require_numeric()
+        self.weights = np.zeros(n_features)
+        self.bias = 0.0
+        self.l2 = l2
+        self.learning_rate = learning_rate
+        self.epochs = epochs
+
+    def partial_fit(self, features: Any, labels: Any) -> None:
+        """Continue gradient descent from the current weights."""
+        labels = np.asarray(labels, dtype=float)
+        positives = labels.sum()
+        negatives = len(labels) - positives
+        if positives == 0 or negatives == 0:
+            return
+        sample_weight = np.where(
+            labels == 1,
+            len(labels) / (2.0 * positives),
+            len(labels) / (2.0 * negatives),
+        )
+        scale = 1.0 / len(labels)
+        for _ in range(self.epochs):
+            residual = (self.predict_proba(features) - labels) * sample_weight
+            gradient = features.T @ residual * scale + self.l2 * self.weights
+            self.weights -= self.learning_rate * gradient
+            self.bias -= self.learning_rate * residual.sum() * scale
+
+    def decision_function(self, features: Any) -> Any:
+        return features @ self.weights + self.bias
+
+    def predict_proba(self, features: Any) -> Any:
+        return 1.0 / (1.0 + np.exp(-np.clip(self.decision_function(features), -30, 30)))
+
+
+# ---------------------------------------------------------------------------
+# Active-learning loop
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class PrioritisationStatus:
+    total_records: int
+    screened: int
+    included: int
+    excluded: int
+    estimated_relevant_remaining: float
+    estimated_recall: float | None
+    recall_target: float
+    stop: bool
+    mode: str  # "cold-start" | "model"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total_records": self.total_records,
+            "screened": self.screened,
+            "included": self.included,
+            "excluded": self.excluded,
+            "estimated_relevant_remaining": round(self.estimated_relevant_remaining, 3),
+            "estimated_recall": (
+                None
+                if self.estimated_recall is None
+                else round(self.estimated_recall, 4)
+            ),
+            "recall_target": self.recall_target,
+            "stop": self.stop,
+            "mode": self.mode,
+        }
+
+
+class ActiveLearningScreener:
+    """Rank unscreened records by predicted relevance, retraining per batch.
+
+    *records* are Appendix A-style dicts identified by ``id_field``.  Feed
+    human decisions with ``record_decisions`` (``included``/``excluded``;
+    anything else is ignored for training), then call ``next_batch``.
+    """
+
+    def __init__(
+        self,
+        records: list[Mapping[str, Any]],
+        *,
+        id_field: str = "id",
+        seed_text: str = "",
+        recall_target: float = DEFAULT_RECALL_TARGET,
+        min_screened: int = 50,
+        min_df: int = 2,
+    ) -> None:
+        _require_numeric()
+        if not 0 < recall_target <= 1:
+            raise ValueError("recall_target must be in (0, 1]")
+        self.records = list(records)
+        self.ids = [
+            str(record.get(id_field) or index) for index, record in enumerate(records)
+        ]
+        if len(set(self.ids)) != len(self.ids):
+            raise ValueError(f"Record '{id_field}' values must be unique")
+        self._row = {record_id: row for row, record_id in enumerate(self.ids)}
+        self.recall_target = recall_target
+        self.min_screened = min_screened
+
+        self.vectoriser = TfidfVectoriser(min_df=min_df)
+        self.features = self.vectoriser.fit_transform(
+            [record_text(record) for record in self.records]
+        )
+        self.classifier = IncrementalLogisticClassifier(self.features.shape[1])
+        self.labels: dict[int, int] = {}
+        self._trained_on = 0
+        self._seed_scores = None
+        if seed_text.strip():
+            seed = self.vectoriser.transform([seed_text])
+            self._seed_scores = np.asarray((self.features @ seed.T).todense()).ravel()
+
+    # -- decisions --------------------------------------------------------
+
+    def record_decisions(self, decisions: Mapping[str, str]) -> int:
+        """Add ``{record_id: decision}``; returns how many were new labels."""
+        added = 0
+        for record_id, decision in decisions.items():
+            label = TRAINING_DECISIONS.get(str(decision).strip().lower())
+            row = self._row.get(str(record_id))
+            if label is None or row is None:
+                continue
+            if self.labels.get(row) != label:
+                self.labels[row] = label
+                added += 1
+        if added:
+            self._retrain()
+        return added
+
+    def _has_both_classes(self) -> bool:
+        return len(set(self.labels.values())) == 2
+
+    def _retrain(self) -> None:
+        if not self._has_both_classes():
+            return
+        rows = sorted(self.labels)
+        self.classifier.partial_fit(
+            self.features[rows], [self.labels[row] for row in rows]
+        )
+        self._trained_on = len(rows)
+
+    # -- ranking ----------------------------------------------------------
+
+    def _unscreened(self) -> list[int]:
+        return [row for row in range(len(self.records)) if row not in self.labels]
+
+    def scores(self) -> Any:
+        """Relevance score per record (probability once a model exists)."""
+        if self._has_both_classes():
+            return self.classifier.predict_proba(self.features)
+        if self._seed_scores is not None:
+            return self._seed_scores
+        return np.zeros(len(self.records))
+
+    def ranked(self) -> list[tuple[Mapping[str, Any], float]]:
+        """All unscreened records, most likely relevant first (stable ties)."""
+        scores = self.scores()
+        rows = self._unscreened()
+        rows.sort(key=lambda row: (-scores[row], row))
+        return [(self.records[row], float(scores[row])) for row in rows]
+
+    def next_batch(self, size: int) -> list[Mapping[str, Any]]:
+        return [record for record, _score in self.ranked()[: max(0, size)]]
+
+    # -- stopping ---------------------------------------------------------
+
+    def status(self) -> PrioritisationStatus:
+        included = sum(self.labels.values())
+        excluded = len(self.labels) - included
+        model = self._has_both_classes()
+        remaining = 0.0
+        recall: float | None = None
+        if model:
+            # Undo the balanced-class odds shift using the labelled class ratio.
+            # Active selection over-samples relevant records, so the correction
+            # is partial and the estimate still errs low.
+            odds = np.exp(self.classifier.decision_function(self.features))
+            odds = odds * (included / excluded)
+            probabilities = odds / (1.0 + odds)
+            remaining = float(probabilities[self._unscreened()].sum())
+            recall = included / (included + remaining) if included else 0.0
+        unscreened = len(self.records) - len(self.labels)
+        stop = unscreened == 0 or (
+            recall is not None
+            and len(self.labels) >= self.min_screened
+            and recall >= self.recall_target
+        )
+        return PrioritisationStatus(
+            total_records=len(self.records),
+            screened=len(self.labels),
+            included=included,
+            excluded=excluded,
+            estimated_relevant_remaining=remaining,
+            estimated_recall=recall,
+            recall_target=self.recall_target,
+            stop=stop,
+            mode="model" if model else "cold-start",
+        )
+
+
+def decisions_from_rows(rows: Iterable[Mapping[str, Any]]) -> dict[str, str]:
+    """``{record id: decision}`` from Appendix B rows (last row per id wins).
+
+    Appendix B rows carry their own ``id`` and point at the Appendix A record
+    through ``source_id``; rows without ``source_id`` fall back to ``id``.
+    """
+    decisions: dict[str, str] = {}
+    for row in rows:
+        if not isinstance(row, Mapping):
+            continue
+        record_id = row.get("source_id") or row.get("id")
+        if record_id:
+            decisions[str(record_id)] = str(row.get("decision", ""))
+    return decisions
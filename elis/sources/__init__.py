@@ -1,19 +1,40 @@
 """ELIS source adapter registry.
 
-Adapters self-register via the ``@register`` decorator.  Import this
-module to ensure all bundled adapters are loaded, then use
-``get_adapter(name)`` to retrieve a class by its lowercase source key.
+Bundled adapters are declared in ``BUILTIN_ADAPTERS`` (source key ->
+module path) and imported only when first requested, so listing sources
+or reading adapter versions never imports ``requests`` or any adapter
+module.  Adapters register their class via the ``@register`` decorator
+when their module is imported; use ``get_adapter(name)`` to retrieve a
+class by its lowercase source key.
 """
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
+import re
+import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from elis.sources.base import SourceAdapter
 
+# Declarative registry of bundled adapters: source key -> defining module.
+BUILTIN_ADAPTERS: dict[str, str] = {
+    "crossref": "elis.sources.crossref",
+    "openalex": "elis.sources.openalex",
+    "scopus": "elis.sources.scopus",
+    "semanticscholar": "elis.sources.semanticscholar",
+}
+
 _REGISTRY: dict[str, type[SourceAdapter]] = {}
 
+_VERSION_RE = re.compile(
+    r"^(?:__version__|ADAPTER_VERSION)\s*(?::\s*str\s*)?=\s*['\"]([^'\"]+)['\"]",
+    re.MULTILINE,
+)
+
 
 def register(name: str):
     """Class decorator that registers an adapter under *name*."""
@@ -28,34 +49,56 @@ def register(name: str):
 def get_adapter(name: str) -> type[SourceAdapter]:
     """Return the adapter **class** registered under *name*.
 
-    Raises ``ValueError`` if *name* is not registered.
+    Only the module declaring *name* is imported.  Raises ``ValueError``
+    if *name* is not registered.
     """
-    _ensure_loaded()
+    if name not in _REGISTRY and name in BUILTIN_ADAPTERS:
+        importlib.import_module(BUILTIN_ADAPTERS[name])
     if name not in _REGISTRY:
-        raise ValueError(f"Unknown source: {name!r}. Available: {sorted(_REGISTRY)}")
+        raise ValueError(f"Unknown source: {name!r}. Available: {available_sources()}")
     return _REGISTRY[name]
 
 
 def available_sources() -> list[str]:
-    """Return sorted list of registered source names."""
-    _ensure_loaded()
-    return sorted(_REGISTRY)
-
+    """Return sorted list of registered source names (imports nothing)."""
+    return sorted(set(BUILTIN_ADAPTERS) | set(_REGISTRY))
 
-# ------------------------------------------------------------------
-# Lazy import to trigger registration decorators
-# ------------------------------------------------------------------
 
-_loaded = False
+@lru_cache(maxsize=None)
+def adapter_version(name: str) -> str:
+    """Return the version string of the adapter registered under *name*.
 
-
-def _ensure_loaded() -> None:
-    global _loaded  # noqa: PLW0603
-    if _loaded:
-        return
-    # Import adapter modules so their @register decorators execute.
-    import elis.sources.crossref  # noqa: F401
-    import elis.sources.openalex  # noqa: F401
-    import elis.sources.scopus  # noqa: F401
-
-    _loaded = True
+    Reads ``__version__`` / ``ADAPTER_VERSION`` from the adapter module,
+    from the already-imported module when available and otherwise from its
+    source text, so no adapter is imported just to be versioned.  Adapters
+    without either attribute are ``"builtin"``; unresolvable ones
+    ``"unknown"``.  Cached per process.
+    """
+    if name in _REGISTRY:
+        module_name = _REGISTRY[name].__module__
+    elif name in BUILTIN_ADAPTERS:
+        module_name = BUILTIN_ADAPTERS[name]
+    else:
+        return "unknown"
+
+    module = sys.modules.get(module_name)
+    if module is not None:
+        version = getattr(module, "__version__", None) or getattr(
+            module, "ADAPTER_VERSION", None
+        )
+        return str(version or "builtin")
+
+    try:
+        spec = importlib.util.find_spec(module_name)
+        if spec is None or not spec.origin:
+            return "unknown"
+        with open(spec.origin, encoding="utf-8") as fh:
+            match = _VERSION_RE.search(fh.read())
+    except (ImportError, OSError, ValueError):
+        return "unknown"
+    return match.group(1) if match else "builtin"
+
+
+def adapter_versions() -> dict[str, str]:
+    """Return ``{source: version}`` for every available source."""
+    return {name: adapter_version(name) for name in available_sources()}
@@ -3,7 +3,91 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterator
+from typing import Any, Iterable, Iterator
+
+# Record fields that identify a harvested record across runs (besides DOI).
+RECORD_ID_FIELDS = ("openalex_id", "crossref_id", "scopus_id", "s2_id")
+
+
+def record_keys(record: dict[str, Any]) -> set[str]:
+    """Return the identity keys (DOI + source IDs) of a harvested record."""
+    keys: set[str] = set()
+    doi = str(record.get("doi") or "").strip().lower()
+    if doi:
+        keys.add(f"doi:{doi}")
+    for field in RECORD_ID_FIELDS:
+        value = record.get(field)
+        if value:
+            keys.add(f"{field}:{value}")
+    return keys
+
+
+class SaturationPolicy:
+    """Optional early-stop policy for adapter pagination.
+
+    A query stops paging after *patience* consecutive pages whose share of
+    new records (not matching any key seen before) is below
+    *min_new_ratio*.  The policy is seeded with the keys already held (e.g.
+    the existing output file) and learns every key it observes, so
+    overlapping queries in one run saturate too.  Stops are collected in
+    :meth:`report` for the run manifest.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_new_ratio: float = 0.1,
+        patience: int = 2,
+        known_records: Iterable[dict[str, Any]] = (),
+    ) -> None:
+        if not 0.0 <= min_new_ratio <= 1.0:
+            raise ValueError("min_new_ratio must be between 0 and 1")
+        if patience < 1:
+            raise ValueError("patience must be >= 1")
+        self.min_new_ratio = min_new_ratio
+        self.patience = patience
+        self._known: set[str] = set()
+        for record in known_records:
+            self._known |= record_keys(record)
+        self._low_pages: dict[str, int] = {}
+        self._pages: dict[str, int] = {}
+        self._stopped: list[dict[str, Any]] = []
+
+    def should_stop(self, query: str, page: list[dict[str, Any]]) -> bool:
+        """Observe one fetched *page* for *query*; return True to stop paging."""
+        new = 0
+        for record in page:
+            keys = record_keys(record)
+            if not keys or not keys & self._known:
+                new += 1
+            self._known |= keys
+
+        self._pages[query] = self._pages.get(query, 0) + 1
+        ratio = new / len(page) if page else 0.0
+        if ratio < self.min_new_ratio:
+            self._low_pages[query] = self._low_pages.get(query, 0) + 1
+        else:
+            self._low_pages[query] = 0
+
+        if self._low_pages[query] < self.patience:
+            return False
+        self._stopped.append(
+            {
+                "query": query,
+                "pages_fetched": self._pages[query],
+                "last_new_ratio": round(ratio, 4),
+            }
+        )
+        return True
+
+    def report(self) -> dict[str, Any]:
+        """Return policy settings and saturated queries for manifests."""
+        return {
+            "min_new_ratio": self.min_new_ratio,
+            "patience": self.patience,
+            "pages_observed": sum(self._pages.values()),
+            "saturated_queries": list(self._stopped),
+        }
 
 
 class SourceAdapter(ABC):
@@ -24,12 +108,22 @@ class SourceAdapter(ABC):
         """
 
     @abstractmethod
-    def harvest(self, queries: list[str], max_results: int) -> Iterator[dict]:
+    def harvest(
+        self,
+        queries: list[str],
+        max_results: int,
+        *,
+        saturation: SaturationPolicy | None = None,
+    ) -> Iterator[dict]:
         """Yield normalised records for *queries*, up to *max_results* total.
 
         Each yielded dict must contain at least the fields required by
         ``schemas/appendix_a_harvester.schema.json``:
         ``source``, ``title``, ``authors``, ``year``.
+
+        When *saturation* is given, adapters call
+        ``saturation.should_stop(query, page)`` after each fetched page and
+        stop paging that query when it returns ``True``.
         """
 
     @property
@@ -0,0 +1,152 @@
+"""HTTP cassettes: recorded request/response pairs for offline replay.
+
+``ELISHttpClient`` appends every exchange to a per-source cassette when
+recording is enabled, either with ``recorder=CassetteRecorder(...)`` or for a
+whole harvest run by setting ``ELIS_HTTP_RECORD_DIR=<dir>``.  The local mock
+API (``elis.sources.mock_api``) replays cassettes so adapter throughput can be
+measured without network access.
+
+A cassette is JSONL, one interaction per line::
+
+    {"method": "GET", "url": "https://api.openalex.org/works",
+     "params": {"filter": "default.search:x", "page": 1, "api_key": "***"},
+     "status": 200, "headers": {"Content-Type": "application/json"},
+     "body": "{...}", "elapsed_ms": 184.2}
+
+Secrets are masked before anything is written: sensitive query parameters
+become ``***`` and request headers are never stored.  Only response headers
+that matter for replay (content type and rate-limit signals) are kept.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+from urllib.parse import urlsplit
+
+RECORD_DIR_ENV = "ELIS_HTTP_RECORD_DIR"
+MASK = "***"
+
+SENSITIVE_PARAMS = frozenset(
+    {"apikey", "api_key", "access_token", "token", "insttoken", "mailto"}
+)
+# Response headers kept for replay; everything else is dropped.
+KEPT_RESPONSE_HEADERS = (
+    "Content-Type",
+    "Retry-After",
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+)
+# Parameters that identify the contact, not the query; ignored for matching.
+_VOLATILE_PARAMS = frozenset({"mailto"})
+
+
+def _is_sensitive(key: str) -> bool:
+    return key.lower().replace("-", "_") in SENSITIVE_PARAMS
+
+
+def sanitise_params(params: dict[str, Any] | None) -> dict[str, Any]:
+    """Copy of *params* with sensitive values masked (values kept JSON-safe)."""
+    return {
+        str(key): MASK if _is_sensitive(str(key)) else value
+        for key, value in (params or {}).items()
+    }
+
+
+def interaction_key(method: str, url: str, params: dict[str, Any] | None) -> str:
+    """Match key: method, URL path and the non-secret query parameters."""
+    kept = sorted(
+        (str(k), str(v))
+        for k, v in (params or {}).items()
+        if not _is_sensitive(str(k)) and str(k) not in _VOLATILE_PARAMS
+    )
+    query = "&".join(f"{k}={v}" for k, v in kept)
+    return f"{method.upper()} {urlsplit(url).path}?{query}"
+
+
+def cassette_path(directory: str | Path, source_name: str) -> Path:
+    return Path(directory) / f"{source_name.lower()}.jsonl"
+
+
+class CassetteRecorder:
+    """Append sanitised interactions to a JSONL cassette (thread-safe)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, source_name: str) -> CassetteRecorder | None:
+        directory = os.getenv(RECORD_DIR_ENV)
+        return cls(cassette_path(directory, source_name)) if directory else None
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        response: Any,
+    ) -> None:
+        headers = getattr(response, "headers", None) or {}
+        elapsed = getattr(response, "elapsed", None)
+        row = {
+            "method": method.upper(),
+            "url": url.split("?", 1)[0],
+            "params": sanitise_params(params),
+            "status": int(response.status_code),
+            "headers": {
+                name: headers[name] for name in KEPT_RESPONSE_HEADERS if name in headers
+            },
+            "body": response.text,
+            "elapsed_ms": (
+                round(elapsed.total_seconds() * 1000, 1)
+                if hasattr(elapsed, "total_seconds")
+                else None
+            ),
+        }
+        line = json.dumps(row, ensure_ascii=False, default=str) + "\n"
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
+
+
+class Cassette:
+    """Recorded interactions indexed by :func:`interaction_key`.
+
+    Repeated keys (e.g. a 429 then a 200 for the same page) are replayed in
+    recorded order; the last one repeats once the sequence is exhausted.
+    """
+
+    def __init__(self, interactions: Iterable[dict[str, Any]] = ()) -> None:
+        self._by_key: dict[str, list[dict[str, Any]]] = {}
+        self._served: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for interaction in interactions:
+            key = interaction_key(
+                interaction["method"], interaction["url"], interaction.get("params")
+            )
+            self._by_key.setdefault(key, []).append(interaction)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        with Path(path).open("r", encoding="utf-8") as handle:
+            return cls(json.loads(line) for line in handle if line.strip())
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._by_key.values())
+
+    def match(
+        self, method: str, url: str, params: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        key = interaction_key(method, url, params)
+        with self._lock:
+            items = self._by_key.get(key)
+            if not items:
+                return None
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            return items[min(index, len(items) - 1)]
@@ -11,9 +11,10 @@ Priority: --search-config + --tier > --search-config (default tier) >
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import yaml
 
@@ -31,6 +32,66 @@ TIERS: dict[str, int] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Query planning — fetch each unique (source, query) once
+# ---------------------------------------------------------------------------
+
+_WS_RE = re.compile(r"\s+")
+_OPEN_PAREN_WS_RE = re.compile(r"\(\s+")
+_CLOSE_PAREN_WS_RE = re.compile(r"\s+\)")
+
+
+def normalise_query(query: str) -> str:
+    """Canonical form used to detect duplicate queries across topics.
+
+    Collapses whitespace (including YAML block-scalar indentation and
+    padding inside parentheses).  Case is preserved because boolean
+    operators are case-sensitive for some sources.
+    """
+    value = _WS_RE.sub(" ", query.strip())
+    value = _OPEN_PAREN_WS_RE.sub("(", value)
+    return _CLOSE_PAREN_WS_RE.sub(")", value)
+
+
+@dataclass(frozen=True)
+class PlannedQuery:
+    """One unique query to fetch, with every (topic, query) it stands for."""
+
+    query: str
+    attributions: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def query_topic(self) -> str:
+        return self.attributions[0][0] if self.attributions else ""
+
+    @property
+    def query_string(self) -> str:
+        return self.attributions[0][1] if self.attributions else self.query
+
+
+def plan_queries(topic_queries: Iterable[tuple[str, str]]) -> list[PlannedQuery]:
+    """Collapse ``(query_topic, query_string)`` pairs to unique queries.
+
+    Order follows first appearance; the first original query text is the
+    one sent to the source.
+    """
+    order: list[str] = []
+    first_text: dict[str, str] = {}
+    attributions: dict[str, list[tuple[str, str]]] = {}
+    for topic, query in topic_queries:
+        key = normalise_query(query)
+        if not key:
+            continue
+        if key not in attributions:
+            order.append(key)
+            first_text[key] = query.strip()
+            attributions[key] = []
+        pair = (topic, query.strip())
+        if pair not in attributions[key]:
+            attributions[key].append(pair)
+    return [PlannedQuery(first_text[k], tuple(attributions[k])) for k in order]
+
+
 # ---------------------------------------------------------------------------
 # HarvestConfig — result of config resolution
 # ---------------------------------------------------------------------------
@@ -38,12 +99,17 @@ TIERS: dict[str, int] = {
 
 @dataclass(frozen=True)
 class HarvestConfig:
-    """Resolved harvest configuration for a single source run."""
+    """Resolved harvest configuration for a single source run.
+
+    ``queries`` holds the unique queries to fetch; ``query_plan`` maps each
+    one back to the topics that asked for it.
+    """
 
     queries: list[str]
     max_results: int
     config_mode: str  # "NEW" or "LEGACY"
     output_path: str
+    query_plan: tuple[PlannedQuery, ...] = ()
 
 
 # ---------------------------------------------------------------------------
@@ -87,21 +153,29 @@ _LEGACY_SOURCE_NAMES: dict[str, list[str]] = {
 }
 
 
-def _get_legacy_queries(config: dict[str, Any], source_name: str) -> list[str]:
-    """Extract queries for *source_name* from legacy config topics."""
+def _get_legacy_topic_queries(
+    config: dict[str, Any], source_name: str
+) -> list[tuple[str, str]]:
+    """Extract ``(topic, query)`` pairs for *source_name* from legacy topics."""
     known_keys = _LEGACY_SOURCE_NAMES.get(source_name, [source_name])
-    queries: list[str] = []
-    for topic in config.get("topics", []):
+    pairs: list[tuple[str, str]] = []
+    for idx, topic in enumerate(config.get("topics", []), start=1):
         if not topic.get("enabled", False):
             continue
         sources = [s.lower() for s in topic.get("sources", [])]
         if not any(k in sources for k in known_keys):
             continue
+        topic_name = str(topic.get("name") or topic.get("id") or f"topic_{idx}")
         for q in topic.get("queries", []):
             stripped = q.strip()
             if stripped:
-                queries.append(stripped)
-    return queries
+                pairs.append((topic_name, stripped))
+    return pairs
+
+
+def _get_legacy_queries(config: dict[str, Any], source_name: str) -> list[str]:
+    """Extract queries for *source_name* from legacy config topics."""
+    return [q for _, q in _get_legacy_topic_queries(config, source_name)]
 
 
 def _get_legacy_max_results(config: dict[str, Any]) -> int:
@@ -228,7 +302,8 @@ def load_harvest_config(
 
     if search_config:
         config = load_yaml(search_config)
-        queries = _get_new_queries(config, source_name)
+        topic = str(config.get("search_id") or Path(search_config).stem)
+        topic_queries = [(topic, q) for q in _get_new_queries(config, source_name)]
         max_results = _resolve_new_max_results(config, source_name, tier)
         config_mode = "NEW"
     else:
@@ -241,16 +316,18 @@ def load_harvest_config(
                 / "elis_search_queries.yml"
             )
         config = load_yaml(legacy_path) if legacy_path.is_file() else {}
-        queries = _get_legacy_queries(config, source_name)
+        topic_queries = _get_legacy_topic_queries(config, source_name)
         max_results = _get_legacy_max_results(config)
         config_mode = "LEGACY"
 
     if max_results_override is not None:
         max_results = max_results_override
 
+    plan = plan_queries(topic_queries)
     return HarvestConfig(
-        queries=queries,
+        queries=[planned.query for planned in plan],
         max_results=max_results,
         config_mode=config_mode,
         output_path=output_path,
+        query_plan=tuple(plan),
     )
@@ -12,7 +12,7 @@ import os
 from typing import Iterator
 
 from elis.sources import register
-from elis.sources.base import SourceAdapter
+from elis.sources.base import SaturationPolicy, SourceAdapter
 from elis.sources.http_client import ELISHttpClient
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,22 @@ logger = logging.getLogger(__name__)
 _BASE_URL = "https://api.crossref.org/works"
 _ROWS_PER_REQUEST = 1000  # API maximum
 
+# Field projection (``select=``): only the fields ``transform_entry`` reads to
+# build ``appendix_a_harvester.schema.json`` rows.  Drops references,
+# funders, licences etc. from ``message.items``.
+_SELECT_FIELDS = (
+    "DOI",
+    "title",
+    "author",
+    "published-print",
+    "published-online",
+    "abstract",
+    "URL",
+    "type",
+    "publisher",
+    "is-referenced-by-count",
+)
+
 
 # ---------------------------------------------------------------------------
 # Transform
@@ -113,13 +129,19 @@ class CrossRefAdapter(SourceAdapter):
         except Exception as exc:
             return False, str(exc)
 
-    def harvest(self, queries: list[str], max_results: int) -> Iterator[dict]:
+    def harvest(
+        self,
+        queries: list[str],
+        max_results: int,
+        *,
+        saturation: SaturationPolicy | None = None,
+    ) -> Iterator[dict]:
         """Yield normalised records from CrossRef for *queries*."""
         client = self._make_client()
         mailto = os.getenv("ELIS_CONTACT")
 
         for query in queries:
-            yield from self._search(client, query, max_results, mailto)
+            yield from self._search(client, query, max_results, mailto, saturation)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -135,6 +157,7 @@ class CrossRefAdapter(SourceAdapter):
         query: str,
         max_results: int,
         mailto: str | None,
+        saturation: SaturationPolicy | None = None,
     ) -> Iterator[dict]:
         """Page through CrossRef results via offset and yield records."""
         offset = 0
@@ -146,6 +169,7 @@ class CrossRefAdapter(SourceAdapter):
                 "query": query,
                 "rows": rows,
                 "offset": offset,
+                "select": ",".join(_SELECT_FIELDS),
             }
             if mailto:
                 params["mailto"] = mailto
@@ -162,12 +186,17 @@ class CrossRefAdapter(SourceAdapter):
             if not items:
                 return
 
-            for entry in items:
-                yield transform_entry(entry)
+            page_records = [transform_entry(entry) for entry in items]
+            for record in page_records:
+                yield record
                 fetched += 1
                 if fetched >= max_results:
                     return
 
+            if saturation is not None and saturation.should_stop(query, page_records):
+                logger.info("[CrossRef] Query saturated — stopping pagination")
+                return
+
             offset += len(items)
 
             # Check if we've exhausted available results
@@ -1,18 +1,24 @@
 """Shared HTTP client for the ELIS adapter layer.
 
 Provides retry on 429/5xx with exponential backoff and jitter,
-per-source rate-limit delays, and secret-safe logging.
+per-source rate-limit delays, compressed transfer negotiation,
+secret-safe logging, optional cassette recording of every exchange
+(see ``elis.sources.cassette``) and an optional per-request rate limiter
+(e.g. ``elis.sources.scopus_quota.ScopusKeyPool``).
 """
 
 from __future__ import annotations
 
 import logging
 import random
+import threading
 import time
-from typing import Any
+from typing import Any, Callable, Protocol, Sized
 
 import requests
 
+from elis.sources.cassette import CassetteRecorder
+
 logger = logging.getLogger(__name__)
 
 # Keys whose values must never appear in log output.
@@ -27,6 +33,50 @@ _SENSITIVE_PARAMS = frozenset(
     }
 )
 
+# Always negotiate compressed transfer; JSON search pages shrink several-fold.
+_DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+
+class RateLimiter(Protocol):
+    """Hook consulted around every attempt of a request."""
+
+    def acquire(self, headers: dict[str, str] | None) -> dict[str, str] | None:
+        """Block until a request may be sent; return the headers to send."""
+        ...
+
+    def observe(
+        self, headers: dict[str, str] | None, response: requests.Response
+    ) -> bool:
+        """Account for *response*; ``True`` to retry at once (no backoff)."""
+        ...
+
+
+class IntervalLimiter:
+    """:class:`RateLimiter` spacing attempts at least *interval* seconds apart.
+
+    Thread-safe: share one instance between the clients of several worker
+    threads to keep them, together, to one provider's rate.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def acquire(self, headers: dict[str, str] | None) -> dict[str, str] | None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+        return headers
+
+    def observe(
+        self, headers: dict[str, str] | None, response: requests.Response
+    ) -> bool:
+        return False
+
 
 def _sanitise_params(params: dict[str, Any] | None) -> dict[str, Any]:
     """Return a copy of *params* with sensitive values masked."""
@@ -58,6 +108,14 @@ class ELISHttpClient:
         Cap for backoff wait in seconds.
     timeout:
         Per-request timeout in seconds.
+    recorder:
+        Cassette to append sanitised request/response pairs to.  Defaults to
+        ``<$ELIS_HTTP_RECORD_DIR>/<source>.jsonl`` when that variable is set.
+    rate_limiter:
+        Optional :class:`RateLimiter` that may delay each attempt and rewrite
+        its headers (e.g. rotate API keys).  Attempts it asks to retry do not
+        count against *max_retries*; a request gives up (raising the last
+        response) after ``(max_retries + 1) * len(rate_limiter)`` of them.
     """
 
     def __init__(
@@ -69,6 +127,8 @@ class ELISHttpClient:
         backoff_base: float = 1.0,
         backoff_max: float = 60.0,
         timeout: int = 30,
+        recorder: CassetteRecorder | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         self.source_name = source_name
         self.delay_seconds = delay_seconds
@@ -76,7 +136,10 @@ class ELISHttpClient:
         self.backoff_base = backoff_base
         self.backoff_max = backoff_max
         self.timeout = timeout
+        self.recorder = recorder or CassetteRecorder.from_env(source_name)
+        self.rate_limiter = rate_limiter
         self._session = requests.Session()
+        self._session.headers.update(_DEFAULT_HEADERS)
 
     # ------------------------------------------------------------------
     # Single request with retry
@@ -93,14 +156,58 @@ class ELISHttpClient:
         Raises ``requests.exceptions.RequestException`` on unrecoverable
         failure or after exhausting retries.
         """
+        return self._send(
+            self._session.get, url, params=params, headers=headers, method="GET"
+        )
+
+    def post(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        json_body: Any = None,
+    ) -> requests.Response:
+        """Issue a POST request with a JSON body and retry on 429 / 5xx.
+
+        Used by batch endpoints (e.g. Semantic Scholar ``/paper/batch``).
+        """
+        return self._send(
+            self._session.post,
+            url,
+            params=params,
+            headers=headers,
+            method="POST",
+            json=json_body,
+        )
+
+    def _max_rejections(self) -> int:
+        """Limiter-requested retries allowed per request (each key, each try)."""
+        keys = len(self.rate_limiter) if isinstance(self.rate_limiter, Sized) else 1
+        return (self.max_retries + 1) * max(1, keys)
+
+    def _send(
+        self,
+        send: Callable[..., requests.Response],
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        method: str = "GET",
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Shared retry loop for :meth:`get` and :meth:`post`."""
         attempt = 0
+        rejections = 0
         while True:
+            sent_headers = headers
+            if self.rate_limiter is not None:
+                sent_headers = self.rate_limiter.acquire(headers)
             try:
-                resp = self._session.get(
+                resp = send(
                     url,
                     params=params,
-                    headers=headers,
+                    headers=sent_headers,
                     timeout=self.timeout,
+                    **kwargs,
                 )
             except requests.exceptions.RequestException:
                 logger.warning(
@@ -111,6 +218,24 @@ class ELISHttpClient:
                 )
                 raise
 
+            if self.recorder is not None:
+                self.recorder.record(method, url, params, resp)
+
+            if self.rate_limiter is not None and self.rate_limiter.observe(
+                sent_headers, resp
+            ):
+                rejections += 1
+                if rejections < self._max_rejections():
+                    continue
+                logger.error(
+                    "[%s] Rate limiter rejected %d attempts — last status %d",
+                    self.source_name,
+                    rejections,
+                    resp.status_code,
+                )
+                resp.raise_for_status()
+                return resp
+
             if resp.status_code == 429 or resp.status_code >= 500:
                 attempt += 1
                 if attempt > self.max_retries:
@@ -0,0 +1,378 @@
+"""Local stand-in for the OpenAlex, CrossRef and Scopus search APIs.
+
+Serves deterministic result pages so adapter throughput, retry and
+rate-limit behaviour can be measured without network access::
+
+    with MockApiServer(MockApiConfig(latency_ms=40, error_rate_429=0.05)) as api:
+        openalex._BASE_URL = api.url("openalex")
+        ...
+
+Routes mirror each API's search endpoint under a source prefix:
+
+=============  ==================================  ============================
+source         path                                pagination
+=============  ==================================  ============================
+``openalex``   ``/openalex/works``                 ``page`` / ``per_page``
+``crossref``   ``/crossref/works``                 ``offset`` / ``rows``
+``scopus``     ``/scopus/content/search/scopus``   ``start`` / ``count``
+=============  ==================================  ============================
+
+A request is answered from the source's cassette (``<cassette_dir>/<source>
+.jsonl``, see ``elis.sources.cassette``) when one matches, otherwise from a
+synthetic corpus of ``results_per_query`` records per query.  Before that,
+the server may delay the response (``latency_ms`` +- ``jitter_ms``), refuse it
+with a 429 when more than ``rate_limit_per_second`` requests arrived within
+the last second, or inject 429/5xx failures at the configured rates.  All
+randomness comes from one seeded RNG, so a sequential client sees the same
+sequence on every run.
+
+With ``quota_per_key`` set, each ``X-ELS-APIKey`` gets that many successful
+requests per ``quota_reset_seconds`` window, reported Elsevier-style in
+``X-RateLimit-Limit`` / ``-Remaining`` / ``-Reset``; beyond it the server
+answers ``429`` with ``X-ELS-Status: QUOTA_EXCEEDED`` until the reset.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from elis.sources.cassette import Cassette, cassette_path
+
+SOURCE_PATHS = {
+    "openalex": "/works",
+    "crossref": "/works",
+    "scopus": "/content/search/scopus",
+}
+
+
+@dataclass(frozen=True)
+class MockApiConfig:
+    results_per_query: int = 1000
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate_429: float = 0.0
+    error_rate_5xx: float = 0.0
+    rate_limit_per_second: float | None = None
+    retry_after_seconds: float = 1.0
+    quota_per_key: int | None = None
+    quota_reset_seconds: float = 60.0
+    seed: int = 0
+    cassette_dir: str | Path | None = None
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+
+def _digest(*parts: object) -> str:
+    return hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+
+def _synthetic_work(query: str, index: int) -> dict[str, Any]:
+    digest = _digest(query, index)
+    return {
+        "key": digest[:12],
+        "doi": f"10.5555/mock.{digest[:10]}",
+        "title": f"{query.title() or 'Topic'} study {index} ({digest[:6]})",
+        "abstract": f"Synthetic abstract {index} about {query}.",
+        "year": 2000 + int(digest[10:12], 16) % 26,
+        "author": f"Author {digest[12:16]}",
+        "citations": int(digest[16:20], 16) % 500,
+    }
+
+
+def _query_text(source: str, params: dict[str, str]) -> str:
+    if source == "openalex":
+        return params.get("filter", "").removeprefix("default.search:")
+    return params.get("query", "")
+
+
+def _window(source: str, params: dict[str, str]) -> tuple[int, int]:
+    def number(name: str, default: int) -> int:
+        try:
+            return int(params.get(name, default))
+        except ValueError:
+            return default
+
+    if source == "openalex":
+        size = number("per_page", 25)
+        return (number("page", 1) - 1) * size, size
+    if source == "crossref":
+        return number("offset", 0), number("rows", 20)
+    return number("start", 0), number("count", 25)
+
+
+def synthetic_page(
+    source: str, params: dict[str, str], results_per_query: int
+) -> dict[str, Any]:
+    """One page of *source*-shaped search results for *params*."""
+    query = _query_text(source, params)
+    start, size = _window(source, params)
+    works = [
+        _synthetic_work(query, i)
+        for i in range(max(0, start), min(results_per_query, start + max(0, size)))
+    ]
+    if source == "openalex":
+        return {
+            "meta": {"count": results_per_query},
+            "results": [
+                {
+                    "id": f"https://openalex.org/W{w['key']}",
+                    "doi": f"https://doi.org/{w['doi']}",
+                    "title": w["title"],
+                    "publication_year": w["year"],
+                    "authorships": [{"author": {"display_name": w["author"]}}],
+                    "abstract_inverted_index": {
+                        word: [pos] for pos, word in enumerate(w["abstract"].split())
+                    },
+                    "cited_by_count": w["citations"],
+                }
+                for w in works
+            ],
+        }
+    if source == "crossref":
+        return {
+            "message": {
+                "total-results": results_per_query,
+                "items": [
+                    {
+                        "DOI": w["doi"],
+                        "title": [w["title"]],
+                        "author": [{"given": "A.", "family": w["author"]}],
+                        "published-print": {"date-parts": [[w["year"]]]},
+                        "abstract": w["abstract"],
+                        "URL": f"https://doi.org/{w['doi']}",
+                        "is-referenced-by-count": w["citations"],
+                        "type": "journal-article",
+                    }
+                    for w in works
+                ],
+            }
+        }
+    return {
+        "search-results": {
+            "opensearch:totalResults": str(results_per_query),
+            "entry": [
+                {
+                    "dc:identifier": f"SCOPUS_ID:{int(w['key'], 16) % 10**11}",
+                    "dc:title": w["title"],
+                    "dc:creator": w["author"],
+                    "prism:coverDate": f"{w['year']}-01-01",
+                    "prism:doi": w["doi"],
+                    "dc:description": w["abstract"],
+                    "citedby-count": str(w["citations"]),
+                }
+                for w in works
+            ],
+        }
+    }
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _MockHttpServer
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        self.server.api.handle(self)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class _MockHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    api: MockApiServer
+
+
+class MockApiServer:
+    """Threaded mock API on ``127.0.0.1``; use as a context manager."""
+
+    def __init__(self, config: MockApiConfig | None = None, port: int = 0) -> None:
+        self.config = config or MockApiConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._arrivals: deque[float] = deque()
+        # API key -> (requests used, reset epoch) for ``quota_per_key``.
+        self._quotas: dict[str, tuple[int, float]] = {}
+        self.stats: Counter[str] = Counter()
+        self._cassettes: dict[str, Cassette] = {}
+        if self.config.cassette_dir:
+            for source in SOURCE_PATHS:
+                path = cassette_path(self.config.cassette_dir, source)
+                if path.exists():
+                    self._cassettes[source] = Cassette.load(path)
+        self._httpd = _MockHttpServer(("127.0.0.1", port), _Handler)
+        self._httpd.api = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return int(self._httpd.server_address[1])
+
+    def url(self, source: str) -> str:
+        """Base URL replacing *source*'s real search endpoint."""
+        return f"http://127.0.0.1:{self.port}/{source}{SOURCE_PATHS[source]}"
+
+    def start(self) -> MockApiServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> MockApiServer:
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+    # -- request handling -------------------------------------------------
+
+    def _decide(self) -> tuple[float, str | None]:
+        """Latency and injected failure for the next request, under the lock."""
+        cfg = self.config
+        with self._lock:
+            now = time.monotonic()
+            self._arrivals.append(now)
+            while self._arrivals and now - self._arrivals[0] > 1.0:
+                self._arrivals.popleft()
+            delay = max(0.0, cfg.latency_ms + self._rng.uniform(-1, 1) * cfg.jitter_ms)
+            roll = self._rng.random()
+            if (
+                cfg.rate_limit_per_second is not None
+                and len(self._arrivals) > cfg.rate_limit_per_second
+            ):
+                return delay, "rate_limited"
+            if roll < cfg.error_rate_429:
+                return delay, "injected_429"
+            if roll < cfg.error_rate_429 + cfg.error_rate_5xx:
+                return delay, "injected_5xx"
+            return delay, None
+
+    def _charge_quota(self, api_key: str, quota: int) -> dict[str, str] | None:
+        """Charge one request to *api_key*; rate-limit headers, or None if dry."""
+        with self._lock:
+            now = time.time()
+            used, reset_at = self._quotas.get(api_key, (0, 0.0))
+            if now >= reset_at:
+                used = 0
+                reset_at = float(math.ceil(now + self.config.quota_reset_seconds))
+            headers = {
+                "X-RateLimit-Limit": str(quota),
+                "X-RateLimit-Reset": f"{reset_at:.0f}",
+            }
+            if used >= quota:
+                self._quotas[api_key] = (used, reset_at)
+                self.stats["quota_exceeded"] += 1
+                return None
+            used += 1
+            self._quotas[api_key] = (used, reset_at)
+            headers["X-RateLimit-Remaining"] = str(quota - used)
+            return headers
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        parts = urlsplit(request.path)
+        source, _, rest = parts.path.lstrip("/").partition("/")
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        with self._lock:
+            self.stats["requests"] += 1
+
+        if source not in SOURCE_PATHS or f"/{rest}" != SOURCE_PATHS[source]:
+            self._send(request, 404, {"error": f"unknown route {parts.path}"})
+            return
+
+        delay, failure = self._decide()
+        if delay:
+            time.sleep(delay / 1000.0)
+        if failure is not None:
+            with self._lock:
+                self.stats[failure] += 1
+            if failure == "injected_5xx":
+                self._send(request, 503, {"error": "injected server error"})
+            else:
+                retry_after = f"{self.config.retry_after_seconds:g}"
+                self._send(
+                    request,
+                    429,
+                    {"error": "rate limited"},
+                    {"Retry-After": retry_after, "X-RateLimit-Remaining": "0"},
+                )
+            return
+
+        quota_headers: dict[str, str] = {}
+        if self.config.quota_per_key is not None:
+            api_key = request.headers.get("X-ELS-APIKey") or ""
+            charged = self._charge_quota(api_key, self.config.quota_per_key)
+            if charged is None:
+                reset_at = self._quotas[api_key][1]
+                self._send(
+                    request,
+                    429,
+                    {"error": "quota exceeded"},
+                    {
+                        "X-ELS-Status": "QUOTA_EXCEEDED - Quota Exceeded",
+                        "X-RateLimit-Limit": str(self.config.quota_per_key),
+                        "X-RateLimit-Remaining": "0",
+                        "X-RateLimit-Reset": f"{reset_at:.0f}",
+                    },
+                )
+                return
+            quota_headers = charged
+
+        cassette = self._cassettes.get(source)
+        recorded = (
+            cassette.match("GET", SOURCE_PATHS[source], params) if cassette else None
+        )
+        if recorded is not None:
+            with self._lock:
+                self.stats["replayed"] += 1
+            self._send(
+                request,
+                int(recorded["status"]),
+                recorded.get("body", ""),
+                {**(recorded.get("headers") or {}), **quota_headers},
+            )
+            return
+
+        with self._lock:
+            self.stats["synthesised"] += 1
+        page = synthetic_page(source, params, self.config.results_per_query)
+        self._send(request, 200, page, quota_headers)
+
+    @staticmethod
+    def _send(
+        request: BaseHTTPRequestHandler,
+        status: int,
+        body: Any,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        payload = (body if isinstance(body, str) else json.dumps(body)).encode("utf-8")
+        request.send_response(status)
+        sent = {name.lower() for name in headers or {}}
+        for name, value in (headers or {}).items():
+            request.send_header(name, str(value))
+        if "content-type" not in sent:
+            request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
@@ -12,7 +12,7 @@ import os
 from typing import Iterator
 
 from elis.sources import register
-from elis.sources.base import SourceAdapter
+from elis.sources.base import SaturationPolicy, SourceAdapter
 from elis.sources.http_client import ELISHttpClient
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,19 @@ logger = logging.getLogger(__name__)
 _BASE_URL = "https://api.openalex.org/works"
 _PER_PAGE = 200  # API maximum
 
+# Field projection (``select=``): only the fields ``transform_entry`` reads to
+# build ``appendix_a_harvester.schema.json`` rows.  Drops concepts,
+# referenced_works, locations etc., which dominate the payload size.
+_SELECT_FIELDS = (
+    "id",
+    "doi",
+    "title",
+    "publication_year",
+    "authorships",
+    "abstract_inverted_index",
+    "cited_by_count",
+)
+
 
 # ---------------------------------------------------------------------------
 # Transform
@@ -123,13 +136,19 @@ class OpenAlexAdapter(SourceAdapter):
         except Exception as exc:
             return False, str(exc)
 
-    def harvest(self, queries: list[str], max_results: int) -> Iterator[dict]:
+    def harvest(
+        self,
+        queries: list[str],
+        max_results: int,
+        *,
+        saturation: SaturationPolicy | None = None,
+    ) -> Iterator[dict]:
         """Yield normalised records from OpenAlex for *queries*."""
         client = self._make_client()
         mailto = os.getenv("ELIS_CONTACT")
 
         for query in queries:
-            yield from self._search(client, query, max_results, mailto)
+            yield from self._search(client, query, max_results, mailto, saturation)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -145,6 +164,7 @@ class OpenAlexAdapter(SourceAdapter):
         query: str,
         max_results: int,
         mailto: str | None,
+        saturation: SaturationPolicy | None = None,
     ) -> Iterator[dict]:
         """Page through OpenAlex results and yield transformed records."""
         page = 1
@@ -156,6 +176,7 @@ class OpenAlexAdapter(SourceAdapter):
                 "filter": f"default.search:{query}",
                 "per_page": per_page,
                 "page": page,
+                "select": ",".join(_SELECT_FIELDS),
             }
             if mailto:
                 params["mailto"] = mailto
@@ -171,12 +192,17 @@ class OpenAlexAdapter(SourceAdapter):
             if not works:
                 return
 
-            for entry in works:
-                yield transform_entry(entry)
+            page_records = [transform_entry(entry) for entry in works]
+            for record in page_records:
+                yield record
                 fetched += 1
                 if fetched >= max_results:
                     return
 
+            if saturation is not None and saturation.should_stop(query, page_records):
+                logger.info("[OpenAlex] Query saturated — stopping pagination")
+                return
+
             # Check total available
             total = data.get("meta", {}).get("count", 0)
             if fetched >= total:
@@ -4,40 +4,77 @@ Ported from ``scripts/scopus_harvest.py``.  Scopus uses offset-based
 pagination, requires ``SCOPUS_API_KEY`` + ``SCOPUS_INST_TOKEN`` env vars,
 wraps queries in ``TITLE-ABS-KEY()``, and returns the first author only
 via ``dc:creator``.
+
+Further keys can be listed in ``SCOPUS_API_KEYS`` (comma or whitespace
+separated, each ``key`` or ``key:insttoken``); harvests rotate across all of
+them by remaining quota (see ``elis.sources.scopus_quota``).
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import re
 from typing import Iterator
 
 from elis.sources import register
-from elis.sources.base import SourceAdapter
+from elis.sources.base import SaturationPolicy, SourceAdapter
 from elis.sources.http_client import ELISHttpClient
+from elis.sources.scopus_quota import QuotaExhausted, ScopusKeyPool
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://api.elsevier.com/content/search/scopus"
 _COUNT_PER_PAGE = 25  # API maximum
 
+# Field projection (``field=``): only the fields ``transform_entry`` reads to
+# build ``appendix_a_harvester.schema.json`` rows.
+_SELECT_FIELDS = (
+    "dc:identifier",
+    "dc:title",
+    "dc:creator",
+    "prism:coverDate",
+    "prism:doi",
+    "dc:description",
+    "prism:url",
+    "citedby-count",
+)
+
 
 # ---------------------------------------------------------------------------
 # Auth
 # ---------------------------------------------------------------------------
 
 
+def _get_credentials() -> list[tuple[str, str]]:
+    """``(api_key, inst_token)`` pairs from ``SCOPUS_API_KEY(S)``.
+
+    Entries of ``SCOPUS_API_KEYS`` without their own ``:insttoken`` use
+    ``SCOPUS_INST_TOKEN``; keys without any token are skipped.
+    """
+    default_token = os.getenv("SCOPUS_INST_TOKEN") or ""
+    entries = [os.getenv("SCOPUS_API_KEY") or ""]
+    entries += re.split(r"[,\s]+", os.getenv("SCOPUS_API_KEYS") or "")
+    credentials: list[tuple[str, str]] = []
+    for entry in entries:
+        api_key, _, inst_token = entry.strip().partition(":")
+        pair = (api_key, inst_token or default_token)
+        if api_key and pair[1] and pair not in credentials:
+            credentials.append(pair)
+    return credentials
+
+
 def _get_auth_headers() -> dict[str, str]:
-    """Build Scopus API auth headers from environment variables.
+    """Build Scopus API auth headers (first configured key) from env vars.
 
     Raises ``EnvironmentError`` if credentials are missing.
     """
-    api_key = os.getenv("SCOPUS_API_KEY")
-    inst_token = os.getenv("SCOPUS_INST_TOKEN")
-    if not api_key or not inst_token:
+    credentials = _get_credentials()
+    if not credentials:
         raise EnvironmentError(
             "Missing SCOPUS_API_KEY or SCOPUS_INST_TOKEN environment variables"
         )
+    api_key, inst_token = credentials[0]
     return {
         "X-ELS-APIKey": api_key,
         "X-ELS-Insttoken": inst_token,
@@ -138,7 +175,13 @@ class ScopusAdapter(SourceAdapter):
         except Exception as exc:
             return False, str(exc)
 
-    def harvest(self, queries: list[str], max_results: int) -> Iterator[dict]:
+    def harvest(
+        self,
+        queries: list[str],
+        max_results: int,
+        *,
+        saturation: SaturationPolicy | None = None,
+    ) -> Iterator[dict]:
         """Yield normalised records from Scopus for *queries*."""
         try:
             headers = _get_auth_headers()
@@ -146,17 +189,28 @@ class ScopusAdapter(SourceAdapter):
             logger.warning("[Scopus] Missing credentials — skipping harvest")
             return
 
-        client = self._make_client()
-        for query in queries:
-            yield from self._search(client, query, max_results, headers)
+        credentials = _get_credentials()
+        pool = ScopusKeyPool.from_env(credentials) if credentials else None
+        if pool is not None and len(pool) > 1:
+            logger.info("[Scopus] Rotating across %d API keys", len(pool))
+
+        client = self._make_client(pool)
+        try:
+            for query in queries:
+                yield from self._search(client, query, max_results, headers, saturation)
+        except QuotaExhausted as exc:
+            logger.warning("[Scopus] %s — stopping harvest", exc)
+        finally:
+            if pool is not None:
+                pool.save()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _make_client() -> ELISHttpClient:
-        return ELISHttpClient("Scopus", delay_seconds=0.5)
+    def _make_client(pool: ScopusKeyPool | None = None) -> ELISHttpClient:
+        return ELISHttpClient("Scopus", delay_seconds=0.5, rate_limiter=pool)
 
     @staticmethod
     def _search(
@@ -164,6 +218,7 @@ class ScopusAdapter(SourceAdapter):
         query: str,
         max_results: int,
         headers: dict[str, str],
+        saturation: SaturationPolicy | None = None,
     ) -> Iterator[dict]:
         """Page through Scopus results via offset and yield records."""
         start = 0
@@ -175,10 +230,13 @@ class ScopusAdapter(SourceAdapter):
                 "query": query,
                 "count": count,
                 "start": start,
+                "field": ",".join(_SELECT_FIELDS),
             }
 
             try:
                 resp = client.get(_BASE_URL, params=params, headers=headers)
+            except QuotaExhausted:
+                raise
             except Exception:
                 logger.warning("[Scopus] Request failed — stopping pagination")
                 return
@@ -188,12 +246,17 @@ class ScopusAdapter(SourceAdapter):
             if not entries:
                 return
 
-            for entry in entries:
-                yield transform_entry(entry)
+            page_records = [transform_entry(entry) for entry in entries]
+            for record in page_records:
+                yield record
                 fetched += 1
                 if fetched >= max_results:
                     return
 
+            if saturation is not None and saturation.should_stop(query, page_records):
+                logger.info("[Scopus] Query saturated — stopping pagination")
+                return
+
             start += len(entries)
 
             # Check total available
@@ -0,0 +1,318 @@
+"""Quota-aware API key pool for the Scopus adapter.
+
+Elsevier meters every API key separately: a weekly quota reported on each
+response as ``X-RateLimit-Limit`` / ``X-RateLimit-Remaining`` /
+``X-RateLimit-Reset`` (epoch seconds), plus a per-second throttle.  When the
+quota runs out the API answers ``429`` with ``X-ELS-Status: QUOTA_EXCEEDED``
+until the reset time.
+
+``ScopusKeyPool`` spreads a harvest over several keys:
+
+- ``acquire`` picks, for each request, the key that can be used soonest
+  (per-key request spacing, ``Retry-After`` cool-downs), preferring keys with
+  an unknown or larger remaining quota.  Keys at or below ``reserve``
+  remaining are skipped until their reset time.  When every key is
+  exhausted it sleeps until the earliest reset rather than letting requests
+  fail; ``max_wait`` bounds that pause (``QuotaExhausted`` beyond it).
+- ``observe`` reads the rate-limit headers of each response.  A quota
+  rejection retires the key until its reset and tells ``ELISHttpClient`` to
+  retry at once, so the request moves to the next key without spending a
+  retry attempt.
+
+Quota state of multi-key pools is persisted to ``.cache/elis/scopus_quota.json``
+(``$SCOPUS_QUOTA_STATE`` overrides it, and also enables it for a single key)
+so the next run does not start on a dry key.  Keys
+are stored as SHA-256 fingerprints, never in clear.  The file is rewritten
+when a key is exhausted or renewed, otherwise at most every
+``SAVE_INTERVAL`` seconds; ``save()`` flushes it at the end of a harvest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+STATE_PATH_ENV = "SCOPUS_QUOTA_STATE"
+MAX_WAIT_ENV = "SCOPUS_QUOTA_MAX_WAIT"
+DEFAULT_STATE_PATH = ".cache/elis/scopus_quota.json"
+# Requests kept in hand per key (e.g. for preflight or interactive use).
+DEFAULT_RESERVE = 10
+# Scopus Search API per-key throttle.
+DEFAULT_REQUESTS_PER_SECOND = 9.0
+# Pause assumed when a key is reported exhausted without a usable reset time
+# (missing, or already in the past).
+UNKNOWN_RESET_PAUSE = 3600.0
+# Longest interval between state-file writes while only counts change.
+SAVE_INTERVAL = 30.0
+
+_KEY_HEADER = "X-ELS-APIKey"
+_TOKEN_HEADER = "X-ELS-Insttoken"
+
+
+class QuotaExhausted(RuntimeError):
+    """Every key is exhausted and the earliest reset is beyond ``max_wait``."""
+
+
+def fingerprint(api_key: str) -> str:
+    """Stable, non-reversible identifier for *api_key* (logs, state file)."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+def _header_number(response: requests.Response, name: str) -> float | None:
+    value = (getattr(response, "headers", None) or {}).get(name)
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _when(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class KeyState:
+    """Quota bookkeeping for one key."""
+
+    fingerprint: str
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None
+    cooldown_until: float = 0.0
+    last_request: float = 0.0
+
+    def persisted(self) -> dict[str, Any]:
+        row = asdict(self)
+        del row["fingerprint"], row["last_request"]
+        return row
+
+
+class ScopusKeyPool:
+    """Rotate Scopus API keys by remaining quota and per-second limits.
+
+    Parameters
+    ----------
+    credentials:
+        ``(api_key, inst_token)`` pairs; an empty token omits the header.
+    state_path:
+        JSON file the quota state is loaded from and saved to; ``None``
+        keeps it in memory only.
+    reserve:
+        Remaining requests below which a key counts as exhausted.
+    requests_per_second:
+        Per-key request rate; requests on one key are spaced accordingly.
+    max_wait:
+        Longest pause (seconds) for a quota reset; ``None`` waits as long as
+        the reset requires.
+    """
+
+    def __init__(
+        self,
+        credentials: Sequence[tuple[str, str]],
+        *,
+        state_path: str | Path | None = DEFAULT_STATE_PATH,
+        reserve: int = DEFAULT_RESERVE,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        max_wait: float | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if not credentials:
+            raise ValueError("ScopusKeyPool needs at least one API key")
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.reserve = reserve
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens: dict[str, str] = {}
+        self._states: dict[str, KeyState] = {}
+        self._saved_at = float("-inf")
+        for api_key, inst_token in credentials:
+            self._tokens.setdefault(api_key, inst_token)
+            self._states.setdefault(api_key, KeyState(fingerprint(api_key)))
+        self._load()
+
+    @classmethod
+    def from_env(cls, credentials: Sequence[tuple[str, str]]) -> ScopusKeyPool:
+        """Pool using ``$SCOPUS_QUOTA_STATE`` and ``$SCOPUS_QUOTA_MAX_WAIT``.
+
+        A single key is only persisted when ``$SCOPUS_QUOTA_STATE`` asks for it.
+        """
+        max_wait = os.getenv(MAX_WAIT_ENV)
+        default_path = DEFAULT_STATE_PATH if len(set(credentials)) > 1 else None
+        return cls(
+            credentials,
+            state_path=os.getenv(STATE_PATH_ENV) or default_path,
+            max_wait=float(max_wait) if max_wait else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def states(self) -> list[KeyState]:
+        return list(self._states.values())
+
+    # -- scheduling -------------------------------------------------------
+
+    def _exhausted(self, state: KeyState, now: float) -> bool:
+        if state.reset_at is not None and now >= state.reset_at:
+            # Quota renewed; the next response reports the new figures.
+            state.remaining = None
+            state.reset_at = None
+        return state.remaining is not None and state.remaining <= self.reserve
+
+    def _ready_at(self, state: KeyState, now: float) -> float:
+        ready = max(state.cooldown_until, state.last_request + self.interval)
+        if self._exhausted(state, now):
+            ready = max(ready, state.reset_at or now + UNKNOWN_RESET_PAUSE)
+        return ready
+
+    def acquire(self, headers: dict[str, str] | None = None) -> dict[str, str]:
+        """Return *headers* carrying the key to use next, waiting if needed."""
+        while True:
+            now = self._clock()
+
+            def rank(api_key: str) -> tuple[float, float]:
+                state = self._states[api_key]
+                remaining = state.remaining
+                return (
+                    max(self._ready_at(state, now), now),
+                    -(float("inf") if remaining is None else remaining),
+                )
+
+            api_key = min(self._states, key=rank)
+            state = self._states[api_key]
+            wait = self._ready_at(state, now) - now
+            if wait <= 0:
+                break
+            if self._exhausted(state, now):
+                if self.max_wait is not None and wait > self.max_wait:
+                    raise QuotaExhausted(
+                        f"All {len(self)} Scopus keys exhausted until "
+                        f"{_when(now + wait)}"
+                    )
+                logger.warning(
+                    "[Scopus] All %d keys near quota exhaustion — pausing %.0fs "
+                    "until %s",
+                    len(self),
+                    wait,
+                    _when(now + wait),
+                )
+            self._sleep(wait)
+
+        state.last_request = now
+        merged = dict(headers or {})
+        merged[_KEY_HEADER] = api_key
+        if self._tokens[api_key]:
+            merged[_TOKEN_HEADER] = self._tokens[api_key]
+        else:
+            merged.pop(_TOKEN_HEADER, None)
+        return merged
+
+    def observe(
+        self, headers: dict[str, str] | None, response: requests.Response
+    ) -> bool:
+        """Record *response*'s quota headers for the key in *headers*.
+
+        Returns ``True`` when the response is a quota rejection: the key is
+        retired until reset and the request should be retried on another.
+        """
+        state = self._states.get((headers or {}).get(_KEY_HEADER, ""))
+        if state is None:
+            return False
+        now = self._clock()
+        remaining = _header_number(response, "X-RateLimit-Remaining")
+        reset = _header_number(response, "X-RateLimit-Reset")
+
+        if response.status_code == 429:
+            headers_in = getattr(response, "headers", None) or {}
+            quota_exceeded = "QUOTA_EXCEEDED" in headers_in.get("X-ELS-Status", "")
+            if not quota_exceeded and not (remaining == 0 and reset is not None):
+                # Per-second throttle: rest this key; the client backs off.
+                retry_after = _header_number(response, "Retry-After") or 1.0
+                state.cooldown_until = now + retry_after
+                return False
+            state.remaining = 0
+            if reset is None or reset <= now:
+                # A stale reset would retire the key for no time at all and
+                # turn the rejection into a retry loop.
+                state.reset_at = now + UNKNOWN_RESET_PAUSE
+            else:
+                state.reset_at = reset
+            logger.warning(
+                "[Scopus] Key %s quota exhausted until %s",
+                state.fingerprint,
+                _when(state.reset_at),
+            )
+            self.save()
+            return True
+
+        if remaining is None:
+            return False
+        was_exhausted = self._exhausted(state, now)
+        limit = _header_number(response, "X-RateLimit-Limit")
+        if limit is not None:
+            state.limit = int(limit)
+        state.remaining = int(remaining)
+        if reset is not None:
+            state.reset_at = reset
+        if (
+            self._exhausted(state, now) != was_exhausted
+            or now - self._saved_at >= SAVE_INTERVAL
+        ):
+            self.save()
+        return False
+
+    # -- persistence ------------------------------------------------------
+
+    def _read(self) -> dict[str, Any]:
+        if self.state_path is None:
+            return {}
+        try:
+            raw = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        keys = raw.get("keys") if isinstance(raw, dict) else None
+        return keys if isinstance(keys, dict) else {}
+
+    def _load(self) -> None:
+        saved = self._read()
+        for state in self._states.values():
+            row = saved.get(state.fingerprint)
+            if not isinstance(row, dict):
+                continue
+            for name in ("limit", "remaining"):
+                if isinstance(row.get(name), int):
+                    setattr(state, name, row[name])
+            for name in ("reset_at", "cooldown_until"):
+                if isinstance(row.get(name), (int, float)):
+                    setattr(state, name, float(row[name]))
+
+    def save(self) -> None:
+        """Merge this pool's keys into the state file (other keys are kept)."""
+        self._saved_at = self._clock()
+        if self.state_path is None:
+            return
+        keys = self._read()
+        for state in self._states.values():
+            keys[state.fingerprint] = state.persisted()
+        payload = {"updated_at": _when(self._clock()), "keys": keys}
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+            tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+            os.replace(tmp, self.state_path)
+        except OSError as exc:
+            logger.warning("[Scopus] Could not save quota state: %s", exc)
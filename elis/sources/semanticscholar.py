@@ -0,0 +1,218 @@
+"""Semantic Scholar source adapter for the ELIS adapter layer.
+
+Replaces ``scripts/_archive/semanticscholar_harvest.py``.  Uses the bulk
+search endpoint (``/paper/search/bulk``), which pages with a continuation
+``token`` and returns up to 1000 papers per request, instead of the
+offset-based ``/paper/search`` (100 per page, 1000 total).  The optional
+``SEMANTIC_SCHOLAR_API_KEY`` env var raises the rate limit.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from typing import Iterator
+
+from elis.sources import register
+from elis.sources.base import SaturationPolicy, SourceAdapter
+from elis.sources.http_client import ELISHttpClient
+
+logger = logging.getLogger(__name__)
+
+_BASE_URL = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
+
+# Only the fields ``transform_entry`` maps into the harvester schema.
+_FIELDS = (
+    "paperId",
+    "title",
+    "authors",
+    "year",
+    "externalIds",
+    "abstract",
+    "url",
+    "venue",
+    "citationCount",
+)
+
+# NOT binds to the following term ("-term"); AND/OR stay space-separated.
+_BOOLEAN_OPERATORS = {"AND": "+ ", "OR": "| ", "NOT": "-"}
+_BOOLEAN_RE = re.compile(r"\b(AND|OR|NOT)\b\s*")
+
+
+# ---------------------------------------------------------------------------
+# Auth / query
+# ---------------------------------------------------------------------------
+
+
+def _get_headers() -> dict[str, str]:
+    """Build request headers; the API key is optional."""
+    api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    return {"x-api-key": api_key} if api_key else {}
+
+
+def to_bulk_query(query: str) -> str:
+    """Translate ``AND``/``OR``/``NOT`` boolean syntax to bulk-search syntax.
+
+    The bulk endpoint understands ``+`` (and), ``|`` (or), ``-`` (not),
+    quoted phrases and parentheses, so the boolean structure of search
+    configs is preserved rather than flattened to keywords.
+    """
+    translated = _BOOLEAN_RE.sub(lambda m: _BOOLEAN_OPERATORS[m.group(1)], query)
+    return " ".join(translated.split())
+
+
+# ---------------------------------------------------------------------------
+# Transform
+# ---------------------------------------------------------------------------
+
+
+def transform_entry(entry: dict) -> dict:
+    """Transform a raw Semantic Scholar paper into the harvester schema.
+
+    Handles:
+    - Authors from ``authors[].name``
+    - DOI from ``externalIds.DOI``
+    - Year as ``int | None``
+    - Citation count defaulting to ``0``
+    """
+    authors = [a.get("name", "") for a in entry.get("authors") or [] if a.get("name")]
+
+    year_raw = entry.get("year")
+    year: int | None = None
+    if year_raw is not None:
+        try:
+            year = int(year_raw)
+        except (ValueError, TypeError):
+            year = None
+
+    external_ids = entry.get("externalIds") or {}
+
+    citation_count = entry.get("citationCount")
+    if citation_count is None:
+        citation_count = 0
+
+    return {
+        "source": "Semantic Scholar",
+        "title": entry.get("title", "") or "",
+        "authors": authors,
+        "year": year,
+        "doi": external_ids.get("DOI", "") or "",
+        "abstract": entry.get("abstract", "") or "",
+        "url": entry.get("url", "") or "",
+        "venue": entry.get("venue", "") or "",
+        "s2_id": entry.get("paperId", "") or "",
+        "citation_count": citation_count,
+        "raw_metadata": entry,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Adapter
+# ---------------------------------------------------------------------------
+
+
+@register("semanticscholar")
+class SemanticScholarAdapter(SourceAdapter):
+    """Adapter for the Semantic Scholar Graph API bulk search."""
+
+    @property
+    def source_name(self) -> str:
+        return "semanticscholar"
+
+    @property
+    def display_name(self) -> str:
+        return "Semantic Scholar"
+
+    def preflight(self) -> tuple[bool, str]:
+        """Check that the Semantic Scholar API is reachable."""
+        client = self._make_client()
+        try:
+            resp = client.get(
+                _BASE_URL,
+                params={"query": "test", "fields": "paperId"},
+                headers=_get_headers(),
+            )
+            if resp.status_code == 200:
+                return True, "ok"
+            return False, f"HTTP {resp.status_code}"  # pragma: no cover
+        except Exception as exc:
+            return False, str(exc)
+
+    def harvest(
+        self,
+        queries: list[str],
+        max_results: int,
+        *,
+        saturation: SaturationPolicy | None = None,
+    ) -> Iterator[dict]:
+        """Yield normalised records from Semantic Scholar for *queries*."""
+        client = self._make_client()
+        headers = _get_headers()
+        if not headers:
+            logger.warning(
+                "[Semantic Scholar] SEMANTIC_SCHOLAR_API_KEY not set — "
+                "using the shared 1 req/s pool"
+            )
+
+        for query in queries:
+            yield from self._search(client, query, max_results, headers, saturation)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _make_client() -> ELISHttpClient:
+        return ELISHttpClient("Semantic Scholar", delay_seconds=1.0)
+
+    @staticmethod
+    def _search(
+        client: ELISHttpClient,
+        query: str,
+        max_results: int,
+        headers: dict[str, str],
+        saturation: SaturationPolicy | None = None,
+    ) -> Iterator[dict]:
+        """Page through bulk-search results via continuation token."""
+        fetched = 0
+        token: str | None = None
+
+        while fetched < max_results:
+            params: dict[str, object] = {
+                "query": to_bulk_query(query),
+                "fields": ",".join(_FIELDS),
+            }
+            if token:
+                params["token"] = token
+
+            try:
+                resp = client.get(_BASE_URL, params=params, headers=headers)
+            except Exception:
+                logger.warning(
+                    "[Semantic Scholar] Request failed — stopping pagination"
+                )
+                return
+
+            data = resp.json()
+            papers = data.get("data") or []
+            if not papers:
+                return
+
+            page_records = [transform_entry(entry) for entry in papers]
+            for record in page_records:
+                yield record
+                fetched += 1
+                if fetched >= max_results:
+                    return
+
+            if saturation is not None and saturation.should_stop(query, page_records):
+                logger.info("[Semantic Scholar] Query saturated — stopping pagination")
+                return
+
+            # A missing token means the result set is exhausted.
+            token = data.get("token")
+            if not token:
+                return
+
+            client.polite_wait()
@@ -3,11 +3,33 @@
 This module enforces host-capacity safeguards so local SLR execution remains
 bounded on ``elis-server`` and Extraction/Synthesis cannot be promoted to local
 execution surfaces.
+
+``LocalAdmissionController`` turns the policy into a host-wide gate: running
+local jobs are tracked in a shared, file-locked state file, memory pressure and
+load are sampled from ``/proc``, and callers queue in FIFO order via
+``wait_for_slot`` until the policy and the host both have room.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+try:  # POSIX hosts; elsewhere the in-process lock is the only guard.
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+MEMORY_PRESSURE_THRESHOLD_PERCENT = 80
+ADMISSION_STATE_ENV = "ELIS_LOCAL_ADMISSION_STATE"
 
 
 @dataclass(frozen=True)
@@ -58,6 +80,29 @@ DEFAULT_WORKLOAD_PLACEMENT_POLICY = WorkloadPlacementPolicy(
 )
 
 
+def load_workload_placement_policy(path: str | Path) -> WorkloadPlacementPolicy:
+    """Read a policy from JSON; omitted fields keep the default policy's values.
+
+    Example: ``{"max_local_concurrency": 3}`` for a host with room for three
+    local jobs.
+    """
+    try:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(
+            f"Cannot read workload placement policy {path}: {exc}"
+        ) from exc
+    if not isinstance(raw, dict):
+        raise ValueError(f"Workload placement policy {path} must be a JSON object")
+    unknown = sorted(set(raw) - {f.name for f in fields(WorkloadPlacementPolicy)})
+    if unknown:
+        raise ValueError(
+            "Unknown workload placement policy fields: " + ", ".join(unknown)
+        )
+    values = {k: tuple(v) if isinstance(v, list) else v for k, v in raw.items()}
+    return replace(DEFAULT_WORKLOAD_PLACEMENT_POLICY, **values)
+
+
 def report_workload_classes(
     policy: WorkloadPlacementPolicy = DEFAULT_WORKLOAD_PLACEMENT_POLICY,
 ) -> dict[str, object]:
@@ -129,7 +174,7 @@ def capacity_triggered_throttling(
         raise ValueError("memory_pressure_percent must be in range 0..100")
 
     queue_overloaded = queue_depth > policy.max_local_concurrency
-    memory_overloaded = memory_pressure_percent >= 80
+    memory_overloaded = memory_pressure_percent >= MEMORY_PRESSURE_THRESHOLD_PERCENT
 
     if queue_overloaded or memory_overloaded:
         return {
@@ -169,3 +214,311 @@ def prevent_local_promotion(
             f"Promotion blocked: local '{source}' cannot promote '{target}' "
             "to local execution."
         )
+
+
+# ---------------------------------------------------------------------------
+# Host sampling
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class HostSample:
+    """Point-in-time host capacity reading."""
+
+    memory_pressure_percent: int
+    load_per_cpu: float
+
+
+def sample_host(proc_root: Path = Path("/proc")) -> HostSample:
+    """Read memory pressure and 1-minute load per CPU from ``/proc``.
+
+    Memory pressure is ``100 - MemAvailable / MemTotal``.  Hosts without
+    ``/proc`` (macOS, Windows) report an idle sample.
+    """
+    meminfo: dict[str, int] = {}
+    try:
+        for line in (proc_root / "meminfo").read_text(encoding="utf-8").splitlines():
+            key, _, rest = line.partition(":")
+            fields = rest.split()
+            if fields and fields[0].isdigit():
+                meminfo[key] = int(fields[0])
+    except OSError:
+        pass
+    total = meminfo.get("MemTotal", 0)
+    available = meminfo.get("MemAvailable", meminfo.get("MemFree", total))
+    pressure = round(100 * (total - available) / total) if total else 0
+
+    try:
+        load = float((proc_root / "loadavg").read_text(encoding="utf-8").split()[0])
+    except (OSError, ValueError, IndexError):
+        load = 0.0
+    return HostSample(
+        memory_pressure_percent=max(0, min(100, pressure)),
+        load_per_cpu=round(load / (os.cpu_count() or 1), 3),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Admission control
+# ---------------------------------------------------------------------------
+
+
+class AdmissionTimeout(TimeoutError):
+    """Raised when ``wait_for_slot`` gives up before a slot is granted."""
+
+
+def default_admission_state_path() -> Path:
+    """Host-wide state file, shared by every checkout on this machine."""
+    override = os.environ.get(ADMISSION_STATE_ENV, "").strip()
+    if override:
+        return Path(override)
+    return Path(tempfile.gettempdir()) / "elis-local-admission.json"
+
+
+def _pid_alive(pid: int) -> bool:
+    # kill(0) and kill(-n) signal process groups; never treat them as a job.
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+@dataclass
+class AdmissionTicket:
+    """A granted local slot; release it (or use it as a context manager)."""
+
+    controller: LocalAdmissionController
+    ticket_id: str
+    workload_class: str
+    slots: int
+    decision: dict[str, Any]
+    waited_seconds: float = 0.0
+    released: bool = field(default=False, init=False)
+
+    def release(self) -> None:
+        if not self.released:
+            self.controller.release(self.ticket_id)
+            self.released = True
+
+    def __enter__(self) -> AdmissionTicket:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.release()
+
+
+class LocalAdmissionController:
+    """Host-wide admission gate for local workload classes.
+
+    State lives in a small JSON file guarded by ``flock``; entries owned by
+    processes that have exited are pruned on every access, so a crashed run
+    never leaks its slot.  A request is admitted when:
+
+      - ``enforce_local_workload_request`` allows it given the slots held by
+        running jobs plus the requests queued ahead of it, and
+      - sampled memory pressure is below ``memory_threshold_percent`` and,
+        when ``max_load_per_cpu`` is set, the 1-minute load per CPU is below it.
+    """
+
+    def __init__(
+        self,
+        state_path: Path | None = None,
+        *,
+        policy: WorkloadPlacementPolicy = DEFAULT_WORKLOAD_PLACEMENT_POLICY,
+        memory_threshold_percent: int = MEMORY_PRESSURE_THRESHOLD_PERCENT,
+        max_load_per_cpu: float | None = None,
+        sampler: Callable[[], HostSample] = sample_host,
+    ) -> None:
+        self.state_path = state_path or default_admission_state_path()
+        self.policy = policy
+        self.memory_threshold_percent = memory_threshold_percent
+        self.max_load_per_cpu = max_load_per_cpu
+        self.sampler = sampler
+        self._thread_lock = threading.Lock()
+
+    # -- state ------------------------------------------------------------
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[dict[str, list[dict[str, Any]]]]:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.state_path.with_name(self.state_path.name + ".lock")
+        with self._thread_lock, lock_path.open("a+") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                state = self._read_state()
+                yield state
+                tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+                tmp.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
+                os.replace(tmp, self.state_path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_state(self) -> dict[str, list[dict[str, Any]]]:
+        try:
+            raw = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            raw = {}
+        state = {
+            key: [e for e in raw.get(key, []) if _pid_alive(int(e.get("pid", 0)))]
+            for key in ("jobs", "waiters")
+        }
+        return state
+
+    # -- admission --------------------------------------------------------
+
+    def _attempt(
+        self,
+        workload_class: str,
+        requested_concurrency: int,
+        ticket_id: str,
+        *,
+        queue: bool,
+    ) -> dict[str, Any]:
+        with self._locked_state() as state:
+            waiters = sorted(state["waiters"], key=lambda w: w["enqueued_at"])
+            position = next(
+                (i for i, w in enumerate(waiters) if w["ticket_id"] == ticket_id),
+                len(waiters),
+            )
+            running = sum(int(job["slots"]) for job in state["jobs"])
+            decision = enforce_local_workload_request(
+                workload_class,
+                requested_concurrency=requested_concurrency,
+                current_local_jobs=running + position,
+                policy=self.policy,
+            )
+            sample = self.sampler()
+            decision.update(
+                running_slots=running,
+                queued_ahead=position,
+                memory_pressure_percent=sample.memory_pressure_percent,
+                load_per_cpu=sample.load_per_cpu,
+            )
+            if decision["allowed"]:
+                if sample.memory_pressure_percent >= self.memory_threshold_percent:
+                    decision.update(
+                        reason=f"memory pressure {sample.memory_pressure_percent}%"
+                    )
+                elif (
+                    self.max_load_per_cpu is not None
+                    and sample.load_per_cpu >= self.max_load_per_cpu
+                ):
+                    decision.update(reason=f"load per CPU {sample.load_per_cpu}")
+                else:
+                    state["waiters"] = [
+                        w for w in waiters if w["ticket_id"] != ticket_id
+                    ]
+                    state["jobs"].append(
+                        {
+                            "ticket_id": ticket_id,
+                            "workload_class": decision["workload_class"],
+                            "slots": decision["effective_concurrency"],
+                            "pid": os.getpid(),
+                            "admitted_at": time.time(),
+                        }
+                    )
+                    return decision
+                decision.update(
+                    allowed=False,
+                    effective_concurrency=0,
+                    throttled=True,
+                    recommended_action="defer",
+                )
+            if queue and position == len(waiters):
+                state["waiters"].append(
+                    {
+                        "ticket_id": ticket_id,
+                        "workload_class": decision["workload_class"],
+                        "pid": os.getpid(),
+                        "enqueued_at": time.time(),
+                    }
+                )
+            return decision
+
+    def try_admit(
+        self, workload_class: str, *, requested_concurrency: int = 1
+    ) -> tuple[AdmissionTicket | None, dict[str, Any]]:
+        """Admit now if possible, without queueing; never jumps queued waiters."""
+        ticket_id = uuid.uuid4().hex
+        decision = self._attempt(
+            workload_class, requested_concurrency, ticket_id, queue=False
+        )
+        if not decision["allowed"]:
+            return None, decision
+        return self._ticket(ticket_id, decision, 0.0), decision
+
+    def wait_for_slot(
+        self,
+        workload_class: str,
+        *,
+        requested_concurrency: int = 1,
+        timeout: float | None = None,
+        poll_seconds: float = 2.0,
+    ) -> AdmissionTicket:
+        """Queue (FIFO) until admitted; raise ``AdmissionTimeout`` after *timeout*."""
+        ticket_id = uuid.uuid4().hex
+        started = time.monotonic()
+        try:
+            while True:
+                decision = self._attempt(
+                    workload_class, requested_concurrency, ticket_id, queue=True
+                )
+                waited = time.monotonic() - started
+                if decision["allowed"]:
+                    return self._ticket(ticket_id, decision, waited)
+                if timeout is not None and waited + poll_seconds > timeout:
+                    raise AdmissionTimeout(
+                        f"No local slot for '{decision['workload_class']}' after "
+                        f"{waited:.0f}s: {decision['reason']}."
+                    )
+                time.sleep(poll_seconds)
+        except BaseException:
+            self._forget_waiter(ticket_id)
+            raise
+
+    @contextmanager
+    def slot(self, workload_class: str, **kwargs: Any) -> Iterator[AdmissionTicket]:
+        """``with controller.slot("screening"): ...`` — wait, run, release."""
+        with self.wait_for_slot(workload_class, **kwargs) as ticket:
+            yield ticket
+
+    def release(self, ticket_id: str) -> None:
+        with self._locked_state() as state:
+            state["jobs"] = [j for j in state["jobs"] if j["ticket_id"] != ticket_id]
+
+    def status(self) -> dict[str, Any]:
+        """Running jobs, queued waiters and a fresh host sample."""
+        with self._locked_state() as state:
+            sample = self.sampler()
+            return {
+                "max_local_concurrency": self.policy.max_local_concurrency,
+                "running": state["jobs"],
+                "queued": sorted(state["waiters"], key=lambda w: w["enqueued_at"]),
+                "memory_pressure_percent": sample.memory_pressure_percent,
+                "load_per_cpu": sample.load_per_cpu,
+            }
+
+    def _forget_waiter(self, ticket_id: str) -> None:
+        with self._locked_state() as state:
+            state["waiters"] = [
+                w for w in state["waiters"] if w["ticket_id"] != ticket_id
+            ]
+
+    def _ticket(
+        self, ticket_id: str, decision: dict[str, Any], waited: float
+    ) -> AdmissionTicket:
+        return AdmissionTicket(
+            controller=self,
+            ticket_id=ticket_id,
+            workload_class=decision["workload_class"],
+            slots=int(decision["effective_concurrency"]),
+            decision=decision,
+            waited_seconds=round(waited, 3),
+        )
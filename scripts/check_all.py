@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+"""Run the scripts/check_*.py gate suite in one process.
+
+Each gate normally runs as its own interpreter, paying startup, imports and
+re-reads of the same repo files (CURRENT_PE.md, AGENTS.md, openclaw.json...).
+This runner imports every gate once, calls its entry point on a thread pool
+with per-thread stdout/stderr capture and a shared ``Path.read_text`` cache,
+and writes one aggregated report with per-check exit codes and timings.
+
+A gate's exit code is exactly what its ``python scripts/check_x.py``
+invocation would have returned: the entry point's return value, or the
+``SystemExit`` code (a string message counts as exit 1, as in CPython).
+Uncaught exceptions are reported with their traceback and exit 1.
+
+Each gate sees ``sys.argv`` as its own script path plus the arguments given
+with ``--check-args``.  Gates that declare required or positional CLI
+arguments are skipped by default; naming one with ``--check`` requires its
+arguments too.
+
+Usage:
+    python scripts/check_all.py
+    python scripts/check_all.py --check check_current_pe --check check_review
+    python scripts/check_all.py --check-args check_active_run="--pe-id PE-X --agent a"
+    python scripts/check_all.py --json gates.json --markdown gates.md --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import pathlib
+import re
+import shlex
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterator, TextIO
+
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_SELF = pathlib.Path(__file__).stem
+_ENTRY_POINTS = ("main", "print_report")
+_NEEDS_ARGS_RE = re.compile(r"required=True|add_argument\(\s*[\"'][^-]")
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    name: str
+    exit_code: int
+    seconds: float
+    output: str
+
+    @property
+    def passed(self) -> bool:
+        return self.exit_code == 0
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+
+def discover_checks(scripts_dir: pathlib.Path = SCRIPTS_DIR) -> dict[str, pathlib.Path]:
+    """Return ``{name: path}`` for every ``check_*.py`` gate, sorted by name."""
+    return {
+        path.stem: path
+        for path in sorted(scripts_dir.glob("check_*.py"))
+        if path.stem != _SELF
+    }
+
+
+def needs_arguments(path: pathlib.Path) -> bool:
+    """True when the gate's argparse setup has required or positional options."""
+    return bool(_NEEDS_ARGS_RE.search(path.read_text(encoding="utf-8")))
+
+
+def _load_entry_point(name: str, path: pathlib.Path) -> Callable[[], object]:
+    module_name = f"check_all__{name}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load {path}")
+        module = importlib.util.module_from_spec(spec)
+        # Registered before exec so dataclasses in the gate can resolve it.
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+    for attr in _ENTRY_POINTS:
+        entry = getattr(module, attr, None)
+        if callable(entry):
+            return entry
+    raise AttributeError(f"{path.name} defines none of {', '.join(_ENTRY_POINTS)}()")
+
+
+# ---------------------------------------------------------------------------
+# Shared process state: output capture and read cache
+# ---------------------------------------------------------------------------
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """Route writes to the calling thread's capture buffer, if it has one."""
+
+    def __init__(self, fallback: TextIO, local: threading.local) -> None:
+        self._fallback = fallback
+        self._local = local
+
+    def _target(self) -> TextIO:
+        return getattr(self._local, "buffer", None) or self._fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return "utf-8"
+
+    def reconfigure(self, **_kwargs: object) -> None:
+        """Gates call ``sys.stdout.reconfigure(encoding=...)``; buffers are text."""
+
+
+@contextmanager
+def _captured_streams() -> Iterator[threading.local]:
+    local = threading.local()
+    saved = sys.stdout, sys.stderr
+    sys.stdout = _ThreadLocalStream(saved[0], local)  # type: ignore[assignment]
+    sys.stderr = _ThreadLocalStream(saved[1], local)  # type: ignore[assignment]
+    try:
+        yield local
+    finally:
+        sys.stdout, sys.stderr = saved
+
+
+class _ThreadLocalArgv(list):
+    """``sys.argv`` stand-in returning the calling thread's argv, if it has one."""
+
+    def __init__(self, fallback: list[str], local: threading.local) -> None:
+        super().__init__()
+        self._fallback = fallback
+        self._local = local
+
+    def _target(self) -> list[str]:
+        return getattr(self._local, "argv", None) or self._fallback
+
+    def __getitem__(self, index):  # type: ignore[override]
+        return self._target()[index]
+
+    def __iter__(self):  # type: ignore[override]
+        return iter(self._target())
+
+    def __len__(self) -> int:
+        return len(self._target())
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._target()
+
+    def __repr__(self) -> str:
+        return repr(self._target())
+
+
+@contextmanager
+def _per_thread_argv(local: threading.local) -> Iterator[None]:
+    saved = sys.argv
+    sys.argv = _ThreadLocalArgv(saved, local)
+    try:
+        yield
+    finally:
+        sys.argv = saved
+
+
+@contextmanager
+def shared_read_cache() -> Iterator[dict[tuple, str]]:
+    """Memoise ``pathlib.Path.read_text`` by (path, mtime, size, encoding)."""
+    original = pathlib.Path.read_text
+    cache: dict[tuple, str] = {}
+
+    def _read_text(self, encoding=None, errors=None, **kwargs):
+        try:
+            stat = os.stat(self)
+        except OSError:
+            return original(self, encoding, errors, **kwargs)
+        key = (os.path.abspath(self), stat.st_mtime_ns, stat.st_size, encoding, errors)
+        text = cache.get(key)
+        if text is None:
+            text = cache[key] = original(self, encoding, errors, **kwargs)
+        return text
+
+    pathlib.Path.read_text = _read_text  # type: ignore[method-assign]
+    try:
+        yield cache
+    finally:
+        pathlib.Path.read_text = original  # type: ignore[method-assign]
+
+
+def _exit_code(exc: SystemExit, out: TextIO) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=out)
+    return 1
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def _run_one(
+    name: str, path: pathlib.Path, args: list[str], local: threading.local
+) -> CheckResult:
+    buffer = io.StringIO()
+    local.buffer = buffer
+    local.argv = [str(path), *args]
+    started = time.perf_counter()
+    try:
+        result = _load_entry_point(name, path)()
+        exit_code = result if isinstance(result, int) else 0
+    except SystemExit as exc:
+        exit_code = _exit_code(exc, buffer)
+    except Exception:
+        traceback.print_exc(file=buffer)
+        exit_code = 1
+    finally:
+        local.buffer = local.argv = None
+    return CheckResult(
+        name=name,
+        exit_code=exit_code,
+        seconds=round(time.perf_counter() - started, 4),
+        output=buffer.getvalue(),
+    )
+
+
+def run_checks(
+    checks: dict[str, pathlib.Path],
+    *,
+    workers: int = 8,
+    check_args: dict[str, list[str]] | None = None,
+) -> list[CheckResult]:
+    """Run *checks* concurrently in this process; results keep *checks* order.
+
+    Each gate sees ``sys.argv`` as ``[its path, *check_args.get(name, [])]``.
+    """
+    check_args = check_args or {}
+    with _captured_streams() as local, _per_thread_argv(local), shared_read_cache():
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [
+                pool.submit(_run_one, name, path, check_args.get(name, []), local)
+                for name, path in checks.items()
+            ]
+            return [future.result() for future in futures]
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+
+def report_payload(results: list[CheckResult], wall_seconds: float) -> dict:
+    return {
+        "passed": all(r.passed for r in results),
+        "wall_seconds": round(wall_seconds, 4),
+        "checks": [{**asdict(r), "passed": r.passed} for r in results],
+    }
+
+
+def render_markdown(results: list[CheckResult], wall_seconds: float) -> str:
+    failed = [r for r in results if not r.passed]
+    lines = [
+        "# Gate suite report",
+        "",
+        f"{len(results) - len(failed)}/{len(results)} checks passed "
+        f"in {wall_seconds:.2f}s.",
+        "",
+        "| Check | Exit | Seconds |",
+        "|-------|------|---------|",
+        *[f"| {r.name} | {r.exit_code} | {r.seconds:.3f} |" for r in results],
+    ]
+    for result in failed:
+        lines += ["", f"## {result.name} (exit {result.exit_code})", "", "```"]
+        lines += [result.output.rstrip() or "(no output)", "```"]
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the scripts/check_*.py gates in one process."
+    )
+    parser.add_argument(
+        "--check",
+        action="append",
+        dest="checks",
+        metavar="NAME",
+        help="Run only this gate (repeatable); default: every argument-free gate.",
+    )
+    parser.add_argument(
+        "--check-args",
+        action="append",
+        default=[],
+        metavar="NAME=ARGS",
+        help="Run gate NAME with these shell-quoted arguments (repeatable); "
+        "implies --check NAME.",
+    )
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--json", dest="json_path", help="Write the JSON report here.")
+    parser.add_argument("--markdown", help="Write the markdown report here.")
+    parser.add_argument(
+        "--list", action="store_true", help="List discovered gates and exit."
+    )
+    args = parser.parse_args(argv)
+
+    discovered = discover_checks()
+    if args.list:
+        for name, path in discovered.items():
+            note = "  (needs arguments)" if needs_arguments(path) else ""
+            print(f"{name}{note}")
+        return 0
+
+    check_args: dict[str, list[str]] = {}
+    for spec in args.check_args:
+        name, sep, value = spec.partition("=")
+        if not sep:
+            parser.error(f"--check-args expects NAME=ARGS, got {spec!r}")
+        check_args[name] = shlex.split(value)
+
+    named = args.checks or []
+    named += [name for name in check_args if name not in named]
+    unknown = sorted(set(named) - set(discovered))
+    if unknown:
+        parser.error(f"unknown check(s): {', '.join(unknown)}")
+    missing = [
+        name
+        for name in named
+        if name not in check_args and needs_arguments(discovered[name])
+    ]
+    if missing:
+        parser.error(
+            f"gate(s) need arguments: {', '.join(missing)}; pass them with "
+            f'--check-args {missing[0]}="..."'
+        )
+    if named:
+        selected = {name: discovered[name] for name in named}
+    else:
+        selected = {
+            name: path for name, path in discovered.items() if not needs_arguments(path)
+        }
+
+    started = time.perf_counter()
+    results = run_checks(selected, workers=args.workers, check_args=check_args)
+    wall = time.perf_counter() - started
+
+    markdown = render_markdown(results, wall)
+    if args.json_path:
+        pathlib.Path(args.json_path).write_text(
+            json.dumps(report_payload(results, wall), indent=2) + "\n",
+            encoding="utf-8",
+        )
+    if args.markdown:
+        pathlib.Path(args.markdown).write_text(markdown, encoding="utf-8")
+    for result in results:
+        status = "PASS" if result.passed else f"FAIL (exit {result.exit_code})"
+        print(f"{result.name:<40} {status:<16} {result.seconds:.3f}s")
+    print(f"{sum(r.passed for r in results)}/{len(results)} passed in {wall:.2f}s")
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,7 @@ agent_id_module = import_module("elis.agent_id")
 engine_from_agent_id = agent_id_module.engine_from_agent_id
 canonical_agent_id = agent_id_module.canonical_agent_id
 workflow_state_machine = import_module("elis.workflow_state_machine")
+pe_registry = import_module("elis.pe_registry")
 
 VALID_ACTIVE_STATUSES = set(workflow_state_machine.ACTIVE_STATES)
 VALID_REGISTRY_STATUSES = set(workflow_state_machine.CANONICAL_STATES)
@@ -52,33 +53,10 @@ def _table_value(lines: list[str], field: str) -> str | None:
     return None
 
 
-def _table_block(lines: list[str], heading: str) -> list[str]:
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == heading.lower():
-            start = idx + 1
-            break
-
-    if start is None:
-        return []
-
-    block: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if block:
-                break
-            continue
-        if stripped.startswith("|"):
-            block.append(stripped)
-            continue
-        if block:
-            break
-    return block
-
-
 def _parse_roles(content: str) -> dict[str, str]:
-    roles_block = _table_block(content.splitlines(), "## Agent roles")
+    roles_block = pe_registry.table_block(
+        content.splitlines(), pe_registry.ROLES_HEADING
+    )
     if len(roles_block) < 3:
         raise ValueError("Agent roles table missing or malformed.")
 
@@ -99,18 +77,7 @@ def _parse_roles(content: str) -> dict[str, str]:
 
 
 def _parse_registry(content: str) -> tuple[list[str], list[dict[str, str]]]:
-    block = _table_block(content.splitlines(), "## Active PE Registry")
-    if len(block) < 3:
-        raise ValueError("Active PE Registry table missing or malformed.")
-
-    header = [part.strip().lower() for part in block[0].strip("|").split("|")]
-    rows: list[dict[str, str]] = []
-    for raw in block[2:]:
-        values = [part.strip() for part in raw.strip("|").split("|")]
-        if len(values) != len(header):
-            raise ValueError("Active PE Registry row has wrong column count.")
-        rows.append(dict(zip(header, values)))
-    return header, rows
+    return pe_registry.parse_registry(content)
 
 
 def _engine(agent_id: str) -> str | None:
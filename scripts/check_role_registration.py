@@ -10,6 +10,7 @@ if str(REPO_ROOT) not in sys.path:
 
 engine_from_agent_id = import_module("elis.agent_id").engine_from_agent_id
 workflow_state_machine = import_module("elis.workflow_state_machine")
+pe_registry = import_module("elis.pe_registry")
 
 VALID_STATUSES = set(workflow_state_machine.CANONICAL_STATES)
 VALID_ROLES = {"Implementer", "Validator"}
@@ -52,28 +53,9 @@ def detect_role(content: str, agent: str) -> str | None:
 
 
 def parse_roles_table(content: str) -> dict[str, str]:
-    lines = content.splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == "## agent roles":
-            start = idx + 1
-            break
-    if start is None:
-        return {}
-
-    table_lines: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if table_lines:
-                break
-            continue
-        if stripped.startswith("|"):
-            table_lines.append(stripped)
-            continue
-        if table_lines:
-            break
-
+    table_lines = pe_registry.table_block(
+        content.splitlines(), pe_registry.ROLES_HEADING
+    )
     matches = []
     for line in table_lines[2:]:
         match = re.match(
@@ -94,40 +76,11 @@ def parse_roles_table(content: str) -> dict[str, str]:
 def parse_active_registry(
     content: str,
 ) -> tuple[list[str], list[dict[str, str]]] | tuple[None, None]:
-    lines = content.splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == "## active pe registry":
-            start = idx + 1
-            break
-    if start is None:
-        return None, None
-
-    table_lines: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if table_lines:
-                break
-            continue
-        if stripped.startswith("|"):
-            table_lines.append(stripped)
-            continue
-        if table_lines:
-            break
-
-    if len(table_lines) < 3:
+    try:
+        return pe_registry.parse_registry(content)
+    except pe_registry.RegistryError:
         return None, None
 
-    header = [part.strip().lower() for part in table_lines[0].strip("|").split("|")]
-    rows: list[dict[str, str]] = []
-    for row_line in table_lines[2:]:
-        parts = [part.strip() for part in row_line.strip("|").split("|")]
-        if len(parts) != len(header):
-            return None, None
-        rows.append(dict(zip(header, parts)))
-    return header, rows
-
 
 def extract_engine(agent_id: str) -> str | None:
     try:
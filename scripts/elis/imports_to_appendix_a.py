@@ -34,7 +34,8 @@
 #       * query_topic / query_string
 #
 # Design notes
-#   - Standard library only (no external Python dependencies).
+#   - Standard library only (no external Python dependencies); title
+#     normalisation is shared with the pipeline via elis.normalise.
 #   - Case-insensitive header handling to tolerate minor Scopus changes.
 #   - Dedup strategy: prefer DOI; else hash of normalised title + year.
 #   - Safe to run multiple times; each run overwrites the canonical
@@ -67,8 +68,13 @@ import os
 import re
 import sys
 from collections import Counter
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from elis.normalise import normalise_title
+
 CANONICAL_A = "json_jsonl/ELIS_Appendix_A_Search_rows.json"
 
 
@@ -91,19 +97,6 @@ def norm(s: Optional[str]) -> Optional[str]:
     return s or None
 
 
-def normalise_title(title: Optional[str]) -> str:
-    """
-    Normalise title for deduplication:
-    - lower-case
-    - strip punctuation
-    - collapse repeated whitespace
-    """
-    if not title:
-        return ""
-    t = re.sub(r"[^\w\s]", " ", title.lower())
-    return re.sub(r"\s+", " ", t).strip()
-
-
 def stable_id(doi: Optional[str], title: Optional[str], year: Optional[int]) -> str:
     """
     Produce a stable deterministic identifier for a record.
@@ -4,14 +4,26 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import pathlib
 import re
 import sys
 from dataclasses import dataclass
+from typing import Callable
 
 if __package__ in {None, ""}:
     sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
+from elis.pe_registry import (
+    RELEASE_HEADING,
+    CurrentPEDocument,
+    load_current_pe,
+    parse_current_pe,
+    parse_registry,
+    read_text_cached,
+)
 from scripts.pm_status_reporter import auth_status_summary
 
 _DEFAULT_CURRENT_PE = pathlib.Path("CURRENT_PE.md")
@@ -37,10 +49,11 @@ def _table_value(content: str, field: str) -> str | None:
     return match.group(1).strip() if match else None
 
 
-def parse_release_context(content: str) -> dict[str, str]:
-    release = _table_value(content, "Release")
-    base_branch = _table_value(content, "Base branch")
-    plan_file = _table_value(content, "Plan file")
+def parse_release_context(content: str | CurrentPEDocument) -> dict[str, str]:
+    document = parse_current_pe(content) if isinstance(content, str) else content
+    release = document.section_value(RELEASE_HEADING, "Release")
+    base_branch = document.section_value(RELEASE_HEADING, "Base branch")
+    plan_file = document.section_value(RELEASE_HEADING, "Plan file")
     if not release or not base_branch or not plan_file:
         raise ValueError("CURRENT_PE.md release context is incomplete.")
     return {
@@ -51,38 +64,7 @@ def parse_release_context(content: str) -> dict[str, str]:
 
 
 def parse_active_registry(content: str) -> list[dict[str, str]]:
-    lines = content.splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == "## active pe registry":
-            start = idx + 1
-            break
-    if start is None:
-        raise ValueError("Active PE Registry section missing.")
-
-    table_lines: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if table_lines:
-                break
-            continue
-        if stripped.startswith("|"):
-            table_lines.append(stripped)
-            continue
-        if table_lines:
-            break
-
-    if len(table_lines) < 3:
-        raise ValueError("Active PE Registry table missing or malformed.")
-
-    header = [part.strip().lower() for part in table_lines[0].strip("|").split("|")]
-    rows: list[dict[str, str]] = []
-    for row_line in table_lines[2:]:
-        parts = [part.strip() for part in row_line.strip("|").split("|")]
-        if len(parts) != len(header):
-            raise ValueError("Active PE Registry row has wrong column count.")
-        rows.append(dict(zip(header, parts)))
+    _, rows = parse_registry(content)
     return rows
 
 
@@ -127,11 +109,17 @@ def _engine_display(agent_id: str) -> str:
     return agent_id
 
 
-def _review_file_for_pe(pe_id: str, repo_root: pathlib.Path) -> pathlib.Path | None:
+def _review_file_for_pe(
+    pe_id: str,
+    repo_root: pathlib.Path,
+    review_files: list[pathlib.Path] | None = None,
+) -> pathlib.Path | None:
+    if review_files is None:
+        review_files = sorted(repo_root.glob(_REVIEW_FILE_GLOB))
     expected = repo_root / f"REVIEW_{pe_id.replace('-', '_')}.md"
-    if expected.exists():
+    if expected in review_files:
         return expected
-    for path in sorted(repo_root.glob(_REVIEW_FILE_GLOB)):
+    for path in review_files:
         if pe_id.replace("-", "_") in path.stem:
             return path
     return None
@@ -192,6 +180,126 @@ def intervention_counts(
     return per_pe, po_count
 
 
+# ---------------------------------------------------------------------------
+# Incremental cache
+# ---------------------------------------------------------------------------
+
+
+def _digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class DashboardCache:
+    """Per-PE derived facts persisted between dashboard runs.
+
+    REVIEW facts (latest verdict, round count) are keyed on the file's
+    mtime/size first and its sha256 second, so an unchanged file is neither
+    read nor re-parsed.  Intervention counts are keyed on the LESSONS hash
+    and the release PE set, and each rendered row on a fingerprint of all of
+    its inputs.  With ``path=None`` the cache lives only for one build.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path
+        self.stats = {"reviews_parsed": 0, "rows_rendered": 0, "rows_reused": 0}
+        data: dict = {}
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            data = {}
+        self._reviews: dict[str, dict] = data.get("reviews", {})
+        self._interventions: dict = data.get("interventions", {})
+        self._rows: dict[str, dict] = data.get("rows", {})
+        self._seen_rows: set[str] = set()
+
+    def review_facts(self, review_file: pathlib.Path) -> tuple[str | None, int]:
+        stat = review_file.stat()
+        key = str(review_file.resolve())
+        entry = self._reviews.get(key)
+        if entry and (entry["mtime_ns"], entry["size"]) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return entry["verdict"], entry["rounds"]
+        content = read_text_cached(review_file)
+        digest = _digest(content)
+        if entry is None or entry["sha256"] != digest:
+            self.stats["reviews_parsed"] += 1
+            entry = {
+                "sha256": digest,
+                "verdict": _latest_verdict(content),
+                "rounds": _round_count(content),
+            }
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._reviews[key] = entry
+        return entry["verdict"], entry["rounds"]
+
+    def interventions(
+        self, lessons_content: str, pe_ids: set[str]
+    ) -> tuple[dict[str, int], int]:
+        key = [_digest(lessons_content), sorted(pe_ids)]
+        if self._interventions.get("key") != key:
+            per_pe, po_count = intervention_counts(lessons_content, pe_ids)
+            self._interventions = {"key": key, "per_pe": per_pe, "po": po_count}
+        return dict(self._interventions["per_pe"]), self._interventions["po"]
+
+    def row(self, pe_id: str, inputs: object, render: Callable[[], str]) -> str:
+        fingerprint = _digest(json.dumps(inputs, sort_keys=True, default=str))
+        self._seen_rows.add(pe_id)
+        entry = self._rows.get(pe_id)
+        if entry and entry["fingerprint"] == fingerprint:
+            self.stats["rows_reused"] += 1
+            return entry["line"]
+        line = render()
+        self._rows[pe_id] = {"fingerprint": fingerprint, "line": line}
+        self.stats["rows_rendered"] += 1
+        return line
+
+    def save(self) -> None:
+        """Persist facts for rows rendered in this build (drops stale PEs)."""
+        if self.path is None:
+            return
+        payload = {
+            "version": self.VERSION,
+            "reviews": self._reviews,
+            "interventions": self._interventions,
+            "rows": {k: v for k, v in self._rows.items() if k in self._seen_rows},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Dashboard
+# ---------------------------------------------------------------------------
+
+
+def _merged_line(
+    pe_id: str,
+    updated: str,
+    facts: tuple[str | None, int] | None,
+    interventions: int,
+) -> str:
+    verdict_text = "merged"
+    if facts is not None:
+        verdict = facts[0] or "PASS"
+        rounds = facts[1]
+        verdict_text = f"{verdict} (round {rounds})"
+        if interventions:
+            noun = "intervention" if interventions == 1 else "interventions"
+            verdict_text = (
+                f"{verdict} (round {rounds} — {interventions} arbiter {noun})"
+            )
+    return f"{pe_id:<11} merged    {updated:<11} {verdict_text}"
+
+
 def build_dashboard(
     release_name: str,
     plan_pes: list[PlanPE],
@@ -199,7 +307,11 @@ def build_dashboard(
     lessons_content: str,
     repo_root: pathlib.Path,
     auth_summary: str,
+    cache: DashboardCache | None = None,
 ) -> str:
+    """Render the dashboard; pass a persisted *cache* for incremental runs."""
+    if cache is None:
+        cache = DashboardCache()
     row_by_pe = {row["pe-id"]: row for row in registry_rows if row.get("pe-id")}
     merged_ids = {
         row["pe-id"]
@@ -207,7 +319,9 @@ def build_dashboard(
         if row.get("status", "").lower() == "merged"
     }
     release_pe_ids = {pe.pe_id for pe in plan_pes}
-    interventions_by_pe, po_count = intervention_counts(lessons_content, release_pe_ids)
+    interventions_by_pe, po_count = cache.interventions(lessons_content, release_pe_ids)
+    # One directory scan per build instead of one per merged PE.
+    review_files = sorted(repo_root.glob(_REVIEW_FILE_GLOB))
 
     lines = [
         f"PE Series: {release_name}",
@@ -221,31 +335,43 @@ def build_dashboard(
                 status_text = f"waiting on {', '.join(unsatisfied)}"
             else:
                 status_text = "ready to start"
-            lines.append(f"{pe.pe_id:<11} planned   —           {status_text}")
+            lines.append(
+                cache.row(
+                    pe.pe_id,
+                    ["planned", unsatisfied],
+                    lambda pe=pe, text=status_text: (
+                        f"{pe.pe_id:<11} planned   —           {text}"
+                    ),
+                )
+            )
             continue
 
         status = row.get("status", "").lower()
         updated = row.get("last-updated", "—")
         if status == "merged":
-            review_file = _review_file_for_pe(pe.pe_id, repo_root)
-            verdict_text = "merged"
-            if review_file is not None:
-                review_content = review_file.read_text(encoding="utf-8")
-                verdict = _latest_verdict(review_content) or "PASS"
-                rounds = _round_count(review_content)
-                interventions = interventions_by_pe.get(pe.pe_id, 0)
-                verdict_text = f"{verdict} (round {rounds})"
-                if interventions:
-                    noun = "intervention" if interventions == 1 else "interventions"
-                    verdict_text = (
-                        f"{verdict} (round {rounds} — {interventions} arbiter {noun})"
-                    )
-            lines.append(f"{pe.pe_id:<11} merged    {updated:<11} {verdict_text}")
+            review_file = _review_file_for_pe(pe.pe_id, repo_root, review_files)
+            facts = cache.review_facts(review_file) if review_file else None
+            interventions = interventions_by_pe.get(pe.pe_id, 0)
+            lines.append(
+                cache.row(
+                    pe.pe_id,
+                    ["merged", updated, facts, interventions],
+                    lambda pe=pe, u=updated, f=facts, n=interventions: _merged_line(
+                        pe.pe_id, u, f, n
+                    ),
+                )
+            )
             continue
 
         implementer = _engine_display(row.get("implementer-agentid", ""))
         lines.append(
-            f"{pe.pe_id:<11} active    —           {status} · {implementer} · updated {updated}"
+            cache.row(
+                pe.pe_id,
+                ["active", status, implementer, updated],
+                lambda pe=pe, s=status, i=implementer, u=updated: (
+                    f"{pe.pe_id:<11} active    —           {s} · {i} · updated {u}"
+                ),
+            )
         )
 
     lines.append("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
@@ -268,6 +394,7 @@ def build_dashboard(
     )
     lines.append(f"PO interventions: {po_count}")
     lines.append(auth_summary)
+    cache.save()
     return "\n".join(lines)
 
 
@@ -293,18 +420,25 @@ def main() -> int:
         action="store_true",
         help="Emit a JSON object with the dashboard text.",
     )
+    parser.add_argument(
+        "--cache",
+        help=(
+            "Incremental mode: reuse per-PE facts from this JSON cache and "
+            "re-render only rows whose inputs changed."
+        ),
+    )
     args = parser.parse_args()
 
     current_pe_path = pathlib.Path(args.current_pe)
     repo_root = current_pe_path.resolve().parent
     try:
-        current_content = current_pe_path.read_text(encoding="utf-8")
-        release_context = parse_release_context(current_content)
-        registry_rows = parse_active_registry(current_content)
+        current_pe = load_current_pe(current_pe_path)
+        release_context = parse_release_context(current_pe)
+        _, registry_rows = current_pe.registry()
         plan_path = repo_root / release_context["plan_file"]
         plan_content = plan_path.read_text(encoding="utf-8")
         plan_pes = parse_plan_markdown(plan_content)
-        lessons_content = pathlib.Path(args.lessons).read_text(encoding="utf-8")
+        lessons_content = read_text_cached(pathlib.Path(args.lessons))
     except OSError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 1
@@ -319,11 +453,10 @@ def main() -> int:
         lessons_content=lessons_content,
         repo_root=repo_root,
         auth_summary=auth_status_summary(),
+        cache=DashboardCache(pathlib.Path(args.cache) if args.cache else None),
     )
 
     if args.json:
-        import json
-
         print(json.dumps({"report": dashboard}, indent=2))
     else:
         print(dashboard)
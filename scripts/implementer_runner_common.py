@@ -13,24 +13,22 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from elis.agent_id import engine_from_agent_id
+from elis.pe_registry import (
+    CURRENT_PE_HEADING,
+    RELEASE_HEADING,
+    CurrentPEDocument,
+    load_current_pe,
+)
 from elis.reviewer_identity import ReviewerIdentityError, review_login_for_engine
 from elis.workflow_state_machine import ensure_canonical_state
 
 
 PE_SECTION_RE = r"### {pe_id}\b"
 PE_ROW_RE = re.compile(r"^\|\s*PE\s*\|\s*(PE-[A-Z0-9-]+-[0-9]+)\s*\|$", re.MULTILINE)
-FIELD_ROW_RE = re.compile(r"^\|\s*(?P<field>[^|]+?)\s*\|\s*(?P<value>[^|]+?)\s*\|$")
 AGENT_ROW_RE = re.compile(
     r"^\|\s*(?P<label>CODEX|Claude Code)\s*\|\s*(?P<role>Implementer|Validator)\s*\|$",
     re.MULTILINE,
 )
-REGISTRY_ROW_RE = re.compile(
-    r"^\|\s*(?P<pe>PE-[A-Z0-9-]+-[0-9]+)\s*\|\s*(?P<domain>[^|]+?)\s*\|"
-    r"\s*(?P<implementer>[^|]+?)\s*\|\s*(?P<validator>[^|]+?)\s*\|"
-    r"\s*(?P<branch>[^|]+?)\s*\|\s*(?P<status>[^|]+?)\s*\|"
-    r"\s*(?P<updated>[^|]+?)\s*\|$",
-    re.MULTILINE,
-)
 
 
 @dataclass(frozen=True)
@@ -62,19 +60,11 @@ class RunnerError(RuntimeError):
     """Raised when the runner cannot proceed safely."""
 
 
-def _extract_table_value(content: str, heading: str, field: str) -> str:
-    lines = content.splitlines()
-    in_heading = False
-    for line in lines:
-        if line.strip() == heading:
-            in_heading = True
-            continue
-        if in_heading and line.startswith("## ") and line.strip() != heading:
-            break
-        match = FIELD_ROW_RE.match(line.strip())
-        if match and match.group("field").strip() == field:
-            return match.group("value").strip()
-    raise RunnerError(f"Missing '{field}' in section '{heading}'.")
+def _extract_table_value(document: CurrentPEDocument, heading: str, field: str) -> str:
+    value = document.section_value(heading, field)
+    if value is None:
+        raise RunnerError(f"Missing '{field}' in section '{heading}'.")
+    return value
 
 
 def _engine(agent_id: str) -> str:
@@ -85,32 +75,28 @@ def _engine(agent_id: str) -> str:
 
 
 def parse_current_pe(path: Path) -> CurrentPEContext:
-    content = path.read_text(encoding="utf-8")
-    pe_id = _extract_table_value(content, "## Current PE", "PE")
-    branch = _extract_table_value(content, "## Current PE", "Branch")
-    base_branch = _extract_table_value(content, "## Release context", "Base branch")
-    plan_file = _extract_table_value(content, "## Release context", "Plan file")
-    plan_location = _extract_table_value(content, "## Release context", "Plan location")
-
-    registry_match = None
-    for match in REGISTRY_ROW_RE.finditer(content):
-        if match.group("pe").strip() == pe_id:
-            registry_match = match
-            break
-    if registry_match is None:
+    document = load_current_pe(path)
+    pe_id = _extract_table_value(document, CURRENT_PE_HEADING, "PE")
+    branch = _extract_table_value(document, CURRENT_PE_HEADING, "Branch")
+    base_branch = _extract_table_value(document, RELEASE_HEADING, "Base branch")
+    plan_file = _extract_table_value(document, RELEASE_HEADING, "Plan file")
+    plan_location = _extract_table_value(document, RELEASE_HEADING, "Plan location")
+
+    row = document.row(pe_id)
+    if row is None:
         raise RunnerError(
             f"Current PE '{pe_id}' is not present in the Active PE Registry."
         )
 
-    implementer_agent = registry_match.group("implementer").strip()
-    validator_agent = registry_match.group("validator").strip()
-    status = registry_match.group("status").strip().lower()
+    implementer_agent = row.implementer
+    validator_agent = row.validator
+    status = row.status.lower()
     try:
         ensure_canonical_state(status)
     except ValueError as exc:
         raise RunnerError(str(exc)) from exc
 
-    if registry_match.group("branch").strip() != branch:
+    if row.branch != branch:
         raise RunnerError(
             "Current PE branch does not match the Active PE Registry row."
         )
@@ -234,12 +220,13 @@ def ensure_expected_login(engine: str) -> None:
         )
 
 
-def branch_commit_count(base_branch: str) -> int:
+def branch_commit_count(base_branch: str, *, cwd: Path | None = None) -> int:
     result = subprocess.run(
         ["git", "rev-list", "--count", f"origin/{base_branch}..HEAD"],
         capture_output=True,
         text=True,
         timeout=30,
+        cwd=cwd,
         check=False,
     )
     if result.returncode != 0:
@@ -11,6 +11,7 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+from elis.pe_registry import RegistryError, parse_registry_table, section_value
 from scripts.pm_assign_pe import make_branch_name
 
 
@@ -82,18 +83,10 @@ def _load_loop_control(path: Path) -> dict[str, object]:
 
 
 def _extract_table_value(content: str, heading: str, field: str) -> str:
-    lines = content.splitlines()
-    in_heading = False
-    for line in lines:
-        if line.strip() == heading:
-            in_heading = True
-            continue
-        if in_heading and line.startswith("## ") and line.strip() != heading:
-            break
-        match = TABLE_FIELD_RE.match(line.strip())
-        if match and match.group("field").strip() == field:
-            return match.group("value").strip()
-    raise SequencerError(f"Missing '{field}' in section '{heading}'.")
+    value = section_value(content, heading, field)
+    if value is None:
+        raise SequencerError(f"Missing '{field}' in section '{heading}'.")
+    return value
 
 
 def _engine(agent_id: str) -> str:
@@ -114,39 +107,10 @@ def _current_branch(content: str) -> str:
 
 
 def _parse_registry_rows(content: str) -> tuple[list[str], list[list[str]]]:
-    lines = content.splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip() == REGISTRY_HEADING:
-            start = idx + 1
-            break
-    if start is None:
-        raise SequencerError("Active PE Registry table not found.")
-
-    table_lines: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if table_lines:
-                break
-            continue
-        if stripped.startswith("|"):
-            table_lines.append(stripped)
-            continue
-        if table_lines:
-            break
-
-    if len(table_lines) < 3:
-        raise SequencerError("Active PE Registry table is malformed.")
-
-    header = [part.strip() for part in table_lines[0].strip("|").split("|")]
-    rows = []
-    for row_line in table_lines[2:]:
-        values = [part.strip() for part in row_line.strip("|").split("|")]
-        if len(values) != len(header):
-            raise SequencerError("Active PE Registry row has wrong column count.")
-        rows.append(values)
-    return header, rows
+    try:
+        return parse_registry_table(content)
+    except RegistryError as exc:
+        raise SequencerError(str(exc)) from exc
 
 
 def _find_registry_row(rows: list[list[str]], pe_id: str) -> list[str]:
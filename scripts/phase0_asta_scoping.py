@@ -12,7 +12,7 @@ import yaml
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from sources.asta_mcp.adapter import AstaMCPAdapter
-from sources.asta_mcp.vocabulary import VocabularyExtractor
+from sources.asta_mcp.vocabulary import VocabularyExtractor, iter_papers
 
 
 DEFAULT_RESEARCH_QUESTIONS = [
@@ -48,6 +48,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Override candidates per query.",
     )
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        default=None,
+        help="Appendix A JSON/JSONL file(s) to stream instead of querying ASTA.",
+    )
     return parser.parse_args()
 
 
@@ -76,6 +82,54 @@ def deduplicate_candidates(papers: list[dict[str, Any]]) -> list[dict[str, Any]]
     return deduped
 
 
+def print_vocabulary(
+    extractor: VocabularyExtractor, vocabulary: dict[str, Any]
+) -> None:
+    """Print top terms, phrases and Boolean starter blocks."""
+    print("Top key terms:")
+    for item in vocabulary.get("key_terms", [])[:15]:
+        print(f"  - {item['term']} ({item['count']})")
+    print()
+
+    print("Top key phrases:")
+    for item in vocabulary.get("key_phrases", [])[:15]:
+        print(f"  - {item['phrase']} ({item['count']})")
+    print()
+
+    print("Boolean starter suggestions:")
+    for suggestion in extractor.generate_boolean_suggestions(vocabulary, top_n=15):
+        print(f"  {suggestion}")
+    print()
+
+
+def run_corpus(
+    extractor: VocabularyExtractor,
+    corpus: list[str],
+    output_file: Path,
+    **top: int,
+) -> int:
+    """Stream vocabulary from full-corpus files (e.g. Appendix A) in flat memory."""
+    print("=" * 70)
+    print("ELIS PHASE 0 - CORPUS VOCABULARY (STREAMING)")
+    print("=" * 70)
+    for path in corpus:
+        print(f"Corpus: {path}")
+    print()
+
+    vocabulary = extractor.extract_stream(iter_papers(*corpus), **top)
+    stats = vocabulary["statistics"]
+    print(
+        f"Papers: {stats['total_papers']} ({stats['papers_with_abstract']} with abstract)"
+    )
+    print()
+
+    extractor.save_to_yaml(vocabulary, output_file)
+    print_vocabulary(extractor, vocabulary)
+    print("Outputs:")
+    print(f"  - Vocabulary: {output_file}")
+    return 0
+
+
 def main() -> int:
     """Execute the Phase 0 ASTA scoping workflow."""
     args = parse_args()
@@ -92,7 +146,23 @@ def main() -> int:
     default_limit = phase_cfg.get("candidates_per_query", 100)
     limit = args.limit if args.limit is not None else default_limit
 
+    vocab_top_terms = int(phase_cfg.get("vocabulary_top_terms", 100))
+    vocab_top_venues = int(phase_cfg.get("vocabulary_top_venues", 30))
+    vocab_top_authors = int(phase_cfg.get("vocabulary_top_authors", 50))
+    vocab_top_phrases = int(phase_cfg.get("vocabulary_top_phrases", 50))
+
     extractor = VocabularyExtractor()
+    if args.corpus:
+        return run_corpus(
+            extractor,
+            args.corpus,
+            Path(args.output),
+            top_terms=vocab_top_terms,
+            top_venues=vocab_top_venues,
+            top_authors=vocab_top_authors,
+            top_phrases=vocab_top_phrases,
+        )
+
     asta = AstaMCPAdapter(evidence_window_end=evidence_window_end)
 
     all_candidates: list[dict[str, Any]] = []
@@ -119,29 +189,17 @@ def main() -> int:
     print(f"Total candidates (deduped): {len(unique_candidates)}")
     print()
 
-    vocab_top_terms = int(phase_cfg.get("vocabulary_top_terms", 100))
-    vocab_top_venues = int(phase_cfg.get("vocabulary_top_venues", 30))
-    vocab_top_authors = int(phase_cfg.get("vocabulary_top_authors", 50))
-
     vocabulary = extractor.extract(
         unique_candidates,
         top_terms=vocab_top_terms,
         top_venues=vocab_top_venues,
         top_authors=vocab_top_authors,
+        top_phrases=vocab_top_phrases,
     )
 
     output_file = Path(args.output)
     extractor.save_to_yaml(vocabulary, output_file)
-
-    print("Top key terms:")
-    for item in vocabulary.get("key_terms", [])[:15]:
-        print(f"  - {item['term']} ({item['count']})")
-    print()
-
-    print("Boolean starter suggestions:")
-    for suggestion in extractor.generate_boolean_suggestions(vocabulary, top_n=15):
-        print(f"  {suggestion}")
-    print()
+    print_vocabulary(extractor, vocabulary)
 
     stats = asta.get_stats()
     print("ASTA adapter stats:")
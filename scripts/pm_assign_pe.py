@@ -28,9 +28,10 @@ import subprocess
 import sys
 
 from elis.agent_id import canonical_surface, engine_from_agent_id
+from elis.pe_registry import RegistryError, parse_registry
 
 # ---------------------------------------------------------------------------
-# Registry parsing (mirrored from scripts/check_role_registration.py)
+# Registry parsing (shared parser in elis/pe_registry.py)
 # ---------------------------------------------------------------------------
 
 VALID_STATUSES = {
@@ -47,40 +48,11 @@ VALID_STATUSES = {
 def parse_active_registry(
     content: str,
 ) -> tuple[list[str], list[dict[str, str]]] | tuple[None, None]:
-    lines = content.splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == "## active pe registry":
-            start = idx + 1
-            break
-    if start is None:
-        return None, None
-
-    table_lines: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if table_lines:
-                break
-            continue
-        if stripped.startswith("|"):
-            table_lines.append(stripped)
-            continue
-        if table_lines:
-            break
-
-    if len(table_lines) < 3:
+    try:
+        return parse_registry(content)
+    except RegistryError:
         return None, None
 
-    header = [part.strip().lower() for part in table_lines[0].strip("|").split("|")]
-    rows: list[dict[str, str]] = []
-    for row_line in table_lines[2:]:
-        parts = [part.strip() for part in row_line.strip("|").split("|")]
-        if len(parts) != len(header):
-            return None, None
-        rows.append(dict(zip(header, parts)))
-    return header, rows
-
 
 def extract_engine(agent_id: str) -> str | None:
     try:
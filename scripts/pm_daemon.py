@@ -0,0 +1,723 @@
+#!/usr/bin/env python
+"""Long-running PM agent service with warm state.
+
+The PM scripts (stall detector, gate evaluator, Discord command handler,
+arbiter) are normally cold-started per event or cron tick,
+and each one re-imports its dependencies and re-parses CURRENT_PE.md,
+LESSONS_LEARNED.md and the REVIEW files.  This daemon keeps those modules
+imported and the parsed files cached in memory (``elis.pe_registry``).  A
+watcher thread polls the files and re-primes the cache as soon as one
+changes.
+
+The daemon listens on loopback HTTP:
+
+    GET  /health   liveness probe
+    GET  /state    watched files, parse generation and registry summary
+    POST /run      {"script", "argv", "cwd", "env", "stdin"} ->
+                   {"exit_code", "stdout", "stderr"}
+
+``/state`` and ``/run`` require ``Authorization: Bearer <token>``, where the
+token is a per-user secret in a 0600 file (``$ELIS_PM_DAEMON_TOKEN_FILE``,
+default ``~/.config/elis/pm_daemon.token``, created on first start).
+``/run`` also requires ``Content-Type: application/json``.
+
+Scripts run in a worker process forked when the daemon starts, before any
+thread exists.  The worker stays single-threaded: it imports the scripts,
+re-primes its parse caches before each request, and runs each request in a
+child forked from itself.  That child starts warm and holds no lock left
+behind by another thread.  A run is killed after ``RUN_TIMEOUT_SECONDS``.
+Where ``os.fork`` is unavailable, each run uses a fresh interpreter instead.
+
+The child runs in the caller's working directory.  ``/run`` declines with 409
+when that directory is outside the daemon's repository, and the client then
+runs the script itself.  The child's environment is the daemon's own, plus
+the caller's values for the variables in ``FORWARDED_ENV``.
+``pm_status_reporter`` is not served, because its auth summary reflects the
+caller's credentials.
+
+Each script is a thin client.  When ``ELIS_PM_DAEMON`` is set, for example
+``ELIS_PM_DAEMON=http://127.0.0.1:8787``, the script forwards its invocation
+here.  If the variable is unset or the daemon is unreachable, it runs
+locally as before.
+
+Usage:
+    python scripts/pm_daemon.py --port 8787
+    ELIS_PM_DAEMON=http://127.0.0.1:8787 python scripts/pm_stall_detector.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import hmac
+import importlib
+import io
+import json
+import os
+import pathlib
+import secrets
+import select
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+DAEMON_ENV = "ELIS_PM_DAEMON"
+TOKEN_FILE_ENV = "ELIS_PM_DAEMON_TOKEN_FILE"
+DEFAULT_TOKEN_FILE = pathlib.Path("~/.config/elis/pm_daemon.token")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+RUN_TIMEOUT_SECONDS = 60.0
+CLIENT_TIMEOUT_SECONDS = RUN_TIMEOUT_SECONDS + 10.0
+# Exit code reported for a run killed at the timeout (as coreutils timeout).
+TIMEOUT_EXIT_CODE = 124
+
+# Scripts the daemon will run, and whether their CLI reads piped stdin.  Only
+# scripts whose output depends on no caller environment beyond FORWARDED_ENV
+# belong here.
+DAEMON_SCRIPTS: dict[str, bool] = {
+    "pm_arbiter": True,
+    "pm_discord_command": False,
+    "pm_gate_evaluator": False,
+    "pm_stall_detector": False,
+}
+
+# Caller environment variables a /run request may set for the script.
+FORWARDED_ENV = frozenset(
+    {"ELIS_PE_REGISTRY_SNAPSHOT", "GITHUB_OUTPUT", "NO_COLOR", "TZ"}
+)
+
+_WATCHED_NAMES = ("CURRENT_PE.md", "LESSONS_LEARNED.md", "HANDOFF.md")
+_WATCHED_GLOBS = ("REVIEW_*.md", "config/pm_loop_control.json")
+
+
+# ---------------------------------------------------------------------------
+# Auth token
+# ---------------------------------------------------------------------------
+
+
+def token_path() -> pathlib.Path:
+    return pathlib.Path(
+        os.environ.get(TOKEN_FILE_ENV) or DEFAULT_TOKEN_FILE
+    ).expanduser()
+
+
+def read_token(path: pathlib.Path) -> str:
+    """Read the shared secret; refuse files other users could read."""
+    if os.name == "posix" and path.stat().st_mode & 0o077:
+        raise PermissionError(f"{path} must be private to its owner (chmod 600)")
+    token = path.read_text(encoding="utf-8").strip()
+    if not token:
+        raise ValueError(f"{path} is empty")
+    return token
+
+
+def ensure_token(path: pathlib.Path) -> str:
+    """Return the token in *path*, creating it (mode 0600) on first use."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return read_token(path)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write(secrets.token_urlsafe(32) + "\n")
+    return read_token(path)
+
+
+# ---------------------------------------------------------------------------
+# Warm state
+# ---------------------------------------------------------------------------
+
+# Serialises cache refreshes by the watcher thread and /state snapshots.
+_STATE_LOCK = threading.Lock()
+
+
+class StateWatcher:
+    """Poll the PM input files and re-prime the parse caches when they change."""
+
+    def __init__(self, repo_root: pathlib.Path, *, poll_seconds: float = 1.0) -> None:
+        self.repo_root = repo_root.resolve()
+        self.poll_seconds = poll_seconds
+        self.generation = 0
+        self._stats: dict[pathlib.Path, tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watched_paths(self) -> list[pathlib.Path]:
+        paths = [self.repo_root / name for name in _WATCHED_NAMES]
+        for pattern in _WATCHED_GLOBS:
+            paths.extend(sorted(self.repo_root.glob(pattern)))
+        return [path for path in paths if path.is_file()]
+
+    def refresh(self) -> list[pathlib.Path]:
+        """Re-prime every watched file whose mtime/size changed; return them."""
+        from elis.pe_registry import load_current_pe, read_text_cached
+
+        with _STATE_LOCK:
+            return self._refresh(load_current_pe, read_text_cached)
+
+    def _refresh(
+        self,
+        load_current_pe: Callable[[pathlib.Path], object],
+        read_text_cached: Callable[[pathlib.Path], object],
+    ) -> list[pathlib.Path]:
+        changed: list[pathlib.Path] = []
+        current = self.watched_paths()
+        for path in current:
+            stat = path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._stats.get(path) == key:
+                continue
+            self._stats[path] = key
+            changed.append(path)
+            if path.name == "CURRENT_PE.md":
+                load_current_pe(path)
+            else:
+                read_text_cached(path)
+        for gone in set(self._stats) - set(current):
+            del self._stats[gone]
+            changed.append(gone)
+        if changed:
+            self.generation += 1
+        return changed
+
+    def snapshot(self) -> dict[str, Any]:
+        from elis.pe_registry import load_current_pe
+
+        registry = self.repo_root / "CURRENT_PE.md"
+        summary: dict[str, Any] = {}
+        if registry.is_file():
+            document = load_current_pe(registry)
+            summary = {
+                "registry_rows": len(document.rows),
+                "registry_error": document.registry_error,
+            }
+        return {
+            "repo_root": str(self.repo_root),
+            "generation": self.generation,
+            "watched": sorted(str(p.relative_to(self.repo_root)) for p in self._stats),
+            **summary,
+        }
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.refresh()
+            except OSError:
+                continue  # A file vanished mid-poll; the next tick catches up.
+
+    def start(self) -> None:
+        self.refresh()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+# ---------------------------------------------------------------------------
+# Script execution
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _process_context(
+    argv: list[str], cwd: str, env: dict[str, str], stdin: str
+) -> Iterator[tuple[io.StringIO, io.StringIO]]:
+    """Apply *argv*/*cwd*/*env*/*stdin* to this process; only used in children."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    os.environ.clear()
+    os.environ.update(env)
+    os.chdir(cwd)
+    sys.argv, sys.stdin = argv, io.StringIO(stdin)
+    sys.stdout, sys.stderr = stdout, stderr
+    yield stdout, stderr
+
+
+def _entry_point(script: str) -> Callable[[], object]:
+    if script not in DAEMON_SCRIPTS:
+        raise ValueError(f"Script not served by the PM daemon: {script}")
+    return importlib.import_module(f"scripts.{script}").main
+
+
+def _child_env(env: dict[str, str]) -> dict[str, str]:
+    """The daemon's environment plus the caller's ``FORWARDED_ENV`` values."""
+    child = {k: v for k, v in os.environ.items() if k != DAEMON_ENV}
+    child.update({k: v for k, v in env.items() if k in FORWARDED_ENV})
+    return child
+
+
+def _timed_out(script: str, timeout: float) -> dict[str, Any]:
+    return {
+        "exit_code": TIMEOUT_EXIT_CODE,
+        "stdout": "",
+        "stderr": f"PM daemon: {script} killed after {timeout:.0f}s\n",
+    }
+
+
+def _run_main(
+    main: Callable[[], object],
+    argv: list[str],
+    cwd: str,
+    env: dict[str, str],
+    stdin: str,
+) -> dict[str, Any]:
+    with _process_context(argv, cwd, env, stdin) as (stdout, stderr):
+        try:
+            result = main()
+            exit_code = result if isinstance(result, int) else 0
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                exit_code = exc.code or 0
+            else:
+                print(exc.code, file=sys.stderr)
+                exit_code = 1
+        except Exception:
+            # Mirror an uncaught exception in a standalone run: traceback, exit 1.
+            traceback.print_exc()
+            exit_code = 1
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _run_forked(request: dict[str, Any], timeout: float) -> dict[str, Any]:
+    """Run *request* in a child of this (single-threaded) worker."""
+    script = request["script"]
+    main = _entry_point(script)
+    argv = [f"scripts/{script}.py", *request["argv"]]
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.close(read_fd)
+        status = 1
+        try:
+            reply = _run_main(
+                main, argv, request["cwd"], request["env"], request["stdin"]
+            )
+            with os.fdopen(write_fd, "wb") as out:
+                out.write(json.dumps(reply).encode("utf-8"))
+            status = 0
+        finally:
+            os._exit(status)
+    os.close(write_fd)
+    deadline = time.monotonic() + timeout
+    chunks: list[bytes] = []
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([read_fd], [], [], remaining)[0]:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                return _timed_out(script, timeout)
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+    os.waitpid(pid, 0)
+    if not chunks:
+        return {"exit_code": 1, "stdout": "", "stderr": "PM daemon child failed\n"}
+    return json.loads(b"".join(chunks))
+
+
+def _run_subprocess(request: dict[str, Any], timeout: float) -> dict[str, Any]:
+    script = request["script"]
+    _entry_point(script)
+    try:
+        completed = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / f"{script}.py")]
+            + request["argv"],
+            cwd=request["cwd"],
+            env=request["env"],
+            input=request["stdin"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return _timed_out(script, timeout)
+    return {
+        "exit_code": completed.returncode,
+        "stdout": completed.stdout,
+        "stderr": completed.stderr,
+    }
+
+
+def _send_message(conn: socket.socket, payload: dict[str, Any]) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    conn.sendall(struct.pack("!I", len(body)) + body)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise EOFError("PM daemon worker closed the connection")
+        data += chunk
+    return bytes(data)
+
+
+def _recv_message(conn: socket.socket) -> dict[str, Any]:
+    (size,) = struct.unpack("!I", _recv_exact(conn, 4))
+    return json.loads(_recv_exact(conn, size))
+
+
+def _worker_loop(conn: socket.socket, repo_root: pathlib.Path, timeout: float) -> None:
+    for script in DAEMON_SCRIPTS:
+        _entry_point(script)
+    watcher = StateWatcher(repo_root)
+    while True:
+        try:
+            request = _recv_message(conn)
+        except EOFError:
+            return
+        try:
+            watcher.refresh()
+        except OSError:
+            pass  # A file vanished mid-refresh; the script reports it.
+        try:
+            reply = _run_forked(request, timeout)
+        except (KeyError, ValueError, OSError) as exc:
+            reply = {"error": str(exc)}
+        _send_message(conn, reply)
+
+
+class ScriptWorker:
+    """Runs served scripts in a single-threaded, pre-forked worker process.
+
+    ``start()`` must be called before the daemon starts any thread.  Without
+    ``os.fork`` (or once the worker has failed) runs fall back to a fresh
+    interpreter per request.
+    """
+
+    def __init__(
+        self, repo_root: pathlib.Path, *, timeout: float = RUN_TIMEOUT_SECONDS
+    ) -> None:
+        self.repo_root = repo_root.resolve()
+        self.timeout = timeout
+        self.pid: int | None = None
+        self._conn: socket.socket | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if not hasattr(os, "fork"):
+            return
+        ours, theirs = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the worker
+            ours.close()
+            status = 0
+            try:
+                _worker_loop(theirs, self.repo_root, self.timeout)
+            except BaseException:
+                status = 1
+            finally:
+                os._exit(status)
+        theirs.close()
+        ours.settimeout(self.timeout + 5.0)
+        self._conn, self.pid = ours, pid
+
+    def run(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run *request* (``script``/``argv``/``cwd``/``env``/``stdin``)."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    _send_message(self._conn, request)
+                    reply = _recv_message(self._conn)
+                except (OSError, EOFError, ValueError):
+                    # Out of step with the worker; stop using it.
+                    self._shutdown()
+                else:
+                    if "error" in reply:
+                        raise ValueError(reply["error"])
+                    return reply
+        return _run_subprocess(request, self.timeout)
+
+    def _shutdown(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.pid is not None:
+            try:
+                os.kill(self.pid, signal.SIGKILL)
+                os.waitpid(self.pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self.pid = None
+
+    def stop(self) -> None:
+        with self._lock:
+            self._shutdown()
+
+
+def run_script(
+    script: str,
+    argv: list[str],
+    *,
+    cwd: str,
+    env: dict[str, str],
+    stdin: str = "",
+    worker: ScriptWorker | None = None,
+) -> dict[str, Any]:
+    """Run *script*'s ``main()`` in a child process in *cwd* with *argv*.
+
+    The child's environment is built by ``_child_env(env)``; the daemon's
+    own working directory and environment are never modified.  Without a
+    *worker* the script runs in a fresh interpreter.
+    """
+    _entry_point(script)
+    request = {
+        "script": script,
+        "argv": list(argv),
+        "cwd": cwd,
+        "env": _child_env(env),
+        "stdin": stdin,
+    }
+    if worker is None:
+        return _run_subprocess(request, RUN_TIMEOUT_SECONDS)
+    return worker.run(request)
+
+
+# ---------------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: PMDaemonServer
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorised(self) -> bool:
+        scheme, _, token = (self.headers.get("Authorization") or "").partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(
+            token.strip().encode("utf-8"), self.server.token.encode("utf-8")
+        ):
+            return True
+        self._reply(401, {"error": "missing or invalid token"})
+        return False
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path == "/health":
+            self._reply(200, {"ok": True})
+        elif self.path == "/state":
+            if self._authorised():
+                self._reply(200, self.server.watcher.snapshot())
+        else:
+            self._reply(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        if self.path != "/run":
+            self._reply(404, {"error": f"unknown path {self.path}"})
+            return
+        if not self._authorised():
+            return
+        if self.headers.get_content_type() != "application/json":
+            self._reply(415, {"error": "Content-Type must be application/json"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            cwd = pathlib.Path(str(request["cwd"])).resolve()
+            repo_root = self.server.watcher.repo_root
+            if cwd != repo_root and repo_root not in cwd.parents:
+                self._reply(409, {"error": f"daemon serves {repo_root}, not {cwd}"})
+                return
+            reply = run_script(
+                str(request["script"]),
+                [str(arg) for arg in request.get("argv", [])],
+                cwd=str(cwd),
+                env={str(k): str(v) for k, v in (request.get("env") or {}).items()},
+                stdin=str(request.get("stdin") or ""),
+                worker=self.server.worker,
+            )
+        except (KeyError, ValueError, TypeError, OSError) as exc:
+            self._reply(400, {"error": str(exc)})
+            return
+        self._reply(200, reply)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Silence per-request logging; the PM scripts own their output."""
+
+
+class PMDaemonServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        watcher: StateWatcher,
+        token: str,
+        worker: ScriptWorker | None = None,
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.watcher = watcher
+        self.token = token
+        self.worker = worker
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.worker is not None:
+            self.worker.stop()
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    *,
+    repo_root: pathlib.Path = pathlib.Path("."),
+    poll_seconds: float = 1.0,
+    token: str | None = None,
+) -> PMDaemonServer:
+    """Start the worker and watcher; return a bound (not yet serving) server.
+
+    *token* defaults to the one in ``token_path()``, created if missing.
+    """
+    token = token or ensure_token(token_path())
+    worker = ScriptWorker(repo_root)
+    worker.start()  # before the watcher thread exists
+    watcher = StateWatcher(repo_root, poll_seconds=poll_seconds)
+    watcher.start()
+    return PMDaemonServer((host, port), watcher, token, worker)
+
+
+# ---------------------------------------------------------------------------
+# Thin client
+# ---------------------------------------------------------------------------
+
+
+def delegate(script: str, argv: list[str] | None = None) -> int | None:
+    """Forward this invocation to the daemon named by ``$ELIS_PM_DAEMON``.
+
+    Writes the daemon's stdout/stderr and returns its exit code, or returns
+    ``None`` when no daemon is configured or reachable so the caller runs
+    locally.
+    """
+    url = os.environ.get(DAEMON_ENV, "").strip().rstrip("/")
+    if not url or script not in DAEMON_SCRIPTS:
+        return None
+    try:
+        token = read_token(token_path())
+    except (OSError, ValueError) as exc:
+        print(
+            f"WARN: PM daemon token unusable ({exc}); running locally.", file=sys.stderr
+        )
+        return None
+    stdin = ""
+    if DAEMON_SCRIPTS.get(script) and not sys.stdin.isatty():
+        stdin = sys.stdin.read()
+    request = urllib.request.Request(
+        f"{url}/run",
+        data=json.dumps(
+            {
+                "script": script,
+                "argv": sys.argv[1:] if argv is None else argv,
+                "cwd": os.getcwd(),
+                "env": {k: v for k, v in os.environ.items() if k in FORWARDED_ENV},
+                "stdin": stdin,
+            }
+        ).encode("utf-8"),
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {token}",
+        },
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=CLIENT_TIMEOUT_SECONDS) as resp:
+            reply = json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        try:
+            reason = json.loads(exc.read()).get("error", exc.reason)
+        except ValueError:
+            reason = exc.reason
+        print(f"WARN: PM daemon declined ({reason}); running locally.", file=sys.stderr)
+        reply = None
+    except (OSError, ValueError) as exc:
+        print(f"WARN: PM daemon unavailable ({exc}); running locally.", file=sys.stderr)
+        reply = None
+    if reply is None:
+        if stdin:
+            sys.stdin = io.StringIO(stdin)
+        return None
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    return int(reply.get("exit_code", 1))
+
+
+def run_cli(script: str, main: Callable[[], int]) -> int:
+    """``__main__`` helper: use the daemon when configured, else run *main*."""
+    exit_code = delegate(script)
+    return main() if exit_code is None else exit_code
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the warm-state PM daemon.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--repo-root", default=".")
+    parser.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=1.0,
+        help="File watcher poll interval (default: 1.0)",
+    )
+    args = parser.parse_args(argv)
+
+    # Import the served scripts up front so the first request is warm too.
+    for script in DAEMON_SCRIPTS:
+        _entry_point(script)
+    print(f"Token file: {token_path()}", flush=True)
+    server = serve(
+        args.host,
+        args.port,
+        repo_root=pathlib.Path(args.repo_root),
+        poll_seconds=args.poll_seconds,
+    )
+    host, port = server.server_address[:2]
+    print(f"PM daemon listening on http://{host}:{port}", flush=True)
+    started = time.monotonic()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.watcher.stop()
+        print(f"PM daemon stopped after {time.monotonic() - started:.0f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
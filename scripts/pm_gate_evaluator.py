@@ -240,4 +240,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    if __package__ in {None, ""}:
+        sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+    from scripts.pm_daemon import run_cli
+
+    sys.exit(run_cli("pm_gate_evaluator", main))
@@ -22,8 +22,18 @@ import pathlib
 import re
 import sys
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from elis.pe_registry import (
+    RegistryError,
+    load_current_pe,
+    parse_registry,
+    read_text_cached,
+)
+
 # ---------------------------------------------------------------------------
-# Registry parsing (verbatim from scripts/pm_assign_pe.py)
+# Registry parsing (shared parser in elis/pe_registry.py)
 # ---------------------------------------------------------------------------
 
 VALID_STATUSES = {
@@ -46,40 +56,11 @@ _DEFAULT_ITERATION_THRESHOLD = 2
 def parse_active_registry(
     content: str,
 ) -> tuple[list[str], list[dict[str, str]]] | tuple[None, None]:
-    lines = content.splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == "## active pe registry":
-            start = idx + 1
-            break
-    if start is None:
-        return None, None
-
-    table_lines: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if table_lines:
-                break
-            continue
-        if stripped.startswith("|"):
-            table_lines.append(stripped)
-            continue
-        if table_lines:
-            break
-
-    if len(table_lines) < 3:
+    try:
+        return parse_registry(content)
+    except RegistryError:
         return None, None
 
-    header = [part.strip().lower() for part in table_lines[0].strip("|").split("|")]
-    rows: list[dict[str, str]] = []
-    for row_line in table_lines[2:]:
-        parts = [part.strip() for part in row_line.strip("|").split("|")]
-        if len(parts) != len(header):
-            return None, None
-        rows.append(dict(zip(header, parts)))
-    return header, rows
-
 
 # ---------------------------------------------------------------------------
 # Stall detection
@@ -149,7 +130,7 @@ def count_validator_iterations(pe_id: str, repo_root: pathlib.Path) -> int:
     review_path = _review_file_path(pe_id, repo_root)
     if review_path is None:
         return 0
-    content = review_path.read_text(encoding="utf-8")
+    content = read_text_cached(review_path)
     return sum(1 for line in content.splitlines() if _ROUND_HISTORY_PATTERN.match(line))
 
 
@@ -266,10 +247,12 @@ def run_detection(
     if now is None:
         now = datetime.datetime.now(datetime.timezone.utc)
 
-    content = registry_path.read_text(encoding="utf-8")
-    _, rows = parse_active_registry(content)
-    if rows is None:
-        raise ValueError(f"Could not parse Active PE Registry from {registry_path}")
+    try:
+        _, rows = load_current_pe(registry_path).registry()
+    except RegistryError as exc:
+        raise ValueError(
+            f"Could not parse Active PE Registry from {registry_path}"
+        ) from exc
 
     messages: list[str] = []
 
@@ -350,4 +333,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    if __package__ in {None, ""}:
+        sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+    from scripts.pm_daemon import run_cli
+
+    sys.exit(run_cli("pm_stall_detector", main))
@@ -20,9 +20,15 @@ import shutil
 import sys
 
 from elis.agent_id import engine_from_agent_id
+from elis.pe_registry import (
+    RegistryError,
+    load_current_pe,
+    parse_registry,
+    read_text_cached,
+)
 
 # ---------------------------------------------------------------------------
-# Registry parsing (verbatim from scripts/pm_assign_pe.py)
+# Registry parsing (shared parser in elis/pe_registry.py)
 # ---------------------------------------------------------------------------
 
 VALID_STATUSES = {
@@ -44,40 +50,11 @@ _DEFAULT_LESSONS = pathlib.Path("LESSONS_LEARNED.md")
 def parse_active_registry(
     content: str,
 ) -> tuple[list[str], list[dict[str, str]]] | tuple[None, None]:
-    lines = content.splitlines()
-    start = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == "## active pe registry":
-            start = idx + 1
-            break
-    if start is None:
-        return None, None
-
-    table_lines: list[str] = []
-    for line in lines[start:]:
-        stripped = line.strip()
-        if not stripped:
-            if table_lines:
-                break
-            continue
-        if stripped.startswith("|"):
-            table_lines.append(stripped)
-            continue
-        if table_lines:
-            break
-
-    if len(table_lines) < 3:
+    try:
+        return parse_registry(content)
+    except RegistryError:
         return None, None
 
-    header = [part.strip().lower() for part in table_lines[0].strip("|").split("|")]
-    rows: list[dict[str, str]] = []
-    for row_line in table_lines[2:]:
-        parts = [part.strip() for part in row_line.strip("|").split("|")]
-        if len(parts) != len(header):
-            return None, None
-        rows.append(dict(zip(header, parts)))
-    return header, rows
-
 
 # ---------------------------------------------------------------------------
 # Agent ID → display name
@@ -307,17 +284,19 @@ def handle_escalate(pe_id: str, rows: list[dict[str, str]]) -> str:
 
 
 def load_registry(registry_path: pathlib.Path) -> list[dict[str, str]]:
-    content = registry_path.read_text(encoding="utf-8")
-    _, rows = parse_active_registry(content)
-    if rows is None:
-        raise ValueError(f"Could not parse Active PE Registry from {registry_path}")
+    try:
+        _, rows = load_current_pe(registry_path).registry()
+    except RegistryError as exc:
+        raise ValueError(
+            f"Could not parse Active PE Registry from {registry_path}"
+        ) from exc
     return rows
 
 
 def load_lessons(lessons_path: pathlib.Path) -> str:
     if not lessons_path.exists():
         return ""
-    return lessons_path.read_text(encoding="utf-8")
+    return read_text_cached(lessons_path)
 
 
 # ---------------------------------------------------------------------------
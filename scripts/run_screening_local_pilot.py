@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
 from elis.screening_local_contract import (
     ScreeningWorkspaceContract,
     detect_asreview_installation,
+    run_batched_screening,
     run_bounded_screening_pilot,
 )
+from elis.workload_placement_policy import AdmissionTimeout, LocalAdmissionController
 
 
 def parse_args() -> argparse.Namespace:
@@ -27,13 +30,43 @@ def parse_args() -> argparse.Namespace:
         "--record-cap",
         type=int,
         default=100,
-        help="Maximum records to process in pilot run",
+        help="Maximum records to process in pilot run (ignored with --batched)",
+    )
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help="Screen every record in checkpointed capacity-policy batches "
+        "instead of truncating at --record-cap; reruns resume",
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="With --batched: process at most this many new batches this run",
+    )
+    parser.add_argument(
+        "--reset-checkpoint",
+        action="store_true",
+        help="With --batched: discard completed batches and start over",
     )
     parser.add_argument(
         "--root",
         default="artifacts/screening",
         help="Review-scoped screening artefact root directory",
     )
+    parser.add_argument(
+        "--admission-timeout",
+        type=float,
+        default=None,
+        help="Give up after waiting this many seconds for a local slot "
+        "(default: queue until admitted)",
+    )
+    parser.add_argument(
+        "--admission-state",
+        default=None,
+        help="Host-wide admission state file "
+        "(default: $ELIS_LOCAL_ADMISSION_STATE or the system temp dir)",
+    )
     return parser.parse_args()
 
 
@@ -45,11 +78,30 @@ def main() -> int:
     )
 
     asreview = detect_asreview_installation()
-    report = run_bounded_screening_pilot(
-        contract=contract,
-        appendix_a_path=Path(args.appendix_a),
-        record_cap=args.record_cap,
+    admission = LocalAdmissionController(
+        Path(args.admission_state) if args.admission_state else None
     )
+    try:
+        if args.batched:
+            report = run_batched_screening(
+                contract=contract,
+                appendix_a_path=Path(args.appendix_a),
+                max_batches=args.max_batches,
+                reset=args.reset_checkpoint,
+                admission=admission,
+                admission_timeout=args.admission_timeout,
+            )
+        else:
+            report = run_bounded_screening_pilot(
+                contract=contract,
+                appendix_a_path=Path(args.appendix_a),
+                record_cap=args.record_cap,
+                admission=admission,
+                admission_timeout=args.admission_timeout,
+            )
+    except AdmissionTimeout as exc:
+        print(f"DEFERRED: {exc}", file=sys.stderr)
+        return 1
 
     output = {
         "asreview": asreview,
@@ -0,0 +1,89 @@
+"""Rank unscreened records by learned relevance and emit the next batch.
+
+Each invocation retrains on the human decisions recorded so far and rewrites
+the review's screening queue; repeat after every screened batch until the
+report says ``"stop": true``.  Requires ``pip install 'elis-slr-agent[screening]'``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from elis.screening_local_contract import (
+    ScreeningWorkspaceContract,
+    run_prioritised_screening,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Active-learning prioritisation for local screening."
+    )
+    parser.add_argument("--review-id", required=True, help="Review identifier")
+    parser.add_argument(
+        "--appendix-a",
+        default="json_jsonl/ELIS_Appendix_A_Search_rows.json",
+        help="Path to Appendix A JSON array",
+    )
+    parser.add_argument(
+        "--decisions",
+        default=None,
+        help="Human decisions (Appendix B-style rows); "
+        "default: <root>/<review-id>/input/screening_decisions.json",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="Records to queue for review"
+    )
+    parser.add_argument(
+        "--recall-target",
+        type=float,
+        default=0.95,
+        help="Stop once estimated recall reaches this fraction",
+    )
+    parser.add_argument(
+        "--min-screened",
+        type=int,
+        default=50,
+        help="Never stop before this many records have been screened",
+    )
+    parser.add_argument(
+        "--seed-text",
+        default="",
+        help="Research question or key phrases used to rank before any labels",
+    )
+    parser.add_argument(
+        "--root",
+        default="artifacts/screening",
+        help="Review-scoped screening artefact root directory",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    contract = ScreeningWorkspaceContract(
+        review_id=args.review_id,
+        root=Path(args.root),
+    )
+    try:
+        report = run_prioritised_screening(
+            contract=contract,
+            appendix_a_path=Path(args.appendix_a),
+            decisions_path=Path(args.decisions) if args.decisions else None,
+            batch_size=args.batch_size,
+            recall_target=args.recall_target,
+            min_screened=args.min_screened,
+            seed_text=args.seed_text,
+        )
+    except ImportError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
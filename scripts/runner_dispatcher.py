@@ -0,0 +1,419 @@
+#!/usr/bin/env python
+"""Run several implementer/validator runner jobs concurrently on one host.
+
+Each job is one ``run_{engine}_agent`` / ``run_{engine}_validator``
+invocation in its own working tree (typically a ``git worktree`` per PE, since
+the runners read CURRENT_PE.md and git state from their cwd).  Up to
+``WorkloadPlacementPolicy.max_local_concurrency`` jobs run at once; the rest
+queue.  The default policy allows one; ``--policy`` reads a JSON policy file
+(``{"max_local_concurrency": 3}``) for hosts with more room.  For every job
+the dispatcher:
+
+  - streams the runner's stdout/stderr to ``<log-dir>/<job>.log``;
+  - sets ``RUNNER_STARTED_AT`` to the launch time, so the runner's own
+    ``ensure_budget`` calls measure from launch rather than from queueing;
+  - re-applies ``ensure_budget`` while the job runs (wall-clock timeout every
+    poll, commit budget every ``--budget-poll-seconds`` for implementer jobs)
+    and terminates the job's process group when it is exceeded;
+  - reports exit code, status and wall time.
+
+With ``--plan``, implementer jobs must be pairwise parallel-eligible
+(``check_parallel_eligibility``) before anything is launched.
+
+Jobs file (JSON list)::
+
+    [{"role": "implementer", "engine": "codex", "pe_id": "PE-X-01",
+      "branch": "feature/pe-x-01", "plan": "PLAN.md", "cwd": "../wt-pe-x-01"},
+     {"role": "validator", "engine": "claude", "pe_id": "PE-X-02",
+      "branch": "feature/pe-x-02", "plan": "PLAN.md", "pr_number": "412",
+      "cwd": "../wt-pe-x-02", "timeout_seconds": 3600}]
+
+Usage:
+    python scripts/runner_dispatcher.py --jobs jobs.json
+    python scripts/runner_dispatcher.py --jobs jobs.json --plan PLAN.md \\
+        --policy host-policy.json --max-concurrency 2 --log-dir runner-logs \\
+        --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from elis.workload_placement_policy import (
+    DEFAULT_WORKLOAD_PLACEMENT_POLICY,
+    WorkloadPlacementPolicy,
+    load_workload_placement_policy,
+)
+from scripts import implementer_runner_common as common
+from scripts.implementer_runner_common import RunnerError, ensure_budget
+
+ROLES = ("implementer", "validator")
+DEFAULT_TIMEOUT_SECONDS = 4 * 60 * 60
+DEFAULT_MAX_COMMITS = 20
+_TERMINATE_GRACE_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class RunnerJob:
+    role: str
+    engine: str
+    pe_id: str
+    branch: str
+    plan: str
+    cwd: Path
+    base_branch: str = "main"
+    pr_number: str = ""
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS
+    max_commits: int = DEFAULT_MAX_COMMITS
+    command: tuple[str, ...] = ()
+    env: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return f"{self.pe_id}-{self.role}"
+
+    def runner_command(self) -> list[str]:
+        """Command for this job; ``command`` in the spec overrides the runner."""
+        if self.command:
+            return list(self.command)
+        entry = "agent" if self.role == "implementer" else "validator"
+        cmd = [
+            sys.executable,
+            "-m",
+            f"scripts.run_{self.engine}_{entry}",
+            "--pe-id",
+            self.pe_id,
+            "--branch",
+            self.branch,
+            "--plan",
+            self.plan,
+            "--base-branch",
+            self.base_branch,
+        ]
+        if self.role == "implementer":
+            cmd += [
+                "--max-commits",
+                str(self.max_commits),
+                "--timeout-seconds",
+                str(self.timeout_seconds),
+            ]
+        else:
+            cmd += ["--pr-number", self.pr_number]
+        return cmd
+
+
+@dataclass(frozen=True)
+class JobResult:
+    name: str
+    status: str  # pass | fail | budget-exceeded | error
+    exit_code: int
+    seconds: float
+    log_path: str
+    message: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "pass"
+
+
+# ---------------------------------------------------------------------------
+# Job specs
+# ---------------------------------------------------------------------------
+
+
+def job_from_dict(raw: dict, *, base_dir: Path) -> RunnerJob:
+    try:
+        role = str(raw["role"]).strip().lower()
+        engine = str(raw["engine"]).strip().lower()
+        pe_id = str(raw["pe_id"]).strip()
+        branch = str(raw["branch"]).strip()
+        plan = str(raw["plan"]).strip()
+    except KeyError as exc:
+        raise RunnerError(f"Job is missing required field '{exc.args[0]}'.") from exc
+    if role not in ROLES:
+        raise RunnerError(f"Job {pe_id}: role must be one of {', '.join(ROLES)}.")
+    if engine not in {"codex", "claude"}:
+        raise RunnerError(f"Job {pe_id}: unsupported engine '{engine}'.")
+    pr_number = str(raw.get("pr_number", "")).strip()
+    if role == "validator" and not pr_number:
+        raise RunnerError(f"Job {pe_id}: validator jobs require 'pr_number'.")
+    cwd = Path(raw.get("cwd", "."))
+    return RunnerJob(
+        role=role,
+        engine=engine,
+        pe_id=pe_id,
+        branch=branch,
+        plan=plan,
+        cwd=cwd if cwd.is_absolute() else (base_dir / cwd).resolve(),
+        base_branch=str(raw.get("base_branch", "main")),
+        pr_number=pr_number,
+        timeout_seconds=int(raw.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+        max_commits=int(raw.get("max_commits", DEFAULT_MAX_COMMITS)),
+        command=tuple(raw.get("command", ())),
+        env={str(k): str(v) for k, v in raw.get("env", {}).items()},
+    )
+
+
+def load_jobs(path: Path) -> list[RunnerJob]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise RunnerError(f"Cannot read jobs file {path}: {exc}") from exc
+    if not isinstance(payload, list):
+        raise RunnerError("Jobs file must contain a JSON list of job objects.")
+    jobs = [job_from_dict(raw, base_dir=path.resolve().parent) for raw in payload]
+    names = [job.name for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise RunnerError(f"Duplicate jobs: {', '.join(duplicates)}.")
+    return jobs
+
+
+def eligibility_failures(jobs: list[RunnerJob], plan_path: Path) -> list[str]:
+    """Pairwise ``check_eligibility`` over the implementer jobs."""
+    from scripts.check_parallel_eligibility import check_eligibility
+    from scripts.pe_sequencer import parse_plan
+
+    plan_pes = parse_plan(plan_path)
+    implementers = sorted({job.pe_id for job in jobs if job.role == "implementer"})
+    failures: list[str] = []
+    for pe_a, pe_b in itertools.combinations(implementers, 2):
+        failures.extend(check_eligibility(pe_a, pe_b, plan_pes)[1])
+    return failures
+
+
+def effective_concurrency(
+    requested: int | None,
+    policy: WorkloadPlacementPolicy = DEFAULT_WORKLOAD_PLACEMENT_POLICY,
+) -> int:
+    """Requested worker count, capped by ``policy.max_local_concurrency``."""
+    if requested is None:
+        return policy.max_local_concurrency
+    if requested < 1:
+        raise RunnerError("--max-concurrency must be at least 1.")
+    return min(requested, policy.max_local_concurrency)
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+def _terminate(proc: subprocess.Popen) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait(timeout=_TERMINATE_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+    except ProcessLookupError:
+        proc.wait()
+
+
+def run_job(
+    job: RunnerJob,
+    log_dir: Path,
+    *,
+    poll_seconds: float = 1.0,
+    budget_poll_seconds: float = 30.0,
+) -> JobResult:
+    """Run one job to completion, enforcing its timeout and commit budget."""
+    log_path = log_dir / f"{job.name}.log"
+    started = time.time()
+    track_commits = job.role == "implementer"
+
+    def _check_budget(commits: int) -> None:
+        ensure_budget(
+            commits,
+            job.max_commits,
+            started_at=started,
+            now=time.time(),
+            timeout_seconds=job.timeout_seconds,
+        )
+
+    def _result(status: str, exit_code: int, message: str = "") -> JobResult:
+        return JobResult(
+            name=job.name,
+            status=status,
+            exit_code=exit_code,
+            seconds=round(time.time() - started, 3),
+            log_path=str(log_path),
+            message=message,
+        )
+
+    try:
+        commits = (
+            common.branch_commit_count(job.base_branch, cwd=job.cwd)
+            if track_commits
+            else 0
+        )
+        _check_budget(commits)
+    except (RunnerError, OSError, ValueError) as exc:
+        return _result("error", 1, str(exc))
+
+    env = {
+        **os.environ,
+        **job.env,
+        "RUNNER_STARTED_AT": f"{started:.3f}",
+        "PYTHONUNBUFFERED": "1",
+    }
+    with log_path.open("w", encoding="utf-8") as log:
+        log.write(f"# {job.name}: {' '.join(job.runner_command())}\n")
+        log.flush()
+        try:
+            proc = subprocess.Popen(
+                job.runner_command(),
+                cwd=job.cwd,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+        except OSError as exc:
+            return _result("error", 1, str(exc))
+
+        last_commit_poll = time.monotonic()
+        while True:
+            try:
+                exit_code = proc.wait(timeout=poll_seconds)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            try:
+                if (
+                    track_commits
+                    and time.monotonic() - last_commit_poll >= budget_poll_seconds
+                ):
+                    last_commit_poll = time.monotonic()
+                    commits = common.branch_commit_count(job.base_branch, cwd=job.cwd)
+                _check_budget(commits)
+            except RunnerError as exc:
+                _terminate(proc)
+                log.write(f"\n# dispatcher: {exc}\n")
+                return _result("budget-exceeded", proc.returncode or 1, str(exc))
+
+    if exit_code == 0:
+        return _result("pass", 0)
+    return _result("fail", exit_code, f"runner exited {exit_code}; see {log_path}")
+
+
+def dispatch(
+    jobs: list[RunnerJob],
+    *,
+    log_dir: Path,
+    max_concurrency: int,
+    poll_seconds: float = 1.0,
+    budget_poll_seconds: float = 30.0,
+) -> list[JobResult]:
+    """Run *jobs* with at most *max_concurrency* at once; results keep job order."""
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        futures = [
+            pool.submit(
+                run_job,
+                job,
+                log_dir,
+                poll_seconds=poll_seconds,
+                budget_poll_seconds=budget_poll_seconds,
+            )
+            for job in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run implementer/validator runner jobs concurrently."
+    )
+    parser.add_argument("--jobs", required=True, help="JSON list of job specs.")
+    parser.add_argument(
+        "--plan",
+        help="Plan file; refuse to start unless implementer jobs are parallel-eligible.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        help="Worker count (capped by the workload placement policy).",
+    )
+    parser.add_argument(
+        "--policy",
+        help="Workload placement policy JSON (default: the built-in policy).",
+    )
+    parser.add_argument("--log-dir", default="runner-logs")
+    parser.add_argument("--budget-poll-seconds", type=float, default=30.0)
+    parser.add_argument("--json", dest="json_path", help="Write per-job results here.")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_jobs(Path(args.jobs))
+        policy = DEFAULT_WORKLOAD_PLACEMENT_POLICY
+        if args.policy:
+            try:
+                policy = load_workload_placement_policy(args.policy)
+            except (TypeError, ValueError) as exc:
+                raise RunnerError(str(exc)) from exc
+        concurrency = effective_concurrency(args.max_concurrency, policy)
+        if args.plan:
+            failures = eligibility_failures(jobs, Path(args.plan))
+            if failures:
+                print("INELIGIBLE: jobs cannot run in parallel.", file=sys.stderr)
+                for reason in failures:
+                    print(f"  - {reason}", file=sys.stderr)
+                return 1
+    except RunnerError as exc:
+        print(f"FAIL: {exc}", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    results = dispatch(
+        jobs,
+        log_dir=Path(args.log_dir),
+        max_concurrency=concurrency,
+        budget_poll_seconds=args.budget_poll_seconds,
+    )
+    wall = time.perf_counter() - started
+
+    for result in results:
+        note = f"  {result.message}" if result.message else ""
+        print(f"{result.name:<32} {result.status:<16} {result.seconds:>9.1f}s{note}")
+    print(
+        f"{sum(r.passed for r in results)}/{len(results)} jobs passed in {wall:.1f}s "
+        f"(max concurrency {concurrency})"
+    )
+    if args.json_path:
+        Path(args.json_path).write_text(
+            json.dumps(
+                {
+                    "max_concurrency": concurrency,
+                    "wall_seconds": round(wall, 3),
+                    "jobs": [{**asdict(r), "passed": r.passed} for r in results],
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
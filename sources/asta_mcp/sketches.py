@@ -0,0 +1,215 @@
+"""Bounded-memory frequency sketches for streaming vocabulary extraction.
+
+``HeavyHitters`` keeps the approximate top-k of an unbounded stream of
+strings in O(capacity + width * depth) memory by pairing two classic
+sketches:
+
+- ``SpaceSaving`` (Metwally et al., 2005) monitors at most ``capacity``
+  items.  A new item evicts the current minimum and inherits its count, so
+  every reported count is an upper bound and any item occurring more than
+  ``total / capacity`` times is guaranteed to be monitored.
+- ``CountMinSketch`` (Cormode & Muthukrishnan, 2005, with conservative
+  update) estimates the count of items outside the summary, also as an
+  upper bound.  It is consulted when Space-Saving admits an item, so a rare
+  newcomer starts at its own (small) estimate rather than at the evicted
+  minimum, and an item whose estimate does not exceed the summary's minimum
+  is not admitted at all ("filtered" Space-Saving), so the long tail never
+  churns the summary.  Monitored items are counted in the summary alone and
+  folded back into the sketch when evicted, which keeps the common case (a
+  frequent item) to one dict update.
+
+Hashes are CRC32-based, so results are identical across runs regardless of
+``PYTHONHASHSEED``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import zlib
+from array import array
+from collections import Counter
+from typing import Iterable, Mapping, Sequence
+
+DEFAULT_WIDTH = 1 << 16
+DEFAULT_DEPTH = 4
+_SEED = 0x9E3779B9
+
+
+class CountMinSketch:
+    """Count-Min sketch with conservative update; estimates never undercount."""
+
+    def __init__(self, width: int = DEFAULT_WIDTH, depth: int = DEFAULT_DEPTH) -> None:
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self._depths = range(depth)
+        self._rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def cells(self, item: str) -> tuple[int, ...]:
+        """One counter index per row for *item* (double hashing)."""
+        data = item.encode("utf-8")
+        h1 = zlib.crc32(data)
+        h2 = zlib.crc32(data, _SEED) | 1
+        width = self.width
+        return tuple([(h1 + i * h2) % width for i in self._depths])
+
+    def add(self, item: str, count: int = 1, cells: Sequence[int] = ()) -> int:
+        """Add *count* occurrences of *item*; return its new estimate."""
+        pairs = list(zip(self._rows, cells or self.cells(item)))
+        estimate = min([row[cell] for row, cell in pairs]) + count
+        for row, cell in pairs:
+            if row[cell] < estimate:
+                row[cell] = estimate
+        return estimate
+
+    def raise_to(self, item: str, count: int, cells: Sequence[int] = ()) -> None:
+        """Make the estimate for *item* at least *count*."""
+        for row, cell in zip(self._rows, cells or self.cells(item)):
+            if row[cell] < count:
+                row[cell] = count
+
+    def estimate(self, item: str) -> int:
+        return min(row[cell] for row, cell in zip(self._rows, self.cells(item)))
+
+
+class SpaceSaving:
+    """Space-Saving top-k counter over at most *capacity* monitored items.
+
+    ``items()`` yields ``(item, count, error)``: the true count lies in
+    ``[count - error, count]``.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        # One (count, item) entry per monitored item.  Increments leave the
+        # entry stale; stale minima are refreshed when an eviction looks.
+        self._heap: list[tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._counts
+
+    def add(
+        self, item: str, count: int = 1, upper_bound: int | None = None
+    ) -> tuple[str, int] | None:
+        """Count *item*; return the evicted ``(item, count)``, if any.
+
+        *upper_bound* (e.g. a Count-Min estimate including this update) caps
+        the count an admitted item inherits from the evicted one.
+        """
+        self.total += count
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+            return None
+        if len(counts) < self.capacity:
+            counts[item] = count
+            self._errors[item] = 0
+            heapq.heappush(self._heap, (count, item))
+            return None
+
+        floor = self.floor()
+        victim = self._heap[0][1]
+        admitted = floor + count
+        if upper_bound is not None:
+            admitted = max(count, min(admitted, upper_bound))
+        del counts[victim]
+        del self._errors[victim]
+        counts[item] = admitted
+        self._errors[item] = admitted - count
+        heapq.heapreplace(self._heap, (admitted, item))
+        return victim, floor
+
+    @property
+    def full(self) -> bool:
+        return len(self._counts) >= self.capacity
+
+    def floor(self) -> int:
+        """Smallest monitored count (0 while empty)."""
+        heap = self._heap
+        counts = self._counts
+        while heap:
+            floor, item = heap[0]
+            current = counts[item]
+            if current == floor:
+                return floor
+            heapq.heapreplace(heap, (current, item))
+        return 0
+
+    def count(self, item: str) -> int | None:
+        return self._counts.get(item)
+
+    def items(self) -> list[tuple[str, int, int]]:
+        """Monitored items as ``(item, count, error)``, highest count first."""
+        errors = self._errors
+        return [
+            (item, count, errors[item])
+            for item, count in sorted(
+                self._counts.items(), key=lambda pair: (-pair[1], pair[0])
+            )
+        ]
+
+
+class HeavyHitters:
+    """Approximate top-k counter: Space-Saving backed by a Count-Min sketch."""
+
+    def __init__(
+        self,
+        capacity: int,
+        width: int = DEFAULT_WIDTH,
+        depth: int = DEFAULT_DEPTH,
+    ) -> None:
+        self.summary = SpaceSaving(capacity)
+        self.sketch = CountMinSketch(width, depth)
+        # Sketch cells of monitored items, reused when they are evicted.
+        self._cells: dict[str, tuple[int, ...]] = {}
+
+    @property
+    def total(self) -> int:
+        return self.summary.total
+
+    def add(self, item: str, count: int = 1) -> None:
+        self.update_counts({item: count})
+
+    def update(self, items: Iterable[str]) -> None:
+        """Count every element of *items* (pre-aggregated per call)."""
+        self.update_counts(Counter(items))
+
+    def update_counts(self, counts: Mapping[str, int]) -> None:
+        """Add *counts* (``item -> occurrences``) to the sketch."""
+        summary = self.summary
+        monitored = summary._counts
+        sketch = self.sketch
+        cells_of = self._cells
+        for item, count in counts.items():
+            if item in monitored:
+                monitored[item] += count
+                summary.total += count
+                continue
+            cells = sketch.cells(item)
+            estimate = sketch.add(item, count, cells)
+            if summary.full and estimate <= summary.floor():
+                summary.total += count  # not a candidate yet; the sketch has it
+                continue
+            evicted = summary.add(item, count, estimate)
+            cells_of[item] = cells
+            if evicted is not None:
+                victim, victim_count = evicted
+                sketch.raise_to(victim, victim_count, cells_of.pop(victim))
+
+    def estimate(self, item: str) -> int:
+        """Upper bound on *item*'s count, monitored or not."""
+        monitored = self.summary.count(item)
+        return self.sketch.estimate(item) if monitored is None else monitored
+
+    def top(self, k: int) -> list[tuple[str, int]]:
+        """The *k* most frequent items as ``(item, estimated_count)``."""
+        return [(item, count) for item, count, _error in self.summary.items()[:k]]
@@ -1,14 +1,26 @@
-"""Vocabulary extraction utilities for ASTA Phase 0 scoping."""
+"""Vocabulary extraction utilities for ASTA Phase 0 scoping.
+
+``VocabularyExtractor.extract`` counts exactly over an in-memory list of
+papers (ASTA candidates).  ``extract_stream`` consumes any iterator of paper
+dicts or JSON/JSONL lines, e.g. ``iter_papers("appendix_a.json")`` over the
+full corpus, and keeps memory flat by counting terms, phrases, venues and
+authors in ``HeavyHitters`` sketches sized from the requested top-k.  Both
+modes mine bigram/trigram phrases from runs of content words that are not
+broken by stopwords, numbers or punctuation.
+"""
 
 from __future__ import annotations
 
+import json
 import re
 from collections import Counter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import yaml
 
+from sources.asta_mcp.sketches import DEFAULT_WIDTH, HeavyHitters
+
 
 DEFAULT_STOPWORDS = {
     # determiners, pronouns, prepositions, conjunctions
@@ -129,16 +141,52 @@ DEFAULT_STOPWORDS = {
 }
 
 
+# Streaming sketches monitor this many candidates per requested top-k slot
+# (at least MIN_SKETCH_CAPACITY), so ranks near the cut-off stay stable.
+SKETCH_CAPACITY_FACTOR = 20
+MIN_SKETCH_CAPACITY = 2000
+# Venues and authors are far fewer distinct strings than terms or phrases.
+SMALL_SKETCH_WIDTH = 1 << 14
+
+_CLAUSE_BREAK = re.compile(r"[.;:,!?()\[\]{}\"]+")
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9\-]+")
+
+
+def iter_papers(*paths: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream paper dicts from JSON array / JSONL files (``_meta`` rows skipped)."""
+    from elis.pipeline.validate import iter_json_rows
+
+    for path in paths:
+        for row in iter_json_rows(Path(path)):
+            if isinstance(row, dict):
+                yield row
+
+
+def _iter_rows(papers: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    """Paper dicts from dicts or raw JSON/JSONL lines, ``_meta`` rows skipped."""
+    for paper in papers:
+        if isinstance(paper, (str, bytes)):
+            if not paper.strip():
+                continue
+            paper = json.loads(paper)
+        if isinstance(paper, dict) and not paper.get("_meta"):
+            yield paper
+
+
 class VocabularyExtractor:
-    """Extract terms, venues, and authors from ASTA candidate records."""
+    """Extract terms, phrases, venues, and authors from candidate records."""
 
     def __init__(
         self,
         min_term_length: int = 3,
         stopwords: set[str] | None = None,
+        phrase_sizes: tuple[int, ...] = (2, 3),
+        min_phrase_count: int = 2,
     ) -> None:
         self.min_term_length = min_term_length
         self.stopwords = stopwords if stopwords is not None else DEFAULT_STOPWORDS
+        self.phrase_sizes = phrase_sizes
+        self.min_phrase_count = min_phrase_count
 
     def extract(
         self,
@@ -146,32 +194,23 @@ class VocabularyExtractor:
         top_terms: int = 100,
         top_venues: int = 30,
         top_authors: int = 50,
+        top_phrases: int = 50,
     ) -> dict[str, Any]:
         """Build a vocabulary summary from a list of candidate papers."""
         term_counter: Counter[str] = Counter()
+        phrase_counter: Counter[str] = Counter()
         venue_counter: Counter[str] = Counter()
         author_counter: Counter[str] = Counter()
 
         papers_with_abstract = 0
         for paper in papers:
-            text_parts: list[str] = []
-            title = paper.get("title")
-            abstract = paper.get("abstract")
-            if isinstance(title, str) and title.strip():
-                text_parts.append(title)
-            if isinstance(abstract, str) and abstract.strip():
-                text_parts.append(abstract)
-                papers_with_abstract += 1
-
-            for token in self._tokenize(" ".join(text_parts)):
-                term_counter[token] += 1
-
-            venue = paper.get("venue") or paper.get("journal")
-            if isinstance(venue, str) and venue.strip():
-                venue_counter[venue.strip()] += 1
-
-            for author in self._extract_authors(paper.get("authors")):
-                author_counter[author] += 1
+            terms, phrases, venue, authors, has_abstract = self._paper_features(paper)
+            papers_with_abstract += has_abstract
+            term_counter.update(terms)
+            phrase_counter.update(phrases)
+            if venue:
+                venue_counter[venue] += 1
+            author_counter.update(authors)
 
         key_terms = [
             {"term": term, "count": count}
@@ -191,14 +230,81 @@ class VocabularyExtractor:
                 "total_papers": len(papers),
                 "papers_with_abstract": papers_with_abstract,
                 "unique_terms": len(term_counter),
+                "unique_phrases": len(phrase_counter),
                 "unique_venues": len(venue_counter),
                 "unique_authors": len(author_counter),
             },
             "key_terms": key_terms,
+            "key_phrases": self._phrase_rows(phrase_counter.most_common(top_phrases)),
             "venues": top_venues_list,
             "authors": top_authors_list,
         }
 
+    def extract_stream(
+        self,
+        papers: Iterable[Any],
+        top_terms: int = 100,
+        top_venues: int = 30,
+        top_authors: int = 50,
+        top_phrases: int = 50,
+    ) -> dict[str, Any]:
+        """Build a vocabulary summary in one pass with bounded memory.
+
+        *papers* may yield dicts or JSON/JSONL lines.  Counts are Space-Saving
+        upper bounds: exact for any item that was never evicted, which in
+        practice covers the reported top-k of a skewed vocabulary.
+        """
+
+        def sketch(top: int, width: int = DEFAULT_WIDTH) -> HeavyHitters:
+            capacity = max(top * SKETCH_CAPACITY_FACTOR, MIN_SKETCH_CAPACITY)
+            return HeavyHitters(capacity, width=width)
+
+        term_sketch = sketch(top_terms)
+        phrase_sketch = sketch(top_phrases)
+        venue_sketch = sketch(top_venues, SMALL_SKETCH_WIDTH)
+        author_sketch = sketch(top_authors, SMALL_SKETCH_WIDTH)
+
+        total_papers = 0
+        papers_with_abstract = 0
+        for paper in _iter_rows(papers):
+            terms, phrases, venue, authors, has_abstract = self._paper_features(paper)
+            total_papers += 1
+            papers_with_abstract += has_abstract
+            term_sketch.update(terms)
+            phrase_sketch.update(phrases)
+            if venue:
+                venue_sketch.add(venue)
+            author_sketch.update(authors)
+
+        return {
+            "statistics": {
+                "total_papers": total_papers,
+                "papers_with_abstract": papers_with_abstract,
+                "total_terms": term_sketch.total,
+                "total_phrases": phrase_sketch.total,
+                "mode": "streaming",
+                "sketch_capacity": {
+                    "terms": term_sketch.summary.capacity,
+                    "phrases": phrase_sketch.summary.capacity,
+                    "venues": venue_sketch.summary.capacity,
+                    "authors": author_sketch.summary.capacity,
+                },
+            },
+            "key_terms": [
+                {"term": term, "count": count}
+                for term, count in term_sketch.top(top_terms)
+            ],
+            "key_phrases": self._phrase_rows(phrase_sketch.top(top_phrases)),
+            "venues": [
+                {"venue": venue, "count": count}
+                for venue, count in venue_sketch.top(top_venues)
+            ],
+            "authors": [
+                {"author": author, "count": count}
+                for author, count in author_sketch.top(top_authors)
+            ],
+        }
+
     def save_to_yaml(self, vocabulary: dict[str, Any], output_path: Path) -> None:
         """Write extracted vocabulary to YAML."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -226,16 +332,55 @@ class VocabularyExtractor:
             blocks.append(f"({' OR '.join(section)})")
         return blocks
 
+    def _phrase_rows(self, ranked: list[tuple[str, int]]) -> list[dict[str, Any]]:
+        return [
+            {"phrase": phrase, "count": count}
+            for phrase, count in ranked
+            if count >= self.min_phrase_count
+        ]
+
+    def _paper_features(
+        self, paper: dict[str, Any]
+    ) -> tuple[list[str], list[str], str | None, list[str], bool]:
+        """Terms, phrases, venue, authors and has-abstract flag of one paper."""
+        texts: list[str] = []
+        title = paper.get("title")
+        abstract = paper.get("abstract")
+        if isinstance(title, str) and title.strip():
+            texts.append(title)
+        has_abstract = isinstance(abstract, str) and bool(abstract.strip())
+        if has_abstract:
+            texts.append(abstract)
+
+        terms = self._tokenize(" ".join(texts))
+        phrases = [phrase for text in texts for phrase in self._phrases(text)]
+        venue = paper.get("venue") or paper.get("journal")
+        venue = venue.strip() if isinstance(venue, str) and venue.strip() else None
+        authors = self._extract_authors(paper.get("authors"))
+        return terms, phrases, venue, authors, has_abstract
+
+    def _is_term(self, token: str) -> bool:
+        return len(token) >= self.min_term_length and token not in self.stopwords
+
     def _tokenize(self, text: str) -> list[str]:
         if not text:
             return []
-        lowered = text.lower()
-        tokens = re.findall(r"[a-z0-9][a-z0-9\-]+", lowered)
-        return [
-            token
-            for token in tokens
-            if len(token) >= self.min_term_length and token not in self.stopwords
-        ]
+        return [token for token in _TOKEN.findall(text.lower()) if self._is_term(token)]
+
+    def _phrases(self, text: str) -> list[str]:
+        """Bigrams/trigrams within runs of adjacent content words."""
+        phrases: list[str] = []
+        for clause in _CLAUSE_BREAK.split(text.lower()):
+            run: list[str] = []
+            for token in [*_TOKEN.findall(clause), ""]:
+                if token and self._is_term(token) and not token.isdigit():
+                    run.append(token)
+                    continue
+                for size in self.phrase_sizes:
+                    for i in range(len(run) - size + 1):
+                        phrases.append(" ".join(run[i : i + size]))
+                run = []
+        return phrases
 
     @staticmethod
     def _extract_authors(raw_authors: Any) -> list[str]:
@@ -1,4 +1,4 @@
-"""Tests for ASTA Phase 2/3 helper functions."""
+"""Tests for ASTA Phase 0/2/3 helper functions."""
 
 from __future__ import annotations
 
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import yaml
 
+from scripts.phase0_asta_scoping import run_corpus
 from scripts.phase2_asta_screening import (
     deduplicate_snippets,
     extract_paper_ids as extract_paper_ids_phase2,
@@ -17,6 +18,24 @@ from scripts.phase3_asta_extraction import (
     group_by_paper_id,
     load_records as load_records_phase3,
 )
+from sources.asta_mcp.vocabulary import VocabularyExtractor
+
+
+def test_phase0_run_corpus_streams_appendix_a(tmp_path: Path) -> None:
+    """Phase 0 --corpus should build vocabulary from Appendix A files."""
+    corpus = tmp_path / "appendix_a.json"
+    rows = [{"_meta": True}] + [
+        {"title": "Risk-limiting audit pilots", "abstract": "Ballot audit pilots."}
+    ] * 3
+    corpus.write_text(json.dumps(rows), encoding="utf-8")
+    output = tmp_path / "vocab.yml"
+
+    code = run_corpus(VocabularyExtractor(), [str(corpus)], output, top_terms=5)
+
+    assert code == 0
+    vocab = yaml.safe_load(output.read_text(encoding="utf-8"))
+    assert vocab["statistics"]["total_papers"] == 3
+    assert {"phrase": "audit pilots", "count": 6} in vocab["key_phrases"]
 
 
 def test_phase2_load_records_json_and_jsonl(tmp_path: Path) -> None:
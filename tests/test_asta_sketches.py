@@ -0,0 +1,64 @@
+"""Unit tests for the streaming frequency sketches."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+from sources.asta_mcp.sketches import CountMinSketch, HeavyHitters, SpaceSaving
+
+
+def _zipf_stream(n: int, vocab: int, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocab)]
+    weights = [1 / (i + 1) for i in range(vocab)]
+    return rng.choices(words, weights, k=n)
+
+
+def test_count_min_never_undercounts() -> None:
+    stream = _zipf_stream(5000, 2000)
+    sketch = CountMinSketch(width=64, depth=3)
+    for item in stream:
+        sketch.add(item)
+    for item, count in Counter(stream).items():
+        assert sketch.estimate(item) >= count
+
+
+def test_space_saving_bounds_contain_true_counts() -> None:
+    stream = _zipf_stream(5000, 2000)
+    summary = SpaceSaving(capacity=50)
+    for item in stream:
+        summary.add(item)
+
+    truth = Counter(stream)
+    assert len(summary) == 50 and summary.total == 5000
+    for item, count, error in summary.items():
+        assert count - error <= truth[item] <= count
+    # Anything above total / capacity must be monitored.
+    assert {w for w, c in truth.items() if c > 5000 / 50} <= {
+        item for item, _count, _error in summary.items()
+    }
+
+
+def test_heavy_hitters_top_k_and_bounded_size() -> None:
+    stream = _zipf_stream(20000, 5000)
+    hitters = HeavyHitters(capacity=100, width=512, depth=4)
+    for start in range(0, len(stream), 100):
+        hitters.update(stream[start : start + 100])
+
+    truth = Counter(stream)
+    assert hitters.total == 20000
+    assert len(hitters.summary) <= 100
+    expected = [item for item, _ in truth.most_common(10)]
+    assert [item for item, _ in hitters.top(10)] == expected
+    for item in ("w0", "w4000"):
+        assert hitters.estimate(item) >= truth[item]
+
+
+def test_sketches_reject_empty_sizes() -> None:
+    with pytest.raises(ValueError):
+        SpaceSaving(0)
+    with pytest.raises(ValueError):
+        CountMinSketch(width=0)
@@ -63,3 +63,80 @@ def test_generate_boolean_suggestions_returns_chunks() -> None:
     assert len(suggestions) == 3
     assert suggestions[0].startswith("(")
     assert "OR" in suggestions[0]
+
+
+def _corpus() -> list[dict]:
+    papers = []
+    for i in range(60):
+        papers.append(
+            {
+                "title": f"Risk-limiting audit of ballot tabulation {i}",
+                "abstract": "A risk-limiting audit checks paper ballots. "
+                "Voter verification improves electoral trust.",
+                "venue": "Journal of Election Security" if i % 3 else "E-Vote-ID",
+                "authors": ["Alice Doe", f"Author {i}"],
+            }
+        )
+    for i in range(400):
+        papers.append({"title": f"unrelated topic{i} keyword{i}", "abstract": ""})
+    return papers
+
+
+def test_extract_mines_bigram_and_trigram_phrases() -> None:
+    vocab = VocabularyExtractor().extract(_corpus(), top_phrases=50)
+
+    phrases = {item["phrase"]: item["count"] for item in vocab["key_phrases"]}
+    assert phrases["risk-limiting audit"] == 120
+    assert phrases["voter verification improves"] == 60
+    assert phrases["audit checks"] == 60
+    # Stopwords ("paper") and sentence ends break phrases; singletons are dropped.
+    assert "checks paper" not in phrases and "paper ballots" not in phrases
+    assert "ballots voter" not in phrases
+    assert all(count >= 2 for count in phrases.values())
+
+
+def test_extract_stream_matches_exact_top_k_with_small_sketches(
+    monkeypatch,
+) -> None:
+    from sources.asta_mcp import vocabulary
+
+    monkeypatch.setattr(vocabulary, "MIN_SKETCH_CAPACITY", 50)
+    monkeypatch.setattr(vocabulary, "SKETCH_CAPACITY_FACTOR", 5)
+    extractor = VocabularyExtractor()
+    # Cut-offs fall between count groups, so both modes pick the same items.
+    top = {"top_terms": 3, "top_phrases": 11, "top_venues": 2, "top_authors": 1}
+    exact = extractor.extract(_corpus(), **top)
+    streamed = extractor.extract_stream(iter(_corpus()), **top)
+
+    def ranked(rows: list[dict]) -> list[tuple]:
+        # Exact mode orders count ties by first occurrence, streaming by value.
+        return sorted(tuple(row.values())[::-1] for row in rows)
+
+    for section in ("key_terms", "key_phrases", "venues", "authors"):
+        assert ranked(streamed[section]) == ranked(exact[section])
+    assert streamed["statistics"]["total_papers"] == 460
+    assert streamed["statistics"]["mode"] == "streaming"
+    assert streamed["statistics"]["sketch_capacity"]["terms"] == 50
+
+
+def test_extract_stream_reads_jsonl_lines_and_appendix_a_files(tmp_path: Path) -> None:
+    import json
+
+    from sources.asta_mcp.vocabulary import iter_papers
+
+    rows = _corpus()[:60]
+    lines = [json.dumps({"_meta": True})] + [json.dumps(r) for r in rows] + [""]
+    extractor = VocabularyExtractor()
+    from_lines = extractor.extract_stream(lines)
+    assert from_lines["statistics"]["total_papers"] == 60
+
+    appendix = tmp_path / "appendix_a.json"
+    appendix.write_text(json.dumps([{"_meta": True}, *rows]), encoding="utf-8")
+    jsonl = tmp_path / "more.jsonl"
+    jsonl.write_text("\n".join(json.dumps(r) for r in rows) + "\n", encoding="utf-8")
+    from_files = extractor.extract_stream(iter_papers(appendix, jsonl))
+    assert from_files["statistics"]["total_papers"] == 120
+    assert from_files["venues"][0] == {
+        "venue": "Journal of Election Security",
+        "count": 80,
+    }
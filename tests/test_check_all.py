@@ -0,0 +1,157 @@
+"""Tests for scripts/check_all.py - in-process gate suite runner."""
+
+from __future__ import annotations
+
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from scripts import check_all
+
+
+def _gate(directory: Path, name: str, body: str) -> Path:
+    path = directory / f"{name}.py"
+    path.write_text(textwrap.dedent(body), encoding="utf-8")
+    return path
+
+
+def _suite(tmp_path: Path) -> dict[str, Path]:
+    _gate(
+        tmp_path,
+        "check_ok",
+        """
+        def main() -> int:
+            print("all good")
+            return 0
+        """,
+    )
+    _gate(
+        tmp_path,
+        "check_code",
+        """
+        import sys
+
+        def main() -> int:
+            print("bad input", file=sys.stderr)
+            return 3
+        """,
+    )
+    _gate(
+        tmp_path,
+        "check_message",
+        """
+        def print_report() -> None:
+            raise SystemExit("policy violated")
+        """,
+    )
+    _gate(
+        tmp_path,
+        "check_crash",
+        """
+        def main() -> int:
+            raise KeyError("GH_TOKEN")
+        """,
+    )
+    _gate(
+        tmp_path,
+        "check_args",
+        """
+        import argparse
+
+        def main() -> int:
+            parser = argparse.ArgumentParser()
+            parser.add_argument("--input", required=True)
+            parser.parse_args()
+            return 0
+        """,
+    )
+    return check_all.discover_checks(tmp_path)
+
+
+def test_discovery_skips_the_runner_and_flags_argument_gates(tmp_path: Path) -> None:
+    checks = _suite(tmp_path)
+    _gate(tmp_path, "check_all", "def main():\n    return 0\n")
+    assert "check_all" not in check_all.discover_checks(tmp_path)
+    assert check_all.needs_arguments(checks["check_args"])
+    assert not check_all.needs_arguments(checks["check_ok"])
+
+
+def test_run_checks_preserves_exit_semantics_and_captures_output(
+    tmp_path: Path,
+) -> None:
+    argv = list(sys.argv)
+    results = {r.name: r for r in check_all.run_checks(_suite(tmp_path), workers=4)}
+
+    assert results["check_ok"].exit_code == 0
+    assert results["check_ok"].output == "all good\n"
+    assert results["check_code"].exit_code == 3
+    assert "bad input" in results["check_code"].output
+    assert results["check_message"].exit_code == 1
+    assert "policy violated" in results["check_message"].output
+    assert results["check_crash"].exit_code == 1
+    assert "KeyError" in results["check_crash"].output
+    assert results["check_args"].exit_code == 2
+    assert sys.argv == argv
+
+
+def test_shared_read_cache_reuses_text_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "AGENTS.md"
+    path.write_text("v1", encoding="utf-8")
+    with check_all.shared_read_cache() as cache:
+        assert path.read_text(encoding="utf-8") == "v1"
+        assert path.read_text(encoding="utf-8") == "v1"
+        assert len(cache) == 1
+        path.write_text("v2 longer", encoding="utf-8")
+        assert path.read_text(encoding="utf-8") == "v2 longer"
+    assert Path.read_text is not None and "check_all" not in Path.read_text.__module__
+
+
+def test_reports_include_per_check_timings(tmp_path: Path) -> None:
+    results = check_all.run_checks(_suite(tmp_path), workers=2)
+    payload = check_all.report_payload(results, 0.5)
+    assert payload["passed"] is False
+    assert {c["name"] for c in payload["checks"]} == set(_suite(tmp_path))
+    assert all("seconds" in c for c in payload["checks"])
+    json.dumps(payload)
+
+    markdown = check_all.render_markdown(results, 0.5)
+    assert "| check_ok | 0 |" in markdown
+    assert "## check_code (exit 3)" in markdown
+
+
+def test_each_gate_sees_its_own_argv(tmp_path: Path) -> None:
+    _suite(tmp_path)
+    _gate(
+        tmp_path,
+        "check_prog",
+        """
+        import argparse
+
+        def main() -> int:
+            parser = argparse.ArgumentParser()
+            parser.add_argument("--input", required=True)
+            print(parser.prog, parser.parse_args().input)
+            return 0
+        """,
+    )
+    checks = check_all.discover_checks(tmp_path)
+    results = {
+        r.name: r
+        for r in check_all.run_checks(
+            checks,
+            workers=4,
+            check_args={"check_args": ["--input", "a"], "check_prog": ["--input", "b"]},
+        )
+    }
+    assert results["check_args"].exit_code == 0
+    assert results["check_prog"].output == "check_prog.py b\n"
+
+
+def test_named_argument_gate_without_args_is_rejected(capsys) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        check_all.main(["--check", "check_active_run"])
+    assert excinfo.value.code == 2
+    assert '--check-args check_active_run="..."' in capsys.readouterr().err
@@ -74,6 +74,19 @@ class TestModuleEntrypoint:
         assert result.returncode == 0
         assert "usage:" in result.stderr.lower() or "usage:" in result.stdout.lower()
 
+    def test_cli_import_is_lazy(self):
+        """Startup must not import manifests, adapters or HTTP stacks."""
+        code = (
+            "import sys, elis.cli\n"
+            "heavy = ['elis.manifest', 'elis.sources', 'requests', 'jsonschema']\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=10
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
+
 
 class TestValidateCLIContract:
     """Tests for validate subcommand contract (v2.0 positional args)."""
@@ -0,0 +1,190 @@
+"""Tests for elis.corpus_index and the `elis index` / `elis query` commands."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from elis import cli
+from elis.corpus_index import (
+    CorpusIndex,
+    artefact_kind,
+    discover_sources,
+    fts_phrase_query,
+)
+
+
+def _write_json(path: Path, payload: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def _write_jsonl(path: Path, rows: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+
+
+@pytest.fixture()
+def workspace(tmp_path: Path) -> Path:
+    run = tmp_path / "runs" / "run-1"
+    _write_json(
+        run / "merge" / "appendix_a.json",
+        [
+            {"_meta": True, "stage": "merge"},
+            {
+                "id": "A-1",
+                "title": "Blockchain voting audits",
+                "abstract": "Risk-limiting audits for blockchain ballots.",
+                "doi": "https://doi.org/10.1/ABC",
+                "year": 2024,
+                "source": "scopus",
+            },
+            {
+                "id": "A-2",
+                "title": "Misinformation and electoral trust",
+                "doi": "10.1/xyz",
+                "source": "openalex",
+            },
+        ],
+    )
+    _write_json(
+        run / "merge" / "appendix_a_manifest.json",
+        {"run_id": "manifest-run", "stage": "merge", "output_path": "appendix_a.json"},
+    )
+    _write_jsonl(
+        run / "dedup" / "duplicates.jsonl",
+        [{"id": "A-9", "title": "Blockchain voting audits", "cluster_id": "c1"}],
+    )
+    _write_jsonl(
+        run / "agentic" / "asta" / "asta_outputs.jsonl",
+        [
+            {
+                "record_id": "A-2",
+                "evidence_spans": [{"text": "deepfake campaigns", "valid": True}],
+                "run_id": "asta-run",
+            }
+        ],
+    )
+    _write_json(
+        tmp_path / "json_jsonl" / "ELIS_Appendix_B_Screening_rows.json",
+        [{"id": "B-A-1", "source_id": "A-1", "title": "Blockchain voting audits"}],
+    )
+    _write_json(tmp_path / "json_jsonl" / "config" / "unrelated.json", {"k": 1})
+    _write_json(
+        tmp_path / "json_jsonl" / "config" / "ELIS_Appendix_A_Search_config.json",
+        {"k": 1},
+    )
+    _write_json(run / "dedup" / "appendix_a_deduped_profile.json", {"k": 1})
+    return tmp_path
+
+
+def _roots(base: Path) -> list[Path]:
+    return [base / "runs", base / "json_jsonl"]
+
+
+def test_discover_uses_manifest_run_id_and_canonical_names(workspace: Path) -> None:
+    sources = {s.path.name: s for s in discover_sources(_roots(workspace))}
+    assert set(sources) == {
+        "appendix_a.json",
+        "duplicates.jsonl",
+        "asta_outputs.jsonl",
+        "ELIS_Appendix_B_Screening_rows.json",
+    }
+    assert sources["appendix_a.json"].run_id == "manifest-run"
+    assert sources["duplicates.jsonl"].run_id == "run-1"
+    assert sources["ELIS_Appendix_B_Screening_rows.json"].run_id is None
+
+
+@pytest.mark.parametrize(
+    ("name", "kind"),
+    [
+        ("ELIS_Appendix_A_Search_rows.json", "appendix_a"),
+        ("ELIS_Appendix_C_DataExtraction_rows.jsonl", "appendix_c"),
+        ("appendix_b.json", "appendix_b"),
+        ("appendix_a_deduped.json", "appendix_a"),
+        ("appendix_a_enriched.jsonl", "appendix_a"),
+        ("ELIS_Appendix_B_Screening_config.json", None),
+        ("appendix_a_deduped_profile.json", None),
+        ("ELIS_Appendix_A_Search_rows_manifest.json", None),
+    ],
+)
+def test_artefact_kind_matches_row_files_only(name: str, kind: str | None) -> None:
+    assert artefact_kind(Path(name)) == kind
+
+
+def test_discover_repo_json_jsonl_skips_config() -> None:
+    repo = Path(__file__).resolve().parents[1]
+    sources = discover_sources([repo / "json_jsonl"])
+    assert sources
+    assert all("config" not in s.path.relative_to(repo).parts for s in sources)
+    assert {s.path.name for s in sources} >= {"ELIS_Appendix_B_Screening_rows.json"}
+
+
+def test_index_and_query_by_text_and_keys(workspace: Path) -> None:
+    with CorpusIndex(workspace / "index.sqlite") as index:
+        stats = index.update(_roots(workspace))
+        assert (stats.files_indexed, stats.rows_indexed) == (4, 5)
+
+        hits = index.query("blockchain audits")
+        assert {(h.kind, h.record_id) for h in hits} == {
+            ("appendix_a", "A-1"),
+            ("duplicates", "A-9"),
+            ("appendix_b", "B-A-1"),
+        }
+        assert [h.record_id for h in index.query(doi="doi:10.1/abc")] == ["A-1"]
+        assert [h.record_id for h in index.query(source_id="A-1")] == ["B-A-1"]
+        assert [h.record_id for h in index.query(cluster_id="c1")] == ["A-9"]
+        (asta,) = index.query("deepfake")
+        assert (asta.kind, asta.run_id) == ("asta", "asta-run")
+        assert index.query("blockchain", run_id="manifest-run")[0].record_id == "A-1"
+        assert index.query('"voting audits" NOT ballots', raw_fts=True)
+        with pytest.raises(ValueError):
+            index.query()
+
+
+def test_update_is_incremental(workspace: Path) -> None:
+    db = workspace / "index.sqlite"
+    with CorpusIndex(db) as index:
+        index.update(_roots(workspace))
+
+        stats = index.update(_roots(workspace))
+        assert (stats.files_indexed, stats.files_unchanged) == (0, 4)
+
+        # Touched but identical content: stat refreshed, rows kept.
+        dup = workspace / "runs" / "run-1" / "dedup" / "duplicates.jsonl"
+        os.utime(dup, ns=(1, 1))
+        assert index.update(_roots(workspace)).files_indexed == 0
+
+        _write_jsonl(
+            dup, [{"id": "A-10", "title": "Ballot secrecy", "cluster_id": "c2"}]
+        )
+        stats = index.update(_roots(workspace))
+        assert (stats.files_indexed, stats.rows_indexed) == (1, 1)
+        assert index.query(cluster_id="c1") == []
+        assert [h.record_id for h in index.query("secrecy")] == ["A-10"]
+
+        dup.unlink()
+        assert index.update(_roots(workspace)).files_removed == 1
+        assert index.query("secrecy") == []
+        assert index.summary()["files"] == 3
+
+
+def test_fts_phrase_query_quotes_tokens() -> None:
+    assert fts_phrase_query('e-voting "AND" trust') == '"e" "voting" "AND" "trust"'
+
+
+def test_cli_index_then_query(workspace: Path, capsys) -> None:
+    db = str(workspace / "index.sqlite")
+    roots = [str(r) for r in _roots(workspace)]
+    assert cli.main(["index", *roots, "--db", db]) == 0
+    assert "Indexed 4 file(s) (5 rows)" in capsys.readouterr().out
+
+    assert cli.main(["query", "electoral", "trust", "--db", db, "--json"]) == 0
+    (hit,) = json.loads(capsys.readouterr().out)
+    assert hit["record_id"] == "A-2"
+
+    assert cli.main(["query", "nothing-matches", "--db", db]) == 1
+    assert cli.main(["query", "x", "--db", str(workspace / "missing.sqlite")]) == 1
@@ -10,6 +10,7 @@ import jsonschema
 import pytest
 
 from elis.sources.crossref import (
+    _SELECT_FIELDS,
     CrossRefAdapter,
     transform_entry,
 )
@@ -342,6 +343,27 @@ class TestCrossRefHarvest:
         call_kwargs = mock_client.get.call_args
         assert call_kwargs[1]["params"]["mailto"] == "test@example.com"
 
+    def test_harvest_requests_field_projection(self) -> None:
+        adapter = CrossRefAdapter()
+        api_data = self._make_api_response([], total=0)
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = api_data
+
+        with patch("elis.sources.crossref.ELISHttpClient") as MockClient:
+            mock_client = MockClient.return_value
+            mock_client.get.return_value = mock_resp
+
+            list(adapter.harvest(["test"], max_results=10))
+
+        selected = mock_client.get.call_args[1]["params"]["select"].split(",")
+        assert selected == list(_SELECT_FIELDS)
+        assert "reference" not in selected
+
+    def test_projection_covers_transform_inputs(self) -> None:
+        assert set(SAMPLE_CROSSREF_ENTRY) <= set(_SELECT_FIELDS)
+
 
 # ---------------------------------------------------------------------------
 # Registry
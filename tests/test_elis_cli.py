@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 from pathlib import Path
 from unittest.mock import patch
@@ -120,6 +121,98 @@ def test_harvest_emits_manifest(tmp_path: Path) -> None:
     _assert_run_manifest(tmp_path / "harvest_manifest.json")
 
 
+def test_harvest_saturation_reported_in_manifest(tmp_path: Path) -> None:
+    """--saturation-ratio should pass a policy to the adapter and report stops."""
+    out = tmp_path / "harvest.json"
+    out.write_text(
+        json.dumps([{"title": "Old", "source": "openalex", "doi": "10.1/old"}]),
+        encoding="utf-8",
+    )
+
+    class _Cfg:
+        queries = ["q"]
+        max_results = 5
+        output_path = str(out)
+        config_mode = "test"
+
+    class _Adapter:
+        display_name = "OpenAlex"
+
+        def harvest(self, queries, max_results, *, saturation=None):
+            page = [{"title": "Old", "source": "openalex", "doi": "10.1/old"}]
+            assert saturation is not None
+            assert saturation.should_stop(queries[0], page)
+            yield from page
+
+    with (
+        patch("elis.sources.config.load_harvest_config", return_value=_Cfg()),
+        patch("elis.sources.get_adapter", return_value=_Adapter),
+    ):
+        code = cli.main(
+            [
+                "harvest",
+                "openalex",
+                "--saturation-ratio",
+                "0.5",
+                "--saturation-pages",
+                "1",
+            ]
+        )
+
+    assert code == 0
+    manifest_path = tmp_path / "harvest_manifest.json"
+    _assert_run_manifest(manifest_path)
+    report = json.loads(manifest_path.read_text(encoding="utf-8"))["stage_report"]
+    assert report["new_records"] == 0
+    assert report["saturation"]["saturated_queries"][0]["query"] == "q"
+
+
+def test_harvest_fetches_planned_query_once_and_fans_out(tmp_path: Path) -> None:
+    """Duplicate queries across topics are fetched once, attributed to both."""
+    from elis.sources.config import PlannedQuery
+
+    out = tmp_path / "harvest.json"
+    planned = PlannedQuery("q", (("Topic A", "q"), ("Topic B", "q ")))
+
+    class _Cfg:
+        queries = ["q"]
+        query_plan = (planned,)
+        max_results = 5
+        output_path = str(out)
+        config_mode = "test"
+
+    calls: list[list[str]] = []
+
+    class _Adapter:
+        display_name = "CrossRef"
+
+        def harvest(self, queries, _max_results, **_kwargs):
+            calls.append(list(queries))
+            yield {"title": "T", "source": "crossref", "doi": "10.1/x"}
+
+    with (
+        patch("elis.sources.config.load_harvest_config", return_value=_Cfg()),
+        patch("elis.sources.get_adapter", return_value=_Adapter),
+    ):
+        code = cli.main(["harvest", "crossref"])
+
+    assert code == 0
+    assert calls == [["q"]]
+    (record,) = json.loads(out.read_text(encoding="utf-8"))
+    assert record["query_topic"] == "Topic A"
+    assert record["query_attributions"] == [
+        {"query_topic": "Topic A", "query_string": "q"},
+        {"query_topic": "Topic B", "query_string": "q "},
+    ]
+    manifest = json.loads(
+        (tmp_path / "harvest_manifest.json").read_text(encoding="utf-8")
+    )
+    assert manifest["stage_report"]["query_plan"] == {
+        "planned_queries": 2,
+        "unique_queries": 1,
+    }
+
+
 def test_merge_calls_pipeline_merge(tmp_path: Path) -> None:
     """merge subcommand should delegate to pipeline merge runner."""
     input_path = tmp_path / "input.json"
@@ -266,6 +359,51 @@ def test_dedup_emits_manifest(tmp_path: Path) -> None:
     _assert_run_manifest(tmp_path / "dedup_manifest.json")
 
 
+def test_enrich_emits_manifest(tmp_path: Path) -> None:
+    """enrich should emit a run manifest sidecar."""
+    in_path = tmp_path / "in.json"
+    in_path.write_text("[]", encoding="utf-8")
+    out_path = tmp_path / "enriched.json"
+    report_path = tmp_path / "enrich_report.json"
+
+    def _fake_run_enrich(*_args, **_kwargs) -> None:
+        out_path.write_text('[{"_meta": true}, {"id": "r1"}]', encoding="utf-8")
+        report_path.write_text("{}", encoding="utf-8")
+
+    with patch("elis.pipeline.enrich.run_enrich", side_effect=_fake_run_enrich):
+        code = cli.main(
+            [
+                "enrich",
+                "--input",
+                str(in_path),
+                "--output",
+                str(out_path),
+                "--report",
+                str(report_path),
+                "--cache",
+                str(tmp_path / "cache.json"),
+            ]
+        )
+    assert code == 0
+    manifest_path = tmp_path / "enriched_manifest.json"
+    _assert_run_manifest(manifest_path)
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert payload["stage"] == "enrich"
+    assert payload["record_count"] == 1
+
+
+def test_enrich_provider_choices_follow_the_registry() -> None:
+    """--providers accepts exactly the providers enrich knows about."""
+    from elis.pipeline.enrich import PROVIDERS
+
+    parser = cli.build_parser()
+    args = parser.parse_args(["enrich", "--providers", *sorted(PROVIDERS)])
+    assert args.providers == sorted(PROVIDERS)
+    enrich = parser._subparsers._group_actions[0].choices["enrich"]
+    (action,) = [a for a in enrich._actions if a.dest == "providers"]
+    assert list(action.choices) == sorted(PROVIDERS)
+
+
 def test_screen_emits_manifest(tmp_path: Path) -> None:
     """screen should emit a run manifest sidecar."""
     in_path = tmp_path / "appendix_a.json"
@@ -309,6 +447,35 @@ def test_validate_explicit_emits_manifest(tmp_path: Path) -> None:
     _assert_run_manifest(tmp_path / "rows_manifest.json")
 
 
+def test_validate_streams_jsonl_target(tmp_path: Path) -> None:
+    """validate <schema> <rows.jsonl> validates each non-_meta line."""
+    data_path = tmp_path / "rows.jsonl"
+    schema_path = tmp_path / "schema.json"
+    data_path.write_text('{"_meta": true}\n{"id": "r1"}\n{"id": 2}\n', encoding="utf-8")
+    schema_path.write_text(
+        json.dumps({"type": "object", "properties": {"id": {"type": "string"}}}),
+        encoding="utf-8",
+    )
+    is_valid, count, errors, _ = cli._validate_json_target(schema_path, data_path)
+    assert (is_valid, count) == (False, 2)
+    assert errors == ["row 1, field 'id': 2 is not of type 'string'"]
+
+
+def test_validate_cache_dir_reuses_rows(tmp_path: Path, capsys) -> None:
+    """validate --cache-dir reports rows answered from the row-hash cache."""
+    data_path = tmp_path / "rows.json"
+    schema_path = tmp_path / "schema.json"
+    data_path.write_text(json.dumps([{"id": "r1"}, {"id": "r2"}]), encoding="utf-8")
+    schema_path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+    argv = ["validate", str(schema_path), str(data_path)]
+    argv += ["--cache-dir", str(tmp_path / "cache")]
+
+    assert cli.main(argv) == 0
+    assert "cached=" not in capsys.readouterr().out
+    assert cli.main(argv) == 0
+    assert "rows=2 file=rows.json cached=2" in capsys.readouterr().out
+
+
 def test_validate_accepts_object_root_schema(tmp_path: Path) -> None:
     """validate must handle object-root payloads (e.g., run manifests)."""
     schema_path = tmp_path / "run_manifest.schema.json"
@@ -705,3 +872,71 @@ def test_export_latest_uses_ascii_output(tmp_path: Path, capsys) -> None:
     captured = capsys.readouterr().out
     assert "->" in captured
     assert "→" not in captured
+
+
+def test_profile_writes_artefacts_next_to_stage_manifest(tmp_path: Path) -> None:
+    in_path = tmp_path / "in.json"
+    in_path.write_text("[]", encoding="utf-8")
+    out_path = tmp_path / "dedup" / "deduped.json"
+    report_path = tmp_path / "dedup" / "report.json"
+
+    def _fake_run_dedup(*_args, **_kwargs) -> None:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text('[{"_meta": true}]', encoding="utf-8")
+        report_path.write_text("{}", encoding="utf-8")
+
+    with patch("elis.pipeline.dedup.run_dedup", side_effect=_fake_run_dedup):
+        code = cli.main(
+            [
+                "--profile",
+                "both",
+                "dedup",
+                "--input",
+                str(in_path),
+                "--output",
+                str(out_path),
+                "--report",
+                str(report_path),
+            ]
+        )
+    assert code == 0
+    assert (tmp_path / "dedup" / "deduped_manifest.json").exists()
+    summary = json.loads(
+        (tmp_path / "dedup" / "deduped_profile.json").read_text(encoding="utf-8")
+    )
+    assert summary["command"] == "dedup"
+    assert summary["cpu"]["hot_path"][0]["function"].endswith("(_run_dedup)")
+    assert (tmp_path / "dedup" / "deduped_profile.pstats").exists()
+    assert (tmp_path / "dedup" / "deduped_profile_mem.txt").exists()
+
+
+def test_profile_without_manifest_falls_back_to_output_path(tmp_path: Path) -> None:
+    output = tmp_path / "runs" / "r1" / "asta_outputs.jsonl"
+
+    with patch("elis.agentic.asta.run_enrich", return_value=output):
+        code = cli.main(
+            [
+                "--profile",
+                "cpu",
+                "agentic",
+                "asta",
+                "enrich",
+                "--input",
+                "in.json",
+                "--run-id",
+                "r1",
+                "--output",
+                str(output),
+            ]
+        )
+    assert code == 0
+    summary_path = output.with_name("asta_outputs_profile.json")
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["command"] == "agentic_asta_enrich"
+
+
+def test_profile_without_manifest_or_output_goes_to_cache_dir() -> None:
+    with patch.object(cli, "_EMITTED_MANIFESTS", []):
+        prefix = cli._profile_prefix(argparse.Namespace(), "validate")
+    assert prefix.parent == Path(".cache/elis/profiles")
+    assert prefix.name.startswith("validate_")
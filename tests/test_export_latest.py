@@ -0,0 +1,90 @@
+"""Tests for elis.export_latest - change-detecting, link-capable export."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from elis import cli, export_latest
+from elis.export_latest import ExportError, export_file, export_run
+
+
+def _run(tmp_path: Path) -> Path:
+    run = tmp_path / "runs" / "r1"
+    (run / "merge").mkdir(parents=True)
+    (run / "dedup").mkdir()
+    (run / "merge" / "appendix_a.json").write_text("[1]", encoding="utf-8")
+    (run / "merge" / "appendix_a_manifest.json").write_text("{}", encoding="utf-8")
+    (run / "dedup" / "duplicates.jsonl").write_text("{}\n", encoding="utf-8")
+    (run / "dedup" / "duplicates.jsonl.idx.json").write_text("{}", encoding="utf-8")
+    return run
+
+
+def test_reexport_skips_identical_files(tmp_path: Path) -> None:
+    run, out = _run(tmp_path), tmp_path / "json_jsonl"
+    first = export_run(run, out, "r1")
+    assert sorted(p.name for p in out.iterdir()) == [
+        "LATEST_RUN_ID.txt",
+        "appendix_a.json",
+        "duplicates.jsonl",
+    ]
+    assert first.count("copied") == 2
+
+    second = export_run(run, out, "r1")
+    assert second.count("unchanged") == 2 and second.written == 0
+
+    (run / "merge" / "appendix_a.json").write_text("[2]", encoding="utf-8")
+    third = export_run(run, out, "r1")
+    assert [f.action for f in third.files] == ["copied", "unchanged"]
+    assert (out / "appendix_a.json").read_text(encoding="utf-8") == "[2]"
+
+
+def test_hardlink_mode_shares_inode_and_never_writes_through(tmp_path: Path) -> None:
+    run, out = _run(tmp_path), tmp_path / "json_jsonl"
+    export_run(run, out, "r1", mode="hardlink")
+    source = run / "merge" / "appendix_a.json"
+    assert os.path.samefile(source, out / "appendix_a.json")
+    assert export_run(run, out, "r1", mode="hardlink").written == 0
+
+    # A new run replaces the link; the old run's bytes stay intact.
+    run2 = tmp_path / "runs" / "r2" / "merge"
+    run2.mkdir(parents=True)
+    (run2 / "appendix_a.json").write_text("[9]", encoding="utf-8")
+    export_run(run2.parent, out, "r2", mode="hardlink")
+    assert source.read_text(encoding="utf-8") == "[1]"
+    assert (out / "appendix_a.json").read_text(encoding="utf-8") == "[9]"
+    assert (out / "LATEST_RUN_ID.txt").read_text(encoding="utf-8") == "r2\n"
+
+
+def test_auto_mode_falls_back_to_copy(tmp_path: Path, monkeypatch) -> None:
+    def refuse(*_args, **_kwargs):
+        raise OSError("not supported")
+
+    monkeypatch.setattr(export_latest, "_reflink", refuse)
+    monkeypatch.setattr(export_latest.os, "link", refuse)
+    source = tmp_path / "a.json"
+    source.write_text("[]", encoding="utf-8")
+    assert export_file(source, tmp_path / "b.json", "auto") == "copied"
+    with pytest.raises(ExportError, match="hardlink"):
+        export_file(source, tmp_path / "c.json", "hardlink")
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_cli_export_latest_link_flag(tmp_path: Path, capsys) -> None:
+    run = _run(tmp_path)
+    args = [
+        "export-latest",
+        "--run-id",
+        "r1",
+        "--runs-dir",
+        str(run.parent),
+        "--export-dir",
+        str(tmp_path / "out"),
+    ]
+    assert cli.main([*args, "--link", "hardlink"]) == 0
+    assert "hardlinked: r1" in capsys.readouterr().out
+    assert cli.main(args) == 0
+    out = capsys.readouterr().out
+    assert "Exported 0 file(s)" in out and "(2 unchanged)" in out
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
 
 from scripts.generate_pe_status_report import (
+    DashboardCache,
     build_dashboard,
     main,
     parse_active_registry,
@@ -208,3 +210,68 @@ PASS
     )
 
     assert "PE-AUTO-09  merged    2026-04-10  PASS (round 5)" in report
+
+
+def _build_cached(
+    tmp_path: Path, cache: DashboardCache, lessons: str = _LESSONS
+) -> str:
+    return build_dashboard(
+        release_name="ELIS 2-Agent Automation Plan",
+        plan_pes=parse_plan_markdown(_PLAN),
+        registry_rows=parse_active_registry(_CURRENT_PE),
+        lessons_content=lessons,
+        repo_root=tmp_path,
+        auth_summary="Auth status: codex OK · claude OK",
+        cache=cache,
+    )
+
+
+def test_dashboard_cache_reuses_rows_across_runs(tmp_path: Path) -> None:
+    review = tmp_path / "REVIEW_PE_AUTO_09.md"
+    review.write_text(_REVIEW, encoding="utf-8")
+    cache_path = tmp_path / "cache" / "dashboard.json"
+
+    first_cache = DashboardCache(cache_path)
+    first = _build_cached(tmp_path, first_cache)
+    assert first_cache.stats["rows_rendered"] == 3
+    assert first == _build_cached(tmp_path, DashboardCache())
+
+    second_cache = DashboardCache(cache_path)
+    assert _build_cached(tmp_path, second_cache) == first
+    assert second_cache.stats == {
+        "reviews_parsed": 0,
+        "rows_rendered": 0,
+        "rows_reused": 3,
+    }
+
+
+def test_dashboard_cache_rerenders_only_changed_rows(tmp_path: Path) -> None:
+    review = tmp_path / "REVIEW_PE_AUTO_09.md"
+    review.write_text(_REVIEW, encoding="utf-8")
+    cache_path = tmp_path / "dashboard.json"
+    _build_cached(tmp_path, DashboardCache(cache_path))
+
+    # Touched but identical content: re-hashed, not re-parsed.
+    stat = review.stat()
+    os.utime(review, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    cache = DashboardCache(cache_path)
+    _build_cached(tmp_path, cache)
+    assert cache.stats["reviews_parsed"] == 0
+    assert cache.stats["rows_rendered"] == 0
+
+    review.write_text(
+        _REVIEW + "\n## Round 2\n\n### Verdict\n\nFAIL\n", encoding="utf-8"
+    )
+    cache = DashboardCache(cache_path)
+    report = _build_cached(tmp_path, cache)
+    assert "PE-AUTO-09  merged    2026-04-10  FAIL (round 2" in report
+    assert cache.stats["reviews_parsed"] == 1
+    assert cache.stats["rows_rendered"] == 1
+
+
+def test_dashboard_cache_ignores_corrupt_or_foreign_files(tmp_path: Path) -> None:
+    cache_path = tmp_path / "dashboard.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+    cache = DashboardCache(cache_path)
+    assert "PE-AUTO-11" in _build_cached(tmp_path, cache, lessons="")
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["version"] == 1
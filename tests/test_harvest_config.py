@@ -12,8 +12,11 @@ from elis.sources.config import (
     _get_legacy_max_results,
     _get_legacy_queries,
     _get_new_queries,
+    _get_legacy_topic_queries,
     _resolve_new_max_results,
     load_harvest_config,
+    normalise_query,
+    plan_queries,
 )
 
 
@@ -138,6 +141,45 @@ class TestNewConfig:
         assert result == 25  # Falls back to max_results_default=testing=25
 
 
+# ---------------------------------------------------------------------------
+# Query planning
+# ---------------------------------------------------------------------------
+
+
+class TestQueryPlan:
+    def test_normalise_collapses_whitespace_and_paren_padding(self) -> None:
+        assert normalise_query('(\n  "a" OR  "b"\n)\n') == '("a" OR "b")'
+
+    def test_normalise_preserves_case(self) -> None:
+        assert normalise_query("a AND b") != normalise_query("a and b")
+
+    def test_duplicates_across_topics_collapse(self) -> None:
+        plan = plan_queries(
+            [
+                ("Topic A", "electoral integrity"),
+                ("Topic B", "voting security"),
+                ("Topic C", "  electoral   integrity "),
+            ]
+        )
+        assert [p.query for p in plan] == ["electoral integrity", "voting security"]
+        assert plan[0].attributions == (
+            ("Topic A", "electoral integrity"),
+            ("Topic C", "electoral   integrity"),
+        )
+        assert plan[0].query_topic == "Topic A"
+
+    def test_repeated_pair_attributed_once(self) -> None:
+        plan = plan_queries([("T", "q"), ("T", "q")])
+        assert plan[0].attributions == (("T", "q"),)
+
+    def test_legacy_topic_queries_carry_topic_name(self) -> None:
+        pairs = _get_legacy_topic_queries(LEGACY_CONFIG, "openalex")
+        assert pairs == [
+            ("Topic A", "electoral integrity"),
+            ("Topic A", "voting security"),
+        ]
+
+
 # ---------------------------------------------------------------------------
 # load_harvest_config integration
 # ---------------------------------------------------------------------------
@@ -193,3 +235,41 @@ class TestLoadHarvestConfig:
         assert cfg.config_mode == "LEGACY"
         assert cfg.max_results > 0
         assert len(cfg.queries) > 0
+
+    def test_legacy_duplicate_queries_fetched_once(self, tmp_path, monkeypatch) -> None:
+        config = {
+            "topics": [
+                {
+                    "name": "T1",
+                    "enabled": True,
+                    "sources": ["crossref"],
+                    "queries": ["q1"],
+                },
+                {
+                    "name": "T2",
+                    "enabled": True,
+                    "sources": ["crossref"],
+                    "queries": ["q1 ", "q2"],
+                },
+            ]
+        }
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / "elis_search_queries.yml").write_text(
+            yaml.dump(config), encoding="utf-8"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        cfg = load_harvest_config("crossref")
+        assert cfg.queries == ["q1", "q2"]
+        assert [p.attributions for p in cfg.query_plan] == [
+            (("T1", "q1"), ("T2", "q1")),
+            (("T2", "q2"),),
+        ]
+
+    def test_new_config_topic_is_search_id(self, tmp_path) -> None:
+        config_path = tmp_path / "search.yml"
+        config_path.write_text(
+            yaml.dump({**NEW_CONFIG, "search_id": "ei_2025"}), encoding="utf-8"
+        )
+        cfg = load_harvest_config("openalex", search_config=str(config_path))
+        assert cfg.query_plan[0].query_topic == "ei_2025"
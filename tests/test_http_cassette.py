@@ -0,0 +1,126 @@
+"""Tests for HTTP cassette recording and the local mock API server."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from elis.sources import crossref, openalex
+from elis.sources.cassette import (
+    RECORD_DIR_ENV,
+    Cassette,
+    CassetteRecorder,
+    interaction_key,
+)
+from elis.sources.http_client import ELISHttpClient
+from elis.sources.mock_api import MockApiConfig, MockApiServer
+
+
+def _client(**kwargs) -> ELISHttpClient:
+    return ELISHttpClient(
+        "OpenAlex", delay_seconds=0, backoff_base=0, backoff_max=0, **kwargs
+    )
+
+
+def test_interaction_key_ignores_secrets_and_param_order() -> None:
+    a = interaction_key("get", "https://x/works?ignored=1", {"b": 2, "a": 1})
+    b = interaction_key("GET", "http://y/works", {"a": "1", "api_key": "s", "b": "2"})
+    assert a == b == "GET /works?a=1&b=2"
+
+
+def test_client_records_sanitised_interactions(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv(RECORD_DIR_ENV, str(tmp_path))
+    with MockApiServer(MockApiConfig(results_per_query=3)) as api:
+        resp = _client().get(
+            api.url("openalex"),
+            params={"filter": "default.search:ai", "per_page": 2, "api_key": "SECRET"},
+        )
+    assert len(resp.json()["results"]) == 2
+
+    text = (tmp_path / "openalex.jsonl").read_text(encoding="utf-8")
+    assert "SECRET" not in text
+    (row,) = [json.loads(line) for line in text.splitlines()]
+    assert row["params"]["api_key"] == "***"
+    assert row["status"] == 200
+    assert row["headers"] == {"Content-Type": "application/json"}
+    assert json.loads(row["body"])["meta"]["count"] == 3
+
+
+def test_server_replays_cassette_in_recorded_order(tmp_path: Path) -> None:
+    params = {"filter": "default.search:ai", "page": 1}
+    rows = [
+        {"method": "GET", "url": "https://api.openalex.org/works", "params": params,
+         "status": 429, "headers": {"Retry-After": "0"}, "body": "{}"},
+        {"method": "GET", "url": "https://api.openalex.org/works", "params": params,
+         "status": 200, "headers": {}, "body": '{"results": [{"id": "W1"}]}'},
+    ]  # fmt: skip
+    (tmp_path / "openalex.jsonl").write_text(
+        "".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8"
+    )
+    assert len(Cassette.load(tmp_path / "openalex.jsonl")) == 2
+
+    with MockApiServer(MockApiConfig(cassette_dir=tmp_path)) as api:
+        resp = _client(max_retries=2).get(api.url("openalex"), params=params)
+        assert resp.json() == {"results": [{"id": "W1"}]}
+        assert api.stats["replayed"] == 2
+
+
+def test_injected_failures_are_seeded_and_retried() -> None:
+    config = MockApiConfig(error_rate_429=0.3, error_rate_5xx=0.2, seed=7)
+    outcomes = []
+    for _ in range(2):
+        with MockApiServer(config) as api:
+            client = _client(max_retries=20)
+            for page in range(1, 6):
+                client.get(
+                    api.url("openalex"),
+                    params={"filter": "default.search:x", "page": page},
+                )
+            outcomes.append(dict(api.stats))
+    assert outcomes[0] == outcomes[1]
+    assert outcomes[0]["injected_429"] + outcomes[0]["injected_5xx"] > 0
+    assert outcomes[0]["synthesised"] == 5
+
+
+def test_rate_limit_returns_429_with_retry_after() -> None:
+    import requests
+
+    with MockApiServer(MockApiConfig(rate_limit_per_second=2)) as api:
+        statuses = [
+            requests.get(api.url("crossref"), params={"query": "x"}, timeout=5)
+            for _ in range(4)
+        ]
+    assert [r.status_code for r in statuses] == [200, 200, 429, 429]
+    assert statuses[-1].headers["Retry-After"] == "1"
+
+
+@pytest.mark.parametrize(
+    ("module", "adapter_cls"),
+    [(openalex, openalex.OpenAlexAdapter), (crossref, crossref.CrossRefAdapter)],
+)
+def test_adapters_paginate_against_mock_api(module, adapter_cls) -> None:
+    with MockApiServer(MockApiConfig(results_per_query=450)) as api:
+        with patch.object(module, "_BASE_URL", api.url(module.__name__.split(".")[-1])):
+            with patch.object(module.ELISHttpClient, "polite_wait", lambda self: None):
+                records = list(adapter_cls().harvest(["voting"], max_results=1000))
+    assert len(records) == 450
+    assert len({r["doi"] for r in records}) == 450
+
+
+def test_recorder_is_thread_safe_append(tmp_path: Path) -> None:
+    recorder = CassetteRecorder(tmp_path / "c" / "x.jsonl")
+
+    class _Resp:
+        status_code = 200
+        headers = {"X-RateLimit-Remaining": "9", "Set-Cookie": "drop"}
+        text = "{}"
+        elapsed = None
+
+    recorder.record("get", "https://h/p?q=1", {"token": "t"}, _Resp())
+    row = json.loads((tmp_path / "c" / "x.jsonl").read_text(encoding="utf-8"))
+    assert row["url"] == "https://h/p"
+    assert row["headers"] == {"X-RateLimit-Remaining": "9"}
+    assert row["params"] == {"token": "***"}
@@ -47,6 +47,20 @@ class TestGetSuccess:
             resp = client.get("http://example.com")
         assert resp.status_code == 200
 
+    def test_session_negotiates_gzip(self) -> None:
+        client = ELISHttpClient("test", delay_seconds=0)
+        assert "gzip" in client._session.headers["Accept-Encoding"]
+
+    def test_post_sends_json_body(self) -> None:
+        client = ELISHttpClient("test", delay_seconds=0)
+        mock_resp = MagicMock(spec=requests.Response)
+        mock_resp.status_code = 200
+
+        with patch.object(client._session, "post", return_value=mock_resp) as post:
+            resp = client.post("http://example.com", json_body={"ids": ["a"]})
+        assert resp.status_code == 200
+        assert post.call_args[1]["json"] == {"ids": ["a"]}
+
 
 # ---------------------------------------------------------------------------
 # Retry behaviour
@@ -0,0 +1,190 @@
+"""Tests for elis.jsonl_index - byte-offset sidecars for JSONL artefacts."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from elis import jsonl_index
+from elis.jsonl_index import (
+    JsonlIndexReader,
+    build_jsonl_index,
+    ensure_jsonl_index,
+    index_asta_logs,
+    index_data_path_for,
+    index_path_for,
+    write_jsonl_with_index,
+)
+from elis.pipeline import dedup
+
+
+def _append(path: Path, rows: list[dict]) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def test_write_with_index_and_random_access(tmp_path: Path) -> None:
+    path = tmp_path / "duplicates.jsonl"
+    rows = [
+        {"id": "r1", "cluster_id": "c1", "duplicate_of": "k1", "title": "Ünïcode"},
+        {"id": "r2", "cluster_id": "c2", "duplicate_of": "k2"},
+        {"id": "r3", "cluster_id": "c1", "duplicate_of": "k1"},
+    ]
+    write_jsonl_with_index(path, rows)
+
+    assert index_path_for(path).name == "duplicates.jsonl.idx.json"
+    with JsonlIndexReader(path) as reader:
+        assert len(reader) == 3
+        assert [r["id"] for r in reader.get("duplicate_of", "k1")] == ["r1", "r3"]
+        assert reader.first("cluster_id", "c2") == rows[1]
+        assert reader.first("cluster_id", "missing") is None
+        assert reader.row(0)["title"] == "Ünïcode"
+        assert list(reader) == rows
+        with pytest.raises(KeyError, match="not indexed"):
+            reader.get("title", "x")
+
+
+def test_header_stays_small_and_lookups_bisect_sorted_keys(tmp_path: Path) -> None:
+    path = tmp_path / "duplicates.jsonl"
+    rows = [
+        {"id": f"r{i}", "cluster_id": f"c{i % 997}", "duplicate_of": f"k{i % 997}"}
+        for i in range(5000)
+    ]
+    rows.append({"id": "u", "cluster_id": "ζ-é"})
+    write_jsonl_with_index(path, rows)
+
+    assert index_path_for(path).stat().st_size < 1024
+    with JsonlIndexReader(path) as reader:
+        assert reader.keys("cluster_id") == sorted(
+            {r["cluster_id"] for r in rows}, key=lambda key: key.encode("utf-8")
+        )
+        assert reader.row_numbers("cluster_id", "c5") == list(range(5, 5000, 997))
+        assert reader.first("cluster_id", "ζ-é")["id"] == "u"
+        assert reader.get("cluster_id", "c50") == rows[50:5000:997]
+        for missing in ("", "a", "c", "c5 ", "zz", "ζ"):
+            assert reader.get("cluster_id", missing) == []
+        assert reader.keys("title") == []
+
+
+def test_truncated_binary_sidecar_is_rebuilt(tmp_path: Path) -> None:
+    path = tmp_path / "duplicates.jsonl"
+    write_jsonl_with_index(path, [{"id": "a", "cluster_id": "c1"}])
+    data = index_data_path_for(path)
+    data.write_bytes(data.read_bytes()[:-3])
+    with JsonlIndexReader(path) as reader:
+        assert reader.first("cluster_id", "c1")["id"] == "a"
+
+
+def test_reader_does_not_parse_unrequested_rows(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "asta_outputs.jsonl"
+    write_jsonl_with_index(path, [{"record_id": f"r{i}"} for i in range(500)])
+    with JsonlIndexReader(path) as reader:
+        decoded = []
+        real_loads = json.loads
+        monkeypatch.setattr(
+            jsonl_index.json,
+            "loads",
+            lambda raw, *a, **k: decoded.append(raw) or real_loads(raw, *a, **k),
+        )
+        assert reader.first("record_id", "r321") == {"record_id": "r321"}
+    assert len(decoded) == 1
+
+
+def test_write_indexes_rows_without_reparsing(tmp_path: Path, monkeypatch) -> None:
+    rows = [
+        {"id": f"r{i}", "cluster_id": f"c{i % 3}", "payload": {"id": i}}
+        for i in range(50)
+    ]
+    written, scanned = tmp_path / "written.jsonl", tmp_path / "scanned.jsonl"
+    with monkeypatch.context() as patched:
+        patched.setattr(jsonl_index.json, "loads", pytest.fail)
+        write_jsonl_with_index(written, rows, ["cluster_id", "payload.id"])
+    _append(scanned, rows)
+    build_jsonl_index(scanned, ["cluster_id", "payload.id"])
+
+    def indexed(path: Path) -> tuple:
+        header = json.loads(index_path_for(path).read_text(encoding="utf-8"))
+        return header["rows"], header["fields"], index_data_path_for(path).read_bytes()
+
+    assert indexed(written) == indexed(scanned)
+
+
+def test_append_only_file_extends_existing_index(tmp_path: Path) -> None:
+    path = tmp_path / "requests.jsonl"
+    _append(path, [{"operation": "search", "payload": {"id": 1}}])
+    first = ensure_jsonl_index(path, ("operation", "payload.id"))
+    assert first["rows"] == 1
+
+    _append(path, [{"operation": "snippets", "payload": {"id": 2}}])
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"operation": "torn"')  # no trailing newline yet
+    extended = ensure_jsonl_index(path, ("operation", "payload.id"))
+    assert extended["rows"] == 2
+    with JsonlIndexReader(path, ("operation", "payload.id")) as reader:
+        assert reader.first("payload.id", 2)["operation"] == "snippets"
+        assert reader.get("operation", "torn") == []
+
+
+def test_rewritten_file_rebuilds_index(tmp_path: Path) -> None:
+    path = tmp_path / "duplicates.jsonl"
+    write_jsonl_with_index(path, [{"id": "a", "cluster_id": "c1"}])
+    path.write_text(json.dumps({"id": "bb", "cluster_id": "c9"}) + "\n")
+    os.utime(path, ns=(1, 1))
+    with JsonlIndexReader(path) as reader:
+        assert reader.get("cluster_id", "c1") == []
+        assert reader.first("cluster_id", "c9")["id"] == "bb"
+
+
+def test_missing_key_field_triggers_rebuild_keeping_old_fields(tmp_path: Path) -> None:
+    path = tmp_path / "x.jsonl"
+    write_jsonl_with_index(path, [{"id": "a", "doi": "10.1/x"}], key_fields=("id",))
+    with JsonlIndexReader(path, ("doi",)) as reader:
+        assert reader.first("doi", "10.1/x")["id"] == "a"
+        assert reader.first("id", "a") is not None
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "duplicates.jsonl"
+    write_jsonl_with_index(path, [])
+    with JsonlIndexReader(path) as reader:
+        assert len(reader) == 0
+        assert reader.get("cluster_id", "c1") == []
+
+
+def test_index_asta_logs(tmp_path: Path) -> None:
+    _append(tmp_path / "requests.jsonl", [{"operation": "a", "payload": {"id": 7}}])
+    _append(tmp_path / "responses.jsonl", [{"operation": "a", "response": {"id": 7}}])
+    indexed = index_asta_logs(tmp_path)
+    assert [p.name for p in indexed] == [
+        "requests.jsonl.idx.json",
+        "responses.jsonl.idx.json",
+    ]
+    with JsonlIndexReader(tmp_path / "responses.jsonl") as reader:
+        assert reader.first("response.id", 7)["operation"] == "a"
+
+
+def test_dedup_writes_duplicates_index(tmp_path: Path) -> None:
+    source = tmp_path / "in.json"
+    source.write_text(
+        json.dumps(
+            [
+                {"id": "k", "source": "scopus", "doi": "10.1/x", "title": "T"},
+                {"id": "d", "source": "crossref", "doi": "10.1/X"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    duplicates = tmp_path / "duplicates.jsonl"
+    dedup.run_dedup(
+        str(source),
+        str(tmp_path / "out.json"),
+        str(tmp_path / "rep.json"),
+        duplicates_path=str(duplicates),
+    )
+    assert index_path_for(duplicates).exists()
+    with JsonlIndexReader(duplicates) as reader:
+        assert [r["id"] for r in reader.get("duplicate_of", "k")] == ["d"]
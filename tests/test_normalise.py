@@ -0,0 +1,176 @@
+"""Tests for elis.normalise - shared precompiled normalisers and batch API."""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from elis import normalise
+from elis.normalise import (
+    NORMALISERS,
+    collapse_ws,
+    collapse_ws_cached,
+    normalise_alnum,
+    normalise_doi,
+    normalise_many,
+    normalise_text,
+    normalise_text_cached,
+    normalise_title,
+)
+from elis.pipeline import dedup
+
+# ---------------------------------------------------------------------------
+# Reference implementations (the per-module helpers this module replaced)
+# ---------------------------------------------------------------------------
+
+
+def _ref_collapse_ws(value):
+    if not value:
+        return ""
+    return re.sub(r"\s+", " ", value.strip())
+
+
+def _ref_text(text):
+    if not text:
+        return ""
+    s = re.sub(r"[^\w\s]", "", text.lower())
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def _ref_title(title):
+    if not title:
+        return ""
+    s = re.sub(r"[^\w\s]", " ", title.lower())
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def _ref_alnum(text):
+    s = re.sub(r"[^a-z0-9\s]", "", (text or "").lower())
+    return re.sub(r"\s+", " ", s).strip()
+
+
+REFERENCE = {
+    "ws": (collapse_ws, _ref_collapse_ws),
+    "text": (normalise_text, _ref_text),
+    "title": (normalise_title, _ref_title),
+    "alnum": (normalise_alnum, _ref_alnum),
+}
+
+_ALPHABET = "aZ9 _-.,;:!?()'\"\t\n  éÉßİİﬁ中文–—​/\\"
+
+
+def _fuzz(count: int = 400, seed: int = 7) -> list[str | None]:
+    rng = random.Random(seed)
+    values: list[str | None] = [None, "", " ", "\t\n", "A", "  Already clean  "]
+    for _ in range(count):
+        values.append("".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 24))))
+    return values
+
+
+# ---------------------------------------------------------------------------
+# Scalar normalisers
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("kind", sorted(REFERENCE))
+def test_scalar_matches_reference(kind: str) -> None:
+    fn, ref = REFERENCE[kind]
+    for value in _fuzz():
+        assert fn(value) == ref(value), repr(value)
+
+
+def test_text_and_title_differ_on_punctuation() -> None:
+    assert normalise_text("Risk-Limiting  Audits!") == "risklimiting audits"
+    assert normalise_title("Risk-Limiting  Audits!") == "risk limiting audits"
+    assert normalise_alnum("Héllo,  World 2025!") == "hllo world 2025"
+
+
+def test_normalise_doi_prefixes() -> None:
+    assert normalise_doi("  https://doi.org/10.1/ABC ") == "10.1/abc"
+    assert normalise_doi("http://doi.org/10.1/x") == "10.1/x"
+    assert normalise_doi("DOI:10.1/x") == "10.1/x"
+    assert normalise_doi(None) == ""
+    # Only one prefix is stripped.
+    assert normalise_doi("doi:https://doi.org/10.1/x") == "https://doi.org/10.1/x"
+
+
+def test_cached_variants_match_scalar() -> None:
+    normalise_text_cached.cache_clear()
+    collapse_ws_cached.cache_clear()
+    for value in _fuzz(100) * 2:
+        assert normalise_text_cached(value) == normalise_text(value)
+        assert collapse_ws_cached(value) == collapse_ws(value)
+    assert normalise_text_cached.cache_info().hits > 0
+
+
+# ---------------------------------------------------------------------------
+# Batch API
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("kind", NORMALISERS)
+def test_batch_matches_scalar(kind: str) -> None:
+    scalar = normalise._SCALAR[kind]
+    values = _fuzz() + ["https://doi.org/10.5/Q", "doi:10.5/q"]
+    assert normalise_many(values, kind) == [scalar(value) for value in values]
+
+
+def test_batch_accepts_generators_and_empty_columns() -> None:
+    assert normalise_many((v for v in ["A  b", None]), "ws") == ["A b", ""]
+    assert normalise_many([], "text") == []
+    assert normalise_many([None, ""], "title") == ["", ""]
+
+
+def test_batch_falls_back_when_values_contain_separator() -> None:
+    values = ["a\x00b", "Title, One", "c \x00 d!"]
+    for kind in NORMALISERS:
+        scalar = normalise._SCALAR[kind]
+        assert normalise_many(values, kind) == [scalar(v) for v in values]
+
+
+def test_batch_rejects_unknown_kind() -> None:
+    with pytest.raises(ValueError, match="kind must be one of"):
+        normalise_many(["x"], "soundex")
+
+
+# ---------------------------------------------------------------------------
+# Stage wiring
+# ---------------------------------------------------------------------------
+
+
+def test_dedup_batch_keys_match_dedup_key(tmp_path: Path) -> None:
+    rows = [
+        {"source": "a", "doi": "https://doi.org/10.1/A", "title": "X", "year": 2020},
+        {
+            "source": "a",
+            "title": "Risk-Limiting Audits!",
+            "year": 2021.0,
+            "authors": ["Lindeman,  M."],
+        },
+        {
+            "source": "b",
+            "doi": "",
+            "title": "Risk-limiting  audits",
+            "year": 2021,
+            "authors": ["lindeman, m"],
+        },
+        {"source": "c", "title": None, "authors": []},
+    ]
+    src = tmp_path / "in.json"
+    src.write_text(json.dumps(rows), encoding="utf-8")
+    out = tmp_path / "out.json"
+    dedup.run_dedup(
+        str(src),
+        str(out),
+        str(tmp_path / "rep.json"),
+        duplicates_path=str(tmp_path / "dups.jsonl"),
+    )
+
+    keepers = json.loads(out.read_text(encoding="utf-8"))[1:]
+    expected = {dedup._cluster_id(dedup._dedup_key(row)) for row in rows}
+    assert {row["cluster_id"] for row in keepers} == expected
+    assert len(keepers) == 3
@@ -10,6 +10,7 @@ import jsonschema
 import pytest
 
 from elis.sources.openalex import (
+    _SELECT_FIELDS,
     OpenAlexAdapter,
     _reconstruct_abstract,
     transform_entry,
@@ -275,3 +276,53 @@ class TestOpenAlexHarvest:
             records = list(adapter.harvest(["test"], max_results=10))
 
         assert records == []
+
+    def test_harvest_requests_field_projection(self) -> None:
+        adapter = OpenAlexAdapter()
+        api_data = self._make_api_response([], total=0)
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = api_data
+
+        with patch("elis.sources.openalex.ELISHttpClient") as MockClient:
+            mock_client = MockClient.return_value
+            mock_client.get.return_value = mock_resp
+
+            list(adapter.harvest(["test"], max_results=10))
+
+        selected = mock_client.get.call_args[1]["params"]["select"].split(",")
+        assert selected == list(_SELECT_FIELDS)
+        assert "concepts" not in selected
+        assert "referenced_works" not in selected
+
+    def test_projection_covers_transform_inputs(self) -> None:
+        assert set(SAMPLE_OPENALEX_ENTRY) <= set(_SELECT_FIELDS)
+
+    def test_harvest_stops_when_saturated(self) -> None:
+        from elis.sources.base import SaturationPolicy
+
+        adapter = OpenAlexAdapter()
+        entries = [
+            {**SAMPLE_OPENALEX_ENTRY, "id": f"W{i}", "doi": f"10.1/{i}"}
+            for i in range(3)
+        ]
+        api_data = self._make_api_response(entries, total=1000)
+        known = [transform_entry(entry) for entry in entries]
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = api_data
+
+        policy = SaturationPolicy(min_new_ratio=0.5, patience=2, known_records=known)
+        with patch("elis.sources.openalex.ELISHttpClient") as MockClient:
+            mock_client = MockClient.return_value
+            mock_client.get.return_value = mock_resp
+
+            records = list(
+                adapter.harvest(["test"], max_results=1000, saturation=policy)
+            )
+
+        assert mock_client.get.call_count == 2
+        assert len(records) == 6
+        assert policy.report()["saturated_queries"][0]["query"] == "test"
@@ -0,0 +1,166 @@
+"""Tests for elis.pe_registry - shared CURRENT_PE.md model and caches."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from elis import pe_registry
+from elis.pe_registry import (
+    CURRENT_PE_HEADING,
+    RELEASE_HEADING,
+    RegistryError,
+    load_current_pe,
+    parse_current_pe,
+    parse_registry,
+    parse_registry_table,
+    read_text_cached,
+)
+
+_CONTENT = """\
+# Current PE Assignment
+
+## Release context
+
+| Field          | Value      |
+|----------------|------------|
+| Release        | Test · v1  |
+| Base branch    | main       |
+| Plan file      | PLAN.md    |
+| Plan location  | repo root  |
+
+## Current PE
+
+| Field   | Value |
+|---------|-------|
+| PE      | PE-OPS-02 |
+| Branch  | feature/pe-ops-02 |
+
+## Active PE Registry
+
+| PE-ID     | Domain | Implementer-agentId | Validator-agentId | Branch            | Status       | Last-updated |
+|-----------|--------|---------------------|-------------------|-------------------|--------------|--------------|
+| PE-OPS-01 | ops    | infra-impl-a        | infra-val-b       | feature/pe-ops-01 | merged       | 2026-05-01   |
+| PE-OPS-02 | ops    | infra-impl-b        | infra-val-a       | feature/pe-ops-02 | implementing | 2026-05-02   |
+| PE-OPS-02 | ops    | infra-impl-a        | infra-val-b       | feature/pe-ops-02 | blocked      | 2026-04-30   |
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    pe_registry.clear_cache()
+    yield
+    pe_registry.clear_cache()
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+def test_parse_registry_lowercases_header_and_keeps_row_order() -> None:
+    header, rows = parse_registry(_CONTENT)
+    assert header[0] == "pe-id"
+    assert [row["status"] for row in rows] == ["merged", "implementing", "blocked"]
+
+
+def test_parse_registry_table_keeps_raw_header_case() -> None:
+    header, rows = parse_registry_table(_CONTENT)
+    assert header[2] == "Implementer-agentId"
+    assert rows[0][0] == "PE-OPS-01"
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("# nothing\n", "not found"),
+        ("## Active PE Registry\n\n| PE-ID |\n", "missing or malformed"),
+        (
+            "## Active PE Registry\n\n| A | B |\n|---|---|\n| only-one |\n",
+            "wrong column count",
+        ),
+    ],
+)
+def test_malformed_registry_raises(content: str, message: str) -> None:
+    with pytest.raises(RegistryError, match=message):
+        parse_registry(content)
+
+
+def test_document_sections_and_typed_rows() -> None:
+    document = parse_current_pe(_CONTENT)
+    assert document.section_value(RELEASE_HEADING, "Plan file") == "PLAN.md"
+    assert document.section_value(CURRENT_PE_HEADING, "PE") == "PE-OPS-02"
+    assert document.section_value(CURRENT_PE_HEADING, "Plan file") is None
+    row = document.row("PE-OPS-02")
+    assert row is not None
+    assert (row.implementer, row.status) == ("infra-impl-b", "implementing")
+
+
+def test_document_defers_registry_error() -> None:
+    document = parse_current_pe("## Current PE\n\n| PE | PE-X-1 |\n")
+    assert document.section_value(CURRENT_PE_HEADING, "PE") == "PE-X-1"
+    with pytest.raises(RegistryError):
+        document.registry()
+
+
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+
+def test_load_current_pe_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "CURRENT_PE.md"
+    path.write_text(_CONTENT, encoding="utf-8")
+    first = load_current_pe(path)
+    assert load_current_pe(path) is first
+
+    path.write_text(_CONTENT.replace("implementing", "validating"), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_current_pe(path)
+    assert second is not first
+    assert second.row("PE-OPS-02").status == "validating"
+
+
+def test_snapshot_round_trip_skips_reparse(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "CURRENT_PE.md"
+    path.write_text(_CONTENT, encoding="utf-8")
+    snapshot = tmp_path / "snap.json"
+
+    document = load_current_pe(path, snapshot_path=snapshot)
+    payload = json.loads(snapshot.read_text(encoding="utf-8"))
+    assert payload["version"] == pe_registry.SNAPSHOT_VERSION
+
+    pe_registry.clear_cache()
+
+    def _no_parse(_content: str):
+        raise AssertionError("snapshot should have been reused")
+
+    monkeypatch.setattr(pe_registry, "parse_current_pe", _no_parse)
+    monkeypatch.setenv(pe_registry.SNAPSHOT_ENV, str(snapshot))
+    restored = load_current_pe(path)
+    assert restored.registry() == document.registry()
+    assert restored.sections == document.sections
+
+
+def test_stale_snapshot_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "CURRENT_PE.md"
+    path.write_text(_CONTENT, encoding="utf-8")
+    snapshot = tmp_path / "snap.json"
+    load_current_pe(path, snapshot_path=snapshot)
+
+    pe_registry.clear_cache()
+    path.write_text(_CONTENT.replace("PLAN.md", "OTHER.md"), encoding="utf-8")
+    document = load_current_pe(path, snapshot_path=snapshot)
+    assert document.section_value(RELEASE_HEADING, "Plan file") == "OTHER.md"
+
+
+def test_read_text_cached_tracks_mtime(tmp_path: Path) -> None:
+    path = tmp_path / "LESSONS_LEARNED.md"
+    path.write_text("one", encoding="utf-8")
+    assert read_text_cached(path) == "one"
+    path.write_text("two!", encoding="utf-8")
+    assert read_text_cached(path) == "two!"
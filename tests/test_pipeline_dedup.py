@@ -444,6 +444,89 @@ def test_dedup_fuzzy_enabled_warns(tmp_path: Path) -> None:
     assert any("fuzzy" in str(warning.message).lower() for warning in w)
 
 
+_ABSTRACT = (
+    "We study how coordinated misinformation campaigns on social platforms "
+    "affect voter confidence in electoral administration across twelve "
+    "democracies, combining survey panels with platform data."
+)
+
+
+def test_dedup_near_dup_merges_preprint_and_published(tmp_path: Path) -> None:
+    """Different DOIs and title wording, same abstract: one cluster with --near-dup."""
+    p = tmp_path / "input.json"
+    rows = [
+        {
+            "id": "pub",
+            "source": "scopus",
+            "doi": "10.1/pub",
+            "title": "Misinformation and Voter Confidence in Twelve Democracies",
+            "abstract": _ABSTRACT,
+        },
+        {
+            "id": "pre",
+            "source": "openalex",
+            "doi": "10.31235/osf.io/abc",
+            "title": "Misinformation and Voter Confidence in 12 Democracies",
+            "abstract": _ABSTRACT + " Preprint.",
+        },
+        {
+            "id": "other",
+            "source": "wos",
+            "doi": "10.1/other",
+            "title": "Blockchain Voting Pilots",
+            "abstract": "A field evaluation of distributed ledger ballots in municipal trials.",
+        },
+    ]
+    _write_json(p, rows)
+    out, rep = tmp_path / "out.json", tmp_path / "rep.json"
+
+    dedup.run_dedup(
+        str(p), str(out), str(rep), duplicates_path=str(tmp_path / "d.jsonl")
+    )
+    assert json.loads(rep.read_text())["unique_clusters"] == 3
+    assert "near_duplicate_pairs" not in json.loads(rep.read_text())
+
+    dedup.run_dedup(
+        str(p),
+        str(out),
+        str(rep),
+        duplicates_path=str(tmp_path / "d.jsonl"),
+        near_dup=True,
+    )
+    report = json.loads(rep.read_text())
+    assert report["unique_clusters"] == 2
+    assert report["near_duplicate_dedup"] == 1
+    (pair,) = report["near_duplicate_pairs"]
+    assert {pair["left"], pair["right"]} == {"pub", "pre"}
+    assert pair["similarity"] >= 0.8
+    merged = [r for r in json.loads(out.read_text())[1:] if r["cluster_size"] == 2]
+    assert merged[0]["id"] == "pub"
+    assert merged[0]["cluster_id"] == pair["cluster_id"]
+    assert merged[0]["cluster_sources"] == ["openalex", "scopus"]
+
+
+def test_dedup_near_dup_ignores_short_titles(tmp_path: Path) -> None:
+    p = tmp_path / "input.json"
+    _write_json(
+        p,
+        [
+            {"id": "a", "source": "A", "title": "Introduction", "year": 2020},
+            {"id": "b", "source": "B", "title": "Introduction", "year": 2021},
+        ],
+    )
+    rep = tmp_path / "rep.json"
+    dedup.run_dedup(
+        str(p),
+        str(tmp_path / "out.json"),
+        str(rep),
+        duplicates_path=str(tmp_path / "d.jsonl"),
+        near_dup=True,
+    )
+    report = json.loads(rep.read_text())
+    assert report["unique_clusters"] == 2
+    assert report["near_duplicate"]["eligible_clusters"] == 0
+
+
 def test_dedup_sort_order_deterministic(tmp_path: Path) -> None:
     """Output keepers must be sorted by (source, query_topic, title)."""
     p = tmp_path / "input.json"
@@ -0,0 +1,287 @@
+"""Tests for elis.pipeline.enrich - batch DOI metadata enrichment stage."""
+
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from elis.pipeline import enrich
+from elis.sources.http_client import IntervalLimiter
+
+
+def _write_json(path: Path, payload: object) -> None:
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def _record(doi: str | None, **extra: object) -> dict:
+    return {
+        "source": "crossref",
+        "title": f"Paper {doi}",
+        "doi": doi,
+        "year": 2021,
+        "authors": ["Alice"],
+        **extra,
+    }
+
+
+def _fake_provider(table: dict[str, dict], calls: list[list[str]]):
+    def _fetch(_client, dois: list[str]) -> dict[str, dict]:
+        calls.append(list(dois))
+        return {doi: table[doi] for doi in dois if doi in table}
+
+    return _fetch
+
+
+# ---------------------------------------------------------------------------
+# Core enrichment
+# ---------------------------------------------------------------------------
+
+
+def test_enrich_fills_only_missing_fields(tmp_path: Path) -> None:
+    records = [
+        _record("10.1/a", abstract="kept", language=None),
+        _record("https://doi.org/10.1/B"),
+        _record(None),
+    ]
+    calls: list[list[str]] = []
+    table = {
+        "10.1/a": {"abstract": "ignored", "language": "en", "venue": "J A"},
+        "10.1/b": {"abstract": "Abstract B", "venue": "J B", "doc_type": "article"},
+    }
+    with patch.dict(
+        enrich.PROVIDERS,
+        {"openalex": (_fake_provider(table, calls), 50, 0.0)},
+        clear=True,
+    ):
+        stats = enrich.enrich_records(records, cache={}, workers=1)
+
+    assert records[0]["abstract"] == "kept"
+    assert records[0]["language"] == "en"
+    assert records[0]["enrichment"] == {"language": "openalex", "venue": "openalex"}
+    assert records[1]["abstract"] == "Abstract B"
+    assert records[1]["doc_type"] == "article"
+    assert "enrichment" not in records[2]
+    assert calls == [["10.1/a", "10.1/b"]]
+    assert stats["providers"]["openalex"]["requests"] == 1
+
+
+def test_enrich_batches_by_provider_limit() -> None:
+    records = [_record(f"10.1/{i:03d}") for i in range(120)]
+    calls: list[list[str]] = []
+    with patch.dict(
+        enrich.PROVIDERS,
+        {"openalex": (_fake_provider({}, calls), 50, 0.0)},
+        clear=True,
+    ):
+        stats = enrich.enrich_records(records, cache={}, workers=3)
+
+    assert sorted(len(batch) for batch in calls) == [20, 50, 50]
+    assert stats["providers"]["openalex"]["requests"] == 3
+
+
+def test_enrich_cache_skips_known_dois() -> None:
+    records = [_record("10.1/a"), _record("10.1/b")]
+    cache = {"openalex": {"10.1/a": {"abstract": "cached"}, "10.1/b": {}}}
+    calls: list[list[str]] = []
+    with patch.dict(
+        enrich.PROVIDERS,
+        {"openalex": (_fake_provider({}, calls), 50, 0.0)},
+        clear=True,
+    ):
+        stats = enrich.enrich_records(records, cache=cache, workers=1)
+
+    assert calls == []
+    assert records[0]["abstract"] == "cached"
+    assert stats["providers"]["openalex"]["cache_hits"] == 2
+
+
+def test_enrich_failed_batch_is_not_cached() -> None:
+    records = [_record("10.1/a")]
+
+    def _boom(_client, _dois):
+        raise RuntimeError("503")
+
+    cache: dict = {}
+    with patch.dict(enrich.PROVIDERS, {"openalex": (_boom, 50, 0.0)}, clear=True):
+        stats = enrich.enrich_records(records, cache=cache, workers=1)
+
+    assert cache == {"openalex": {}}
+    assert stats["providers"]["openalex"]["failed_dois"] == 1
+
+
+def test_enrich_falls_through_to_second_provider() -> None:
+    records = [_record("10.1/a")]
+    first = {"10.1/a": {"language": "en"}}
+    second = {"10.1/a": {"abstract": "From S2", "venue": "V"}}
+    with patch.dict(
+        enrich.PROVIDERS,
+        {
+            "openalex": (_fake_provider(first, []), 50, 0.0),
+            "semanticscholar": (_fake_provider(second, []), 500, 0.0),
+        },
+        clear=True,
+    ):
+        enrich.enrich_records(records, cache={}, workers=1)
+
+    assert records[0]["enrichment"] == {
+        "language": "openalex",
+        "abstract": "semanticscholar",
+        "venue": "semanticscholar",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Provider payload mapping
+# ---------------------------------------------------------------------------
+
+
+def test_fetch_openalex_uses_or_filter() -> None:
+    client = MagicMock()
+    client.get.return_value.json.return_value = {
+        "results": [
+            {
+                "doi": "https://doi.org/10.1/A",
+                "abstract_inverted_index": {"Hello": [0], "world": [1]},
+                "language": "en",
+                "primary_location": {"source": {"display_name": "Journal"}},
+                "type": "article",
+            }
+        ]
+    }
+    resolved = enrich.fetch_openalex(client, ["10.1/a", "10.1/b"])
+
+    params = client.get.call_args[1]["params"]
+    assert params["filter"] == "doi:10.1/a|10.1/b"
+    assert resolved == {
+        "10.1/a": {
+            "abstract": "Hello world",
+            "language": "en",
+            "venue": "Journal",
+            "doc_type": "article",
+        }
+    }
+
+
+def test_fetch_openalex_resolves_delimiter_dois_one_by_one() -> None:
+    single = {"doi": "https://doi.org/10.1/x|y", "language": "fr"}
+    missing = MagicMock(status_code=404)
+
+    def _get(url, params=None):
+        resp = MagicMock()
+        if "filter" in (params or {}):
+            resp.json.return_value = {"results": []}
+        elif url.endswith("10.1/x%7Cy"):
+            resp.json.return_value = single
+        else:
+            raise requests.HTTPError(response=missing)
+        return resp
+
+    client = MagicMock()
+    client.get.side_effect = _get
+    resolved = enrich.fetch_openalex(client, ["10.1/a", "10.1/x|y", "10.1/p,q"])
+
+    filters = [c[1]["params"].get("filter") for c in client.get.call_args_list]
+    assert filters == ["doi:10.1/a", None, None]
+    assert set(resolved) == {"10.1/x|y"}
+    assert resolved["10.1/x|y"]["language"] == "fr"
+
+
+def test_worker_clients_share_one_rate_limiter() -> None:
+    limiters: set[int] = set()
+
+    def _fetch(client, dois):
+        limiters.add(id(client.rate_limiter))
+        assert client.delay_seconds == 0
+        return {}
+
+    with patch.dict(enrich.PROVIDERS, {"openalex": (_fetch, 1, 0.0)}, clear=True):
+        enrich._resolve_batches("openalex", [f"10.1/{i}" for i in range(8)], workers=4)
+
+    assert len(limiters) == 1
+
+
+def test_interval_limiter_spaces_attempts_across_threads() -> None:
+    limiter = IntervalLimiter(0.05)
+    starts: list[float] = []
+
+    def _attempt(_: int) -> None:
+        limiter.acquire(None)
+        starts.append(time.monotonic())
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_attempt, range(6)))
+
+    starts.sort()
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.04
+
+
+def test_fetch_semantic_scholar_aligns_positional_results() -> None:
+    client = MagicMock()
+    client.post.return_value.json.return_value = [
+        None,
+        {"abstract": "B", "venue": "VB", "publicationTypes": ["JournalArticle"]},
+    ]
+    resolved = enrich.fetch_semantic_scholar(client, ["10.1/a", "10.1/b"])
+
+    assert client.post.call_args[1]["json_body"] == {
+        "ids": ["DOI:10.1/a", "DOI:10.1/b"]
+    }
+    assert resolved == {
+        "10.1/b": {"abstract": "B", "venue": "VB", "doc_type": "journalarticle"}
+    }
+
+
+# ---------------------------------------------------------------------------
+# Stage I/O
+# ---------------------------------------------------------------------------
+
+
+def test_run_enrich_writes_outputs_and_preserves_meta(tmp_path: Path) -> None:
+    src = tmp_path / "in.json"
+    _write_json(src, [{"_meta": True, "protocol_version": "x"}, _record("10.1/a")])
+    out = tmp_path / "out.json"
+    rep = tmp_path / "rep.json"
+    cache_path = tmp_path / "cache.json"
+
+    table = {"10.1/a": {"abstract": "A"}}
+    with patch.dict(
+        enrich.PROVIDERS,
+        {"openalex": (_fake_provider(table, []), 50, 0.0)},
+        clear=True,
+    ):
+        enrich.run_enrich(
+            str(src), str(out), str(rep), cache_path=str(cache_path), workers=1
+        )
+
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert payload[0]["_meta"] is True
+    assert payload[0]["enrich"] == {"providers": ["openalex"]}
+    assert payload[1]["abstract"] == "A"
+
+    report = json.loads(rep.read_text(encoding="utf-8"))
+    assert report["missing_before"]["abstract"] == 1
+    assert report["missing_after"]["abstract"] == 0
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cache["openalex"]["10.1/a"] == {"abstract": "A"}
+
+
+def test_run_enrich_rejects_unknown_provider(tmp_path: Path) -> None:
+    src = tmp_path / "in.json"
+    _write_json(src, [])
+    try:
+        enrich.run_enrich(
+            str(src),
+            str(tmp_path / "o.json"),
+            str(tmp_path / "r.json"),
+            providers=["nope"],
+        )
+    except ValueError as exc:
+        assert "nope" in str(exc)
+    else:
+        raise AssertionError("Expected ValueError for unknown provider")
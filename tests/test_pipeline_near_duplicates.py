@@ -0,0 +1,69 @@
+"""Tests for elis.pipeline.near_duplicates - MinHash/LSH near-duplicates."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from elis.pipeline.near_duplicates import (
+    find_near_duplicates,
+    jaccard,
+    minhash_signature,
+    shingle_hashes,
+)
+
+
+def _texts(n: int, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(5000)]
+    return [" ".join(rng.choices(vocab, k=80)) for _ in range(n)]
+
+
+def test_shingles_are_case_and_punctuation_insensitive() -> None:
+    assert shingle_hashes("Voting, Audits!") == shingle_hashes("voting audits")
+    assert len(shingle_hashes("a b c a b")) == 3
+    assert len(shingle_hashes("single")) == 1
+    assert shingle_hashes(None) == frozenset()
+
+
+def test_signature_agreement_tracks_jaccard() -> None:
+    base = _texts(1)[0].split()
+    edited = base[:60] + ["changed"] * 20
+    left, right = shingle_hashes(" ".join(base)), shingle_hashes(" ".join(edited))
+    sig_left, sig_right = (minhash_signature(s, 256) for s in (left, right))
+    agreement = sum(a == b for a, b in zip(sig_left, sig_right)) / 256
+    assert agreement == pytest.approx(jaccard(left, right), abs=0.12)
+    assert minhash_signature(left, 64) == minhash_signature(left, 64)
+
+
+def test_finds_planted_near_duplicates_without_all_pairs() -> None:
+    texts = _texts(2000)
+    planted = {}
+    for index in range(0, 2000, 100):
+        words = texts[index].split()
+        words[10] = "edited"
+        planted[index] = len(texts)
+        texts.append(" ".join(words))
+
+    result = find_near_duplicates(texts, threshold=0.8)
+
+    assert {(p.left, p.right) for p in result.pairs} == set(planted.items())
+    assert all(p.similarity >= 0.8 for p in result.pairs)
+    # LSH keeps verification far below the ~2.1M all-pairs comparisons.
+    assert result.candidates < 1000
+
+
+def test_threshold_and_argument_validation() -> None:
+    text = " ".join(f"w{i}" for i in range(20))
+    half = (
+        " ".join(f"w{i}" for i in range(10))
+        + " "
+        + " ".join(f"x{i}" for i in range(10))
+    )
+    assert find_near_duplicates([text, half], threshold=0.9).pairs == []
+    assert len(find_near_duplicates([text, text], threshold=1.0).pairs) == 1
+    with pytest.raises(ValueError):
+        find_near_duplicates([text], threshold=0)
+    with pytest.raises(ValueError):
+        find_near_duplicates([text], bands=0)
@@ -6,11 +6,19 @@ import json
 
 import pytest
 
+from elis.pipeline import validate as validate_mod
 from elis.pipeline.validate import (
+    RowCache,
+    compile_validator,
     generate_report,
+    iter_json_rows,
     load_json_file,
+    row_hash,
+    schema_hash,
     validate_appendix,
+    validate_path,
     validate_records,
+    validate_rows,
 )
 
 
@@ -94,3 +102,180 @@ class TestGenerateReport:
         report = generate_report(results)
         assert "Errors" in report
         assert "Error 1" in report
+
+    def test_error_count_uses_total_not_capped_messages(self):
+        results = {"Appendix A": (False, 5, ["Error 1", "id: 40 more errors"], 41)}
+        report = generate_report(results)
+        assert "- Error count: **41**" in report
+
+
+ROW_SCHEMA = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {"id": {"type": "string"}, "year": {"type": "integer"}},
+}
+
+
+class TestValidationEngine:
+    def test_compiled_validator_cached_by_schema_hash(self):
+        reordered = dict(reversed(list(ROW_SCHEMA.items())))
+        assert compile_validator(ROW_SCHEMA) is compile_validator(reordered)
+        assert schema_hash(ROW_SCHEMA) == schema_hash(reordered)
+
+    def test_streams_json_array_across_read_boundaries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(validate_mod, "_READ_SIZE", 7)
+        rows = [{"_meta": True}] + [{"id": str(i), "year": i * 111} for i in range(50)]
+        f = tmp_path / "rows.json"
+        f.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        assert list(iter_json_rows(f)) == rows[1:]
+
+    def test_streams_jsonl(self, tmp_path):
+        f = tmp_path / "rows.jsonl"
+        f.write_text('{"_meta": true}\n{"id": "1"}\n\n{"id": "2"}\n', encoding="utf-8")
+        assert list(iter_json_rows(f)) == [{"id": "1"}, {"id": "2"}]
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ('[{"id": "1"} {"id": "2"}]', "Expecting ',' delimiter"),
+            ('[{"id": "1"},]', "Expecting value"),
+            ('[{"id": "1"},, {"id": "2"}]', "Expecting value"),
+            ('[, {"id": "1"}]', "Expecting value"),
+            ('[{"id": "1"}] garbage', "Extra data"),
+            ('[{"id": "1"}][]', "Extra data"),
+            ('[{"id": "1"}', "Expecting ',' delimiter"),
+        ],
+    )
+    def test_malformed_json_array_rejected(self, tmp_path, monkeypatch, text, message):
+        f = tmp_path / "rows.json"
+        f.write_text(text, encoding="utf-8")
+        for size in (3, validate_mod._READ_SIZE):
+            monkeypatch.setattr(validate_mod, "_READ_SIZE", size)
+            with pytest.raises(json.JSONDecodeError, match=message):
+                list(iter_json_rows(f))
+
+    def test_malformed_json_array_fails_validation(self, tmp_path):
+        jf = tmp_path / "data.json"
+        sf = tmp_path / "schema.json"
+        jf.write_text('[{"id": "1"} {"id": "2"},] garbage', encoding="utf-8")
+        sf.write_text(json.dumps({"type": "array", "items": ROW_SCHEMA}))
+        result = validate_path(jf, sf)
+        assert not result.is_valid
+        assert "Invalid JSON" in result.errors[0]
+
+    def test_non_array_json_rejected(self, tmp_path):
+        f = tmp_path / "obj.json"
+        f.write_text('{"not": "array"}', encoding="utf-8")
+        with pytest.raises(ValueError, match="Expected array, got dict"):
+            list(iter_json_rows(f))
+
+    def test_errors_capped_per_field_but_counted(self):
+        rows = [{"id": 1} for _ in range(30)] + [{"year": "x"} for _ in range(3)]
+        result = validate_rows(rows, ROW_SCHEMA, max_errors_per_field=5)
+        assert result.error_counts == {"id": 30, "year": 3, "<required>": 3}
+        assert len(result.errors) == 5 + 3 + 3
+        assert "field 'id': 25 more errors not shown" in result.messages()
+
+    def test_parallel_matches_serial(self):
+        rows = [{"id": str(i)} if i % 7 else {"id": i} for i in range(600)]
+        serial = validate_rows(rows, ROW_SCHEMA, workers=1, chunk_size=50)
+        parallel = validate_rows(
+            rows, ROW_SCHEMA, workers=2, chunk_size=50, parallel_threshold=100
+        )
+        assert parallel.row_count == serial.row_count == 600
+        assert parallel.error_counts == serial.error_counts
+        assert parallel.messages() == serial.messages()
+        assert serial.errors[0] == "row 0, field 'id': 0 is not of type 'string'"
+
+    def test_validate_appendix_streams_jsonl(self, tmp_path):
+        jf = tmp_path / "data.jsonl"
+        sf = tmp_path / "schema.json"
+        jf.write_text('{"id": "1"}\n{"id": 2}\n', encoding="utf-8")
+        sf.write_text(json.dumps({"type": "array", "items": ROW_SCHEMA}))
+        ok, count, errors = validate_appendix("Test", jf, sf)
+        assert (ok, count) == (False, 2)
+        assert errors == ["row 1, field 'id': 2 is not of type 'string'"]
+
+    @pytest.mark.parametrize(
+        "schema, instance",
+        [
+            ({"type": "integer"}, True),
+            ({"type": "number"}, False),
+            ({"enum": [1, 2]}, True),
+            ({"const": 0}, False),
+            ({"type": "object", "additionalProperties": False}, {"x": 1}),
+            ({"type": "string", "minLength": 2}, "a"),
+            ({"type": "string", "pattern": "^10\\."}, "11.1"),
+            ({"type": "array", "items": {"type": "string"}}, ["a", None]),
+        ],
+    )
+    def test_fast_path_never_accepts_invalid(self, schema, instance):
+        compiled = compile_validator(schema)
+        assert compiled.fast_check is not None
+        assert list(compiled.iter_errors(instance))
+
+    def test_fast_path_accepts_integral_float(self):
+        compiled = compile_validator({"type": "integer", "minimum": 1})
+        assert compiled.fast_check(2.0) is True
+        assert not list(compiled.validator.iter_errors(2.0))
+
+    def test_unsupported_keyword_falls_back_to_jsonschema(self):
+        compiled = compile_validator({"anyOf": [{"type": "string"}]})
+        assert compiled.fast_check is None
+        assert list(compiled.iter_errors(1))
+        assert not list(compiled.iter_errors("a"))
+
+
+class TestRowCache:
+    def _write(self, tmp_path, rows, schema=ROW_SCHEMA):
+        jf = tmp_path / "rows.json"
+        sf = tmp_path / "schema.json"
+        jf.write_text(json.dumps(rows), encoding="utf-8")
+        sf.write_text(json.dumps(schema), encoding="utf-8")
+        return jf, sf
+
+    def test_unchanged_rows_reused_and_changed_rows_rechecked(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        rows = [{"id": str(i)} for i in range(5)]
+        jf, sf = self._write(tmp_path, rows)
+        first = validate_path(jf, sf, cache_dir=cache_dir)
+        assert (first.row_count, first.cached_rows) == (5, 0)
+
+        rows[2] = {"id": 2}
+        rows.append({"id": "new"})
+        self._write(tmp_path, rows)
+        second = validate_path(jf, sf, cache_dir=cache_dir)
+        assert (second.row_count, second.cached_rows) == (6, 4)
+        assert second.messages() == ["row 2, field 'id': 2 is not of type 'string'"]
+
+    def test_cached_errors_replayed_at_current_row_index(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        jf, sf = self._write(tmp_path, [{"id": 1}])
+        validate_path(jf, sf, cache_dir=cache_dir)
+
+        self._write(tmp_path, [{"id": "a"}, {"id": 1}])
+        result = validate_path(jf, sf, cache_dir=cache_dir)
+        assert result.cached_rows == 1
+        assert result.messages() == ["row 1, field 'id': 1 is not of type 'string'"]
+
+    def test_schema_change_invalidates_cache(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        jf, sf = self._write(tmp_path, [{"id": "1", "year": 2020}])
+        validate_path(jf, sf, cache_dir=cache_dir)
+
+        stricter = {**ROW_SCHEMA, "required": ["id", "title"]}
+        self._write(tmp_path, [{"id": "1", "year": 2020}], schema=stricter)
+        result = validate_path(jf, sf, cache_dir=cache_dir)
+        assert result.cached_rows == 0
+        assert result.is_valid is False
+
+    def test_save_keeps_only_rows_seen_this_run(self, tmp_path):
+        cache = RowCache(tmp_path / "c.json", schema_hash(ROW_SCHEMA))
+        validate_rows([{"id": "a"}, {"id": "b"}], ROW_SCHEMA, cache=cache)
+        cache.save()
+
+        cache = RowCache(tmp_path / "c.json", schema_hash(ROW_SCHEMA))
+        validate_rows([{"id": "a"}], ROW_SCHEMA, cache=cache)
+        cache.save()
+        payload = json.loads((tmp_path / "c.json").read_text(encoding="utf-8"))
+        assert list(payload["rows"]) == [row_hash({"id": "a"})]
@@ -0,0 +1,217 @@
+"""Tests for scripts/pm_daemon.py - warm-state PM service and thin clients."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from elis import pe_registry
+from scripts import pm_daemon
+
+_REGISTRY = """\
+## Active PE Registry
+
+| PE-ID | Domain | Implementer-agentId | Validator-agentId | Branch | Status | Last-updated |
+|-------|--------|---------------------|-------------------|--------|--------|--------------|
+| PE-OC-01 | openclaw-infra | infra-impl-codex | prog-val-claude | feature/pe-oc-01 | implementing | 2026-02-20 |
+"""
+
+
+@pytest.fixture()
+def daemon(tmp_path: Path, monkeypatch):
+    (tmp_path / "CURRENT_PE.md").write_text(_REGISTRY, encoding="utf-8")
+    (tmp_path / "LESSONS_LEARNED.md").write_text("# Lessons\n", encoding="utf-8")
+    monkeypatch.setenv(pm_daemon.TOKEN_FILE_ENV, str(tmp_path / "pm.token"))
+    server = pm_daemon.serve("127.0.0.1", 0, repo_root=tmp_path, poll_seconds=60)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    monkeypatch.setenv(pm_daemon.DAEMON_ENV, f"http://{host}:{port}")
+    monkeypatch.chdir(tmp_path)
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.watcher.stop()
+    pe_registry.clear_cache()
+
+
+def test_delegate_runs_script_in_daemon_with_caller_context(daemon, capsys) -> None:
+    exit_code = pm_daemon.delegate("pm_stall_detector", ["--threshold-hours", "100000"])
+    out = capsys.readouterr().out
+    assert exit_code == 0
+    assert "No stalls or iteration breaches detected." in out
+    assert os.getcwd() == str(daemon.watcher.repo_root)
+
+
+def test_delegate_preserves_exit_codes_and_stderr(daemon, tmp_path, capsys) -> None:
+    event = tmp_path / "event.json"
+    event.write_text(json.dumps({"labels": []}), encoding="utf-8")
+    assert pm_daemon.delegate("pm_gate_evaluator", []) == 2
+    assert "--gate" in capsys.readouterr().err
+
+    assert (
+        pm_daemon.delegate(
+            "pm_gate_evaluator", ["--gate", "gate-1", "--event-file", str(event)]
+        )
+        == 0
+    )
+    assert json.loads(capsys.readouterr().out)["gate"] == "gate-1"
+
+
+def _post(server, body: bytes, headers: dict[str, str]) -> int:
+    host, port = server.server_address[:2]
+    request = urllib.request.Request(
+        f"http://{host}:{port}/run", data=body, headers=headers, method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            return resp.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+
+
+def test_daemon_requires_token_and_json(daemon) -> None:
+    body = json.dumps({"script": "pm_stall_detector"}).encode("utf-8")
+    json_type = {"Content-Type": "application/json"}
+    assert _post(daemon, body, json_type) == 401
+    assert _post(daemon, body, {**json_type, "Authorization": "Bearer nope"}) == 401
+    auth = {"Authorization": f"Bearer {daemon.token}"}
+    assert _post(daemon, body, {**auth, "Content-Type": "text/plain"}) == 415
+
+
+def test_token_file_is_private(tmp_path) -> None:
+    path = tmp_path / "sub" / "pm.token"
+    token = pm_daemon.ensure_token(path)
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert pm_daemon.ensure_token(path) == token
+    path.chmod(0o644)
+    with pytest.raises(PermissionError, match="chmod 600"):
+        pm_daemon.read_token(path)
+
+
+def test_scripts_get_allowlisted_env_and_daemon_stays_untouched(
+    daemon, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setenv("PM_DAEMON_TEST_OWN", "daemon")
+    child = pm_daemon._child_env({"GITHUB_OUTPUT": "out.txt", "AWS_SECRET": "x"})
+    assert child["GITHUB_OUTPUT"] == "out.txt"
+    assert child["PM_DAEMON_TEST_OWN"] == "daemon"
+    assert "AWS_SECRET" not in child and pm_daemon.DAEMON_ENV not in child
+
+    before = dict(os.environ)
+    monkeypatch.chdir(tmp_path.parent)
+    reply = pm_daemon.run_script(
+        "pm_stall_detector",
+        ["--threshold-hours", "100000"],
+        cwd=str(tmp_path),
+        env={"GITHUB_OUTPUT": "out.txt"},
+    )
+    assert reply["exit_code"] == 0
+    assert "No stalls" in reply["stdout"]
+    assert dict(os.environ) == before
+    assert os.getcwd() == str(tmp_path.parent)
+
+
+def test_daemon_rejects_unknown_scripts(daemon) -> None:
+    with pytest.raises(ValueError, match="not served"):
+        pm_daemon.run_script("check_current_pe", [], cwd=".", env={})
+    # The status reporter reads the caller's credentials and PATH.
+    assert "pm_status_reporter" not in pm_daemon.DAEMON_SCRIPTS
+    assert pm_daemon.delegate("pm_status_reporter", []) is None
+
+
+def test_daemon_declines_callers_outside_its_repo(
+    daemon, tmp_path_factory, monkeypatch, capsys
+) -> None:
+    monkeypatch.chdir(tmp_path_factory.mktemp("other-worktree"))
+    assert pm_daemon.delegate("pm_stall_detector", []) is None
+    assert "declined" in capsys.readouterr().err
+
+    subdir = daemon.watcher.repo_root / "docs"
+    subdir.mkdir()
+    monkeypatch.chdir(subdir)
+    assert (
+        pm_daemon.delegate(
+            "pm_stall_detector",
+            ["--threshold-hours", "100000", "--registry", "../CURRENT_PE.md"],
+        )
+        == 0
+    )
+
+
+def test_worker_kills_runs_past_the_timeout(tmp_path, monkeypatch) -> None:
+    # Patched before the fork, so the worker inherits the hanging entry point.
+    monkeypatch.setattr(pm_daemon, "_entry_point", lambda script: _hang)
+    worker = pm_daemon.ScriptWorker(tmp_path, timeout=0.5)
+    worker.start()
+    try:
+        assert worker.pid is not None
+        started = time.monotonic()
+        reply = pm_daemon.run_script(
+            "pm_stall_detector", [], cwd=str(tmp_path), env={}, worker=worker
+        )
+        assert time.monotonic() - started < 10
+        assert reply["exit_code"] == pm_daemon.TIMEOUT_EXIT_CODE
+        assert "killed after" in reply["stderr"]
+        # The worker survives a killed run and serves the next request.
+        assert (
+            worker.run(
+                {
+                    "script": "x",
+                    "argv": [],
+                    "cwd": str(tmp_path),
+                    "env": {},
+                    "stdin": "",
+                }
+            )["exit_code"]
+            == pm_daemon.TIMEOUT_EXIT_CODE
+        )
+    finally:
+        worker.stop()
+    assert worker.pid is None
+
+
+def _hang() -> int:
+    time.sleep(60)
+    return 0
+
+
+def test_watcher_reprimes_changed_files(daemon, tmp_path) -> None:
+    watcher = daemon.watcher
+    generation = watcher.generation
+    assert watcher.refresh() == []
+
+    lessons = tmp_path / "LESSONS_LEARNED.md"
+    lessons.write_text("# Lessons\n\n## LL-01 — new\n", encoding="utf-8")
+    stat = lessons.stat()
+    os.utime(lessons, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert watcher.refresh() == [lessons.resolve()]
+    assert watcher.generation == generation + 1
+    assert watcher.snapshot()["registry_rows"] == 1
+
+
+def test_delegate_falls_back_when_daemon_unset_or_down(
+    tmp_path, monkeypatch, capsys
+) -> None:
+    monkeypatch.delenv(pm_daemon.DAEMON_ENV, raising=False)
+    assert pm_daemon.delegate("pm_stall_detector", []) is None
+
+    monkeypatch.setenv(pm_daemon.DAEMON_ENV, "http://127.0.0.1:9")
+    monkeypatch.setenv(pm_daemon.TOKEN_FILE_ENV, str(tmp_path / "missing.token"))
+    assert pm_daemon.delegate("pm_stall_detector", []) is None
+    assert "token unusable" in capsys.readouterr().err
+
+    pm_daemon.ensure_token(tmp_path / "missing.token")
+
+    monkeypatch.setenv(pm_daemon.DAEMON_ENV, "http://127.0.0.1:9")
+    monkeypatch.setattr("sys.stdin", io.StringIO("M a.py\n"))
+    assert pm_daemon.run_cli("pm_arbiter", lambda: 7) == 7
+    assert "running locally" in capsys.readouterr().err
@@ -0,0 +1,89 @@
+"""Tests for elis.profiling (``elis --profile``)."""
+
+from __future__ import annotations
+
+import json
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from elis.profiling import StageProfiler, hot_path
+
+
+def _leaf(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _branch() -> int:
+    return _leaf(20000) + _leaf(10)
+
+
+def _allocate() -> list[bytes]:
+    return [bytes(1024) for _ in range(2000)]
+
+
+def test_cpu_profile_writes_summary_pstats_and_listing(tmp_path: Path) -> None:
+    with StageProfiler("cpu", top=5) as profiler:
+        _branch()
+
+    written = profiler.write(tmp_path / "out" / "deduped", command="dedup")
+    assert [p.name for p in written] == [
+        "deduped_profile.json",
+        "deduped_profile.pstats",
+        "deduped_profile_cpu.txt",
+    ]
+    summary = json.loads(written[0].read_text(encoding="utf-8"))
+    assert summary["mode"] == "cpu" and summary["command"] == "dedup"
+    assert "memory" not in summary
+    assert len(summary["cpu"]["top_own"]) == 5
+    path = [step["function"] for step in summary["cpu"]["hot_path"]]
+    assert path[0].endswith("(_branch)")
+    assert path[1].endswith("(_leaf)")
+    assert pstats.Stats(str(written[1])).total_calls > 0
+
+
+def test_mem_profile_reports_peak_and_top_allocations(tmp_path: Path) -> None:
+    assert not tracemalloc.is_tracing()
+    with StageProfiler("mem") as profiler:
+        kept = _allocate()
+    assert not tracemalloc.is_tracing()
+
+    summary = profiler.summary()
+    assert "cpu" not in summary
+    assert summary["memory"]["peak_bytes"] >= len(kept) * 1024
+    assert any(
+        row["location"].endswith(".py:" + str(_allocate.__code__.co_firstlineno + 1))
+        for row in summary["memory"]["top_allocations"]
+    )
+    written = profiler.write(tmp_path / "stage")
+    assert [p.name for p in written] == ["stage_profile.json", "stage_profile_mem.txt"]
+
+
+def test_both_mode_collects_cpu_and_memory() -> None:
+    with StageProfiler("both") as profiler:
+        _allocate()
+    summary = profiler.summary()
+    assert {"cpu", "memory"} <= set(summary)
+
+
+def test_rejects_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        StageProfiler("wall")
+
+
+def test_hot_path_follows_heaviest_callee_and_stops_on_cycles() -> None:
+    root, a, b = ("m.py", 1, "root"), ("m.py", 2, "a"), ("m.py", 3, "b")
+    stats = {
+        root: (1, 1, 0.1, 1.0, {}),
+        a: (1, 1, 0.2, 0.7, {root: (1, 1, 0.2, 0.7), b: (1, 1, 0.0, 0.1)}),
+        b: (1, 1, 0.1, 0.2, {root: (1, 1, 0.1, 0.2), a: (1, 1, 0.1, 0.1)}),
+    }
+    steps = hot_path(stats)
+    assert [s["function"] for s in steps] == [
+        "m.py:1(root)",
+        "m.py:2(a)",
+        "m.py:3(b)",
+    ]
+    assert steps[1]["cumulative_pct"] == 70.0
@@ -0,0 +1,225 @@
+"""Tests for scripts/runner_dispatcher.py - concurrent runner jobs."""
+
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import replace
+from itertools import count
+from pathlib import Path
+
+import pytest
+
+from elis.workload_placement_policy import (
+    DEFAULT_WORKLOAD_PLACEMENT_POLICY,
+)
+from scripts import implementer_runner_common as common
+from scripts import runner_dispatcher
+from scripts.implementer_runner_common import RunnerError
+from scripts.runner_dispatcher import RunnerJob, dispatch, run_job
+
+_STAMP = (
+    "import sys, time; print('start', time.time(), flush=True); "
+    "time.sleep(float(sys.argv[1])); print('end', time.time(), flush=True); "
+    "sys.exit(int(sys.argv[2]))"
+)
+
+
+def _job(tmp_path: Path, pe_id: str, *, sleep: float = 0.0, exit_code: int = 0):
+    return RunnerJob(
+        role="validator",
+        engine="claude",
+        pe_id=pe_id,
+        branch=f"feature/{pe_id.lower()}",
+        plan="PLAN.md",
+        cwd=tmp_path,
+        pr_number="1",
+        command=(sys.executable, "-c", _STAMP, str(sleep), str(exit_code)),
+    )
+
+
+def _stamps(log_path: str) -> dict[str, float]:
+    stamps = {}
+    for line in Path(log_path).read_text(encoding="utf-8").splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] in {"start", "end"}:
+            stamps[parts[0]] = float(parts[1])
+    return stamps
+
+
+def test_jobs_overlap_up_to_max_concurrency(tmp_path: Path) -> None:
+    jobs = [_job(tmp_path, "PE-X-01", sleep=0.4), _job(tmp_path, "PE-X-02", sleep=0.4)]
+    results = dispatch(
+        jobs, log_dir=tmp_path / "logs", max_concurrency=2, poll_seconds=0.05
+    )
+
+    assert [r.status for r in results] == ["pass", "pass"]
+    first, second = (_stamps(r.log_path) for r in results)
+    assert first["start"] < second["end"] and second["start"] < first["end"]
+    assert all(r.seconds >= 0.4 for r in results)
+
+
+def test_single_slot_runs_jobs_back_to_back(tmp_path: Path) -> None:
+    jobs = [_job(tmp_path, "PE-X-01", sleep=0.2), _job(tmp_path, "PE-X-02", sleep=0.2)]
+    results = dispatch(
+        jobs, log_dir=tmp_path / "logs", max_concurrency=1, poll_seconds=0.05
+    )
+    first, second = (_stamps(r.log_path) for r in results)
+    assert first["end"] <= second["start"]
+
+
+def test_failed_job_keeps_exit_code_and_log(tmp_path: Path) -> None:
+    result = run_job(
+        _job(tmp_path, "PE-X-01", exit_code=3), tmp_path, poll_seconds=0.05
+    )
+    assert (result.status, result.exit_code) == ("fail", 3)
+    log = Path(result.log_path).read_text(encoding="utf-8")
+    assert log.startswith("# PE-X-01-validator:")
+    assert "end" in log
+
+
+def test_timeout_terminates_job(tmp_path: Path) -> None:
+    job = replace(_job(tmp_path, "PE-X-01", sleep=30), timeout_seconds=1)
+    result = run_job(job, tmp_path, poll_seconds=0.05)
+    assert result.status == "budget-exceeded"
+    assert "Runner timeout exceeded" in result.message
+    assert result.seconds < 10
+    assert "dispatcher: Runner timeout exceeded" in Path(result.log_path).read_text(
+        encoding="utf-8"
+    )
+
+
+def test_commit_budget_is_polled_for_implementer_jobs(
+    tmp_path: Path, monkeypatch
+) -> None:
+    counter = count()
+    monkeypatch.setattr(
+        common, "branch_commit_count", lambda _base, cwd=None: next(counter) * 5
+    )
+    job = replace(
+        _job(tmp_path, "PE-X-01", sleep=30), role="implementer", max_commits=3
+    )
+    result = run_job(job, tmp_path, poll_seconds=0.05, budget_poll_seconds=0)
+    assert result.status == "budget-exceeded"
+    assert "Commit budget exceeded" in result.message
+
+
+def test_budget_already_exceeded_is_not_launched(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(common, "branch_commit_count", lambda _base, cwd=None: 99)
+    job = replace(_job(tmp_path, "PE-X-01"), role="implementer")
+    result = run_job(job, tmp_path)
+    assert result.status == "error"
+    assert not Path(result.log_path).exists()
+
+
+def test_concurrency_is_capped_by_policy() -> None:
+    cap = DEFAULT_WORKLOAD_PLACEMENT_POLICY.max_local_concurrency
+    assert runner_dispatcher.effective_concurrency(None) == cap
+    assert runner_dispatcher.effective_concurrency(cap + 5) == cap
+    policy = replace(DEFAULT_WORKLOAD_PLACEMENT_POLICY, max_local_concurrency=4)
+    assert runner_dispatcher.effective_concurrency(2, policy) == 2
+    with pytest.raises(RunnerError):
+        runner_dispatcher.effective_concurrency(0)
+
+
+def test_main_runs_jobs_in_parallel_under_policy_file(tmp_path: Path, capsys) -> None:
+    specs = [
+        {
+            "role": "validator",
+            "engine": "claude",
+            "pe_id": pe_id,
+            "branch": "b",
+            "plan": "PLAN.md",
+            "pr_number": "1",
+            "command": [sys.executable, "-c", _STAMP, "0.4", "0"],
+        }
+        for pe_id in ("PE-X-01", "PE-X-02")
+    ]
+    jobs_file = tmp_path / "jobs.json"
+    jobs_file.write_text(json.dumps(specs), encoding="utf-8")
+    policy = tmp_path / "policy.json"
+    policy.write_text(json.dumps({"max_local_concurrency": 2}), encoding="utf-8")
+    out = tmp_path / "results.json"
+
+    argv = ["--jobs", str(jobs_file), "--log-dir", str(tmp_path / "logs")]
+    assert (
+        runner_dispatcher.main([*argv, "--policy", str(policy), "--json", str(out)])
+        == 0
+    )
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert report["max_concurrency"] == 2
+    first, second = (_stamps(job["log_path"]) for job in report["jobs"])
+    assert first["start"] < second["end"] and second["start"] < first["end"]
+
+    policy.write_text(json.dumps({"max_local_jobs": 2}), encoding="utf-8")
+    assert runner_dispatcher.main([*argv, "--policy", str(policy)]) == 1
+    assert "max_local_jobs" in capsys.readouterr().err
+
+
+def test_load_jobs_builds_runner_commands(tmp_path: Path) -> None:
+    jobs_file = tmp_path / "jobs.json"
+    jobs_file.write_text(
+        json.dumps(
+            [
+                {
+                    "role": "implementer",
+                    "engine": "codex",
+                    "pe_id": "PE-X-01",
+                    "branch": "feature/pe-x-01",
+                    "plan": "PLAN.md",
+                    "cwd": "wt-01",
+                    "max_commits": 7,
+                },
+                {
+                    "role": "validator",
+                    "engine": "claude",
+                    "pe_id": "PE-X-02",
+                    "branch": "feature/pe-x-02",
+                    "plan": "PLAN.md",
+                    "pr_number": "12",
+                },
+            ]
+        ),
+        encoding="utf-8",
+    )
+    implementer, validator = runner_dispatcher.load_jobs(jobs_file)
+    assert implementer.cwd == (tmp_path / "wt-01").resolve()
+    command = implementer.runner_command()
+    assert command[1:3] == ["-m", "scripts.run_codex_agent"]
+    assert command[command.index("--max-commits") + 1] == "7"
+    assert validator.runner_command()[2] == "scripts.run_claude_validator"
+    assert "--pr-number" in validator.runner_command()
+
+
+def test_load_jobs_rejects_invalid_specs(tmp_path: Path) -> None:
+    jobs_file = tmp_path / "jobs.json"
+    base = {"role": "validator", "engine": "claude", "pe_id": "PE-X-01"}
+    jobs_file.write_text(json.dumps([base]), encoding="utf-8")
+    with pytest.raises(RunnerError, match="missing required field 'branch'"):
+        runner_dispatcher.load_jobs(jobs_file)
+
+    full = {**base, "branch": "b", "plan": "p"}
+    jobs_file.write_text(json.dumps([full]), encoding="utf-8")
+    with pytest.raises(RunnerError, match="pr_number"):
+        runner_dispatcher.load_jobs(jobs_file)
+
+    jobs_file.write_text(json.dumps([{**full, "pr_number": "1"}] * 2), encoding="utf-8")
+    with pytest.raises(RunnerError, match="Duplicate jobs"):
+        runner_dispatcher.load_jobs(jobs_file)
+
+
+def test_eligibility_failures_use_plan_dependencies(tmp_path: Path) -> None:
+    plan = tmp_path / "PLAN.md"
+    plan.write_text(
+        "### PE-X-01 · One\n\n| Field | Value |\n|---|---|\n| Domain | infra |\n| Depends On | — |\n"
+        "| Implementer | `infra-impl-codex` |\n| Validator | `infra-val-claude` |\n\n"
+        "### PE-X-02 · Two\n\n| Field | Value |\n|---|---|\n| Domain | infra |\n| Depends On | PE-X-01 |\n"
+        "| Implementer | `infra-impl-claude` |\n| Validator | `infra-val-codex` |\n",
+        encoding="utf-8",
+    )
+    jobs = [
+        replace(_job(tmp_path, "PE-X-01"), role="implementer"),
+        replace(_job(tmp_path, "PE-X-02"), role="implementer"),
+    ]
+    failures = runner_dispatcher.eligibility_failures(jobs, plan)
+    assert failures == ["PE-X-02 directly depends on PE-X-01."]
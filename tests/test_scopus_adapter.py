@@ -10,6 +10,7 @@ import jsonschema
 import pytest
 
 from elis.sources.scopus import (
+    _SELECT_FIELDS,
     ScopusAdapter,
     _get_auth_headers,
     transform_entry,
@@ -374,6 +375,28 @@ class TestScopusHarvest:
 
         assert records == []
 
+    def test_harvest_requests_field_projection(self) -> None:
+        adapter = ScopusAdapter()
+        api_data = self._make_api_response([], total=0)
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = api_data
+
+        with (
+            patch("elis.sources.scopus._get_auth_headers", return_value={"h": "v"}),
+            patch("elis.sources.scopus.ELISHttpClient") as MockClient,
+        ):
+            mock_client = MockClient.return_value
+            mock_client.get.return_value = mock_resp
+            list(adapter.harvest(["test"], max_results=10))
+
+        params = mock_client.get.call_args[1]["params"]
+        assert params["field"].split(",") == list(_SELECT_FIELDS)
+
+    def test_projection_covers_transform_inputs(self) -> None:
+        assert set(SAMPLE_SCOPUS_ENTRY) <= set(_SELECT_FIELDS)
+
     def test_harvest_skips_when_no_credentials(self) -> None:
         adapter = ScopusAdapter()
 
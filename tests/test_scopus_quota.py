@@ -0,0 +1,302 @@
+"""Tests for the quota-aware Scopus API key pool."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from elis.sources import scopus
+from elis.sources.http_client import ELISHttpClient
+from elis.sources.mock_api import MockApiConfig, MockApiServer
+from elis.sources.scopus_quota import (
+    DEFAULT_STATE_PATH,
+    MAX_WAIT_ENV,
+    SAVE_INTERVAL,
+    STATE_PATH_ENV,
+    UNKNOWN_RESET_PAUSE,
+    QuotaExhausted,
+    ScopusKeyPool,
+    fingerprint,
+)
+
+KEYS = [("key-a", "tok"), ("key-b", "tok"), ("key-c", "")]
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _pool(clock: FakeClock, credentials=KEYS, **kwargs) -> ScopusKeyPool:
+    kwargs.setdefault("state_path", None)
+    kwargs.setdefault("requests_per_second", 0)
+    return ScopusKeyPool(credentials, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _response(status: int = 200, **headers: object) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = {name.replace("_", "-"): str(v) for name, v in headers.items()}
+    return resp
+
+
+def _quota(pool: ScopusKeyPool, key: str, remaining: int, reset: float) -> None:
+    pool.observe(
+        {"X-ELS-APIKey": key},
+        _response(**{"X-RateLimit-Remaining": remaining, "X-RateLimit-Reset": reset}),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+
+def test_acquire_sets_key_headers_and_keeps_others() -> None:
+    clock = FakeClock()
+    pool = _pool(clock)
+    headers = pool.acquire({"Accept": "application/json", "X-ELS-Insttoken": "x"})
+    assert headers == {
+        "Accept": "application/json",
+        "X-ELS-APIKey": "key-a",
+        "X-ELS-Insttoken": "tok",
+    }
+    _quota(pool, "key-a", 100, clock.now + 60)
+    _quota(pool, "key-b", 100, clock.now + 60)
+    # A key without its own token drops the inherited header.
+    assert pool.acquire({"X-ELS-Insttoken": "x"}) == {"X-ELS-APIKey": "key-c"}
+
+
+def test_prefers_unknown_then_largest_remaining_quota() -> None:
+    clock = FakeClock()
+    pool = _pool(clock)
+    reset = clock.now + 3600
+    _quota(pool, "key-a", 500, reset)
+    _quota(pool, "key-b", 900, reset)
+    assert pool.acquire()["X-ELS-APIKey"] == "key-c"
+    _quota(pool, "key-c", 100, reset)
+    assert pool.acquire()["X-ELS-APIKey"] == "key-b"
+
+
+def test_keys_at_reserve_are_skipped() -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:2], reserve=10)
+    _quota(pool, "key-a", 10, clock.now + 60)
+    _quota(pool, "key-b", 11, clock.now + 60)
+    assert [pool.acquire()["X-ELS-APIKey"] for _ in range(3)] == ["key-b"] * 3
+    assert clock.slept == []
+
+
+def test_per_key_rate_spreads_requests_across_keys() -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:2], requests_per_second=2)
+    used = [pool.acquire()["X-ELS-APIKey"] for _ in range(4)]
+    assert used == ["key-a", "key-b", "key-a", "key-b"]
+    assert sum(clock.slept) == pytest.approx(0.5)
+
+
+def test_pauses_until_earliest_reset_when_all_keys_exhausted(caplog) -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:2])
+    start = clock.now
+    _quota(pool, "key-a", 0, start + 600)
+    _quota(pool, "key-b", 3, start + 120)
+
+    assert pool.acquire()["X-ELS-APIKey"] == "key-b"
+    assert clock.now == start + 120
+    assert "pausing" in caplog.text
+    # The renewed key's quota is unknown until the next response.
+    (state,) = [s for s in pool.states() if s.fingerprint == fingerprint("key-b")]
+    assert state.remaining is None and state.reset_at is None
+
+
+def test_max_wait_raises_instead_of_pausing() -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:1], max_wait=60)
+    _quota(pool, "key-a", 0, clock.now + 3600)
+    with pytest.raises(QuotaExhausted, match="exhausted until"):
+        pool.acquire()
+    assert clock.slept == []
+
+
+# ---------------------------------------------------------------------------
+# Response accounting
+# ---------------------------------------------------------------------------
+
+
+def test_quota_rejection_retires_key_and_requests_retry() -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:2])
+    rejected = _response(429, **{"X-ELS-Status": "QUOTA_EXCEEDED - Quota Exceeded"})
+    assert pool.observe({"X-ELS-APIKey": "key-a"}, rejected) is True
+    assert pool.acquire()["X-ELS-APIKey"] == "key-b"
+
+
+def test_quota_rejection_with_past_reset_uses_default_pause() -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:1])
+    rejected = _response(
+        429, **{"X-ELS-Status": "QUOTA_EXCEEDED", "X-RateLimit-Reset": clock.now - 5}
+    )
+    assert pool.observe({"X-ELS-APIKey": "key-a"}, rejected) is True
+    (state,) = pool.states()
+    assert state.reset_at == clock.now + UNKNOWN_RESET_PAUSE
+
+
+def test_throttle_rejection_cools_key_down_without_retiring_it() -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:2])
+    throttled = _response(429, **{"Retry-After": 2, "X-RateLimit-Remaining": 0})
+    assert pool.observe({"X-ELS-APIKey": "key-a"}, throttled) is False
+    assert pool.acquire()["X-ELS-APIKey"] == "key-b"
+    assert pool.acquire()["X-ELS-APIKey"] == "key-b"
+    clock.now += 2
+    _quota(pool, "key-b", 50, clock.now + 60)
+    assert pool.acquire()["X-ELS-APIKey"] == "key-a"
+
+
+def test_unknown_keys_are_ignored() -> None:
+    pool = _pool(FakeClock())
+    assert pool.observe({"X-ELS-APIKey": "other"}, _response(429)) is False
+    assert pool.observe(None, _response(200)) is False
+
+
+def test_state_persists_between_pools_without_raw_keys(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "quota.json"
+    path.write_text(json.dumps({"keys": {"foreign": {"remaining": 1}}}))
+    first = _pool(clock, KEYS[:2], state_path=path)
+    _quota(first, "key-a", 0, clock.now + 600)
+
+    text = path.read_text(encoding="utf-8")
+    assert "key-a" not in text
+    saved = json.loads(text)["keys"]
+    assert saved[fingerprint("key-a")]["remaining"] == 0
+    assert "foreign" in saved
+
+    second = _pool(clock, KEYS[:2], state_path=path)
+    assert second.acquire()["X-ELS-APIKey"] == "key-b"
+
+
+def test_state_is_saved_on_exhaustion_or_after_interval(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "quota.json"
+    pool = _pool(clock, KEYS[:1], state_path=path, reserve=10)
+
+    def saved_remaining() -> int:
+        keys = json.loads(path.read_text(encoding="utf-8"))["keys"]
+        return keys[fingerprint("key-a")]["remaining"]
+
+    _quota(pool, "key-a", 100, clock.now + 3600)
+    assert saved_remaining() == 100
+    _quota(pool, "key-a", 99, clock.now + 3600)
+    assert saved_remaining() == 100
+    clock.now += SAVE_INTERVAL
+    _quota(pool, "key-a", 98, clock.now + 3600)
+    assert saved_remaining() == 98
+    _quota(pool, "key-a", 10, clock.now + 3600)
+    assert saved_remaining() == 10
+    _quota(pool, "key-a", 9, clock.now + 3600)
+    pool.save()
+    assert saved_remaining() == 9
+
+
+# ---------------------------------------------------------------------------
+# Credentials and client wiring
+# ---------------------------------------------------------------------------
+
+
+def test_credentials_from_env() -> None:
+    env = {
+        "SCOPUS_API_KEY": "k1",
+        "SCOPUS_INST_TOKEN": "t",
+        "SCOPUS_API_KEYS": "k1, k2:t2\nk3",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        assert scopus._get_credentials() == [("k1", "t"), ("k2", "t2"), ("k3", "t")]
+    with patch.dict("os.environ", {"SCOPUS_API_KEYS": "k1 k2:t2"}, clear=True):
+        assert scopus._get_credentials() == [("k2", "t2")]
+        assert scopus._get_auth_headers()["X-ELS-APIKey"] == "k2"
+
+
+def test_from_env_persists_only_multi_key_pools(tmp_path: Path) -> None:
+    with patch.dict("os.environ", {}, clear=True):
+        assert ScopusKeyPool.from_env(KEYS[:1]).state_path is None
+        pool = ScopusKeyPool.from_env(KEYS[:2])
+        assert pool.state_path == Path(DEFAULT_STATE_PATH)
+        assert pool.state_path.parts[:2] == (".cache", "elis")
+    with patch.dict("os.environ", {STATE_PATH_ENV: str(tmp_path / "q.json")}):
+        assert ScopusKeyPool.from_env(KEYS[:1]).state_path == tmp_path / "q.json"
+
+
+def test_client_moves_request_to_next_key_on_quota_rejection() -> None:
+    config = MockApiConfig(results_per_query=5, quota_per_key=1)
+    with MockApiServer(config) as api:
+        url = api.url("scopus")
+        params = {"query": "TITLE-ABS-KEY(x)", "count": 5, "start": 0}
+        requests.get(url, params=params, headers={"X-ELS-APIKey": "key-a"})
+        pool = ScopusKeyPool(KEYS[:2], state_path=None, reserve=0)
+        client = ELISHttpClient(
+            "Scopus", delay_seconds=0, max_retries=0, rate_limiter=pool
+        )
+        resp = client.get(url, params=params)
+        assert resp.status_code == 200
+        assert api.stats["quota_exceeded"] == 1
+    remaining = {s.fingerprint: s.remaining for s in pool.states()}
+    assert remaining == {fingerprint("key-a"): 0, fingerprint("key-b"): 0}
+
+
+def test_client_caps_quota_rejections_per_request() -> None:
+    clock = FakeClock()
+    pool = _pool(clock, KEYS[:2])
+    rejected = _response(429, **{"X-ELS-Status": "QUOTA_EXCEEDED"})
+    rejected.raise_for_status.side_effect = requests.HTTPError("429")
+    client = ELISHttpClient("Scopus", delay_seconds=0, max_retries=1, rate_limiter=pool)
+    with (
+        patch.object(client._session, "get", return_value=rejected) as send,
+        pytest.raises(requests.HTTPError),
+    ):
+        client.get("https://api.example/scopus")
+    assert send.call_count == (client.max_retries + 1) * len(pool)
+
+
+@pytest.mark.parametrize(
+    ("keys", "max_wait", "expected"), [("k1 k2 k3", "", 200), ("k1", "0", 75)]
+)
+def test_harvest_rotates_keys_and_stops_at_max_wait(
+    tmp_path: Path, keys: str, max_wait: str, expected: int
+) -> None:
+    # 13 requests per key leave 3 above the default reserve of 10.
+    config = MockApiConfig(results_per_query=1000, quota_per_key=13)
+    state = tmp_path / "quota.json"
+    env = {
+        "SCOPUS_API_KEYS": keys,
+        "SCOPUS_INST_TOKEN": "tok",
+        STATE_PATH_ENV: str(state),
+        MAX_WAIT_ENV: max_wait,
+    }
+    with (
+        MockApiServer(config) as api,
+        patch.object(scopus, "_BASE_URL", api.url("scopus")),
+        patch.object(ELISHttpClient, "polite_wait"),
+        patch.dict("os.environ", env, clear=True),
+    ):
+        records = list(scopus.ScopusAdapter().harvest(["q"], max_results=200))
+        assert api.stats["quota_exceeded"] == 0
+
+    assert len(records) == expected
+    saved = json.loads(state.read_text(encoding="utf-8"))["keys"]
+    assert len(saved) == len(keys.split())
+    assert all(row["remaining"] >= 10 for row in saved.values())
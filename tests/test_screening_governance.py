@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import threading
+from pathlib import Path
+
 import pytest
 
 from elis.screening_governance import (
     CapacityPolicy,
     ScreeningDecision,
     DEFAULT_CAPACITY_POLICY,
+    batch_size,
     enforce_capacity,
     generate_audit_bundle,
     is_borderline,
+    plan_batches,
+    run_batched,
     surface_borderline_cases,
 )
 
@@ -198,3 +204,140 @@ def test_capacity_policy_rejects_negative_min_seconds() -> None:
         ValueError, match="min_seconds_between_runs must be non-negative"
     ):
         CapacityPolicy(min_seconds_between_runs=-1)
+
+
+# ---------------------------------------------------------------------------
+# AC-4b: chunked, checkpointed execution
+# ---------------------------------------------------------------------------
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+def _double(batch: list[int]) -> list[int]:
+    return [value * 2 for value in batch]
+
+
+def test_plan_batches_keeps_every_record_within_run_cap() -> None:
+    policy = CapacityPolicy(max_records_per_run=4, max_records_per_batch=10)
+    batches = plan_batches(list(range(10)), policy)
+    assert batch_size(policy) == 4
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert sum(batches, []) == list(range(10))
+
+
+def test_run_batched_processes_all_records_in_order(tmp_path: Path) -> None:
+    policy = CapacityPolicy(max_records_per_run=3, max_records_per_batch=3)
+    report = run_batched(
+        list(range(8)), _double, checkpoint_dir=tmp_path, policy=policy
+    )
+    assert report.rows == [value * 2 for value in range(8)]
+    assert report.batches_processed == [0, 1, 2]
+    assert report.complete
+    assert (tmp_path / "batch_00002.json").exists()
+
+
+def test_run_batched_resumes_from_checkpoint(tmp_path: Path) -> None:
+    policy = CapacityPolicy(max_records_per_run=2, max_records_per_batch=2)
+    records = list(range(7))
+    first = run_batched(
+        records, _double, checkpoint_dir=tmp_path, policy=policy, max_batches=2
+    )
+    assert first.batches_processed == [0, 1]
+    assert not first.complete
+
+    seen: list[list[int]] = []
+
+    def _tracking(batch: list[int]) -> list[int]:
+        seen.append(batch)
+        return _double(batch)
+
+    second = run_batched(records, _tracking, checkpoint_dir=tmp_path, policy=policy)
+    assert seen == [[4, 5], [6]]
+    assert second.batches_resumed == [0, 1]
+    assert second.rows == [value * 2 for value in records]
+    assert second.complete
+
+
+def test_run_batched_failed_batch_is_retried_on_resume(tmp_path: Path) -> None:
+    policy = CapacityPolicy(max_records_per_run=2, max_records_per_batch=2)
+
+    def _flaky(batch: list[int]) -> list[int]:
+        if 2 in batch:
+            raise RuntimeError("classifier crashed")
+        return _double(batch)
+
+    with pytest.raises(RuntimeError, match="classifier crashed"):
+        run_batched(list(range(4)), _flaky, checkpoint_dir=tmp_path, policy=policy)
+    report = run_batched(
+        list(range(4)), _double, checkpoint_dir=tmp_path, policy=policy
+    )
+    assert report.batches_resumed == [0]
+    assert report.batches_processed == [1]
+
+
+def test_run_batched_rejects_checkpoint_for_other_input(tmp_path: Path) -> None:
+    run_batched([1, 2, 3], _double, checkpoint_dir=tmp_path)
+    with pytest.raises(ValueError, match="different input"):
+        run_batched([1, 2, 4], _double, checkpoint_dir=tmp_path)
+
+
+def test_run_batched_spaces_batch_starts_across_runs(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    policy = CapacityPolicy(
+        max_records_per_run=1, max_records_per_batch=1, min_seconds_between_runs=5
+    )
+
+    def _run(**kwargs):
+        return run_batched(
+            [1, 2, 3],
+            _double,
+            checkpoint_dir=tmp_path,
+            policy=policy,
+            clock=clock,
+            sleep=clock.sleep,
+            **kwargs,
+        )
+
+    assert _run(max_batches=2).throttle_seconds == 5.0
+    assert clock.sleeps == [5.0]
+
+    # The last batch start is checkpointed, so a prompt resume still waits.
+    clock.now += 2
+    report = _run()
+    assert clock.sleeps == [5.0, 3.0]
+    assert report.complete
+
+
+def test_run_batched_bounds_concurrency(tmp_path: Path) -> None:
+    policy = CapacityPolicy(
+        max_records_per_run=1, max_records_per_batch=1, max_concurrent_runs=2
+    )
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Barrier(2, timeout=5)
+
+    def _slow(batch: list[int]) -> list[int]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait()
+        with lock:
+            active -= 1
+        return batch
+
+    report = run_batched([1, 2, 3, 4], _slow, checkpoint_dir=tmp_path, policy=policy)
+    assert report.rows == [1, 2, 3, 4]
+    assert peak == 2
@@ -6,12 +6,21 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from elis.screening_local_contract import (
     ScreeningWorkspaceContract,
     assert_non_runtime_storage,
     detect_asreview_installation,
+    run_batched_screening,
     run_bounded_screening_pilot,
 )
+from elis.screening_governance import CapacityPolicy
+from elis.workload_placement_policy import (
+    AdmissionTimeout,
+    HostSample,
+    LocalAdmissionController,
+)
 
 
 def _write_appendix_a(path: Path, n: int) -> None:
@@ -109,3 +118,58 @@ def test_bounded_pilot_writes_schema_bound_auditable_outputs(tmp_path: Path) ->
     assert manifest_payload["record_cap"] == 3
 
     assert report["stored_outside_runtime_state"] is True
+
+
+def test_bounded_pilot_waits_for_admission_slot(tmp_path: Path) -> None:
+    contract = ScreeningWorkspaceContract(review_id="review-xyz", root=tmp_path)
+    appendix_a = tmp_path / "appendix_a_input.json"
+    _write_appendix_a(appendix_a, n=2)
+    admission = LocalAdmissionController(
+        tmp_path / "admission.json", sampler=lambda: HostSample(95, 0.0)
+    )
+
+    with pytest.raises(AdmissionTimeout, match="memory pressure 95%"):
+        run_bounded_screening_pilot(
+            contract=contract,
+            appendix_a_path=appendix_a,
+            admission=admission,
+            admission_timeout=0,
+        )
+    assert not contract.appendix_b_output().exists()
+
+    admission.sampler = lambda: HostSample(10, 0.0)
+    report = run_bounded_screening_pilot(
+        contract=contract, appendix_a_path=appendix_a, admission=admission
+    )
+    assert report["records_written"] == 2
+    assert report["admission_wait_seconds"] < 1
+    assert admission.status()["running"] == []
+
+
+def test_batched_screening_covers_records_beyond_the_cap(tmp_path: Path) -> None:
+    contract = ScreeningWorkspaceContract(review_id="review-xyz", root=tmp_path)
+    appendix_a = tmp_path / "appendix_a_input.json"
+    _write_appendix_a(appendix_a, n=25)
+    policy = CapacityPolicy(max_records_per_run=10, max_records_per_batch=10)
+
+    partial = run_batched_screening(
+        contract=contract, appendix_a_path=appendix_a, policy=policy, max_batches=2
+    )
+    assert partial["complete"] is False
+    assert partial["rows_written"] == 20
+
+    report = run_batched_screening(
+        contract=contract, appendix_a_path=appendix_a, policy=policy
+    )
+    assert report["complete"] is True
+    assert report["batches_resumed"] == [0, 1]
+    assert report["batches_processed"] == [2]
+    rows = json.loads(contract.appendix_b_output().read_text(encoding="utf-8"))
+    assert [row["id"] for row in rows] == [f"rec-{idx}" for idx in range(25)]
+    manifest = json.loads(contract.pilot_manifest().read_text(encoding="utf-8"))
+    assert manifest["pilot_mode"] == "batched"
+
+    restarted = run_batched_screening(
+        contract=contract, appendix_a_path=appendix_a, policy=policy, reset=True
+    )
+    assert restarted["batches_processed"] == [0, 1, 2]
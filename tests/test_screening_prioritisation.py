@@ -0,0 +1,163 @@
+"""Tests for elis.screening_prioritisation - active-learning ranking."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from elis.screening_local_contract import (  # noqa: E402
+    ScreeningWorkspaceContract,
+    run_prioritised_screening,
+)
+from elis.screening_prioritisation import (  # noqa: E402
+    ActiveLearningScreener,
+    TfidfVectoriser,
+    decisions_from_rows,
+    tokenize,
+)
+
+_RELEVANT = "election integrity misinformation voting fraud audit ballot".split()
+_OTHER = "protein cell cancer gene soil crop battery solar traffic election".split()
+
+
+def _corpus(n: int = 600, rate: float = 0.08, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    records = []
+    for index in range(n):
+        relevant = rng.random() < rate
+        words = rng.choices(_RELEVANT if relevant else _OTHER, k=6)
+        words += rng.choices(_RELEVANT + _OTHER, k=6)
+        records.append(
+            {
+                "id": f"rec-{index}",
+                "title": " ".join(words[:4]),
+                "abstract": " ".join(words),
+                "_relevant": relevant,
+            }
+        )
+    return records
+
+
+def _label(batch: list[dict]) -> dict[str, str]:
+    return {r["id"]: "included" if r["_relevant"] else "excluded" for r in batch}
+
+
+def test_tokenize_drops_stopwords_digits_and_noise() -> None:
+    assert tokenize("The 2024 study of AI-based E-voting, in x") == [
+        "ai",
+        "voting",
+    ]
+
+
+def test_tfidf_rows_are_l2_normalised() -> None:
+    matrix = TfidfVectoriser(min_df=1).fit_transform(
+        ["ballot audit ballot", "protein cell", ""]
+    )
+    norms = (matrix.multiply(matrix).sum(axis=1)).A.ravel()
+    assert norms[0] == pytest.approx(1.0)
+    assert norms[1] == pytest.approx(1.0)
+    assert norms[2] == 0.0
+
+
+def test_seed_text_ranks_cold_start() -> None:
+    records = _corpus()
+    screener = ActiveLearningScreener(records, seed_text="ballot fraud audit")
+    top = screener.next_batch(20)
+    assert screener.status().mode == "cold-start"
+    assert sum(r["_relevant"] for r in top) >= 15
+
+
+def test_active_learning_finds_relevant_records_early_and_stops() -> None:
+    records = _corpus()
+    total_relevant = sum(r["_relevant"] for r in records)
+    screener = ActiveLearningScreener(records, min_screened=60)
+
+    screener.record_decisions(_label(records[:30]))
+    assert screener.status().mode == "model"
+    while not screener.status().stop:
+        screener.record_decisions(_label(screener.next_batch(30)))
+
+    status = screener.status()
+    assert status.included / total_relevant >= 0.95
+    assert status.screened < len(records) / 2
+    assert status.estimated_recall >= 0.95
+
+
+def test_unknown_ids_and_borderline_decisions_are_not_training_labels() -> None:
+    screener = ActiveLearningScreener(_corpus(n=50))
+    added = screener.record_decisions(
+        {"rec-1": "borderline", "missing": "included", "rec-2": "included"}
+    )
+    assert added == 1
+    assert screener.status().screened == 1
+    assert decisions_from_rows([{"id": "a", "decision": "excluded"}, {}]) == {
+        "a": "excluded"
+    }
+
+
+def test_duplicate_ids_are_rejected() -> None:
+    with pytest.raises(ValueError, match="unique"):
+        ActiveLearningScreener([{"id": "a"}, {"id": "a"}])
+
+
+def test_run_prioritised_screening_writes_queue_and_report(tmp_path: Path) -> None:
+    records = _corpus(n=200)
+    contract = ScreeningWorkspaceContract(review_id="review-xyz", root=tmp_path)
+    appendix_a = tmp_path / "appendix_a.json"
+    appendix_a.write_text(json.dumps([{"_meta": True}, *records]), encoding="utf-8")
+
+    contract.ensure_dirs()
+    screened = records[:40]
+    contract.human_decisions().write_text(
+        json.dumps([{"id": k, "decision": v} for k, v in _label(screened).items()]),
+        encoding="utf-8",
+    )
+
+    report = run_prioritised_screening(
+        contract=contract, appendix_a_path=appendix_a, batch_size=10
+    )
+    queue = json.loads(contract.prioritised_queue().read_text(encoding="utf-8"))
+    assert [row["rank"] for row in queue] == list(range(1, 11))
+    assert not {row["id"] for row in queue} & {r["id"] for r in screened}
+    assert all(row["_relevant"] for row in queue[:5])
+    assert report["screened"] == 40
+    assert report["mode"] == "model"
+    saved = json.loads(contract.prioritisation_report().read_text(encoding="utf-8"))
+    assert saved["queued"] == 10
+
+
+def test_appendix_b_rows_are_keyed_by_source_id(tmp_path: Path) -> None:
+    jsonschema = pytest.importorskip("jsonschema")
+    schema_path = Path(__file__).resolve().parents[1] / "schemas/appendix_b.schema.json"
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    records = _corpus(n=200)
+    screened = records[:40]
+    rows = [
+        {
+            "id": f"B-{index:04d}",
+            "source_id": record_id,
+            "title": "t",
+            "decision": decision,
+            "reason": "r",
+            "decided_at": "2026-01-01T00:00:00Z",
+        }
+        for index, (record_id, decision) in enumerate(_label(screened).items())
+    ]
+    jsonschema.validate(rows, schema)
+    assert decisions_from_rows(rows) == _label(screened)
+
+    contract = ScreeningWorkspaceContract(review_id="review-xyz", root=tmp_path)
+    appendix_a = tmp_path / "appendix_a.json"
+    appendix_a.write_text(json.dumps(records), encoding="utf-8")
+    contract.ensure_dirs()
+    contract.human_decisions().write_text(json.dumps(rows), encoding="utf-8")
+    report = run_prioritised_screening(
+        contract=contract, appendix_a_path=appendix_a, batch_size=10
+    )
+    assert report["screened"] == 40
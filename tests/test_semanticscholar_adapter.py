@@ -0,0 +1,178 @@
+"""Tests for the Semantic Scholar bulk-search source adapter."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import jsonschema
+import pytest
+
+from elis.sources.semanticscholar import (
+    _FIELDS,
+    SemanticScholarAdapter,
+    to_bulk_query,
+    transform_entry,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+SAMPLE_S2_ENTRY = {
+    "paperId": "abc123",
+    "title": "Electoral Integrity at Scale",
+    "authors": [{"authorId": "1", "name": "Alice Smith"}, {"name": "Bob Jones"}],
+    "year": 2022,
+    "externalIds": {"DOI": "10.1234/s2.001", "CorpusId": 42},
+    "abstract": "We study electoral integrity.",
+    "url": "https://www.semanticscholar.org/paper/abc123",
+    "venue": "Journal of Elections",
+    "citationCount": 7,
+}
+
+
+def _load_harvester_schema() -> dict:
+    schema_path = Path("schemas/appendix_a_harvester.schema.json")
+    if not schema_path.exists():
+        pytest.skip("Harvester schema not found")
+    return json.loads(schema_path.read_text(encoding="utf-8"))
+
+
+def _response(data: dict) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = data
+    return resp
+
+
+# ---------------------------------------------------------------------------
+# Query translation
+# ---------------------------------------------------------------------------
+
+
+class TestToBulkQuery:
+    def test_and_or_translated(self) -> None:
+        query = '("electoral system" OR "voting system") AND integrity'
+        assert (
+            to_bulk_query(query) == '("electoral system" | "voting system") + integrity'
+        )
+
+    def test_not_becomes_negation(self) -> None:
+        assert to_bulk_query("voting NOT sports") == "voting -sports"
+
+    def test_plain_keywords_unchanged(self) -> None:
+        assert to_bulk_query("  election   audit ") == "election audit"
+
+
+# ---------------------------------------------------------------------------
+# Transform
+# ---------------------------------------------------------------------------
+
+
+class TestTransformEntry:
+    def test_basic_fields(self) -> None:
+        record = transform_entry(SAMPLE_S2_ENTRY)
+        assert record["source"] == "Semantic Scholar"
+        assert record["authors"] == ["Alice Smith", "Bob Jones"]
+        assert record["doi"] == "10.1234/s2.001"
+        assert record["year"] == 2022
+        assert record["s2_id"] == "abc123"
+        assert record["venue"] == "Journal of Elections"
+        assert record["citation_count"] == 7
+
+    def test_missing_fields_handled(self) -> None:
+        record = transform_entry({"paperId": "x", "externalIds": None})
+        assert record["title"] == ""
+        assert record["authors"] == []
+        assert record["year"] is None
+        assert record["doi"] == ""
+        assert record["citation_count"] == 0
+
+    def test_schema_compliance(self) -> None:
+        schema = _load_harvester_schema()
+        jsonschema.validate([transform_entry(SAMPLE_S2_ENTRY)], schema)
+
+    def test_projection_covers_transform_inputs(self) -> None:
+        assert set(SAMPLE_S2_ENTRY) <= set(_FIELDS)
+
+
+# ---------------------------------------------------------------------------
+# Harvest pagination
+# ---------------------------------------------------------------------------
+
+
+class TestSemanticScholarHarvest:
+    def test_harvest_follows_continuation_token(self) -> None:
+        adapter = SemanticScholarAdapter()
+        page1 = {"total": 2, "token": "NEXT", "data": [SAMPLE_S2_ENTRY]}
+        page2 = {"total": 2, "data": [{**SAMPLE_S2_ENTRY, "paperId": "def"}]}
+
+        with patch("elis.sources.semanticscholar.ELISHttpClient") as MockClient:
+            mock_client = MockClient.return_value
+            mock_client.get.side_effect = [_response(page1), _response(page2)]
+            records = list(adapter.harvest(["election"], max_results=100))
+
+        assert [r["s2_id"] for r in records] == ["abc123", "def"]
+        first, second = mock_client.get.call_args_list
+        assert "token" not in first[1]["params"]
+        assert second[1]["params"]["token"] == "NEXT"
+        assert first[1]["params"]["fields"] == ",".join(_FIELDS)
+
+    def test_harvest_respects_max_results(self) -> None:
+        adapter = SemanticScholarAdapter()
+        page = {"token": "NEXT", "data": [SAMPLE_S2_ENTRY] * 5}
+
+        with patch("elis.sources.semanticscholar.ELISHttpClient") as MockClient:
+            mock_client = MockClient.return_value
+            mock_client.get.return_value = _response(page)
+            records = list(adapter.harvest(["q"], max_results=3))
+
+        assert len(records) == 3
+        assert mock_client.get.call_count == 1
+
+    def test_harvest_stops_on_empty_page(self) -> None:
+        adapter = SemanticScholarAdapter()
+
+        with patch("elis.sources.semanticscholar.ELISHttpClient") as MockClient:
+            MockClient.return_value.get.return_value = _response({"data": []})
+            records = list(adapter.harvest(["q"], max_results=10))
+
+        assert records == []
+
+    def test_harvest_handles_request_failure(self) -> None:
+        adapter = SemanticScholarAdapter()
+
+        with patch("elis.sources.semanticscholar.ELISHttpClient") as MockClient:
+            MockClient.return_value.get.side_effect = Exception("network error")
+            records = list(adapter.harvest(["q"], max_results=10))
+
+        assert records == []
+
+    def test_harvest_sends_api_key_when_set(self) -> None:
+        adapter = SemanticScholarAdapter()
+
+        with (
+            patch("elis.sources.semanticscholar.ELISHttpClient") as MockClient,
+            patch.dict("os.environ", {"SEMANTIC_SCHOLAR_API_KEY": "k"}),
+        ):
+            mock_client = MockClient.return_value
+            mock_client.get.return_value = _response({"data": []})
+            list(adapter.harvest(["q"], max_results=10))
+
+        assert mock_client.get.call_args[1]["headers"] == {"x-api-key": "k"}
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+class TestSemanticScholarRegistry:
+    def test_registered(self) -> None:
+        from elis.sources import available_sources, get_adapter
+
+        assert "semanticscholar" in available_sources()
+        assert get_adapter("semanticscholar") is SemanticScholarAdapter
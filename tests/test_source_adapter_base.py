@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 
-from elis.sources import available_sources, get_adapter
-from elis.sources.base import SourceAdapter
+from elis.sources import (
+    BUILTIN_ADAPTERS,
+    adapter_version,
+    adapter_versions,
+    available_sources,
+    get_adapter,
+)
+from elis.sources.base import SaturationPolicy, SourceAdapter, record_keys
 
 
 # ---------------------------------------------------------------------------
@@ -29,6 +38,31 @@ class TestRegistry:
         sources = available_sources()
         assert sources == sorted(sources)
 
+    def test_builtin_adapters_register_under_declared_name(self) -> None:
+        for name, module in BUILTIN_ADAPTERS.items():
+            assert get_adapter(name).__module__ == module
+
+    def test_listing_and_versions_import_no_adapter(self) -> None:
+        code = (
+            "import sys\n"
+            "from elis.sources import adapter_versions, available_sources\n"
+            "assert 'semanticscholar' in available_sources()\n"
+            "assert set(adapter_versions().values()) == {'builtin'}\n"
+            "loaded = [m for m in sys.modules if m.startswith('elis.sources.')]\n"
+            "assert 'requests' not in sys.modules, 'requests'\n"
+            "assert loaded == [], loaded\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=30
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_adapter_versions_cached(self) -> None:
+        adapter_version.cache_clear()
+        adapter_versions()
+        adapter_versions()
+        assert adapter_version.cache_info().hits == len(available_sources())
+
 
 # ---------------------------------------------------------------------------
 # ABC contract tests
@@ -45,3 +79,52 @@ class TestSourceAdapterABC:
         adapter = cls()
         assert adapter.source_name == "openalex"
         assert adapter.display_name == "OpenAlex"
+
+
+# ---------------------------------------------------------------------------
+# Saturation policy
+# ---------------------------------------------------------------------------
+
+
+def _rec(doi: str) -> dict:
+    return {"source": "X", "title": doi, "authors": [], "year": None, "doi": doi}
+
+
+class TestSaturationPolicy:
+    def test_record_keys_cover_doi_and_ids(self) -> None:
+        keys = record_keys({"doi": "10.1/A", "openalex_id": "W1", "scopus_id": ""})
+        assert keys == {"doi:10.1/a", "openalex_id:W1"}
+
+    def test_stops_after_patience_low_novelty_pages(self) -> None:
+        known = [_rec(f"10.1/{i}") for i in range(20)]
+        policy = SaturationPolicy(min_new_ratio=0.2, patience=2, known_records=known)
+
+        assert policy.should_stop("q", [_rec(f"10.1/{i}") for i in range(10)]) is False
+        assert policy.should_stop("q", [_rec(f"10.1/{i}") for i in range(10, 20)])
+
+        report = policy.report()
+        assert report["saturated_queries"] == [
+            {"query": "q", "pages_fetched": 2, "last_new_ratio": 0.0}
+        ]
+
+    def test_novel_page_resets_counter(self) -> None:
+        known = [_rec("10.1/old")]
+        policy = SaturationPolicy(min_new_ratio=0.5, patience=2, known_records=known)
+
+        assert policy.should_stop("q", [_rec("10.1/old")]) is False
+        assert policy.should_stop("q", [_rec("10.1/new")]) is False
+        assert policy.should_stop("q", [_rec("10.1/old")]) is False
+        assert policy.report()["saturated_queries"] == []
+
+    def test_learns_keys_across_queries(self) -> None:
+        policy = SaturationPolicy(min_new_ratio=0.5, patience=1)
+        page = [_rec("10.1/a"), _rec("10.1/b")]
+
+        assert policy.should_stop("first", page) is False
+        assert policy.should_stop("second", page) is True
+
+    def test_rejects_invalid_settings(self) -> None:
+        with pytest.raises(ValueError):
+            SaturationPolicy(min_new_ratio=1.5)
+        with pytest.raises(ValueError):
+            SaturationPolicy(patience=0)
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+
 import pytest
 
 from elis.workload_placement_policy import (
     DEFAULT_WORKLOAD_PLACEMENT_POLICY,
+    AdmissionTimeout,
+    HostSample,
+    LocalAdmissionController,
     WorkloadPlacementPolicy,
     capacity_triggered_throttling,
     enforce_local_workload_request,
+    load_workload_placement_policy,
     prevent_local_promotion,
     report_workload_classes,
+    sample_host,
 )
 
 
@@ -77,6 +91,25 @@ def test_ac4_local_helper_cannot_promote_synthesis_to_local() -> None:
         )
 
 
+def test_load_policy_overrides_defaults(tmp_path: Path) -> None:
+    path = tmp_path / "policy.json"
+    path.write_text(
+        json.dumps(
+            {"max_local_concurrency": 3, "local_workload_classes": ["screening"]}
+        ),
+        encoding="utf-8",
+    )
+    policy = load_workload_placement_policy(path)
+    assert policy.max_local_concurrency == 3
+    assert policy.local_workload_classes == ("screening",)
+    assert policy.off_host_workload_classes == (
+        DEFAULT_WORKLOAD_PLACEMENT_POLICY.off_host_workload_classes
+    )
+    path.write_text(json.dumps({"max_local_concurrency": 0}), encoding="utf-8")
+    with pytest.raises(ValueError, match="at least 1"):
+        load_workload_placement_policy(path)
+
+
 def test_policy_rejects_overlapping_class_sets() -> None:
     with pytest.raises(ValueError, match="both local and off-host"):
         WorkloadPlacementPolicy(
@@ -96,3 +129,134 @@ def test_rejects_unknown_local_workload_class() -> None:
 def test_ac5_suite_marker() -> None:
     """AC-5 exists as the test-command contract (`pytest ...test_workload_placement_policy`)."""
     assert True
+
+
+# ---------------------------------------------------------------------------
+# Admission controller
+# ---------------------------------------------------------------------------
+
+
+def _controller(tmp_path: Path, *, memory: int = 10, load: float = 0.1, **kwargs):
+    return LocalAdmissionController(
+        tmp_path / "admission.json",
+        sampler=lambda: HostSample(memory, load),
+        **kwargs,
+    )
+
+
+def test_sample_host_reads_meminfo_and_loadavg(tmp_path: Path) -> None:
+    (tmp_path / "meminfo").write_text(
+        "MemTotal:       1000 kB\nMemFree:   100 kB\nMemAvailable:    250 kB\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "loadavg").write_text("2.00 1.50 1.00 1/100 42\n", encoding="utf-8")
+    sample = sample_host(tmp_path)
+    assert sample.memory_pressure_percent == 75
+    assert sample.load_per_cpu == round(2.0 / (os.cpu_count() or 1), 3)
+    assert sample_host(tmp_path / "missing") == HostSample(0, 0.0)
+
+
+def test_admission_tracks_running_jobs_across_controllers(tmp_path: Path) -> None:
+    first = _controller(tmp_path)
+    second = _controller(tmp_path)
+
+    ticket, decision = first.try_admit("screening")
+    assert ticket is not None and decision["running_slots"] == 0
+    blocked, decision = second.try_admit("bibliometric-preanalysis")
+    assert blocked is None
+    assert decision["reason"] == "local capacity reached"
+
+    ticket.release()
+    again, _ = second.try_admit("bibliometric-preanalysis")
+    assert again is not None
+    assert [j["workload_class"] for j in second.status()["running"]] == [
+        "bibliometric-preanalysis"
+    ]
+
+
+def test_memory_pressure_and_load_defer_admission(tmp_path: Path) -> None:
+    ticket, decision = _controller(tmp_path, memory=85).try_admit("screening")
+    assert ticket is None
+    assert decision["reason"] == "memory pressure 85%"
+    assert decision["recommended_action"] == "defer"
+
+    loaded = _controller(tmp_path, load=3.0, max_load_per_cpu=2.0)
+    assert loaded.try_admit("screening")[1]["reason"] == "load per CPU 3.0"
+
+
+def test_wait_for_slot_queues_until_release(tmp_path: Path) -> None:
+    controller = _controller(tmp_path)
+    held, _ = controller.try_admit("screening")
+    assert held is not None
+    threading.Timer(0.2, held.release).start()
+
+    with controller.slot("screening", poll_seconds=0.05) as ticket:
+        assert ticket.waited_seconds >= 0.1
+        assert len(controller.status()["running"]) == 1
+    assert controller.status()["running"] == []
+
+
+def test_wait_for_slot_times_out_and_leaves_queue(tmp_path: Path) -> None:
+    controller = _controller(tmp_path)
+    held, _ = controller.try_admit("screening")
+    with pytest.raises(AdmissionTimeout, match="local capacity reached"):
+        controller.wait_for_slot("screening", timeout=0.2, poll_seconds=0.05)
+    assert controller.status()["queued"] == []
+    held.release()
+
+
+def test_queued_waiters_are_served_in_order(tmp_path: Path) -> None:
+    policy = replace(DEFAULT_WORKLOAD_PLACEMENT_POLICY, max_local_concurrency=1)
+    controller = _controller(tmp_path, policy=policy)
+    held, _ = controller.try_admit("screening")
+    order: list[str] = []
+
+    def _wait(name: str) -> None:
+        with controller.slot("screening", poll_seconds=0.02):
+            order.append(name)
+            time.sleep(0.05)
+
+    early = threading.Thread(target=_wait, args=("early",))
+    early.start()
+    time.sleep(0.1)
+    late = threading.Thread(target=_wait, args=("late",))
+    late.start()
+    time.sleep(0.1)
+    # A non-queued request never jumps the waiters.
+    held.release()
+    assert controller.try_admit("screening")[0] is None
+    early.join(5)
+    late.join(5)
+    assert order == ["early", "late"]
+
+
+def test_slots_of_exited_processes_are_reclaimed(tmp_path: Path) -> None:
+    controller = _controller(tmp_path)
+    code = (
+        "import sys; from pathlib import Path; "
+        "from elis.workload_placement_policy import HostSample, LocalAdmissionController; "
+        "c = LocalAdmissionController(Path(sys.argv[1]), sampler=lambda: HostSample(0, 0.0)); "
+        "assert c.try_admit('screening')[0] is not None"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code, str(controller.state_path)],
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert controller.try_admit("screening")[0] is not None
+
+
+@pytest.mark.parametrize("pid", [0, -1])
+def test_entries_without_a_real_pid_are_dropped(tmp_path: Path, pid: int) -> None:
+    controller = _controller(tmp_path)
+    assert controller.try_admit("screening")[0] is not None
+    state = json.loads(controller.state_path.read_text(encoding="utf-8"))
+    state["jobs"][0]["pid"] = pid
+    controller.state_path.write_text(json.dumps(state), encoding="utf-8")
+    assert controller.try_admit("screening")[0] is not None
+
+
+def test_admission_rejects_off_host_classes(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError, match="off-host only"):
+        _controller(tmp_path).wait_for_slot("extraction")
+    assert _controller(tmp_path).status()["queued"] == []